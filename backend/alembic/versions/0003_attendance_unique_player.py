@@ -0,0 +1,37 @@
+"""attendance unique player
+
+One attendance record per (match_id, player_id). Duplicates left by the
+old per-player insert path are removed first, keeping the newest record.
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-19 15:05:48.296220
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0003'
+down_revision: Union[str, None] = '0002'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # The derived table lets MySQL read the table it deletes from
+    op.execute(
+        "DELETE FROM attendance_record WHERE attendance_id NOT IN ("
+        "SELECT keep_id FROM (SELECT MAX(attendance_id) AS keep_id FROM attendance_record "
+        "GROUP BY match_id, player_id) AS keep)"
+    )
+    # Batch mode: SQLite cannot add a constraint in place
+    with op.batch_alter_table('attendance_record') as batch_op:
+        batch_op.create_unique_constraint('uq_attendance_record_match_player', ['match_id', 'player_id'])
+
+
+def downgrade() -> None:
+    with op.batch_alter_table('attendance_record') as batch_op:
+        batch_op.drop_constraint('uq_attendance_record_match_player', type_='unique')
@@ -4,6 +4,7 @@ Thin controller that delegates to AuthService.
 """
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
+from pydantic import BaseModel
 
 from app.database import get_db
 from app.services.auth_service import AuthService
@@ -15,6 +16,8 @@ from app.schemas.common import MessageResponse
 from app.dependencies.auth import get_current_user
 from app.models.user import UserAccount
 from app.utils.security import create_access_token, create_refresh_token, verify_refresh_token
+from app.models.enums import AccountStatus
+from app.repositories.user_repository import UserRepository
 
 router = APIRouter()
 
@@ -96,8 +99,6 @@ async def logout(user: UserAccount = Depends(get_current_user)):
     return MessageResponse(message="Logged out successfully")
 
 
-from pydantic import BaseModel
-
 class RefreshTokenRequest(BaseModel):
     """Refresh token request body."""
     refreshToken: str
@@ -155,9 +156,6 @@ async def delete_account(
     db: AsyncSession = Depends(get_db)
 ):
     """Delete user account (soft delete - sets status to DELETED)."""
-    from app.models.enums import AccountStatus
-    from app.repositories.user_repository import UserRepository
-    
     user_repo = UserRepository(db)
     
     # Set account status to DELETED
@@ -4,7 +4,7 @@ Thin controller that delegates to BookingService.
 """
 from typing import List, Optional
 from datetime import date, time
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, status, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.database import get_db
@@ -103,8 +103,6 @@ async def get_owner_pending_bookings(
     field_service: FieldService = Depends(get_field_service)
 ):
     """Get all pending bookings for owner's fields."""
-    from app.models.enums import BookingStatus
-    
     fields = await field_service.get_fields_by_owner(user.user_id)
     all_pending = []
     for field in fields:
@@ -120,6 +118,7 @@ async def get_owner_pending_bookings(
 @router.put("/{booking_id}/approve", response_model=MessageResponse)
 async def approve_booking(
     booking_id: int,
+    background_tasks: BackgroundTasks,
     user: UserAccount = Depends(get_current_user),
     booking_service: BookingService = Depends(get_booking_service),
     field_service: FieldService = Depends(get_field_service)
@@ -133,13 +132,14 @@ async def approve_booking(
     if not field or field.owner_id != user.user_id:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not authorized")
     
-    await booking_service.approve_booking(booking)
+    await booking_service.approve_booking(booking, background_tasks)
     return MessageResponse(message="Booking approved")
 
 
 @router.put("/{booking_id}/reject", response_model=MessageResponse)
 async def reject_booking(
     booking_id: int,
+    background_tasks: BackgroundTasks,
     user: UserAccount = Depends(get_current_user),
     booking_service: BookingService = Depends(get_booking_service),
     field_service: FieldService = Depends(get_field_service)
@@ -153,7 +153,7 @@ async def reject_booking(
     if not field or field.owner_id != user.user_id:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not authorized")
     
-    await booking_service.reject_booking(booking)
+    await booking_service.reject_booking(booking, background_tasks)
     return MessageResponse(message="Booking rejected")
 
 
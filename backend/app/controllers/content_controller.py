@@ -6,14 +6,24 @@ from typing import List, Optional
 from pydantic import BaseModel
 from fastapi import APIRouter, Depends, HTTPException, status, Query
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select
+from datetime import datetime
 
 from app.database import get_db
 from app.services.content_service import ContentService
-from app.schemas.social import PostResponse, PostCreate, CommentResponse, CommentCreate
+from app.services.moderation_stats_service import ModerationStatsService, PENDING_REPORTS
+from app.repositories.moderation_repository import ReportCaseRepository
+from app.schemas.social import PostResponse, POST_SERIALIZER, PostCreate, CommentResponse, CommentCreate
 from app.schemas.common import MessageResponse
 from app.dependencies.auth import get_current_user, get_current_user_optional
 from app.models.user import UserAccount
-from app.models.enums import Visibility
+from app.models.enums import (
+    Visibility, MediaType, MediaOwnerType, ReactionType, ReactionEntityType,
+    ReportStatus, ReportContentType
+)
+from app.models.media import MediaAsset
+from app.models.social import Post, Comment, Reaction
+from app.models.moderation import Report
 
 router = APIRouter()
 
@@ -22,22 +32,6 @@ def get_content_service(db: AsyncSession = Depends(get_db)) -> ContentService:
     return ContentService(db)
 
 
-def post_to_response(p) -> PostResponse:
-    return PostResponse(
-        postId=p.post_id,
-        authorId=p.author_id,
-        teamId=p.team_id,
-        imageUrl=p.image.storage_path if p.image else None,
-        content=p.content,
-        visibility=p.visibility.value,
-        reactionCount=p.reaction_count,
-        commentCount=p.comment_count,
-        isHidden=p.is_hidden,
-        createdAt=p.created_at.isoformat(),
-        updatedAt=p.updated_at.isoformat(),
-    )
-
-
 @router.post("", response_model=PostResponse, status_code=status.HTTP_201_CREATED)
 async def create_post(
     data: PostCreate,
@@ -55,9 +49,6 @@ async def create_post(
     
     # If imageUrl is provided, create a media asset and link it
     if data.imageUrl:
-        from app.models.media import MediaAsset
-        from app.models.enums import MediaType, MediaOwnerType
-        
         media = MediaAsset(
             owner_id=user.user_id,
             owner_type=MediaOwnerType.POST,
@@ -74,7 +65,7 @@ async def create_post(
         await db.commit()
         await db.refresh(post)
     
-    return post_to_response(post)
+    return POST_SERIALIZER.to_model(post)
 
 
 @router.get("", response_model=List[PostResponse])
@@ -85,8 +76,6 @@ async def get_posts(
     db: AsyncSession = Depends(get_db)
 ):
     """Get posts feed (all non-hidden posts)."""
-    from app.models.social import Post
-    
     # Get all non-hidden posts (including public, private, team-only)
     stmt = select(Post).where(Post.is_hidden == False).order_by(Post.created_at.desc())
     
@@ -98,7 +87,7 @@ async def get_posts(
     result = await db.execute(stmt)
     posts = result.scalars().all()
     
-    return [post_to_response(p) for p in posts]
+    return POST_SERIALIZER.response(posts)
 
 
 class UserReactionResponse(BaseModel):
@@ -114,9 +103,6 @@ async def get_my_reactions(
     db: AsyncSession = Depends(get_db)
 ):
     """Get current user's reactions for multiple posts."""
-    from app.models.social import Reaction
-    from app.models.enums import ReactionEntityType
-    
     result = await db.execute(
         select(Reaction).where(
             Reaction.entity_type == ReactionEntityType.POST,
@@ -146,7 +132,7 @@ async def get_post(
     post = await content_service.get_post_by_id(post_id)
     if not post:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Post not found")
-    return post_to_response(post)
+    return POST_SERIALIZER.to_model(post)
 
 
 @router.delete("/{post_id}", response_model=MessageResponse)
@@ -218,26 +204,17 @@ async def add_comment(
 
 
 # --- Community Enhancements ---
-from sqlalchemy import select
 
 @router.post("/{post_id}/like", response_model=MessageResponse)
 async def like_post(
     post_id: int,
     user: UserAccount = Depends(get_current_user),
-    content_service: ContentService = Depends(get_content_service),
-    db: AsyncSession = Depends(get_db)
+    content_service: ContentService = Depends(get_content_service)
 ):
     """Like a post."""
-    from app.models.social import Post
-    
-    post = await content_service.get_post_by_id(post_id)
-    if not post:
+    if not await content_service.adjust_reaction_count(post_id, 1):
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Post not found")
     
-    # Increment reaction count
-    post.reaction_count = (post.reaction_count or 0) + 1
-    await db.commit()
-    
     return MessageResponse(message="Post liked")
 
 
@@ -245,18 +222,14 @@ async def like_post(
 async def unlike_post(
     post_id: int,
     user: UserAccount = Depends(get_current_user),
-    content_service: ContentService = Depends(get_content_service),
-    db: AsyncSession = Depends(get_db)
+    content_service: ContentService = Depends(get_content_service)
 ):
     """Unlike a post."""
     post = await content_service.get_post_by_id(post_id)
     if not post:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Post not found")
     
-    # Decrement reaction count
-    if post.reaction_count and post.reaction_count > 0:
-        post.reaction_count = post.reaction_count - 1
-    await db.commit()
+    await content_service.adjust_reaction_count(post_id, -1)
     
     return MessageResponse(message="Post unliked")
 
@@ -269,8 +242,6 @@ async def get_user_posts(
     db: AsyncSession = Depends(get_db)
 ):
     """Get posts by a specific user."""
-    from app.models.social import Post
-    
     result = await db.execute(
         select(Post)
         .where(Post.author_id == user_id, Post.is_hidden == False)
@@ -280,7 +251,7 @@ async def get_user_posts(
     )
     posts = result.scalars().all()
     
-    return [post_to_response(p) for p in posts]
+    return POST_SERIALIZER.response(posts)
 
 
 @router.get("/team/{team_id}", response_model=List[PostResponse])
@@ -291,8 +262,6 @@ async def get_team_posts(
     db: AsyncSession = Depends(get_db)
 ):
     """Get posts for a specific team."""
-    from app.models.social import Post
-    
     result = await db.execute(
         select(Post)
         .where(Post.team_id == team_id, Post.is_hidden == False)
@@ -302,7 +271,7 @@ async def get_team_posts(
     )
     posts = result.scalars().all()
     
-    return [post_to_response(p) for p in posts]
+    return POST_SERIALIZER.response(posts)
 
 
 @router.get("/{post_id}/comments/{comment_id}/replies", response_model=List[CommentResponse])
@@ -312,8 +281,6 @@ async def get_comment_replies(
     db: AsyncSession = Depends(get_db)
 ):
     """Get replies to a specific comment."""
-    from app.models.social import Comment
-    
     result = await db.execute(
         select(Comment)
         .where(
@@ -365,10 +332,6 @@ async def toggle_reaction(
     db: AsyncSession = Depends(get_db)
 ):
     """Toggle a reaction on a post - creates if not exists, removes if same type, updates if different type."""
-    from app.models.social import Post, Reaction
-    from app.models.enums import ReactionType, ReactionEntityType
-    from datetime import datetime
-    
     post = await content_service.get_post_by_id(post_id)
     if not post:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Post not found")
@@ -445,9 +408,6 @@ async def get_reactions(
     db: AsyncSession = Depends(get_db)
 ):
     """Get all reactions for a post."""
-    from app.models.social import Reaction
-    from app.models.enums import ReactionEntityType
-    
     post = await content_service.get_post_by_id(post_id)
     if not post:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Post not found")
@@ -472,7 +432,6 @@ async def get_reactions(
     ]
 
 
-
 # --- Reports Endpoint for Regular Users ---
 class CreateReportRequest(BaseModel):
     """Create report request."""
@@ -500,9 +459,6 @@ async def create_report(
     db: AsyncSession = Depends(get_db)
 ):
     """Report content (post, comment, or user)."""
-    from app.models.moderation import Report
-    from app.models.enums import ReportStatus, ReportContentType
-    
     # Map string content type to enum
     try:
         content_type_enum = ReportContentType(data.contentType)
@@ -518,7 +474,9 @@ async def create_report(
         status=ReportStatus.PENDING,
     )
     
+    await ReportCaseRepository(db).add_report(report)
     db.add(report)
+    await ModerationStatsService(db).adjust(PENDING_REPORTS, 1)
     await db.commit()
     await db.refresh(report)
     
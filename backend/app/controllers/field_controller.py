@@ -3,18 +3,28 @@ FieldController - Field HTTP endpoints.
 Thin controller that delegates to FieldService.
 """
 from typing import List, Optional
-from datetime import date
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from datetime import date, time as datetime_time
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Request
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 from pydantic import BaseModel
+from sqlalchemy import select, delete
 
 from app.database import get_db
 from app.services.field_service import FieldService
 from app.schemas.field import (
-    FieldProfileResponse, FieldProfileCreate, FieldProfileUpdate, FieldCalendarResponse
+    FieldProfileResponse, FieldProfileCreate, FieldProfileUpdate, FieldCalendarResponse,
+    FIELD_PROFILE_SERIALIZER, AmenityResponse, FieldPricingRuleResponse, FieldPricingRuleCreate
 )
 from app.dependencies.auth import get_current_user
 from app.models.user import UserAccount
+from app.repositories.field_repository import FieldRepository
+from app.services.reference_data import load_reference_data
+from app.utils.http_cache import get_response_cache, cached_response
+from app.schemas.common import MessageResponse
+from app.models.field import FieldAmenity, FieldPricingRule, FieldCalendar
+from app.models.media import MediaAsset
+from app.models.enums import CalendarStatus, MediaOwnerType
 
 router = APIRouter()
 
@@ -23,25 +33,6 @@ def get_field_service(db: AsyncSession = Depends(get_db)) -> FieldService:
     return FieldService(db)
 
 
-def field_to_response(f) -> FieldProfileResponse:
-    return FieldProfileResponse(
-        fieldId=f.field_id,
-        ownerId=f.owner_id,
-        fieldName=f.field_name,
-        description=f.description,
-        location=f.location,
-        latitude=f.latitude,
-        longitude=f.longitude,
-        defaultPricePerHour=float(f.default_price_per_hour),
-        capacity=f.capacity,
-        status=f.status.value,
-        rejectionReason=f.rejection_reason,
-        coverImage=f.cover_image.storage_path if f.cover_image else None,
-        createdAt=f.created_at.isoformat(),
-        updatedAt=f.updated_at.isoformat(),
-    )
-
-
 @router.post("", response_model=FieldProfileResponse, status_code=status.HTTP_201_CREATED)
 async def create_field(
     data: FieldProfileCreate,
@@ -59,7 +50,7 @@ async def create_field(
         default_price_per_hour=data.defaultPricePerHour,
         capacity=data.capacity,
     )
-    return field_to_response(field)
+    return FIELD_PROFILE_SERIALIZER.to_model(field)
 
 
 @router.get("/my-fields", response_model=List[FieldProfileResponse])
@@ -69,7 +60,7 @@ async def get_my_fields(
 ):
     """Get fields owned by current user."""
     fields = await field_service.get_fields_by_owner(user.user_id)
-    return [field_to_response(f) for f in fields]
+    return FIELD_PROFILE_SERIALIZER.response(fields)
 
 
 @router.get("/owner/{owner_id}", response_model=List[FieldProfileResponse])
@@ -79,46 +70,44 @@ async def get_fields_by_owner(
 ):
     """Get fields by owner ID (public endpoint)."""
     fields = await field_service.get_fields_by_owner(owner_id)
-    return [field_to_response(f) for f in fields]
+    return FIELD_PROFILE_SERIALIZER.response(fields)
 
 
 # --- Amenities (must be before /{field_id} routes) ---
-from app.schemas.field import AmenityResponse
 
 @router.get("/amenities", response_model=List[AmenityResponse])
 async def get_all_amenities(
+    request: Request,
     db: AsyncSession = Depends(get_db)
 ):
     """Get all available amenities."""
-    from sqlalchemy import select
-    from app.models.field import Amenity
+    reference = await load_reference_data(db)
     
-    result = await db.execute(
-        select(Amenity).where(Amenity.is_active == True)
-    )
-    amenities = result.scalars().all()
-    
-    return [
-        AmenityResponse(
-            amenityId=a.amenity_id,
-            name=a.name,
-            description=a.description,
-            icon=a.icon,
-            isActive=a.is_active,
-        ) for a in amenities
-    ]
+    # Keyed by registry version, so a reload never serves the old list
+    cache = get_response_cache()
+    key = f"amenities:v{reference.version}"
+    entry = cache.get(key)
+    if entry is None:
+        entry = cache.put(key, reference.active_amenities, reference.version)
+    return cached_response(request, entry)
 
 
 @router.get("/{field_id}", response_model=FieldProfileResponse)
 async def get_field(
     field_id: int,
+    request: Request,
     field_service: FieldService = Depends(get_field_service)
 ):
     """Get field by ID."""
-    field = await field_service.get_field_by_id(field_id)
-    if not field:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Field not found")
-    return field_to_response(field)
+    cache = get_response_cache()
+    key = f"field:{field_id}"
+    entry = cache.get(key)
+    if entry is None:
+        field = await field_service.get_field_by_id(field_id)
+        if not field:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Field not found")
+        entry = cache.put(key, FIELD_PROFILE_SERIALIZER(field), field.updated_at)
+    return cached_response(request, entry)
 
 
 @router.put("/{field_id}", response_model=FieldProfileResponse)
@@ -146,13 +135,12 @@ async def update_field(
         pass
     if "rejectionReason" in update_data:
         update_data["rejection_reason"] = update_data.pop("rejectionReason")
-        
+    
     updated = await field_service.update_field(field, **update_data)
-    return field_to_response(updated)
+    get_response_cache().invalidate(f"field:{field_id}")
+    return FIELD_PROFILE_SERIALIZER.to_model(updated)
 
 
-from app.schemas.common import MessageResponse
-
 @router.delete("/{field_id}", response_model=MessageResponse)
 async def delete_field(
     field_id: int,
@@ -167,8 +155,8 @@ async def delete_field(
     if field.owner_id != user.user_id:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not authorized")
     
-    await db.delete(field)
-    await db.commit()
+    await field_service.delete_field(field)
+    get_response_cache().invalidate(f"field:{field_id}", f"field:{field_id}:pricing")
     
     return MessageResponse(message="Field deleted")
 
@@ -194,10 +182,6 @@ async def set_cover_image(
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not authorized")
     
     # Verify the media asset exists and belongs to this field
-    from app.models.media import MediaAsset
-    from app.models.enums import MediaOwnerType
-    from sqlalchemy import select
-    
     result = await db.execute(
         select(MediaAsset).where(
             MediaAsset.asset_id == data.mediaAssetId,
@@ -210,7 +194,8 @@ async def set_cover_image(
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Media asset not found or does not belong to this field")
     
     updated = await field_service.update_field(field, cover_image_id=data.mediaAssetId)
-    return field_to_response(updated)
+    get_response_cache().invalidate(f"field:{field_id}")
+    return FIELD_PROFILE_SERIALIZER.to_model(updated)
 
 
 @router.get("/{field_id}/calendar", response_model=List[FieldCalendarResponse])
@@ -238,9 +223,6 @@ async def get_calendar(
     ]
 
 
-from pydantic import BaseModel
-from datetime import time as datetime_time
-
 class CalendarBlockRequest(BaseModel):
     """Request to block a calendar slot."""
     date: str
@@ -257,10 +239,6 @@ async def block_calendar_slot(
     db: AsyncSession = Depends(get_db)
 ):
     """Block a calendar slot (field owner only)."""
-    from app.models.field import FieldCalendar
-    from app.models.enums import CalendarStatus
-    from app.repositories.field_repository import FieldRepository
-    
     field = await field_service.get_field_by_id(field_id)
     if not field:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Field not found")
@@ -298,10 +276,6 @@ async def unblock_calendar_slot(
     db: AsyncSession = Depends(get_db)
 ):
     """Unblock/delete a blocked calendar slot (field owner only)."""
-    from sqlalchemy import select
-    from app.models.field import FieldCalendar
-    from app.models.enums import CalendarStatus
-    
     result = await db.execute(
         select(FieldCalendar).where(FieldCalendar.calendar_id == calendar_id)
     )
@@ -324,38 +298,43 @@ async def unblock_calendar_slot(
 
 
 # --- Field Pricing ---
-from app.schemas.field import FieldPricingRuleResponse, FieldPricingRuleCreate, AmenityResponse
 
 
 @router.get("/{field_id}/pricing", response_model=List[FieldPricingRuleResponse])
 async def get_field_pricing(
     field_id: int,
+    request: Request,
     db: AsyncSession = Depends(get_db)
 ):
     """Get pricing rules for a field."""
-    from sqlalchemy import select
-    from app.models.field import FieldPricingRule
-    
-    result = await db.execute(
-        select(FieldPricingRule).where(FieldPricingRule.field_id == field_id)
-    )
-    rules = result.scalars().all()
-    
-    return [
-        FieldPricingRuleResponse(
-            pricingRuleId=r.pricing_rule_id,
-            fieldId=r.field_id,
-            name=r.name,
-            dayOfWeek=r.day_of_week,  # Already a list (JSON type)
-            startTime=r.start_time.isoformat(),
-            endTime=r.end_time.isoformat(),
-            pricePerHour=float(r.price_per_hour),
-            priority=r.priority,
-            isActive=r.is_active,
-            createdAt=r.created_at.isoformat(),
-            updatedAt=r.updated_at.isoformat(),
-        ) for r in rules
-    ]
+    cache = get_response_cache()
+    key = f"field:{field_id}:pricing"
+    entry = cache.get(key)
+    if entry is None:
+        result = await db.execute(
+            select(FieldPricingRule).where(FieldPricingRule.field_id == field_id)
+        )
+        rules = result.scalars().all()
+        
+        content = [
+            FieldPricingRuleResponse(
+                pricingRuleId=r.pricing_rule_id,
+                fieldId=r.field_id,
+                name=r.name,
+                dayOfWeek=r.day_of_week,  # Already a list (JSON type)
+                startTime=r.start_time.isoformat(),
+                endTime=r.end_time.isoformat(),
+                pricePerHour=float(r.price_per_hour),
+                priority=r.priority,
+                isActive=r.is_active,
+                createdAt=r.created_at.isoformat(),
+                updatedAt=r.updated_at.isoformat(),
+            ).model_dump() for r in rules
+        ]
+        # Rules are replaced wholesale, so IDs plus the newest updated_at identify the version
+        version = ([r.pricing_rule_id for r in rules], max((r.updated_at for r in rules), default=None))
+        entry = cache.put(key, content, version)
+    return cached_response(request, entry)
 
 
 @router.put("/{field_id}/pricing", response_model=List[FieldPricingRuleResponse])
@@ -367,10 +346,6 @@ async def update_field_pricing(
     db: AsyncSession = Depends(get_db)
 ):
     """Update pricing rules for a field (replaces all rules)."""
-    from sqlalchemy import select, delete
-    from app.models.field import FieldPricingRule
-    from datetime import time as datetime_time
-    
     field = await field_service.get_field_by_id(field_id)
     if not field:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Field not found")
@@ -397,6 +372,7 @@ async def update_field_pricing(
         new_rules.append(rule)
     
     await db.commit()
+    get_response_cache().invalidate(f"field:{field_id}:pricing")
     
     return [
         FieldPricingRuleResponse(
@@ -415,33 +391,15 @@ async def update_field_pricing(
     ]
 
 
-
-
 @router.get("/{field_id}/amenities", response_model=List[AmenityResponse])
 async def get_field_amenities(
     field_id: int,
     db: AsyncSession = Depends(get_db)
 ):
     """Get amenities for a field."""
-    from sqlalchemy import select
-    from app.models.field import FieldAmenity, Amenity
-    
-    result = await db.execute(
-        select(Amenity)
-        .join(FieldAmenity, FieldAmenity.amenity_id == Amenity.amenity_id)
-        .where(FieldAmenity.field_id == field_id)
-    )
-    amenities = result.scalars().all()
-    
-    return [
-        AmenityResponse(
-            amenityId=a.amenity_id,
-            name=a.name,
-            description=a.description,
-            icon=a.icon,
-            isActive=a.is_active,
-        ) for a in amenities
-    ]
+    reference = await load_reference_data(db)
+    amenity_ids = await FieldRepository(db).find_amenity_ids(field_id)
+    return ORJSONResponse(reference.amenity_responses(amenity_ids))
 
 
 class FieldAmenityUpdateRequest(BaseModel):
@@ -458,39 +416,26 @@ async def update_field_amenities(
     db: AsyncSession = Depends(get_db)
 ):
     """Update amenities for a field."""
-    from sqlalchemy import select, delete
-    from app.models.field import FieldAmenity, Amenity
-    
     field = await field_service.get_field_by_id(field_id)
     if not field:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Field not found")
     if field.owner_id != user.user_id:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not authorized")
     
+    reference = await load_reference_data(db)
+    unknown = await reference.unknown_amenity_ids(db, data.amenityIds)
+    if unknown:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=f"Unknown amenity IDs: {unknown}")
+    amenity_ids = list(dict.fromkeys(data.amenityIds))
+    
     # Delete existing field amenities
     await db.execute(delete(FieldAmenity).where(FieldAmenity.field_id == field_id))
     
     # Add new field amenities
-    for amenity_id in data.amenityIds:
+    for amenity_id in amenity_ids:
         field_amenity = FieldAmenity(field_id=field_id, amenity_id=amenity_id)
         db.add(field_amenity)
     
     await db.commit()
     
-    # Return updated amenities
-    result = await db.execute(
-        select(Amenity)
-        .join(FieldAmenity, FieldAmenity.amenity_id == Amenity.amenity_id)
-        .where(FieldAmenity.field_id == field_id)
-    )
-    amenities = result.scalars().all()
-    
-    return [
-        AmenityResponse(
-            amenityId=a.amenity_id,
-            name=a.name,
-            description=a.description,
-            icon=a.icon,
-            isActive=a.is_active,
-        ) for a in amenities
-    ]
+    return ORJSONResponse(reference.amenity_responses(amenity_ids))
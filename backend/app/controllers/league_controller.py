@@ -0,0 +1,92 @@
+"""
+LeagueController - League table HTTP endpoints.
+Standings are served from the in-memory LeagueTable.
+"""
+from typing import List, Optional
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy.ext.asyncio import AsyncSession
+from pydantic import BaseModel
+
+from app.database import get_db
+from app.services.league_table import load_league_table, partition
+
+router = APIRouter()
+
+
+class StandingResponse(BaseModel):
+    """One row of the league table."""
+    rank: int
+    teamId: int
+    teamName: str
+    location: Optional[str] = None
+    skillLevel: Optional[int] = None
+    played: int
+    wins: int
+    draws: int
+    losses: int
+    goalsFor: int
+    goalsAgainst: int
+    goalDifference: int
+    points: int
+    form: str
+
+
+class TeamStandingResponse(StandingResponse):
+    """A team's position and the number of teams ranked alongside it."""
+    totalTeams: int
+
+
+def standing_to_response(rank: int, s: dict) -> dict:
+    return dict(
+        rank=rank,
+        teamId=s["team_id"],
+        teamName=s["team_name"],
+        location=s["location"],
+        skillLevel=s["skill_level"],
+        played=s["matches_played"],
+        wins=s["wins"],
+        draws=s["draws"],
+        losses=s["losses"],
+        goalsFor=s["goals_for"],
+        goalsAgainst=s["goals_against"],
+        goalDifference=s["goal_difference"],
+        points=s["points"],
+        form=s["form"],
+    )
+
+
+def get_partition(
+    location: Optional[str] = Query(None, description="Only teams at this location"),
+    skillBand: Optional[str] = Query(None, description="Only teams in this skill band: 1-3, 4-6 or 7-10"),
+) -> tuple:
+    try:
+        return partition(location, skillBand)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+
+@router.get("", response_model=List[StandingResponse])
+async def get_standings(
+    limit: int = Query(20, ge=1, le=100),
+    offset: int = Query(0, ge=0),
+    key: tuple = Depends(get_partition),
+    db: AsyncSession = Depends(get_db)
+):
+    """League table, best first: points, then goal difference, then goals scored."""
+    table = await load_league_table(db)
+    return [StandingResponse(**standing_to_response(rank, s)) for rank, s in table.top(limit, offset, key)]
+
+
+@router.get("/teams/{team_id}", response_model=TeamStandingResponse)
+async def get_team_standing(
+    team_id: int,
+    key: tuple = Depends(get_partition),
+    db: AsyncSession = Depends(get_db)
+):
+    """A team's rank in the (optionally filtered) league table."""
+    table = await load_league_table(db)
+    ranked = table.rank(team_id, key)
+    if ranked is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Team is not ranked")
+    rank, standing = ranked
+    return TeamStandingResponse(**standing_to_response(rank, standing), totalTeams=table.size(key))
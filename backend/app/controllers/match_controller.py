@@ -4,22 +4,25 @@ Thin controller that delegates to MatchService.
 """
 from typing import List
 from datetime import date, time
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
+from pydantic import BaseModel
 
 from app.database import get_db
 from app.services.match_service import MatchService
 from app.services.team_service import TeamService
 from app.schemas.match import (
-    MatchEventResponse, MatchEventCreate, MatchEventUpdate,
-    MatchInvitationResponse, MatchInvitationCreate, AttendanceRecordResponse,
-    MatchResultCreate, MatchResultResponse
+    MatchEventResponse, MatchEventCreate, MatchEventUpdate, MatchInvitationResponse,
+    MatchInvitationCreate, AttendanceRecordResponse, MatchResultCreate, MatchResultResponse,
+    AttendanceUpdateRequest
 )
 from app.schemas.common import MessageResponse
 from app.dependencies.auth import get_current_user
 from app.models.user import UserAccount
-from app.models.enums import Visibility
-from app.repositories.match_repository import InvitationRepository
+from app.models.enums import Visibility, MatchStatus, AttendanceStatus
+from app.repositories.match_repository import InvitationRepository, AttendanceRepository, ResultRepository
+from app.repositories.player_repository import PlayerRepository
+from app.repositories.team_repository import RosterRepository
 
 router = APIRouter()
 
@@ -95,9 +98,6 @@ async def update_match(
     team_service: TeamService = Depends(get_team_service)
 ):
     """Update match details."""
-    from datetime import date, time
-    from app.models.enums import Visibility, MatchStatus
-    
     match = await match_service.get_match_by_id(match_id)
     if not match:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Match not found")
@@ -168,6 +168,7 @@ async def get_team_invitations(
 @router.put("/{match_id}/cancel", response_model=MessageResponse)
 async def cancel_match(
     match_id: int,
+    background_tasks: BackgroundTasks,
     user: UserAccount = Depends(get_current_user),
     match_service: MatchService = Depends(get_match_service),
     team_service: TeamService = Depends(get_team_service)
@@ -181,7 +182,7 @@ async def cancel_match(
     if not team or team.leader_id != user.user_id:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not authorized")
     
-    await match_service.cancel_match(match)
+    await match_service.cancel_match(match, user.user_id, background_tasks)
     return MessageResponse(message="Match cancelled")
 
 
@@ -248,8 +249,6 @@ async def get_attendance(
     db: AsyncSession = Depends(get_db)
 ):
     """Get match attendance."""
-    from app.repositories.player_repository import PlayerRepository
-    
     records = await match_service.get_match_attendance(match_id)
     
     # Get player profiles to map player_id -> user_id
@@ -275,8 +274,6 @@ async def get_attendance(
     ]
 
 
-from app.schemas.match import AttendanceUpdateRequest
-
 @router.post("/{match_id}/attendance/confirm", response_model=AttendanceRecordResponse, status_code=status.HTTP_201_CREATED)
 async def confirm_attendance(
     match_id: int,
@@ -284,63 +281,25 @@ async def confirm_attendance(
     db: AsyncSession = Depends(get_db)
 ):
     """Player confirms own attendance for a match."""
-    from app.models.match import AttendanceRecord
-    from app.models.enums import AttendanceStatus
-    from app.repositories.match_repository import AttendanceRepository
-    from app.repositories.player_repository import PlayerRepository
-    from app.repositories.team_repository import RosterRepository
-    from datetime import datetime
-    
     player_repo = PlayerRepository(db)
     player = await player_repo.find_by_user_id(user.user_id)
     if not player:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Player profile required")
     
-    # Check if player is in a team for this match
-    roster_repo = RosterRepository(db)
-    roster_entries = await roster_repo.find_by_player(player.player_id)
-    
     match = await MatchService(db).get_match_by_id(match_id)
     if not match:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Match not found")
     
-    # Find team_id for player in this match
-    team_id = None
-    for entry in roster_entries:
-        if entry.team_id in [match.host_team_id, match.opponent_team_id]:
-            team_id = entry.team_id
-            break
-    
+    # Which of the two teams the player plays for
+    team_ids = [t for t in (match.host_team_id, match.opponent_team_id) if t]
+    team_id = await RosterRepository(db).find_team_of_player(player.player_id, team_ids)
     if not team_id:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not a player in this match")
     
-    attendance_repo = AttendanceRepository(db)
-    
-    # Check if already confirmed
-    existing = await db.execute(
-        select(AttendanceRecord).where(
-            AttendanceRecord.match_id == match_id,
-            AttendanceRecord.player_id == player.player_id
-        )
+    records = await MatchService(db).set_attendance(
+        match, team_id, {player.player_id: AttendanceStatus.PRESENT.value}, user.user_id
     )
-    record = existing.scalar_one_or_none()
-    
-    if record:
-        record.status = AttendanceStatus.PRESENT
-        record.confirmed_at = datetime.utcnow()
-        record.confirmed_by = user.user_id
-    else:
-        record = AttendanceRecord(
-            match_id=match_id,
-            player_id=player.player_id,
-            team_id=team_id,
-            status=AttendanceStatus.PRESENT,
-            confirmed_at=datetime.utcnow(),
-            confirmed_by=user.user_id,
-        )
-        db.add(record)
-    
-    await db.commit()
+    record = records[0]
     
     return AttendanceRecordResponse(
         attendanceId=record.attendance_id,
@@ -353,8 +312,6 @@ async def confirm_attendance(
     )
 
 
-from sqlalchemy import select
-
 @router.put("/{match_id}/attendance/{player_id}", response_model=AttendanceRecordResponse)
 async def update_attendance(
     match_id: int,
@@ -365,10 +322,6 @@ async def update_attendance(
     db: AsyncSession = Depends(get_db)
 ):
     """Update player attendance (team leader only)."""
-    from app.models.match import AttendanceRecord
-    from app.models.enums import AttendanceStatus
-    from datetime import datetime
-    
     match = await MatchService(db).get_match_by_id(match_id)
     if not match:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Match not found")
@@ -382,22 +335,17 @@ async def update_attendance(
     if not is_authorized:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not authorized")
     
-    result = await db.execute(
-        select(AttendanceRecord).where(
-            AttendanceRecord.match_id == match_id,
-            AttendanceRecord.player_id == player_id
-        )
-    )
-    record = result.scalar_one_or_none()
-    
-    if not record:
+    existing = await AttendanceRepository(db).find_by_match_and_players(match_id, [player_id])
+    if player_id not in existing:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Attendance record not found")
     
-    record.status = AttendanceStatus(data.status)
-    record.confirmed_at = datetime.utcnow()
-    record.confirmed_by = user.user_id
-    
-    await db.commit()
+    try:
+        records = await MatchService(db).set_attendance(
+            match, existing[player_id].team_id, {player_id: data.status}, user.user_id
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    record = records[0]
     
     return AttendanceRecordResponse(
         attendanceId=record.attendance_id,
@@ -410,8 +358,6 @@ async def update_attendance(
     )
 
 
-from pydantic import BaseModel
-
 class BatchAttendanceItem(BaseModel):
     playerId: int
     status: str
@@ -429,10 +375,6 @@ async def batch_update_attendance(
     db: AsyncSession = Depends(get_db)
 ):
     """Batch update attendance records (team leader only)."""
-    from app.models.match import AttendanceRecord
-    from app.models.enums import AttendanceStatus
-    from datetime import datetime
-    
     match = await MatchService(db).get_match_by_id(match_id)
     if not match:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Match not found")
@@ -452,36 +394,12 @@ async def batch_update_attendance(
     elif opponent_team and opponent_team.leader_id == user.user_id:
         leader_team_id = opponent_team.team_id
     
-    updated_records = []
-    for item in data.records:
-        result = await db.execute(
-            select(AttendanceRecord).where(
-                AttendanceRecord.match_id == match_id,
-                AttendanceRecord.player_id == item.playerId
-            )
-        )
-        record = result.scalar_one_or_none()
-        
-        if record:
-            # Update existing record
-            record.status = AttendanceStatus(item.status)
-            record.confirmed_at = datetime.utcnow()
-            record.confirmed_by = user.user_id
-            updated_records.append(record)
-        else:
-            # Create new attendance record
-            new_record = AttendanceRecord(
-                match_id=match_id,
-                player_id=item.playerId,
-                team_id=leader_team_id,
-                status=AttendanceStatus(item.status),
-                confirmed_at=datetime.utcnow(),
-                confirmed_by=user.user_id,
-            )
-            db.add(new_record)
-            updated_records.append(new_record)
-    
-    await db.commit()
+    # Later entries for the same player win
+    statuses = {item.playerId: item.status for item in data.records}
+    try:
+        updated_records = await MatchService(db).set_attendance(match, leader_team_id, statuses, user.user_id)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
     
     return [
         AttendanceRecordResponse(
@@ -510,26 +428,14 @@ async def get_attendance_stats(
     match_service: MatchService = Depends(get_match_service)
 ):
     """Get attendance statistics for a match."""
-    records = await match_service.get_match_attendance(match_id)
-    
-    stats = {
-        "present": 0,
-        "absent": 0,
-        "pending": 0,
-        "excused": 0,
-    }
-    
-    for r in records:
-        status_val = r.status.value.lower()
-        if status_val in stats:
-            stats[status_val] += 1
+    counts = await match_service.get_attendance_counts(match_id)
     
     return AttendanceStatsResponse(
-        totalPlayers=len(records),
-        confirmed=stats["present"],  # Present = confirmed
-        declined=stats["absent"],  # Absent = declined
-        pending=stats["pending"],
-        absent=stats["absent"] + stats["excused"],
+        totalPlayers=sum(counts.values()),
+        confirmed=counts[AttendanceStatus.PRESENT],  # Present = confirmed
+        declined=counts[AttendanceStatus.ABSENT],  # Absent = declined
+        pending=counts[AttendanceStatus.PENDING],
+        absent=counts[AttendanceStatus.ABSENT] + counts[AttendanceStatus.EXCUSED],
     )
 
 
@@ -555,12 +461,9 @@ async def record_result(
     data: MatchResultCreate,
     user: UserAccount = Depends(get_current_user),
     match_service: MatchService = Depends(get_match_service),
-    team_service: TeamService = Depends(get_team_service),
-    db: AsyncSession = Depends(get_db)
+    team_service: TeamService = Depends(get_team_service)
 ):
     """Record match result."""
-    from app.models.match import MatchResult
-    
     match = await match_service.get_match_by_id(match_id)
     if not match:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Match not found")
@@ -574,30 +477,12 @@ async def record_result(
     if not is_authorized:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not authorized")
     
-    # Check if result already exists
-    from app.repositories.match_repository import ResultRepository
-    result_repo = ResultRepository(db)
-    existing = await result_repo.find_by_match(match_id)
-    if existing:
-        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Result already recorded")
-    
-    # Determine winner
-    winner_id = None
-    if data.homeScore > data.awayScore:
-        winner_id = match.host_team_id
-    elif data.awayScore > data.homeScore:
-        winner_id = match.opponent_team_id
-    
-    result = MatchResult(
-        match_id=match_id,
-        home_score=data.homeScore,
-        away_score=data.awayScore,
-        winner_id=winner_id,
-        notes=data.notes,
-        recorded_by=user.user_id,
-    )
-    await result_repo.save(result)
-    await result_repo.commit()
+    try:
+        result = await match_service.record_result(
+            match, data.homeScore, data.awayScore, user.user_id, data.notes
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
     
     return result_to_response(result)
 
@@ -608,8 +493,6 @@ async def get_result(
     db: AsyncSession = Depends(get_db)
 ):
     """Get match result."""
-    from app.repositories.match_repository import ResultRepository
-    
     result_repo = ResultRepository(db)
     result = await result_repo.find_by_match(match_id)
     
@@ -0,0 +1,63 @@
+"""
+MatchmakingController - Opponent suggestion HTTP endpoints.
+Candidates are served from the in-memory OpponentIndex.
+"""
+from datetime import date
+from typing import List, Optional
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy.ext.asyncio import AsyncSession
+from pydantic import BaseModel
+
+from app.database import get_db
+from app.dependencies.auth import get_current_user
+from app.models.user import UserAccount
+from app.repositories.team_repository import TeamRepository
+from app.services.matchmaking_service import MatchmakingService, DEFAULT_RADIUS_KM
+
+router = APIRouter()
+
+
+class OpponentResponse(BaseModel):
+    """A suggested opponent, best first."""
+    teamId: int
+    teamName: str
+    location: Optional[str] = None
+    skillLevel: Optional[int] = None
+    rating: float
+    distanceKm: float
+    score: float
+
+
+@router.get("/teams/{team_id}/opponents", response_model=List[OpponentResponse])
+async def find_opponents(
+    team_id: int,
+    matchDate: date = Query(..., description="Proposed match day; teams already playing that day are left out"),
+    radiusKm: float = Query(DEFAULT_RADIUS_KM, gt=0, le=200),
+    limit: int = Query(10, ge=1, le=50),
+    user: UserAccount = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
+):
+    """Opponents for a team (leader only), ranked by rating balance and distance."""
+    team = await TeamRepository(db).find_by_id(team_id)
+    if not team:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Team not found")
+    if team.leader_id != user.user_id:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not authorized")
+    
+    try:
+        opponents = await MatchmakingService(db).find_opponents(team, matchDate, radiusKm, limit)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    
+    return [
+        OpponentResponse(
+            teamId=o["team_id"],
+            teamName=o["team_name"],
+            location=o["location"],
+            skillLevel=o["skill_level"],
+            rating=round(o["rating"], 1),
+            distanceKm=round(o["distance_km"], 2),
+            score=round(o["score"], 4),
+        )
+        for o in opponents
+    ]
@@ -9,18 +9,28 @@ from pydantic import BaseModel
 import os
 import uuid
 from datetime import datetime
+from urllib.parse import urlparse
 
 from app.database import get_db
 from app.dependencies.auth import get_current_user
 from app.models.user import UserAccount
 from app.models.media import MediaAsset
 from app.models.enums import MediaType, MediaOwnerType
+from app.utils.http_cache import get_response_cache
+from app.repositories.field_repository import FieldRepository
 
 router = APIRouter()
 
 # Storage path for uploads
 UPLOAD_DIR = os.path.join(os.path.dirname(__file__), "..", "..", "uploads")
 
+# Response cache key prefix of the entity each media owner type belongs to
+CACHED_OWNER_TYPES = {
+    MediaOwnerType.TEAM: "team",
+    MediaOwnerType.FIELD: "field",
+    MediaOwnerType.PLAYER: "player",
+}
+
 
 class MediaAssetResponse(BaseModel):
     """Media asset response."""
@@ -177,7 +187,6 @@ async def delete_media(
     
     # Also allow entity owner to delete (e.g., field owner can delete field photos)
     if not is_authorized and asset.owner_type == MediaOwnerType.FIELD:
-        from app.repositories.field_repository import FieldRepository
         field_repo = FieldRepository(db)
         field = await field_repo.find_by_id(asset.entity_id)
         if field and field.owner_id == user.user_id:
@@ -195,6 +204,11 @@ async def delete_media(
     await db.delete(asset)
     await db.commit()
     
+    # The asset may have been a logo, cover or avatar (FKs are SET NULL)
+    cache_prefix = CACHED_OWNER_TYPES.get(asset.owner_type)
+    if cache_prefix:
+        get_response_cache().invalidate(f"{cache_prefix}:{asset.entity_id}")
+    
     return {"message": "Media asset deleted"}
 
 
@@ -213,7 +227,6 @@ async def add_media_by_url(
 ):
     """Add a media asset by URL (external image)."""
     # Validate URL
-    from urllib.parse import urlparse
     parsed = urlparse(data.url)
     if not parsed.scheme in ('http', 'https'):
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid URL scheme")
@@ -4,20 +4,30 @@ Handles reports, team/field verification, user management.
 """
 from typing import List, Optional
 from datetime import datetime
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, HTTPException, Response, status, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 from pydantic import BaseModel
 
 from app.database import get_db
 from app.dependencies.auth import get_current_user
-from app.models.user import UserAccount
-from app.models.moderation import Report, ModerationLog
+from app.utils.http_cache import get_response_cache
+from app.services.moderation_stats_service import (
+    ModerationStatsService, PENDING_REPORTS, PENDING_TEAMS, PENDING_FIELDS, TOTAL_USERS
+)
+from app.models.user import UserAccount, ROLE_BITS
+from app.repositories.user_repository import UserRepository
+from app.repositories.team_repository import TeamRepository
+from app.repositories.field_repository import FieldRepository
+from app.repositories.moderation_repository import ReportRepository, ReportCaseRepository, ModerationLogRepository
+from app.utils.keyset import NEXT_CURSOR_HEADER, decode_cursor, next_cursor
+from app.models.moderation import Report, ReportCase, ModerationLog
 from app.models.team import TeamProfile
 from app.models.field import FieldProfile
 from app.models.enums import (
     ReportContentType, ReportStatus, ModerationAction,
-    TeamStatus, FieldStatus, UserRole
+    TeamStatus, FieldStatus, UserRole,
+    AccountStatus,
 )
 
 router = APIRouter()
@@ -38,6 +48,26 @@ class ReportResponse(BaseModel):
     resolvedAt: Optional[str]
 
 
+class ReportQueueResponse(ReportResponse):
+    priority: int  # Users reporting the same content or user in its open case
+
+
+class ReportCaseResponse(BaseModel):
+    caseId: int
+    contentId: Optional[int]
+    contentType: str
+    reportedUserId: Optional[int]
+    reportCount: int
+    status: str
+    createdAt: str
+    latestReportAt: str
+    resolvedAt: Optional[str]
+
+
+class ReportCaseDetailResponse(ReportCaseResponse):
+    reports: List[ReportResponse]  # Most recent first
+
+
 class ReportCreate(BaseModel):
     reportedUserId: Optional[int] = None
     contentId: Optional[int] = None
@@ -100,10 +130,45 @@ def report_to_response(r: Report) -> ReportResponse:
     )
 
 
+def case_to_response(c: ReportCase) -> ReportCaseResponse:
+    return ReportCaseResponse(
+        caseId=c.case_id,
+        contentId=c.content_id,
+        contentType=c.content_type.value,
+        reportedUserId=c.reported_user_id,
+        reportCount=c.report_count,
+        status=c.status.value,
+        createdAt=c.created_at.isoformat(),
+        latestReportAt=c.latest_report_at.isoformat(),
+        resolvedAt=c.resolved_at.isoformat() if c.resolved_at else None,
+    )
+
+
+def log_to_response(l: ModerationLog) -> ModerationLogResponse:
+    return ModerationLogResponse(
+        logId=l.log_id,
+        moderatorId=l.moderator_id,
+        targetUserId=l.target_user_id,
+        action=l.action.value,
+        reason=l.reason,
+        details=l.details,
+        createdAt=l.created_at.isoformat(),
+    )
+
+
+def parse_cursor(cursor: Optional[str], *types: type) -> Optional[tuple]:
+    """Sort key of a queue cursor, or None for the first page; 400 if it is not valid."""
+    if not cursor:
+        return None
+    try:
+        return decode_cursor(cursor, *types)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+
 async def require_moderator(user: UserAccount):
     """Check if user has moderator role."""
-    # UserAccount uses 'roles' (list) not 'role'
-    if UserRole.MODERATOR.value not in user.roles:
+    if not user.has_role(UserRole.MODERATOR.value):
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Moderator access required")
 
 
@@ -125,30 +190,49 @@ async def create_report(
         details=data.details,
         status=ReportStatus.PENDING,
     )
+    await ReportCaseRepository(db).add_report(report)
     db.add(report)
+    await ModerationStatsService(db).adjust(PENDING_REPORTS, 1)
     await db.commit()
     
     return report_to_response(report)
 
 
-@router.get("/reports", response_model=List[ReportResponse])
+@router.get("/reports", response_model=List[ReportQueueResponse])
 async def get_reports(
+    response: Response,
     status_filter: Optional[str] = Query(None, alias="status"),
-    limit: int = Query(50, le=100),
+    sort: str = Query(
+        "age", pattern="^(age|priority)$",
+        description="age: oldest first; priority: reports of open cases, most reported case first",
+    ),
+    cursor: Optional[str] = Query(None, description="X-Next-Cursor from the previous page"),
+    limit: int = Query(50, ge=1, le=100),
     user: UserAccount = Depends(get_current_user),
     db: AsyncSession = Depends(get_db)
 ):
-    """Get all reports (moderator only)."""
+    """Get the report queue a page at a time (moderator only)."""
     await require_moderator(user)
     
-    stmt = select(Report).order_by(Report.created_at.desc()).limit(limit)
-    if status_filter:
-        stmt = stmt.where(Report.status == ReportStatus(status_filter))
+    by_priority = sort == "priority"
+    after = parse_cursor(cursor, *((int, int) if by_priority else ()), datetime, int)
+    rows = await ReportRepository(db).find_queue(
+        status=ReportStatus(status_filter) if status_filter else None,
+        by_priority=by_priority,
+        after=after,
+        limit=limit,
+    )
     
-    result = await db.execute(stmt)
-    reports = result.scalars().all()
+    next_page = next_cursor(
+        rows, limit,
+        lambda row: ((row[1], row[0].case_id) if by_priority else ()) + (row[0].created_at, row[0].report_id)
+    )
+    if next_page:
+        response.headers[NEXT_CURSOR_HEADER] = next_page
     
-    return [report_to_response(r) for r in reports]
+    return [
+        ReportQueueResponse(**report_to_response(r).model_dump(), priority=priority) for r, priority in rows
+    ]
 
 
 @router.get("/reports/{report_id}", response_model=ReportResponse)
@@ -185,27 +269,114 @@ async def resolve_report(
     if not report:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Report not found")
     
-    report.status = ReportStatus.RESOLVED if action == "resolve" else ReportStatus.DISMISSED
+    new_status = ReportStatus.RESOLVED if action == "resolve" else ReportStatus.DISMISSED
+    was_pending = report.status == ReportStatus.PENDING
+    report.status = new_status
     report.resolved_at = datetime.utcnow()
+    await ReportRepository(db).update(report)
+    if was_pending:
+        await ModerationStatsService(db).adjust(PENDING_REPORTS, -1)
+        if report.case_id:
+            await ReportCaseRepository(db).remove_report(report.case_id, new_status)
     await db.commit()
     
     return report_to_response(report)
 
 
+# --- Report Case Endpoints ---
+
+@router.get("/cases", response_model=List[ReportCaseResponse])
+async def get_report_cases(
+    response: Response,
+    status_filter: Optional[str] = Query("Pending", alias="status"),
+    sort: str = Query("age", pattern="^(age|priority)$", description="age: oldest first; priority: most reported first"),
+    cursor: Optional[str] = Query(None, description="X-Next-Cursor from the previous page"),
+    limit: int = Query(50, ge=1, le=100),
+    user: UserAccount = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
+):
+    """Get the queue of report cases, one per reported target, a page at a time (moderator only)."""
+    await require_moderator(user)
+    
+    by_priority = sort == "priority"
+    after = parse_cursor(cursor, *((int,) if by_priority else ()), datetime, int)
+    cases = await ReportCaseRepository(db).find_queue(
+        status=ReportStatus(status_filter) if status_filter else None,
+        by_priority=by_priority,
+        after=after,
+        limit=limit,
+    )
+    
+    next_page = next_cursor(
+        cases, limit, lambda c: ((c.report_count,) if by_priority else ()) + (c.created_at, c.case_id)
+    )
+    if next_page:
+        response.headers[NEXT_CURSOR_HEADER] = next_page
+    
+    return [case_to_response(c) for c in cases]
+
+
+@router.get("/cases/{case_id}", response_model=ReportCaseDetailResponse)
+async def get_report_case(
+    case_id: int,
+    user: UserAccount = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
+):
+    """Get a report case with its most recent reports (moderator only)."""
+    await require_moderator(user)
+    
+    case_repo = ReportCaseRepository(db)
+    case = await case_repo.find_by_id(case_id)
+    if not case:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Report case not found")
+    
+    reports = await case_repo.find_reports(case_id)
+    return ReportCaseDetailResponse(
+        **case_to_response(case).model_dump(),
+        reports=[report_to_response(r) for r in reports],
+    )
+
+
+@router.put("/cases/{case_id}/resolve", response_model=ReportCaseResponse)
+async def resolve_report_case(
+    case_id: int,
+    action: str = Query(...),
+    user: UserAccount = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
+):
+    """Resolve or dismiss a case and every pending report in it (moderator only)."""
+    await require_moderator(user)
+    
+    case_repo = ReportCaseRepository(db)
+    case = await case_repo.find_by_id(case_id)
+    if not case:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Report case not found")
+    
+    closed = await case_repo.resolve(case, ReportStatus.RESOLVED if action == "resolve" else ReportStatus.DISMISSED)
+    if closed:
+        await ModerationStatsService(db).adjust(PENDING_REPORTS, -closed)
+    await db.commit()
+    
+    return case_to_response(case)
+
+
 # --- Team Verification Endpoints ---
 
 @router.get("/teams/pending", response_model=List[dict])
 async def get_pending_teams(
+    response: Response,
+    cursor: Optional[str] = Query(None, description="X-Next-Cursor from the previous page"),
+    limit: int = Query(50, ge=1, le=100),
     user: UserAccount = Depends(get_current_user),
     db: AsyncSession = Depends(get_db)
 ):
-    """Get teams pending verification (moderator only)."""
+    """Get teams pending verification, oldest first, a page at a time (moderator only)."""
     await require_moderator(user)
     
-    result = await db.execute(
-        select(TeamProfile).where(TeamProfile.status == TeamStatus.PENDING)
-    )
-    teams = result.scalars().all()
+    teams = await TeamRepository(db).find_pending(parse_cursor(cursor, datetime, int), limit)
+    next_page = next_cursor(teams, limit, lambda t: (t.created_at, t.team_id))
+    if next_page:
+        response.headers[NEXT_CURSOR_HEADER] = next_page
     
     return [
         {
@@ -264,6 +435,8 @@ async def verify_team(
     if not team:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Team not found")
     
+    if team.status == TeamStatus.PENDING:
+        await ModerationStatsService(db).adjust(PENDING_TEAMS, -1)
     if data.approved:
         team.status = TeamStatus.VERIFIED
     else:
@@ -271,6 +444,7 @@ async def verify_team(
         team.rejection_reason = data.rejectionReason
     
     await db.commit()
+    get_response_cache().invalidate(f"team:{team_id}")
     
     return {"message": f"Team {'verified' if data.approved else 'rejected'}"}
 
@@ -279,16 +453,19 @@ async def verify_team(
 
 @router.get("/fields/pending", response_model=List[dict])
 async def get_pending_fields(
+    response: Response,
+    cursor: Optional[str] = Query(None, description="X-Next-Cursor from the previous page"),
+    limit: int = Query(50, ge=1, le=100),
     user: UserAccount = Depends(get_current_user),
     db: AsyncSession = Depends(get_db)
 ):
-    """Get fields pending verification (moderator only)."""
+    """Get fields pending verification, oldest first, a page at a time (moderator only)."""
     await require_moderator(user)
     
-    result = await db.execute(
-        select(FieldProfile).where(FieldProfile.status == FieldStatus.PENDING)
-    )
-    fields = result.scalars().all()
+    fields = await FieldRepository(db).find_pending(parse_cursor(cursor, datetime, int), limit)
+    next_page = next_cursor(fields, limit, lambda f: (f.created_at, f.field_id))
+    if next_page:
+        response.headers[NEXT_CURSOR_HEADER] = next_page
     
     return [
         {
@@ -349,6 +526,8 @@ async def verify_field(
     if not field:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Field not found")
     
+    if field.status == FieldStatus.PENDING:
+        await ModerationStatsService(db).adjust(PENDING_FIELDS, -1)
     if data.approved:
         field.status = FieldStatus.VERIFIED
     else:
@@ -356,6 +535,7 @@ async def verify_field(
         field.rejection_reason = data.rejectionReason
     
     await db.commit()
+    get_response_cache().invalidate(f"field:{field_id}")
     
     return {"message": f"Field {'verified' if data.approved else 'rejected'}"}
 
@@ -364,41 +544,35 @@ async def verify_field(
 
 @router.get("/users", response_model=List[UserSummaryResponse])
 async def get_users(
+    response: Response,
     query: Optional[str] = Query(None),
     role: Optional[str] = Query(None),
     status_filter: Optional[str] = Query(None, alias="status"),
-    limit: int = Query(50, le=100),
+    cursor: Optional[str] = Query(None, description="X-Next-Cursor from the previous page"),
+    limit: int = Query(50, ge=1, le=100),
     user: UserAccount = Depends(get_current_user),
     db: AsyncSession = Depends(get_db)
 ):
-    """Get all users (moderator only)."""
+    """Get users in ID order, a page at a time (moderator only)."""
     await require_moderator(user)
     
-    from app.models.enums import AccountStatus
-    from sqlalchemy import or_
-    
-    stmt = select(UserAccount)
-    
-    # Filter by query (username or email) if provided
-    if query:
-        search_pattern = f"%{query}%"
-        stmt = stmt.where(
-            or_(
-                UserAccount.username.ilike(search_pattern),
-                UserAccount.email.ilike(search_pattern)
-            )
+    if role and role not in ROLE_BITS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Unknown role '{role}'; expected one of {', '.join(ROLE_BITS)}"
         )
     
-    # Filter by status if provided
-    if status_filter:
-        stmt = stmt.where(UserAccount.status == AccountStatus(status_filter))
-    
-    # Note: role filtering with JSON column is complex, skip for now
-    
-    stmt = stmt.limit(limit)
-    
-    result = await db.execute(stmt)
-    users = result.scalars().all()
+    after = parse_cursor(cursor, int)
+    users = await UserRepository(db).find_page(
+        query=query,
+        role_bits=ROLE_BITS[role] if role else 0,
+        status=AccountStatus(status_filter) if status_filter else None,
+        after_id=after[0] if after else None,
+        limit=limit,
+    )
+    next_page = next_cursor(users, limit, lambda u: (u.user_id,))
+    if next_page:
+        response.headers[NEXT_CURSOR_HEADER] = next_page
     
     return [
         UserSummaryResponse(
@@ -452,8 +626,13 @@ async def update_user_role(
     
     if not target_user:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found")
+    if data.role not in ROLE_BITS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Unknown role '{data.role}'; expected one of {', '.join(ROLE_BITS)}"
+        )
     
-    target_user.roles = [data.role]  # Set roles list with new role
+    target_user.roles = [data.role]  # Set roles list with new role (and role_mask)
     await db.commit()
     
     # Log the action
@@ -485,7 +664,6 @@ async def suspend_user(
     if not target_user:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found")
     
-    from app.models.enums import AccountStatus
     target_user.status = AccountStatus.SUSPENDED
     
     # Log the action
@@ -524,7 +702,6 @@ async def ban_user(
     if not target_user:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found")
     
-    from app.models.enums import AccountStatus
     target_user.status = AccountStatus.BANNED
     
     # Log the action
@@ -563,7 +740,6 @@ async def reactivate_user(
     if not target_user:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found")
     
-    from app.models.enums import AccountStatus
     target_user.status = AccountStatus.ACTIVE
     
     # Log the action
@@ -617,62 +793,46 @@ async def get_user_history(
 
 # --- Moderation Log Endpoints ---
 
+async def _log_page(
+    response: Response, db: AsyncSession, action: Optional[str], cursor: Optional[str], limit: int
+) -> List[ModerationLogResponse]:
+    after = parse_cursor(cursor, int)
+    logs = await ModerationLogRepository(db).find_page(
+        action=ModerationAction(action) if action else None,
+        before_id=after[0] if after else None,
+        limit=limit,
+    )
+    next_page = next_cursor(logs, limit, lambda l: (l.log_id,))
+    if next_page:
+        response.headers[NEXT_CURSOR_HEADER] = next_page
+    return [log_to_response(l) for l in logs]
+
+
 @router.get("/logs", response_model=List[ModerationLogResponse])
 async def get_moderation_logs(
-    limit: int = Query(50, le=100),
+    response: Response,
+    cursor: Optional[str] = Query(None, description="X-Next-Cursor from the previous page"),
+    limit: int = Query(50, ge=1, le=100),
     user: UserAccount = Depends(get_current_user),
     db: AsyncSession = Depends(get_db)
 ):
-    """Get moderation action logs (moderator only)."""
+    """Get moderation action logs, newest first, a page at a time (moderator only)."""
     await require_moderator(user)
-    
-    result = await db.execute(
-        select(ModerationLog).order_by(ModerationLog.created_at.desc()).limit(limit)
-    )
-    logs = result.scalars().all()
-    
-    return [
-        ModerationLogResponse(
-            logId=l.log_id,
-            moderatorId=l.moderator_id,
-            targetUserId=l.target_user_id,
-            action=l.action.value,
-            reason=l.reason,
-            details=l.details,
-            createdAt=l.created_at.isoformat(),
-        ) for l in logs
-    ]
+    return await _log_page(response, db, None, cursor, limit)
 
 
 @router.get("/history", response_model=List[ModerationLogResponse])
 async def get_moderation_history(
+    response: Response,
     action: Optional[str] = Query(None),
-    limit: int = Query(50, le=100),
+    cursor: Optional[str] = Query(None, description="X-Next-Cursor from the previous page"),
+    limit: int = Query(50, ge=1, le=100),
     user: UserAccount = Depends(get_current_user),
     db: AsyncSession = Depends(get_db)
 ):
     """Get moderation history (alias for /logs, moderator only)."""
     await require_moderator(user)
-    
-    stmt = select(ModerationLog).order_by(ModerationLog.created_at.desc()).limit(limit)
-    
-    if action:
-        stmt = stmt.where(ModerationLog.action == ModerationAction(action))
-    
-    result = await db.execute(stmt)
-    logs = result.scalars().all()
-    
-    return [
-        ModerationLogResponse(
-            logId=l.log_id,
-            moderatorId=l.moderator_id,
-            targetUserId=l.target_user_id,
-            action=l.action.value,
-            reason=l.reason,
-            details=l.details,
-            createdAt=l.created_at.isoformat(),
-        ) for l in logs
-    ]
+    return await _log_page(response, db, action, cursor, limit)
 
 
 @router.get("/logs/user/{user_id}", response_model=List[ModerationLogResponse])
@@ -714,26 +874,29 @@ async def get_moderation_stats(
     """Get moderation dashboard statistics (moderator only)."""
     await require_moderator(user)
     
-    from sqlalchemy import func
+    stats = await ModerationStatsService(db).get_stats()
     
-    # Pending reports
-    pending_reports = await db.execute(
-        select(func.count(Report.report_id)).where(Report.status == ReportStatus.PENDING)
-    )
-    # Pending teams
-    pending_teams = await db.execute(
-        select(func.count(TeamProfile.team_id)).where(TeamProfile.status == TeamStatus.PENDING)
-    )
-    # Pending fields
-    pending_fields = await db.execute(
-        select(func.count(FieldProfile.field_id)).where(FieldProfile.status == FieldStatus.PENDING)
-    )
-    # Total users
-    total_users = await db.execute(select(func.count(UserAccount.user_id)))
+    return {
+        "pendingReports": stats[PENDING_REPORTS],
+        "pendingTeams": stats[PENDING_TEAMS],
+        "pendingFields": stats[PENDING_FIELDS],
+        "totalUsers": stats[TOTAL_USERS],
+    }
+
+
+@router.post("/stats/reconcile", response_model=dict)
+async def reconcile_moderation_stats(
+    user: UserAccount = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
+):
+    """Recompute dashboard counters from the source tables (moderator only)."""
+    await require_moderator(user)
+    
+    stats = await ModerationStatsService(db).reconcile()
     
     return {
-        "pendingReports": pending_reports.scalar() or 0,
-        "pendingTeams": pending_teams.scalar() or 0,
-        "pendingFields": pending_fields.scalar() or 0,
-        "totalUsers": total_users.scalar() or 0,
+        "pendingReports": stats[PENDING_REPORTS],
+        "pendingTeams": stats[PENDING_TEAMS],
+        "pendingFields": stats[PENDING_FIELDS],
+        "totalUsers": stats[TOTAL_USERS],
     }
@@ -2,26 +2,35 @@
 NotificationController - Notification HTTP endpoints.
 Thin controller that delegates to NotificationService.
 """
-from typing import List
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.ext.asyncio import AsyncSession
+import asyncio
+import json
+from typing import Awaitable, Callable, List, Optional
+from fastapi import APIRouter, Depends, Header, HTTPException, Request, status, Query
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from pydantic import BaseModel
+from sqlalchemy import select
 
-from app.database import get_db
-from app.services.notification_service import NotificationService
-from app.schemas.notification import NotificationResponse
+from app.config import get_settings
+from app.database import get_db, get_session_factory
+from app.services.notification_service import NotificationService, notification_event, unread_count_event
+from app.services.notification_hub import NotificationHub, get_notification_hub
+from app.schemas.notification import NotificationResponse, NotificationBatchReadRequest
 from app.schemas.common import MessageResponse
-from app.dependencies.auth import get_current_user
+from app.dependencies.auth import get_current_user, get_current_user_stream
 from app.models.user import UserAccount
+from app.models.notification import NotificationPreference
 
 router = APIRouter()
 
+# Backlog rows read per query when a stream catches up
+CATCH_UP_PAGE_SIZE = 100
+
 
 def get_notification_service(db: AsyncSession = Depends(get_db)) -> NotificationService:
     return NotificationService(db)
 
 
-from fastapi import Query
-
 @router.get("", response_model=List[NotificationResponse])
 async def get_notifications(
     unread_only: bool = Query(False, alias="unreadOnly"),
@@ -45,9 +54,7 @@ async def get_notifications(
     ]
 
 
-from pydantic import BaseModel as PydanticBaseModel
-
-class UnreadCountResponse(PydanticBaseModel):
+class UnreadCountResponse(BaseModel):
     """Unread notification count response."""
     count: int
 
@@ -58,8 +65,113 @@ async def get_unread_count(
     notification_service: NotificationService = Depends(get_notification_service)
 ):
     """Get unread notification count."""
-    notifications = await notification_service.get_notifications(user.user_id, unread_only=True)
-    return UnreadCountResponse(count=len(notifications))
+    count = await notification_service.get_unread_count(user.user_id)
+    return UnreadCountResponse(count=count)
+
+
+# --- Server-sent events ---
+
+def format_sse(event: str, data: dict, event_id: int = None) -> str:
+    """Format one server-sent event frame."""
+    frame = f"id: {event_id}\n" if event_id is not None else ""
+    return frame + f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
+
+async def notification_event_stream(
+    hub: NotificationHub,
+    user_id: int,
+    session_factory: async_sessionmaker,
+    is_disconnected: Callable[[], Awaitable[bool]],
+    last_event_id: Optional[int] = None,
+    heartbeat_interval: float = 15,
+):
+    """
+    Yield SSE frames for a user's notifications.
+    
+    Subscribes before reading the backlog so nothing created in between is
+    lost; events already covered by the backlog are skipped by ID. When the
+    subscription overflows, buffered events are discarded and the stream
+    catches up from the database instead.
+    """
+    subscription = hub.subscribe(user_id)
+    
+    async def catch_up(after_id: Optional[int]):
+        async with session_factory() as session:
+            service = NotificationService(session, hub)
+            backlog = []
+            if after_id is None:
+                latest_id = await service.get_latest_notification_id(user_id)
+            else:
+                # Page until a short page, however many were missed
+                latest_id = after_id
+                while True:
+                    page = await service.get_notifications_since(user_id, latest_id, CATCH_UP_PAGE_SIZE)
+                    backlog.extend(page)
+                    if page:
+                        latest_id = page[-1].notification_id
+                    if len(page) < CATCH_UP_PAGE_SIZE:
+                        break
+            count = await service.get_unread_count(user_id)
+        frames = [
+            format_sse("notification", event["data"], event["id"])
+            for event in map(notification_event, backlog)
+        ]
+        frames.append(format_sse("unread_count", unread_count_event(count)["data"]))
+        return frames, latest_id
+    
+    try:
+        frames, last_sent_id = await catch_up(last_event_id)
+        for frame in frames:
+            yield frame
+        
+        while not await is_disconnected():
+            if subscription.overflowed:
+                subscription.drain()
+                frames, last_sent_id = await catch_up(last_sent_id)
+                for frame in frames:
+                    yield frame
+                continue
+            
+            try:
+                event = await asyncio.wait_for(subscription.queue.get(), timeout=heartbeat_interval)
+            except asyncio.TimeoutError:
+                yield ": heartbeat\n\n"
+                continue
+            
+            event_id = event.get("id")
+            if event_id is not None:
+                if event_id <= last_sent_id:
+                    continue
+                last_sent_id = event_id
+            yield format_sse(event["event"], event["data"], event_id)
+    finally:
+        hub.unsubscribe(subscription)
+
+
+@router.get("/stream")
+async def stream_notifications(
+    request: Request,
+    last_event_id: Optional[int] = Header(None, alias="Last-Event-ID"),
+    user: UserAccount = Depends(get_current_user_stream),
+    session_factory: async_sessionmaker = Depends(get_session_factory)
+):
+    """
+    Stream new notifications and unread-count changes as server-sent events.
+    Reconnecting clients resume from the Last-Event-ID header.
+    """
+    stream = notification_event_stream(
+        get_notification_hub(),
+        user.user_id,
+        session_factory,
+        request.is_disconnected,
+        last_event_id=last_event_id,
+        heartbeat_interval=get_settings().notification_stream_heartbeat_seconds,
+    )
+    return StreamingResponse(
+        stream,
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
 
 
 @router.put("/{notification_id}/read", response_model=MessageResponse)
@@ -69,10 +181,21 @@ async def mark_as_read(
     notification_service: NotificationService = Depends(get_notification_service)
 ):
     """Mark notification as read."""
-    await notification_service.mark_as_read(notification_id)
+    await notification_service.mark_as_read(notification_id, user.user_id)
     return MessageResponse(message="Marked as read")
 
 
+@router.put("/read", response_model=MessageResponse)
+async def mark_many_as_read(
+    data: NotificationBatchReadRequest,
+    user: UserAccount = Depends(get_current_user),
+    notification_service: NotificationService = Depends(get_notification_service)
+):
+    """Mark several notifications as read."""
+    count = await notification_service.mark_many_as_read(data.notificationIds, user.user_id)
+    return MessageResponse(message=f"Marked {count} notifications as read")
+
+
 @router.put("/mark-all-read", response_model=MessageResponse)
 async def mark_all_read(
     user: UserAccount = Depends(get_current_user),
@@ -84,9 +207,6 @@ async def mark_all_read(
 
 
 # --- Notification Preferences ---
-from pydantic import BaseModel
-from typing import Optional
-from sqlalchemy import select
 
 class NotificationPreferencesResponse(BaseModel):
     """Notification preferences response."""
@@ -116,8 +236,6 @@ async def get_preferences(
     db: AsyncSession = Depends(get_db)
 ):
     """Get notification preferences."""
-    from app.models.notification import NotificationPreference
-    
     result = await db.execute(
         select(NotificationPreference).where(NotificationPreference.user_id == user.user_id)
     )
@@ -156,8 +274,6 @@ async def update_preferences(
     db: AsyncSession = Depends(get_db)
 ):
     """Update notification preferences."""
-    from app.models.notification import NotificationPreference
-    
     result = await db.execute(
         select(NotificationPreference).where(NotificationPreference.user_id == user.user_id)
     )
@@ -1,36 +1,29 @@
 """
 PlayerController - Player profile HTTP endpoints.
 """
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, status, Request
 from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List
 
 from app.database import get_db
 from app.repositories.player_repository import PlayerRepository
-from app.schemas.player import PlayerProfileResponse, PlayerProfileUpdate
+from app.schemas.player import (
+    PlayerProfileResponse, PLAYER_PROFILE_SERIALIZER, PlayerProfileUpdate, PlayerStatsResponse
+)
 from app.dependencies.auth import get_current_user
 from app.models.user import UserAccount
+from app.utils.http_cache import get_response_cache, cached_response
+from app.schemas.match import MatchEventResponse
+from app.models.media import MediaAsset
+from app.models.enums import MediaType, MediaOwnerType
+from app.repositories.team_repository import RosterRepository
+from app.schemas.team import TeamRosterResponse
+from app.repositories.match_repository import MatchRepository
+from app.services.stats_service import StatsService
 
 router = APIRouter()
 
 
-def player_to_response(p) -> PlayerProfileResponse:
-    return PlayerProfileResponse(
-        playerId=p.player_id,
-        userId=p.user_id,
-        displayName=p.display_name,
-        position=p.position,
-        skillLevel=p.skill_level,
-        bio=p.bio,
-        profileImage=p.profile_image.storage_path if p.profile_image else None,
-        dateOfBirth=p.date_of_birth.isoformat() if p.date_of_birth else None,
-        height=p.height,
-        weight=p.weight,
-        preferredFoot=p.preferred_foot.value if p.preferred_foot else None,
-        createdAt=p.created_at.isoformat(),
-        updatedAt=p.updated_at.isoformat(),
-    )
-
-
 @router.get("/profile", response_model=PlayerProfileResponse)
 async def get_my_profile(
     user: UserAccount = Depends(get_current_user),
@@ -43,7 +36,7 @@ async def get_my_profile(
     if not profile:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Player profile not found")
     
-    return player_to_response(profile)
+    return PLAYER_PROFILE_SERIALIZER.to_model(profile)
 
 
 @router.put("/profile", response_model=PlayerProfileResponse)
@@ -68,9 +61,6 @@ async def update_profile(
     if remove_profile_image:
         profile.profile_image_id = None
     elif profile_image_url:
-        from app.models.media import MediaAsset
-        from app.models.enums import MediaType, MediaOwnerType
-        
         media = MediaAsset(
             owner_id=user.user_id,
             owner_type=MediaOwnerType.PLAYER,
@@ -93,23 +83,50 @@ async def update_profile(
     await player_repo.update(profile)
     await db.commit()
     await db.refresh(profile)
+    get_response_cache().invalidate(f"player:{profile.player_id}")
     
-    return player_to_response(profile)
+    return PLAYER_PROFILE_SERIALIZER.to_model(profile)
 
 
 @router.get("/{player_id}", response_model=PlayerProfileResponse)
 async def get_player(
     player_id: int,
+    request: Request,
     db: AsyncSession = Depends(get_db)
 ):
     """Get player by ID."""
-    player_repo = PlayerRepository(db)
-    profile = await player_repo.find_by_id(player_id)
-    
-    if not profile:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Player not found")
-    
-    return player_to_response(profile)
+    cache = get_response_cache()
+    key = f"player:{player_id}"
+    entry = cache.get(key)
+    if entry is None:
+        player_repo = PlayerRepository(db)
+        profile = await player_repo.find_by_id(player_id)
+        
+        if not profile:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Player not found")
+        
+        entry = cache.put(key, PLAYER_PROFILE_SERIALIZER(profile), profile.updated_at)
+    return cached_response(request, entry)
+
+
+@router.get("/{player_id}/stats", response_model=PlayerStatsResponse)
+async def get_player_stats(
+    player_id: int,
+    db: AsyncSession = Depends(get_db)
+):
+    """Get a player's match statistics."""
+    stats = await StatsService(db).get_player_stats(player_id)
+    return PlayerStatsResponse(
+        playerId=stats["player_id"],
+        matchesPlayed=stats["matches_played"],
+        matchesMissed=stats["matches_missed"],
+        attendanceRate=stats["attendance_rate"],
+        wins=stats["wins"],
+        draws=stats["draws"],
+        losses=stats["losses"],
+        goalsFor=stats["goals_for"],
+        goalsAgainst=stats["goals_against"],
+    )
 
 
 @router.get("/{player_id}/roster", response_model=list)
@@ -118,9 +135,6 @@ async def get_player_roster(
     db: AsyncSession = Depends(get_db)
 ):
     """Get player's team memberships."""
-    from app.repositories.team_repository import RosterRepository
-    from app.schemas.team import TeamRosterResponse
-    
     roster_repo = RosterRepository(db)
     roster = await roster_repo.find_by_player(player_id)
     
@@ -148,11 +162,7 @@ async def get_player_by_user_id(
     if not profile:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Player not found")
     
-    return player_to_response(profile)
-
-
-from typing import List
-from app.schemas.match import MatchEventResponse
+    return PLAYER_PROFILE_SERIALIZER.to_model(profile)
 
 
 @router.get("/user/{user_id}/schedule", response_model=List[MatchEventResponse])
@@ -161,9 +171,6 @@ async def get_user_schedule(
     db: AsyncSession = Depends(get_db)
 ):
     """Get player's match schedule by user_id (looks up player first)."""
-    from app.repositories.team_repository import RosterRepository
-    from app.repositories.match_repository import MatchRepository
-    
     player_repo = PlayerRepository(db)
     player = await player_repo.find_by_user_id(user_id)
     if not player:
@@ -216,9 +223,6 @@ async def get_player_schedule(
     db: AsyncSession = Depends(get_db)
 ):
     """Get player's match schedule."""
-    from app.repositories.team_repository import RosterRepository
-    from app.repositories.match_repository import MatchRepository
-    
     roster_repo = RosterRepository(db)
     match_repo = MatchRepository(db)
     
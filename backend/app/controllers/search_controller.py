@@ -2,36 +2,73 @@
 SearchController - Search HTTP endpoints.
 """
 from typing import List, Optional
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.ext.asyncio import AsyncSession
+from pydantic import BaseModel
+from sqlalchemy import select, func
 
 from app.database import get_db
-from app.services.team_service import TeamService
-from app.services.field_service import FieldService
-from app.repositories.player_repository import PlayerRepository
-from app.schemas.team import TeamProfileResponse
-from app.schemas.field import FieldProfileResponse
-from app.schemas.player import PlayerProfileResponse
-from app.models.enums import TeamStatus
+from app.dependencies.auth import get_current_user, require_moderator
+from app.repositories.team_repository import TeamRepository
+from app.services.recruitment_service import RecruitmentService, DEFAULT_RADIUS_KM
+from app.services.suggest_index import load_suggest_index, SUGGEST_TYPES
+from app.schemas.team import TeamSearchResponse, TEAM_PROFILE_SERIALIZER
+from app.schemas.field import FieldProfileResponse, FIELD_PROFILE_SERIALIZER
+from app.schemas.player import PlayerProfileResponse, PLAYER_PROFILE_SERIALIZER
+from app.services.reference_data import load_reference_data
+from app.utils.serialization import RowSerializer
+from app.utils.search_cache import get_search_cache, normalize_filters, search_key
+from app.models.enums import TeamStatus, FieldStatus
+from app.models.team import TeamProfile
+from app.models.field import FieldProfile, FieldAmenity
+from app.models.player import PlayerProfile
+from app.models.user import UserAccount
+from app.models.stats import TeamStats, INITIAL_RATING
 
 router = APIRouter()
 
 
-@router.get("/teams", response_model=List[TeamProfileResponse])
-async def search_teams(
-    query: Optional[str] = Query(None),
-    location: Optional[str] = Query(None),
-    minSkillLevel: Optional[int] = Query(None),
-    maxSkillLevel: Optional[int] = Query(None),
-    limit: int = Query(20, le=100),
+class SuggestionResponse(BaseModel):
+    """A type-ahead suggestion: what it is, its ID and its name."""
+    type: str
+    id: int
+    name: str
+
+
+@router.get("/suggest", response_model=List[SuggestionResponse])
+async def suggest(
+    q: str = Query(..., min_length=1, max_length=100, description="What has been typed so far"),
+    types: Optional[List[str]] = Query(None, alias="types[]", description="team, field, player or owner"),
+    limit: int = Query(10, ge=1, le=50),
     db: AsyncSession = Depends(get_db)
 ):
-    """Search for teams with filters."""
-    from sqlalchemy import select
-    from app.models.team import TeamProfile
+    """Names starting with q, or with a word that does, from the in-memory suggest index."""
+    if types:
+        unknown = sorted(set(types) - set(SUGGEST_TYPES))
+        if unknown:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Unknown suggestion types: {unknown}; expected {', '.join(SUGGEST_TYPES)}"
+            )
+    
+    index = await load_suggest_index(db)
+    suggestions = index.suggest(q, [t for t in SUGGEST_TYPES if t in types] if types else SUGGEST_TYPES, limit)
+    return ORJSONResponse([{"type": kind, "id": entity_id, "name": name} for kind, entity_id, name in suggestions])
+
+
+async def _find_teams(
+    db: AsyncSession, query, location, minSkillLevel, maxSkillLevel, minRating, maxRating, sortByRating, limit
+) -> List[dict]:
+    # Teams that have not played a rated match have the initial rating
+    rating = func.coalesce(TeamStats.rating, INITIAL_RATING)
     
     # Build query with filters
-    stmt = select(TeamProfile).where(TeamProfile.status == TeamStatus.VERIFIED)
+    stmt = (
+        select(TeamProfile, rating)
+        .outerjoin(TeamStats, TeamStats.team_id == TeamProfile.team_id)
+        .where(TeamProfile.status == TeamStatus.VERIFIED)
+    )
     
     if query:
         stmt = stmt.where(TeamProfile.team_name.ilike(f"%{query}%"))
@@ -45,45 +82,50 @@ async def search_teams(
     if maxSkillLevel is not None:
         stmt = stmt.where(TeamProfile.skill_level <= maxSkillLevel)
     
+    if minRating is not None:
+        stmt = stmt.where(rating >= minRating)
+    
+    if maxRating is not None:
+        stmt = stmt.where(rating <= maxRating)
+    
+    if sortByRating:
+        stmt = stmt.order_by(rating.desc(), TeamProfile.team_id)
+    
     stmt = stmt.limit(limit)
     
     result = await db.execute(stmt)
-    teams = list(result.scalars().all())
-    
     return [
-        TeamProfileResponse(
-            teamId=t.team_id,
-            teamName=t.team_name,
-            description=t.description,
-            logoUrl=t.logo.storage_path if t.logo else None,
-            leaderId=t.leader_id,
-            status=t.status.value,
-            rejectionReason=t.rejection_reason,
-            location=t.location,
-            latitude=t.latitude,
-            longitude=t.longitude,
-            skillLevel=t.skill_level,
-            createdAt=t.created_at.isoformat(),
-            updatedAt=t.updated_at.isoformat(),
-        ) for t in teams
+        {**TEAM_PROFILE_SERIALIZER(team), "rating": round(team_rating, 1)} for team, team_rating in result.all()
     ]
 
 
-@router.get("/fields", response_model=List[FieldProfileResponse])
-async def search_fields(
+@router.get("/teams", response_model=List[TeamSearchResponse])
+async def search_teams(
     query: Optional[str] = Query(None),
     location: Optional[str] = Query(None),
-    minPrice: Optional[float] = Query(None),
-    maxPrice: Optional[float] = Query(None),
-    amenityIds: Optional[List[int]] = Query(None, alias="amenityIds[]"),
+    minSkillLevel: Optional[int] = Query(None),
+    maxSkillLevel: Optional[int] = Query(None),
+    minRating: Optional[float] = Query(None),
+    maxRating: Optional[float] = Query(None),
+    sortByRating: bool = Query(False),
     limit: int = Query(20, le=100),
     db: AsyncSession = Depends(get_db)
 ):
-    """Search for fields with filters."""
-    from sqlalchemy import select
-    from app.models.field import FieldProfile, FieldAmenity
-    from app.models.enums import FieldStatus
-    
+    """Search for teams with filters, optionally by Elo rating (highest first)."""
+    filters = normalize_filters(
+        query=query, location=location, minSkillLevel=minSkillLevel, maxSkillLevel=maxSkillLevel,
+        minRating=minRating, maxRating=maxRating, sortByRating=sortByRating, limit=limit,
+    )
+    cache = get_search_cache()
+    key = search_key(filters)
+    body = cache.get("teams", key)
+    if body is None:
+        generation = cache.generation("teams")
+        body = cache.put("teams", key, await _find_teams(db, **filters), generation)
+    return Response(body, media_type="application/json")
+
+
+async def _find_fields(db: AsyncSession, query, location, minPrice, maxPrice, amenityIds, limit) -> List[dict]:
     # Build query with filters
     stmt = select(FieldProfile).where(FieldProfile.status == FieldStatus.VERIFIED)
     
@@ -99,9 +141,8 @@ async def search_fields(
     if maxPrice is not None:
         stmt = stmt.where(FieldProfile.default_price_per_hour <= maxPrice)
     
-    if amenityIds and len(amenityIds) > 0:
+    if amenityIds:
         # Fields that have ALL the specified amenities (AND logic)
-        from sqlalchemy import func
         stmt = stmt.where(
             FieldProfile.field_id.in_(
                 select(FieldAmenity.field_id)
@@ -114,40 +155,39 @@ async def search_fields(
     stmt = stmt.limit(limit)
     
     result = await db.execute(stmt)
-    fields = list(result.scalars().all())
-    
-    return [
-        FieldProfileResponse(
-            fieldId=f.field_id,
-            ownerId=f.owner_id,
-            fieldName=f.field_name,
-            description=f.description,
-            location=f.location,
-            latitude=f.latitude,
-            longitude=f.longitude,
-            defaultPricePerHour=float(f.default_price_per_hour),
-            capacity=f.capacity,
-            status=f.status.value,
-            rejectionReason=f.rejection_reason,
-            createdAt=f.created_at.isoformat(),
-            updatedAt=f.updated_at.isoformat(),
-        ) for f in fields
-    ]
+    return FIELD_PROFILE_SERIALIZER.many(result.scalars().all())
 
 
-@router.get("/players", response_model=List[PlayerProfileResponse])
-async def search_players(
+@router.get("/fields", response_model=List[FieldProfileResponse])
+async def search_fields(
     query: Optional[str] = Query(None),
-    position: Optional[str] = Query(None),
-    minSkillLevel: Optional[int] = Query(None),
-    maxSkillLevel: Optional[int] = Query(None),
+    location: Optional[str] = Query(None),
+    minPrice: Optional[float] = Query(None),
+    maxPrice: Optional[float] = Query(None),
+    amenityIds: Optional[List[int]] = Query(None, alias="amenityIds[]"),
     limit: int = Query(20, le=100),
     db: AsyncSession = Depends(get_db)
 ):
-    """Search for players with filters."""
-    from sqlalchemy import select
-    from app.models.player import PlayerProfile
+    """Search for fields with filters."""
+    if amenityIds:
+        reference = await load_reference_data(db)
+        unknown = await reference.unknown_amenity_ids(db, amenityIds)
+        if unknown:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=f"Unknown amenity IDs: {unknown}")
     
+    filters = normalize_filters(
+        query=query, location=location, minPrice=minPrice, maxPrice=maxPrice, amenityIds=amenityIds, limit=limit,
+    )
+    cache = get_search_cache()
+    key = search_key(filters)
+    body = cache.get("fields", key)
+    if body is None:
+        generation = cache.generation("fields")
+        body = cache.put("fields", key, await _find_fields(db, **filters), generation)
+    return Response(body, media_type="application/json")
+
+
+async def _find_players(db: AsyncSession, query, position, minSkillLevel, maxSkillLevel, limit) -> List[dict]:
     # Build query with filters
     stmt = select(PlayerProfile)
     
@@ -166,29 +206,78 @@ async def search_players(
     stmt = stmt.limit(limit)
     
     result = await db.execute(stmt)
-    players = list(result.scalars().all())
+    return PLAYER_PROFILE_SERIALIZER.many(result.scalars().all())
+
+
+@router.get("/players", response_model=List[PlayerProfileResponse])
+async def search_players(
+    query: Optional[str] = Query(None),
+    position: Optional[str] = Query(None),
+    minSkillLevel: Optional[int] = Query(None),
+    maxSkillLevel: Optional[int] = Query(None),
+    limit: int = Query(20, le=100),
+    db: AsyncSession = Depends(get_db)
+):
+    """Search for players with filters."""
+    filters = normalize_filters(
+        query=query, position=position, minSkillLevel=minSkillLevel, maxSkillLevel=maxSkillLevel, limit=limit,
+    )
+    cache = get_search_cache()
+    key = search_key(filters)
+    body = cache.get("players", key)
+    if body is None:
+        generation = cache.generation("players")
+        body = cache.put("players", key, await _find_players(db, **filters), generation)
+    return Response(body, media_type="application/json")
+
+
+class RecruitResponse(BaseModel):
+    """A player a team could recruit, nearest first."""
+    playerId: int
+    userId: int
+    displayName: str
+    position: Optional[str] = None
+    skillLevel: Optional[int] = None
+    location: Optional[str] = None
+    distanceKm: float
+
+
+@router.get("/recruits", response_model=List[RecruitResponse])
+async def search_recruits(
+    teamId: int = Query(..., description="Recruiting team; its roster is left out and distances start from it"),
+    position: Optional[str] = Query(None, description="Exact position, case-insensitive"),
+    skillBand: Optional[str] = Query(None, description="Skill band: 1-3, 4-6 or 7-10"),
+    radiusKm: float = Query(DEFAULT_RADIUS_KM, gt=0, le=100),
+    limit: int = Query(20, ge=1, le=100),
+    user: UserAccount = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
+):
+    """Players near a team who are not on it (team leader only)."""
+    team = await TeamRepository(db).find_by_id(teamId)
+    if not team:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Team not found")
+    if team.leader_id != user.user_id:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not authorized")
+    
+    try:
+        players = await RecruitmentService(db).find_players(team, position, skillBand, radiusKm, limit)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
     
     return [
-        PlayerProfileResponse(
-            playerId=p.player_id,
-            userId=p.user_id,
-            displayName=p.display_name,
-            position=p.position,
-            skillLevel=p.skill_level,
-            bio=p.bio,
-            profileImage=p.profile_image.storage_path if p.profile_image else None,
-            dateOfBirth=p.date_of_birth.isoformat() if p.date_of_birth else None,
-            height=p.height,
-            weight=p.weight,
-            preferredFoot=p.preferred_foot.value if p.preferred_foot else None,
-            createdAt=p.created_at.isoformat(),
-            updatedAt=p.updated_at.isoformat(),
-        ) for p in players
+        RecruitResponse(
+            playerId=p["player_id"],
+            userId=p["user_id"],
+            displayName=p["display_name"],
+            position=p["position"],
+            skillLevel=p["skill_level"],
+            location=p["location"],
+            distanceKm=round(p["distance_km"], 2),
+        )
+        for p in players
     ]
 
 
-from pydantic import BaseModel
-
 class OwnerSearchResponse(BaseModel):
     """Field owner search response."""
     userId: int
@@ -199,18 +288,18 @@ class OwnerSearchResponse(BaseModel):
     createdAt: str
 
 
-@router.get("/owners", response_model=List[OwnerSearchResponse])
-async def search_owners(
-    query: Optional[str] = Query(None),
-    location: Optional[str] = Query(None),
-    limit: int = Query(20, le=100),
-    db: AsyncSession = Depends(get_db)
-):
-    """Search for field owners."""
-    from sqlalchemy import select, func
-    from app.models.user import UserAccount
-    from app.models.field import FieldProfile
-    
+# Rows are (UserAccount, field_count) tuples
+OWNER_SEARCH_SERIALIZER = RowSerializer(OwnerSearchResponse, {
+    "userId": lambda row: row[0].user_id,
+    "username": lambda row: row[0].username,
+    "location": lambda row: row[0].location,
+    "isVerified": lambda row: row[0].is_verified,
+    "fieldCount": lambda row: row[1] or 0,
+    "createdAt": lambda row: row[0].created_at.isoformat(),
+})
+
+
+async def _find_owners(db: AsyncSession, query, location, limit) -> List[dict]:
     # Find users who own at least one field
     stmt = (
         select(
@@ -231,15 +320,29 @@ async def search_owners(
     stmt = stmt.limit(limit)
     
     result = await db.execute(stmt)
-    rows = result.all()
-    
-    return [
-        OwnerSearchResponse(
-            userId=row[0].user_id,
-            username=row[0].username,
-            location=row[0].location,
-            isVerified=row[0].is_verified,
-            fieldCount=row[1] or 0,
-            createdAt=row[0].created_at.isoformat(),
-        ) for row in rows
-    ]
+    return OWNER_SEARCH_SERIALIZER.many(result.all())
+
+
+@router.get("/owners", response_model=List[OwnerSearchResponse])
+async def search_owners(
+    query: Optional[str] = Query(None),
+    location: Optional[str] = Query(None),
+    limit: int = Query(20, le=100),
+    db: AsyncSession = Depends(get_db)
+):
+    """Search for field owners."""
+    filters = normalize_filters(query=query, location=location, limit=limit)
+    cache = get_search_cache()
+    key = search_key(filters)
+    body = cache.get("owners", key)
+    if body is None:
+        generation = cache.generation("owners")
+        body = cache.put("owners", key, await _find_owners(db, **filters), generation)
+    return Response(body, media_type="application/json")
+
+
+@router.get("/cache/stats", response_model=dict)
+async def get_search_cache_stats(user: UserAccount = Depends(get_current_user)):
+    """Search cache size, hit rate and invalidations, overall and per kind (moderator only)."""
+    await require_moderator(user)
+    return get_search_cache().stats()
@@ -2,22 +2,29 @@
 TeamController - Team HTTP endpoints.
 Thin controller that delegates to TeamService.
 """
+from datetime import date, datetime
 from typing import List, Optional
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, status, Request, Query
 from sqlalchemy.ext.asyncio import AsyncSession
+from pydantic import BaseModel
 
 from app.database import get_db
 from app.services.team_service import TeamService
+from app.services.wallet_service import WalletService
+from app.services.stats_service import StatsService
 from app.schemas.team import (
-    TeamProfileResponse, TeamProfileCreate, TeamProfileUpdate,
-    JoinRequestResponse, JoinRequestCreate,
-    TeamRosterResponse, RosterAddPlayerRequest, RosterUpdateRoleRequest
+    TeamProfileResponse, TEAM_PROFILE_SERIALIZER, TeamProfileCreate, TeamProfileUpdate,
+    JoinRequestResponse, JoinRequestCreate, JoinRequestBatchRequest,
+    TeamRosterResponse, RosterAddPlayerRequest, RosterUpdateRoleRequest, TeamStatsResponse
 )
 from app.schemas.common import MessageResponse
 from app.dependencies.auth import get_current_user
 from app.models.user import UserAccount
 from app.repositories.player_repository import PlayerRepository
-from app.repositories.team_repository import JoinRequestRepository
+from app.repositories.team_repository import JoinRequestRepository, TeamRepository, RosterRepository
+from app.utils.http_cache import get_response_cache, cached_response
+from app.models.team import TeamRoster
+from app.models.enums import RosterRole
 
 router = APIRouter()
 
@@ -26,24 +33,6 @@ def get_team_service(db: AsyncSession = Depends(get_db)) -> TeamService:
     return TeamService(db)
 
 
-def team_to_response(team) -> TeamProfileResponse:
-    return TeamProfileResponse(
-        teamId=team.team_id,
-        teamName=team.team_name,
-        description=team.description,
-        logoUrl=team.logo.storage_path if team.logo else None,
-        leaderId=team.leader_id,
-        status=team.status.value,
-        rejectionReason=team.rejection_reason,
-        location=team.location,
-        latitude=team.latitude,
-        longitude=team.longitude,
-        skillLevel=team.skill_level,
-        createdAt=team.created_at.isoformat(),
-        updatedAt=team.updated_at.isoformat(),
-    )
-
-
 @router.post("", response_model=TeamProfileResponse, status_code=status.HTTP_201_CREATED)
 async def create_team(
     data: TeamProfileCreate,
@@ -63,7 +52,7 @@ async def create_team(
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
     
-    return team_to_response(team)
+    return TEAM_PROFILE_SERIALIZER.to_model(team)
 
 
 @router.get("/my-teams", response_model=List[TeamProfileResponse])
@@ -73,7 +62,7 @@ async def get_my_teams(
 ):
     """Get teams where current user is leader."""
     teams = await team_service.get_teams_by_leader(user.user_id)
-    return [team_to_response(t) for t in teams]
+    return TEAM_PROFILE_SERIALIZER.response(teams)
 
 
 @router.get("/user/{user_id}", response_model=List[TeamProfileResponse])
@@ -82,8 +71,6 @@ async def get_user_teams(
     db: AsyncSession = Depends(get_db)
 ):
     """Get teams where user is a member (by user_id, not player_id)."""
-    from app.repositories.team_repository import RosterRepository, TeamRepository
-    
     # First, find the player profile by user_id
     player_repo = PlayerRepository(db)
     player = await player_repo.find_by_user_id(user_id)
@@ -101,7 +88,7 @@ async def get_user_teams(
             if team:
                 teams.append(team)
     
-    return [team_to_response(t) for t in teams]
+    return TEAM_PROFILE_SERIALIZER.response(teams)
 
 
 @router.get("/player/{player_id}", response_model=List[TeamProfileResponse])
@@ -110,8 +97,6 @@ async def get_player_teams(
     db: AsyncSession = Depends(get_db)
 ):
     """Get teams where player is a member."""
-    from app.repositories.team_repository import RosterRepository, TeamRepository
-    
     roster_repo = RosterRepository(db)
     team_repo = TeamRepository(db)
     
@@ -123,19 +108,46 @@ async def get_player_teams(
             if team:
                 teams.append(team)
     
-    return [team_to_response(t) for t in teams]
+    return TEAM_PROFILE_SERIALIZER.response(teams)
 
 
 @router.get("/{team_id}", response_model=TeamProfileResponse)
 async def get_team(
     team_id: int,
+    request: Request,
     team_service: TeamService = Depends(get_team_service)
 ):
     """Get team by ID."""
-    team = await team_service.get_team_by_id(team_id)
-    if not team:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Team not found")
-    return team_to_response(team)
+    cache = get_response_cache()
+    key = f"team:{team_id}"
+    entry = cache.get(key)
+    if entry is None:
+        team = await team_service.get_team_by_id(team_id)
+        if not team:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Team not found")
+        entry = cache.put(key, TEAM_PROFILE_SERIALIZER(team), team.updated_at)
+    return cached_response(request, entry)
+
+
+@router.get("/{team_id}/stats", response_model=TeamStatsResponse)
+async def get_team_stats(
+    team_id: int,
+    db: AsyncSession = Depends(get_db)
+):
+    """Get a team's win/draw/loss record and Elo rating."""
+    stats = await StatsService(db).get_team_stats(team_id)
+    return TeamStatsResponse(
+        teamId=stats["team_id"],
+        matchesPlayed=stats["matches_played"],
+        wins=stats["wins"],
+        draws=stats["draws"],
+        losses=stats["losses"],
+        goalsFor=stats["goals_for"],
+        goalsAgainst=stats["goals_against"],
+        points=stats["points"],
+        form=stats["form"],
+        rating=round(stats["rating"], 1),
+    )
 
 
 @router.put("/{team_id}", response_model=TeamProfileResponse)
@@ -153,7 +165,8 @@ async def update_team(
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not authorized")
     
     updated = await team_service.update_team(team, **data.model_dump(exclude_unset=True))
-    return team_to_response(updated)
+    get_response_cache().invalidate(f"team:{team_id}")
+    return TEAM_PROFILE_SERIALIZER.to_model(updated)
 
 
 @router.delete("/{team_id}", response_model=MessageResponse)
@@ -170,6 +183,7 @@ async def delete_team(
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not authorized")
     
     await team_service.delete_team(team)
+    get_response_cache().invalidate(f"team:{team_id}")
     return MessageResponse(message="Team deleted")
 
 
@@ -209,8 +223,6 @@ async def request_to_join(
     db: AsyncSession = Depends(get_db)
 ):
     """Request to join a team."""
-    from app.repositories.team_repository import RosterRepository
-    
     # Check if user is the team leader
     team = await team_service.get_team_by_id(team_id)
     if not team:
@@ -270,6 +282,26 @@ async def process_join_request(
     return MessageResponse(message=f"Request {action}ed")
 
 
+@router.put("/{team_id}/join-requests/{action}", response_model=MessageResponse)
+async def process_join_requests(
+    team_id: int,
+    action: str,
+    data: JoinRequestBatchRequest,
+    user: UserAccount = Depends(get_current_user),
+    team_service: TeamService = Depends(get_team_service)
+):
+    """Accept or reject several pending join requests (leader only)."""
+    if action not in ["accept", "reject"]:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid action")
+    
+    team = await team_service.get_team_by_id(team_id)
+    if not team or team.leader_id != user.user_id:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not authorized")
+    
+    count = await team_service.process_join_requests(team_id, data.requestIds, action == "accept")
+    return MessageResponse(message=f"{count} requests {action}ed")
+
+
 # --- Team Roster ---
 
 def roster_to_response(r) -> TeamRosterResponse:
@@ -290,7 +322,6 @@ async def get_team_roster(
     db: AsyncSession = Depends(get_db)
 ):
     """Get team roster."""
-    from app.repositories.team_repository import RosterRepository
     roster_repo = RosterRepository(db)
     roster = await roster_repo.find_by_team(team_id)
     return [roster_to_response(r) for r in roster]
@@ -305,10 +336,6 @@ async def add_player_to_roster(
     db: AsyncSession = Depends(get_db)
 ):
     """Add player to team roster (leader only)."""
-    from app.repositories.team_repository import RosterRepository
-    from app.models.team import TeamRoster
-    from app.models.enums import RosterRole
-    
     team = await team_service.get_team_by_id(team_id)
     if not team:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Team not found")
@@ -340,8 +367,6 @@ async def remove_player_from_roster(
     db: AsyncSession = Depends(get_db)
 ):
     """Remove player from team roster (leader only)."""
-    from app.repositories.team_repository import RosterRepository
-    
     team = await team_service.get_team_by_id(team_id)
     if not team:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Team not found")
@@ -368,9 +393,6 @@ async def update_player_role(
     db: AsyncSession = Depends(get_db)
 ):
     """Update player role in roster (leader only)."""
-    from app.repositories.team_repository import RosterRepository
-    from app.models.enums import RosterRole
-    
     roster_repo = RosterRepository(db)
     roster_entry = await roster_repo.find_by_id(roster_id)
     if not roster_entry:
@@ -388,9 +410,6 @@ async def update_player_role(
 
 
 # --- Team Wallet & Finance ---
-from pydantic import BaseModel
-from decimal import Decimal
-from sqlalchemy import select
 
 class WalletResponse(BaseModel):
     """Team wallet response."""
@@ -413,6 +432,27 @@ class TransactionResponse(BaseModel):
     createdAt: str
 
 
+class CategoryTotalResponse(BaseModel):
+    """Income or expense total for one category over a statement period."""
+    type: str
+    category: Optional[str]
+    total: float
+    count: int
+
+
+class WalletStatementResponse(BaseModel):
+    """Wallet statement for a date range."""
+    walletId: Optional[int]  # None until the team's wallet is first used
+    teamId: int
+    startDate: str
+    endDate: str
+    openingBalance: float
+    closingBalance: float
+    totalIncome: float
+    totalExpense: float
+    categories: List[CategoryTotalResponse]
+
+
 class TransactionCreate(BaseModel):
     """Create transaction request."""
     type: str  # DEPOSIT, WITHDRAWAL, EXPENSE, INCOME
@@ -421,30 +461,44 @@ class TransactionCreate(BaseModel):
     category: Optional[str] = None
 
 
+def get_wallet_service(db: AsyncSession = Depends(get_db)) -> WalletService:
+    return WalletService(db)
+
+
+def transaction_to_response(t) -> TransactionResponse:
+    """Convert transaction model to response."""
+    return TransactionResponse(
+        transactionId=t.transaction_id,
+        walletId=t.wallet_id,
+        type=t.type.value,
+        amount=float(t.amount),
+        description=t.description,
+        category=t.category,
+        createdBy=t.created_by,
+        createdAt=t.created_at.isoformat(),
+    )
+
+
+async def get_led_team(team_id: int, user: UserAccount, team_service: TeamService):
+    """Load a team the user leads, or raise 404/403."""
+    team = await team_service.get_team_by_id(team_id)
+    if not team:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Team not found")
+    if team.leader_id != user.user_id:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not authorized")
+    return team
+
+
 @router.get("/{team_id}/wallet", response_model=WalletResponse)
 async def get_team_wallet(
     team_id: int,
     user: UserAccount = Depends(get_current_user),
     team_service: TeamService = Depends(get_team_service),
-    db: AsyncSession = Depends(get_db)
+    wallet_service: WalletService = Depends(get_wallet_service)
 ):
     """Get team wallet (team leader only)."""
-    from app.models.team import TeamWallet
-    
-    team = await team_service.get_team_by_id(team_id)
-    if not team:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Team not found")
-    if team.leader_id != user.user_id:
-        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not authorized")
-    
-    result = await db.execute(select(TeamWallet).where(TeamWallet.team_id == team_id))
-    wallet = result.scalar_one_or_none()
-    
-    if not wallet:
-        # Create wallet if it doesn't exist
-        wallet = TeamWallet(team_id=team_id, balance=Decimal("0.00"))
-        db.add(wallet)
-        await db.commit()
+    await get_led_team(team_id, user, team_service)
+    wallet = await wallet_service.get_wallet(team_id)
     
     return WalletResponse(
         walletId=wallet.wallet_id,
@@ -461,43 +515,47 @@ async def get_wallet_transactions(
     limit: int = 50,
     user: UserAccount = Depends(get_current_user),
     team_service: TeamService = Depends(get_team_service),
-    db: AsyncSession = Depends(get_db)
+    wallet_service: WalletService = Depends(get_wallet_service)
 ):
     """Get team wallet transactions (team leader only)."""
-    from app.models.team import TeamWallet, TransactionLog
-    
-    team = await team_service.get_team_by_id(team_id)
-    if not team:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Team not found")
-    if team.leader_id != user.user_id:
-        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not authorized")
-    
-    result = await db.execute(select(TeamWallet).where(TeamWallet.team_id == team_id))
-    wallet = result.scalar_one_or_none()
-    
-    if not wallet:
-        return []
+    await get_led_team(team_id, user, team_service)
+    transactions = await wallet_service.get_transactions(team_id, limit)
+    return [transaction_to_response(t) for t in transactions]
+
+
+@router.get("/{team_id}/wallet/statement", response_model=WalletStatementResponse)
+async def get_wallet_statement(
+    team_id: int,
+    start: Optional[date] = Query(None, description="First day (default: start of this month)"),
+    end: Optional[date] = Query(None, description="Last day, inclusive (default: today)"),
+    user: UserAccount = Depends(get_current_user),
+    team_service: TeamService = Depends(get_team_service),
+    wallet_service: WalletService = Depends(get_wallet_service)
+):
+    """Opening/closing balance and category totals for a period (team leader only)."""
+    await get_led_team(team_id, user, team_service)
+    today = datetime.utcnow().date()
+    try:
+        statement = await wallet_service.get_statement(team_id, start or today.replace(day=1), end or today)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
     
-    result = await db.execute(
-        select(TransactionLog)
-        .where(TransactionLog.wallet_id == wallet.wallet_id)
-        .order_by(TransactionLog.created_at.desc())
-        .limit(limit)
+    return WalletStatementResponse(
+        walletId=statement["wallet_id"],
+        teamId=statement["team_id"],
+        startDate=statement["start"].isoformat(),
+        endDate=statement["end"].isoformat(),
+        openingBalance=float(statement["opening_balance"]),
+        closingBalance=float(statement["closing_balance"]),
+        totalIncome=float(statement["total_income"]),
+        totalExpense=float(statement["total_expense"]),
+        categories=[
+            CategoryTotalResponse(
+                type=c["type"].value, category=c["category"], total=float(c["total"]), count=c["count"]
+            )
+            for c in statement["categories"]
+        ],
     )
-    transactions = result.scalars().all()
-    
-    return [
-        TransactionResponse(
-            transactionId=t.transaction_id,
-            walletId=t.wallet_id,
-            type=t.type.value,
-            amount=float(t.amount),
-            description=t.description,
-            category=t.category,
-            createdBy=t.created_by,
-            createdAt=t.created_at.isoformat(),
-        ) for t in transactions
-    ]
 
 
 @router.post("/{team_id}/wallet/deposit", response_model=TransactionResponse, status_code=status.HTTP_201_CREATED)
@@ -506,52 +564,17 @@ async def deposit_funds(
     data: TransactionCreate,
     user: UserAccount = Depends(get_current_user),
     team_service: TeamService = Depends(get_team_service),
-    db: AsyncSession = Depends(get_db)
+    wallet_service: WalletService = Depends(get_wallet_service)
 ):
     """Deposit funds to team wallet (team leader only)."""
-    from app.models.team import TeamWallet, TransactionLog
-    from app.models.enums import TransactionType
-    
-    team = await team_service.get_team_by_id(team_id)
-    if not team:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Team not found")
-    if team.leader_id != user.user_id:
-        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not authorized")
-    
-    result = await db.execute(select(TeamWallet).where(TeamWallet.team_id == team_id))
-    wallet = result.scalar_one_or_none()
-    
-    if not wallet:
-        wallet = TeamWallet(team_id=team_id, balance=Decimal("0.00"))
-        db.add(wallet)
-        await db.commit()
-        await db.refresh(wallet)
-    
-    # Add funds
-    wallet.balance = wallet.balance + Decimal(str(data.amount))
-    
-    # Log transaction
-    transaction = TransactionLog(
-        wallet_id=wallet.wallet_id,
-        type=TransactionType.INCOME,
-        amount=Decimal(str(data.amount)),
-        description=data.description or "Deposit",
-        category=data.category,
-        created_by=user.user_id,
-    )
-    db.add(transaction)
-    await db.commit()
-    
-    return TransactionResponse(
-        transactionId=transaction.transaction_id,
-        walletId=transaction.wallet_id,
-        type=transaction.type.value,
-        amount=float(transaction.amount),
-        description=transaction.description,
-        category=transaction.category,
-        createdBy=transaction.created_by,
-        createdAt=transaction.created_at.isoformat(),
-    )
+    await get_led_team(team_id, user, team_service)
+    try:
+        transaction = await wallet_service.deposit(
+            team_id, data.amount, user.user_id, data.description, data.category
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    return transaction_to_response(transaction)
 
 
 @router.post("/{team_id}/wallet/withdraw", response_model=TransactionResponse, status_code=status.HTTP_201_CREATED)
@@ -560,52 +583,17 @@ async def withdraw_funds(
     data: TransactionCreate,
     user: UserAccount = Depends(get_current_user),
     team_service: TeamService = Depends(get_team_service),
-    db: AsyncSession = Depends(get_db)
+    wallet_service: WalletService = Depends(get_wallet_service)
 ):
     """Withdraw funds from team wallet (team leader only)."""
-    from app.models.team import TeamWallet, TransactionLog
-    from app.models.enums import TransactionType
-    
-    team = await team_service.get_team_by_id(team_id)
-    if not team:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Team not found")
-    if team.leader_id != user.user_id:
-        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not authorized")
-    
-    result = await db.execute(select(TeamWallet).where(TeamWallet.team_id == team_id))
-    wallet = result.scalar_one_or_none()
-    
-    if not wallet:
-        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Wallet not found")
-    
-    if wallet.balance < Decimal(str(data.amount)):
-        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Insufficient funds")
-    
-    # Subtract funds
-    wallet.balance = wallet.balance - Decimal(str(data.amount))
-    
-    # Log transaction
-    transaction = TransactionLog(
-        wallet_id=wallet.wallet_id,
-        type=TransactionType.EXPENSE,
-        amount=Decimal(str(data.amount)),
-        description=data.description or "Withdrawal",
-        category=data.category,
-        created_by=user.user_id,
-    )
-    db.add(transaction)
-    await db.commit()
-    
-    return TransactionResponse(
-        transactionId=transaction.transaction_id,
-        walletId=transaction.wallet_id,
-        type=transaction.type.value,
-        amount=float(transaction.amount),
-        description=transaction.description,
-        category=transaction.category,
-        createdBy=transaction.created_by,
-        createdAt=transaction.created_at.isoformat(),
-    )
+    await get_led_team(team_id, user, team_service)
+    try:
+        transaction = await wallet_service.withdraw(
+            team_id, data.amount, user.user_id, data.description, data.category
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    return transaction_to_response(transaction)
 
 
 @router.post("/{team_id}/wallet/expense", response_model=TransactionResponse, status_code=status.HTTP_201_CREATED)
@@ -614,49 +602,14 @@ async def record_expense(
     data: TransactionCreate,
     user: UserAccount = Depends(get_current_user),
     team_service: TeamService = Depends(get_team_service),
-    db: AsyncSession = Depends(get_db)
+    wallet_service: WalletService = Depends(get_wallet_service)
 ):
     """Record an expense (team leader only)."""
-    from app.models.team import TeamWallet, TransactionLog
-    from app.models.enums import TransactionType
-    
-    team = await team_service.get_team_by_id(team_id)
-    if not team:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Team not found")
-    if team.leader_id != user.user_id:
-        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not authorized")
-    
-    result = await db.execute(select(TeamWallet).where(TeamWallet.team_id == team_id))
-    wallet = result.scalar_one_or_none()
-    
-    if not wallet:
-        wallet = TeamWallet(team_id=team_id, balance=Decimal("0.00"))
-        db.add(wallet)
-        await db.commit()
-        await db.refresh(wallet)
-    
-    # Subtract expense
-    wallet.balance = wallet.balance - Decimal(str(data.amount))
-    
-    # Log transaction
-    transaction = TransactionLog(
-        wallet_id=wallet.wallet_id,
-        type=TransactionType.EXPENSE,
-        amount=Decimal(str(data.amount)),
-        description=data.description or "Expense",
-        category=data.category,
-        created_by=user.user_id,
-    )
-    db.add(transaction)
-    await db.commit()
-    
-    return TransactionResponse(
-        transactionId=transaction.transaction_id,
-        walletId=transaction.wallet_id,
-        type=transaction.type.value,
-        amount=float(transaction.amount),
-        description=transaction.description,
-        category=transaction.category,
-        createdBy=transaction.created_by,
-        createdAt=transaction.created_at.isoformat(),
-    )
+    await get_led_team(team_id, user, team_service)
+    try:
+        transaction = await wallet_service.record_expense(
+            team_id, data.amount, user.user_id, data.description, data.category
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    return transaction_to_response(transaction)
@@ -1,12 +1,20 @@
 """
 Database connection and session management for async SQLAlchemy with MySQL.
 """
-from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
+import logging
+import re
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from sqlalchemy import text
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import create_async_engine, AsyncEngine, AsyncSession, async_sessionmaker
 from sqlalchemy.orm import DeclarativeBase
 
 from app.config import get_settings
 
 settings = get_settings()
+logger = logging.getLogger(__name__)
 
 # Create async engine
 engine = create_async_engine(
@@ -47,10 +55,88 @@ async def get_db() -> AsyncSession:
             await session.close()
 
 
+def get_session_factory() -> async_sessionmaker:
+    """
+    Dependency that provides the session factory itself.
+    Used by long-lived responses (streams) that must open their own sessions
+    after the request-scoped session has been closed.
+    """
+    return async_session_factory
+
+
+MIGRATIONS_DIR = Path(__file__).resolve().parent.parent / "alembic" / "versions"
+SCHEMA_MODES = ("check", "create", "off")
+
+_REVISION_PATTERN = re.compile(r"^(down_revision|revision)\b[^=]*=\s*['\"]?([\w]+)", re.MULTILINE)
+
+
+def schema_revisions(migrations_dir: Path = MIGRATIONS_DIR) -> List[str]:
+    """
+    Migration revisions from oldest to newest, read from the migration files.
+    
+    Reading the `revision`/`down_revision` assignments directly keeps Alembic
+    (and its import cost) out of worker startup. The history is linear.
+    """
+    parents: Dict[str, Optional[str]] = {}
+    for path in migrations_dir.glob("*.py"):
+        values = dict(_REVISION_PATTERN.findall(path.read_text()))
+        if "revision" in values:
+            down = values.get("down_revision")
+            parents[values["revision"]] = None if down == "None" else down
+    
+    children = {parent: revision for revision, parent in parents.items()}
+    ordered, current = [], children.get(None)
+    while current is not None:
+        ordered.append(current)
+        current = children.get(current)
+    if len(ordered) != len(parents):
+        raise RuntimeError(f"Migration history in {migrations_dir} is not a single linear chain")
+    return ordered
+
+
+async def check_schema_version(db_engine: AsyncEngine = None, revisions: List[str] = None) -> str:
+    """
+    Verify the database is migrated to this build's head revision.
+    
+    Runs one SELECT on `alembic_version`; never introspects or creates
+    tables. A revision this build does not know is assumed to come from a
+    newer release whose (backwards compatible) migration ran ahead of a
+    rolling deploy, so it is logged and accepted.
+    """
+    db_engine = db_engine or engine
+    revisions = revisions if revisions is not None else schema_revisions()
+    try:
+        async with db_engine.connect() as conn:
+            current = (await conn.execute(text("SELECT version_num FROM alembic_version"))).scalar()
+    except DBAPIError as exc:
+        raise RuntimeError("Database schema is not initialised; run `alembic upgrade head`") from exc
+    
+    head = revisions[-1] if revisions else None
+    if current is None:
+        raise RuntimeError("Database schema is not initialised; run `alembic upgrade head`")
+    if current not in revisions:
+        logger.warning(f"Database schema revision {current} is newer than this build ({head})")
+    elif current != head:
+        raise RuntimeError(f"Database schema is at {current}, expected {head}; run `alembic upgrade head`")
+    return current
+
+
 async def init_db():
-    """Initialize database tables."""
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
+    """
+    Prepare the schema according to DATABASE_SCHEMA_MODE.
+    
+    "check" (default) only verifies the migration revision, so many workers
+    can start at once without DDL; "create" runs create_all (local
+    development against a throwaway database); "off" does nothing.
+    """
+    mode = settings.database_schema_mode
+    if mode == "check":
+        await check_schema_version()
+    elif mode == "create":
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+    elif mode != "off":
+        raise ValueError(f"Unknown DATABASE_SCHEMA_MODE {mode!r}; expected one of {SCHEMA_MODES}")
 
 
 async def close_db():
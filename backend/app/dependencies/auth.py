@@ -2,13 +2,13 @@
 Authentication dependencies for FastAPI.
 """
 from typing import Optional, List
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, HTTPException, Query, status
 from fastapi.security import OAuth2PasswordBearer
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 
 from app.database import get_db
-from app.models.user import UserAccount
+from app.models.user import UserAccount, role_mask
 from app.models.enums import AccountStatus, UserRole
 from app.utils.security import verify_access_token
 
@@ -77,6 +77,19 @@ async def get_current_user_optional(
         return None
 
 
+async def get_current_user_stream(
+    token: Optional[str] = Depends(oauth2_scheme),
+    query_token: Optional[str] = Query(None, alias="token"),
+    db: AsyncSession = Depends(get_db)
+) -> UserAccount:
+    """
+    Get the current user for streaming endpoints.
+    Browsers' EventSource cannot send headers, so the access token may
+    also be passed as a `token` query parameter.
+    """
+    return await get_current_user(token or query_token, db)
+
+
 def require_role(*required_roles: str):
     """
     Dependency factory that checks if the user has any of the required roles.
@@ -86,11 +99,10 @@ def require_role(*required_roles: str):
         async def admin_only(user: UserAccount = Depends(get_current_user)):
             ...
     """
+    required = role_mask(required_roles)
+    
     async def role_checker(user: UserAccount = Depends(get_current_user)) -> UserAccount:
-        user_roles = set(user.roles)
-        required = set(required_roles)
-        
-        if not user_roles.intersection(required):
+        if not user.role_mask & required:
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail="Insufficient permissions"
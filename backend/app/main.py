@@ -1,6 +1,7 @@
 """
 FastAPI application entry point.
 """
+import asyncio
 from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
@@ -8,7 +9,16 @@ from fastapi.staticfiles import StaticFiles
 import os
 
 from app.config import get_settings
-from app.database import init_db, close_db
+from app.database import init_db, close_db, async_session_factory
+from app.services.email_queue import EmailQueue, get_email_queue, set_email_queue
+from app.services.moderation_stats_service import run_periodic_reconcile
+from app.services.reference_data import load_reference_data, run_periodic_refresh
+from app.services.wallet_service import run_periodic_snapshots
+from app.services.league_table import get_league_table
+from app.services.opponent_index import get_opponent_index
+from app.services.player_index import get_player_index
+from app.services.suggest_index import get_suggest_index
+from app.services.incremental_index import warm_indexes
 
 settings = get_settings()
 
@@ -22,9 +32,55 @@ async def lifespan(app: FastAPI):
     # Ensure upload directory exists
     os.makedirs(settings.upload_dir, exist_ok=True)
     
+    # Start outbound email workers
+    if settings.email_enabled:
+        email_queue = EmailQueue()
+        await email_queue.start()
+        set_email_queue(email_queue)
+    
+    # Periodically reconcile moderation dashboard counters
+    reconcile_task = asyncio.create_task(run_periodic_reconcile(
+        async_session_factory, settings.moderation_stats_reconcile_minutes * 60
+    ))
+    
+    # Warm the in-memory indexes in the background and keep them in step with
+    # other processes; a request that needs one first waits for its load
+    index_refresh_minutes = {
+        get_league_table(): settings.league_table_refresh_minutes,
+        get_opponent_index(): settings.opponent_index_refresh_minutes,
+        get_player_index(): settings.player_index_refresh_minutes,
+        get_suggest_index(): settings.suggest_index_refresh_minutes,
+    }
+    index_tasks = [asyncio.create_task(warm_indexes(index_refresh_minutes, async_session_factory))]
+    for index, refresh_minutes in index_refresh_minutes.items():
+        index_tasks.append(asyncio.create_task(index.run_periodic_refresh(
+            async_session_factory, refresh_minutes * 60
+        )))
+    
+    # Snapshot wallet opening balances for statements
+    snapshot_task = asyncio.create_task(run_periodic_snapshots(
+        async_session_factory, settings.wallet_snapshot_interval_minutes * 60
+    ))
+    
+    # Preload amenities and keep them fresh
+    async with async_session_factory() as session:
+        await load_reference_data(session)
+    reference_task = asyncio.create_task(run_periodic_refresh(
+        async_session_factory, settings.reference_data_refresh_minutes * 60
+    ))
+    
     yield
     
     # Shutdown
+    reconcile_task.cancel()
+    snapshot_task.cancel()
+    for task in index_tasks:
+        task.cancel()
+    reference_task.cancel()
+    email_queue = get_email_queue()
+    if email_queue:
+        await email_queue.stop()
+        set_email_queue(None)
     await close_db()
 
 
@@ -60,6 +116,8 @@ from app.controllers import player_controller
 from app.controllers import search_controller
 from app.controllers import media_controller
 from app.controllers import moderation_controller
+from app.controllers import league_controller
+from app.controllers import matchmaking_controller
 
 app.include_router(auth_controller.router, prefix="/api/auth", tags=["Authentication"])
 app.include_router(player_controller.router, prefix="/api/players", tags=["Players"])
@@ -72,6 +130,8 @@ app.include_router(notification_controller.router, prefix="/api/notifications",
 app.include_router(search_controller.router, prefix="/api/search", tags=["Search"])
 app.include_router(media_controller.router, prefix="/api/media", tags=["Media"])
 app.include_router(moderation_controller.router, prefix="/api/mod", tags=["Moderation"])
+app.include_router(league_controller.router, prefix="/api/standings", tags=["Standings"])
+app.include_router(matchmaking_controller.router, prefix="/api/matchmaking", tags=["Matchmaking"])
 
 
 @app.get("/")
@@ -7,14 +7,18 @@ from app.database import Base
 # Import all models to register them with SQLAlchemy
 from app.models.user import UserAccount, Session
 from app.models.player import PlayerProfile
-from app.models.team import TeamProfile, TeamRoster, JoinRequest, TeamWallet, TransactionLog
+from app.models.team import (
+    TeamProfile, TeamRoster, JoinRequest, TeamWallet, TransactionLog, WalletMonthlyTotal, WalletBalanceSnapshot
+)
 from app.models.field import FieldProfile, FieldCalendar, FieldPricingRule, CancellationPolicy, Amenity, FieldAmenity
 from app.models.booking import BookingRequest
 from app.models.match import MatchEvent, MatchInvitation, AttendanceRecord, MatchResult
 from app.models.social import Post, Comment, Reaction
-from app.models.moderation import Report, ModerationLog
+from app.models.moderation import Report, ReportCase, ModerationLog, ModerationCounter
 from app.models.notification import Notification, NotificationPreference
 from app.models.media import MediaAsset
+from app.models.email import EmailOutbox, EmailDeadLetter
+from app.models.stats import PlayerStats, TeamStats
 
 __all__ = [
     "Base",
@@ -24,6 +28,7 @@ __all__ = [
     "PlayerProfile",
     # Team
     "TeamProfile", "TeamRoster", "JoinRequest", "TeamWallet", "TransactionLog",
+    "WalletMonthlyTotal", "WalletBalanceSnapshot",
     # Field
     "FieldProfile", "FieldCalendar", "FieldPricingRule", "CancellationPolicy", "Amenity", "FieldAmenity",
     # Booking
@@ -33,9 +38,13 @@ __all__ = [
     # Social
     "Post", "Comment", "Reaction",
     # Moderation
-    "Report", "ModerationLog",
+    "Report", "ReportCase", "ModerationLog", "ModerationCounter",
     # Notification
     "Notification", "NotificationPreference",
     # Media
     "MediaAsset",
+    # Email
+    "EmailOutbox", "EmailDeadLetter",
+    # Stats
+    "PlayerStats", "TeamStats",
 ]
@@ -0,0 +1,57 @@
+"""
+Email models: EmailOutbox, EmailDeadLetter.
+"""
+from datetime import datetime
+from typing import Optional
+from sqlalchemy import String, Text, Integer, DateTime, Enum as SQLEnum, Index
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.database import Base
+from app.models.enums import EmailStatus
+
+
+class EmailOutbox(Base):
+    """Outbound email waiting to be delivered by the email queue workers."""
+    __tablename__ = "email_outbox"
+    
+    email_id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
+    recipient: Mapped[str] = mapped_column(String(255), nullable=False)
+    recipient_domain: Mapped[str] = mapped_column(String(255), nullable=False, index=True)
+    subject: Mapped[str] = mapped_column(String(255), nullable=False)
+    body: Mapped[str] = mapped_column(Text, nullable=False)
+    status: Mapped[EmailStatus] = mapped_column(
+        SQLEnum(EmailStatus),
+        nullable=False,
+        default=EmailStatus.PENDING
+    )
+    attempts: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    next_attempt_at: Mapped[datetime] = mapped_column(DateTime, nullable=False, default=datetime.utcnow)
+    claim_token: Mapped[Optional[str]] = mapped_column(String(36), nullable=True, index=True)
+    claimed_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
+    last_error: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    created_at: Mapped[datetime] = mapped_column(DateTime, nullable=False, default=datetime.utcnow)
+    sent_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
+    
+    __table_args__ = (
+        Index("ix_email_outbox_status_next_attempt", "status", "next_attempt_at"),
+    )
+    
+    def __repr__(self) -> str:
+        return f"<EmailOutbox(id={self.email_id}, to='{self.recipient}', status={self.status.value})>"
+
+
+class EmailDeadLetter(Base):
+    """Email that exhausted its retries."""
+    __tablename__ = "email_dead_letter"
+    
+    dead_letter_id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
+    email_id: Mapped[int] = mapped_column(Integer, nullable=False, index=True)
+    recipient: Mapped[str] = mapped_column(String(255), nullable=False)
+    subject: Mapped[str] = mapped_column(String(255), nullable=False)
+    body: Mapped[str] = mapped_column(Text, nullable=False)
+    attempts: Mapped[int] = mapped_column(Integer, nullable=False)
+    last_error: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    failed_at: Mapped[datetime] = mapped_column(DateTime, nullable=False, default=datetime.utcnow)
+    
+    def __repr__(self) -> str:
+        return f"<EmailDeadLetter(id={self.dead_letter_id}, email={self.email_id})>"
@@ -152,6 +152,14 @@ class NotificationType(str, enum.Enum):
     REACTIONS = "Reactions"
 
 
+class EmailStatus(str, enum.Enum):
+    """Outbound email status."""
+    PENDING = "Pending"
+    SENDING = "Sending"
+    SENT = "Sent"
+    DEAD = "Dead"
+
+
 class PreferredFoot(str, enum.Enum):
     """Preferred foot."""
     LEFT = "Left"
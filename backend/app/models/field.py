@@ -4,7 +4,7 @@ Field-related models: FieldProfile, FieldCalendar, FieldPricingRule, Cancellatio
 from datetime import datetime, date, time
 from decimal import Decimal
 from typing import Optional, List, TYPE_CHECKING
-from sqlalchemy import String, Text, Float, Integer, Boolean, Date, Time, DateTime, Numeric, Enum as SQLEnum, JSON, ForeignKey
+from sqlalchemy import String, Text, Float, Integer, Boolean, Date, Time, DateTime, Numeric, Enum as SQLEnum, JSON, ForeignKey, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.database import Base
@@ -55,6 +55,11 @@ class FieldProfile(Base):
     booking_requests: Mapped[List["BookingRequest"]] = relationship("BookingRequest", back_populates="field")
     matches: Mapped[List["MatchEvent"]] = relationship("MatchEvent", back_populates="field")
     
+    __table_args__ = (
+        # Verification queue: pending fields, oldest first
+        Index("ix_field_profile_status_created", "status", "created_at"),
+    )
+    
     def __repr__(self) -> str:
         return f"<FieldProfile(id={self.field_id}, name='{self.field_name}')>"
 
@@ -3,7 +3,7 @@ Match-related models: MatchEvent, MatchInvitation, AttendanceRecord, MatchResult
 """
 from datetime import datetime, date, time
 from typing import Optional, List, TYPE_CHECKING
-from sqlalchemy import String, Text, Integer, Date, Time, DateTime, Enum as SQLEnum, ForeignKey
+from sqlalchemy import String, Text, Integer, Float, Date, Time, DateTime, Enum as SQLEnum, ForeignKey, UniqueConstraint
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.database import Base
@@ -107,6 +107,11 @@ class AttendanceRecord(Base):
     match: Mapped["MatchEvent"] = relationship("MatchEvent", back_populates="attendance_records")
     player: Mapped["PlayerProfile"] = relationship("PlayerProfile", back_populates="attendance_records")
     
+    __table_args__ = (
+        # One record per player per match; batch updates upsert against it
+        UniqueConstraint("match_id", "player_id", name="uq_attendance_record_match_player"),
+    )
+    
     def __repr__(self) -> str:
         return f"<AttendanceRecord(match={self.match_id}, player={self.player_id})>"
 
@@ -123,6 +128,8 @@ class MatchResult(Base):
     notes: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
     recorded_by: Mapped[int] = mapped_column(ForeignKey("user_account.user_id"), nullable=False)
     created_at: Mapped[datetime] = mapped_column(DateTime, nullable=False, default=datetime.utcnow)
+    # Elo points the host team gained (the opponent lost as many); None while the match is unrated
+    rating_change: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
     
     # Relationships
     match: Mapped["MatchEvent"] = relationship("MatchEvent", back_populates="result")
@@ -1,9 +1,9 @@
 """
-Moderation models: Report, ModerationLog.
+Moderation models: Report, ReportCase, ModerationLog, ModerationCounter.
 """
 from datetime import datetime
 from typing import Optional, TYPE_CHECKING
-from sqlalchemy import String, Text, Integer, DateTime, Enum as SQLEnum, ForeignKey
+from sqlalchemy import String, Text, Integer, DateTime, Enum as SQLEnum, ForeignKey, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.database import Base
@@ -19,6 +19,7 @@ class Report(Base):
     
     report_id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
     reporter_id: Mapped[int] = mapped_column(ForeignKey("user_account.user_id"), nullable=False, index=True)
+    case_id: Mapped[Optional[int]] = mapped_column(ForeignKey("report_case.case_id"), nullable=True, index=True)
     reported_user_id: Mapped[Optional[int]] = mapped_column(ForeignKey("user_account.user_id"), nullable=True, index=True)
     content_id: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
     content_type: Mapped[ReportContentType] = mapped_column(SQLEnum(ReportContentType), nullable=False)
@@ -32,10 +33,52 @@ class Report(Base):
     created_at: Mapped[datetime] = mapped_column(DateTime, nullable=False, default=datetime.utcnow)
     resolved_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
     
+    __table_args__ = (
+        # Report queue by status, oldest first
+        Index("ix_report_status_created", "status", "created_at"),
+    )
+    
     def __repr__(self) -> str:
         return f"<Report(id={self.report_id}, type={self.content_type.value})>"
 
 
+class ReportCase(Base):
+    """All reports against one piece of content (or one user), handled as a single case."""
+    __tablename__ = "report_case"
+    
+    case_id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
+    content_type: Mapped[ReportContentType] = mapped_column(SQLEnum(ReportContentType), nullable=False)
+    content_id: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
+    reported_user_id: Mapped[Optional[int]] = mapped_column(ForeignKey("user_account.user_id"), nullable=True)
+    # "<content type>:<target id>" while pending, NULL once closed, so each target has at most one open case
+    open_key: Mapped[Optional[str]] = mapped_column(String(64), nullable=True, unique=True)
+    # Users with a pending report in the case, however many reports each filed
+    report_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    status: Mapped[ReportStatus] = mapped_column(
+        SQLEnum(ReportStatus),
+        nullable=False,
+        default=ReportStatus.PENDING
+    )
+    created_at: Mapped[datetime] = mapped_column(DateTime, nullable=False, default=datetime.utcnow)
+    latest_report_at: Mapped[datetime] = mapped_column(DateTime, nullable=False, default=datetime.utcnow)
+    resolved_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
+    
+    __table_args__ = (
+        # Case queue by status, oldest first or most reported first
+        Index("ix_report_case_status_created", "status", "created_at"),
+        Index("ix_report_case_status_count", "status", "report_count", "case_id"),
+    )
+    
+    @staticmethod
+    def key_for(content_type: ReportContentType, content_id: Optional[int], reported_user_id: Optional[int]) -> str:
+        """open_key of the case for a report's target: its content, or the reported user if it has none."""
+        target_id = content_id if content_id is not None else reported_user_id
+        return f"{content_type.value}:{target_id}"
+    
+    def __repr__(self) -> str:
+        return f"<ReportCase(id={self.case_id}, key='{self.open_key}', reporters={self.report_count})>"
+
+
 class ModerationLog(Base):
     """Audit trail for moderation actions."""
     __tablename__ = "moderation_log"
@@ -50,3 +93,20 @@ class ModerationLog(Base):
     
     def __repr__(self) -> str:
         return f"<ModerationLog(id={self.log_id}, action={self.action.value})>"
+
+
+class ModerationCounter(Base):
+    """Materialized count backing the moderation dashboard."""
+    __tablename__ = "moderation_counter"
+    
+    name: Mapped[str] = mapped_column(String(50), primary_key=True)
+    value: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime,
+        nullable=False,
+        default=datetime.utcnow,
+        onupdate=datetime.utcnow
+    )
+    
+    def __repr__(self) -> str:
+        return f"<ModerationCounter(name='{self.name}', value={self.value})>"
@@ -0,0 +1,63 @@
+"""
+Denormalized match statistics: PlayerStats, TeamStats.
+
+Maintained by StatsService whenever a result is recorded, attendance
+changes or a match is cancelled, and rebuildable from the match tables.
+team_stats also persists the league table (see LeagueTable) and each
+team's Elo rating (see rating_service).
+"""
+from typing import Optional
+from sqlalchemy import Integer, Float, String, ForeignKey
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.database import Base
+
+INITIAL_RATING = 1500.0  # Elo rating of a team without rated matches
+
+
+class PlayerStats(Base):
+    """A player's totals over all non-cancelled matches."""
+    __tablename__ = "player_stats"
+    
+    player_id: Mapped[int] = mapped_column(
+        ForeignKey("player_profile.player_id", ondelete="CASCADE"), primary_key=True
+    )
+    matches_played: Mapped[int] = mapped_column(Integer, nullable=False, default=0)  # Attendance: Present
+    matches_missed: Mapped[int] = mapped_column(Integer, nullable=False, default=0)  # Absent or Excused
+    wins: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    draws: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    losses: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    goals_for: Mapped[int] = mapped_column(Integer, nullable=False, default=0)  # Team goals in matches played
+    goals_against: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    
+    @property
+    def attendance_rate(self) -> Optional[float]:
+        answered = self.matches_played + self.matches_missed
+        return self.matches_played / answered if answered else None
+    
+    def __repr__(self) -> str:
+        return f"<PlayerStats(player={self.player_id}, played={self.matches_played})>"
+
+
+class TeamStats(Base):
+    """A team's record over all non-cancelled matches with a result."""
+    __tablename__ = "team_stats"
+    
+    team_id: Mapped[int] = mapped_column(
+        ForeignKey("team_profile.team_id", ondelete="CASCADE"), primary_key=True
+    )
+    matches_played: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    wins: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    draws: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    losses: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    goals_for: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    goals_against: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    form: Mapped[str] = mapped_column(String(5), nullable=False, default="")  # Last results, oldest first: "WDLWW"
+    rating: Mapped[float] = mapped_column(Float, nullable=False, default=INITIAL_RATING, index=True)
+    
+    @property
+    def points(self) -> int:
+        return 3 * self.wins + self.draws
+    
+    def __repr__(self) -> str:
+        return f"<TeamStats(team={self.team_id}, W{self.wins} D{self.draws} L{self.losses})>"
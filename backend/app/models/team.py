@@ -1,10 +1,13 @@
 """
-Team-related models: TeamProfile, TeamRoster, JoinRequest, TeamWallet, TransactionLog.
+Team-related models: TeamProfile, TeamRoster, JoinRequest, TeamWallet, TransactionLog,
+WalletMonthlyTotal, WalletBalanceSnapshot.
 """
-from datetime import datetime
+from datetime import datetime, date
 from decimal import Decimal
 from typing import Optional, List, TYPE_CHECKING
-from sqlalchemy import String, Text, Float, Integer, Boolean, DateTime, Numeric, Enum as SQLEnum, ForeignKey
+from sqlalchemy import (
+    String, Text, Float, Integer, Boolean, Date, DateTime, Numeric, Enum as SQLEnum, ForeignKey, Index
+)
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.database import Base
@@ -59,6 +62,11 @@ class TeamProfile(Base):
     booking_requests: Mapped[List["BookingRequest"]] = relationship("BookingRequest", back_populates="team")
     posts: Mapped[List["Post"]] = relationship("Post", back_populates="team")
     
+    __table_args__ = (
+        # Verification queue: pending teams, oldest first
+        Index("ix_team_profile_status_created", "status", "created_at"),
+    )
+    
     def __repr__(self) -> str:
         return f"<TeamProfile(id={self.team_id}, name='{self.team_name}')>"
 
@@ -144,7 +152,7 @@ class TransactionLog(Base):
     __tablename__ = "transaction_log"
     
     transaction_id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
-    wallet_id: Mapped[int] = mapped_column(ForeignKey("team_wallet.wallet_id"), nullable=False, index=True)
+    wallet_id: Mapped[int] = mapped_column(ForeignKey("team_wallet.wallet_id"), nullable=False)
     type: Mapped[TransactionType] = mapped_column(SQLEnum(TransactionType), nullable=False)
     amount: Mapped[Decimal] = mapped_column(Numeric(15, 2), nullable=False)
     description: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
@@ -155,5 +163,38 @@ class TransactionLog(Base):
     # Relationships
     wallet: Mapped["TeamWallet"] = relationship("TeamWallet", back_populates="transactions")
     
+    __table_args__ = (
+        # Statement tails: a wallet's transactions within a time range
+        Index("ix_transaction_log_wallet_created", "wallet_id", "created_at"),
+    )
+    
     def __repr__(self) -> str:
         return f"<TransactionLog(id={self.transaction_id}, type={self.type.value}, amount={self.amount})>"
+
+
+class WalletMonthlyTotal(Base):
+    """Per-month, per-category transaction totals of a wallet, kept in step with TransactionLog."""
+    __tablename__ = "wallet_monthly_total"
+    
+    wallet_id: Mapped[int] = mapped_column(ForeignKey("team_wallet.wallet_id", ondelete="CASCADE"), primary_key=True)
+    month: Mapped[date] = mapped_column(Date, primary_key=True)  # First day of the month
+    type: Mapped[TransactionType] = mapped_column(SQLEnum(TransactionType), primary_key=True)
+    category: Mapped[str] = mapped_column(String(100), primary_key=True, default="")  # "" = uncategorised
+    total: Mapped[Decimal] = mapped_column(Numeric(15, 2), nullable=False, default=Decimal("0.00"))
+    transaction_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    
+    def __repr__(self) -> str:
+        return f"<WalletMonthlyTotal(wallet={self.wallet_id}, month={self.month}, {self.type.value}={self.total})>"
+
+
+class WalletBalanceSnapshot(Base):
+    """A wallet's balance at the start of a month."""
+    __tablename__ = "wallet_balance_snapshot"
+    
+    wallet_id: Mapped[int] = mapped_column(ForeignKey("team_wallet.wallet_id", ondelete="CASCADE"), primary_key=True)
+    month: Mapped[date] = mapped_column(Date, primary_key=True)  # First day of the month
+    opening_balance: Mapped[Decimal] = mapped_column(Numeric(15, 2), nullable=False)
+    created_at: Mapped[datetime] = mapped_column(DateTime, nullable=False, default=datetime.utcnow)
+    
+    def __repr__(self) -> str:
+        return f"<WalletBalanceSnapshot(wallet={self.wallet_id}, month={self.month}, opening={self.opening_balance})>"
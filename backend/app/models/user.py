@@ -2,23 +2,49 @@
 User and Session models.
 """
 from datetime import datetime
-from typing import Optional, List
-from sqlalchemy import String, Text, Float, Boolean, DateTime, Enum as SQLEnum, JSON, ForeignKey
-from sqlalchemy.orm import Mapped, mapped_column, relationship
+from typing import Iterable, Optional, List
+from sqlalchemy import String, Text, Float, Integer, Boolean, DateTime, Enum as SQLEnum, JSON, ForeignKey, Index
+from sqlalchemy.orm import Mapped, mapped_column, relationship, validates
 
 from app.database import Base
 from app.models.enums import AccountStatus, UserRole
 
+# One bit per role in UserAccount.role_mask; never renumber
+ROLE_BITS = {
+    UserRole.PLAYER.value: 1,
+    UserRole.TEAM_LEADER.value: 2,
+    UserRole.FIELD_OWNER.value: 4,
+    UserRole.MODERATOR.value: 8,
+}
+
+
+def role_mask(roles: Iterable[str]) -> int:
+    """Bitmask of a list of UserRole values (unknown roles are ignored)."""
+    mask = 0
+    for role in roles or ():
+        mask |= ROLE_BITS.get(role, 0)
+    return mask
+
+
+def masks_with(bits: int) -> List[int]:
+    """Every role_mask value sharing a bit with `bits`, for an index-friendly IN filter."""
+    return [mask for mask in range(1 << len(ROLE_BITS)) if mask & bits]
+
 
 class UserAccount(Base):
     """User account for authentication and role management."""
     __tablename__ = "user_account"
+    __table_args__ = (
+        # Role-filtered listings: IN (masks) on role_mask, keyset on user_id
+        Index("ix_user_account_role_mask_user_id", "role_mask", "user_id"),
+    )
     
     user_id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
     username: Mapped[str] = mapped_column(String(255), unique=True, nullable=False, index=True)
     email: Mapped[str] = mapped_column(String(255), unique=True, nullable=False, index=True)
     password_hash: Mapped[str] = mapped_column(String(255), nullable=False)
     roles: Mapped[List[str]] = mapped_column(JSON, nullable=False, default=list)  # List of UserRole values
+    role_mask: Mapped[int] = mapped_column(Integer, nullable=False, default=0, server_default="0")  # Kept in step with roles
     status: Mapped[AccountStatus] = mapped_column(
         SQLEnum(AccountStatus), 
         nullable=False, 
@@ -47,6 +73,16 @@ class UserAccount(Base):
     reactions: Mapped[List["Reaction"]] = relationship("Reaction", back_populates="user")
     notifications: Mapped[List["Notification"]] = relationship("Notification", back_populates="user")
     
+    @validates("roles")
+    def _sync_role_mask(self, key: str, roles: List[str]) -> List[str]:
+        # Roles are always assigned as a whole list, never mutated in place
+        self.role_mask = role_mask(roles)
+        return roles
+    
+    def has_role(self, *roles: str) -> bool:
+        """Whether the user has any of these roles."""
+        return bool(self.role_mask & role_mask(roles))
+    
     def __repr__(self) -> str:
         return f"<UserAccount(id={self.user_id}, username='{self.username}')>"
 
@@ -4,21 +4,31 @@ Repositories package - Data Access Layer (DAO pattern).
 from app.repositories.base_repository import BaseRepository
 from app.repositories.user_repository import UserRepository, SessionRepository
 from app.repositories.player_repository import PlayerRepository
-from app.repositories.team_repository import TeamRepository, RosterRepository, JoinRequestRepository
-from app.repositories.field_repository import FieldRepository, CalendarRepository
+from app.repositories.team_repository import (
+    TeamRepository, RosterRepository, JoinRequestRepository, WalletRepository, TransactionRepository,
+    WalletMonthlyTotalRepository, WalletSnapshotRepository,
+)
+from app.repositories.field_repository import FieldRepository, CalendarRepository, AmenityRepository
 from app.repositories.booking_repository import BookingRepository
 from app.repositories.match_repository import MatchRepository, InvitationRepository, AttendanceRepository
 from app.repositories.content_repository import PostRepository, CommentRepository, ReactionRepository
 from app.repositories.notification_repository import NotificationRepository
+from app.repositories.email_repository import EmailOutboxRepository
+from app.repositories.moderation_repository import ModerationCounterRepository
+from app.repositories.stats_repository import PlayerStatsRepository, TeamStatsRepository
 
 __all__ = [
     "BaseRepository",
     "UserRepository", "SessionRepository",
     "PlayerRepository",
     "TeamRepository", "RosterRepository", "JoinRequestRepository",
-    "FieldRepository", "CalendarRepository",
+    "WalletRepository", "TransactionRepository", "WalletMonthlyTotalRepository", "WalletSnapshotRepository",
+    "FieldRepository", "CalendarRepository", "AmenityRepository",
     "BookingRepository",
     "MatchRepository", "InvitationRepository", "AttendanceRepository",
     "PostRepository", "CommentRepository", "ReactionRepository",
     "NotificationRepository",
+    "EmailOutboxRepository",
+    "ModerationCounterRepository",
+    "PlayerStatsRepository", "TeamStatsRepository",
 ]
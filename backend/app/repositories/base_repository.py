@@ -2,16 +2,22 @@
 Base repository providing generic CRUD operations.
 All entity repositories extend this base class following the DAO pattern.
 """
-from typing import TypeVar, Generic, Optional, List, Type
+from typing import TypeVar, Generic, Optional, List, Type, Iterable, Dict, Any, Callable
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, update, delete
-from sqlalchemy.orm import selectinload
+from sqlalchemy import select, update, delete, inspect
+from sqlalchemy.dialects.mysql import insert as mysql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import selectinload, MANYTOONE
+from sqlalchemy.orm.attributes import set_committed_value
 
 from app.database import Base
 
 # Generic type for the model
 T = TypeVar('T', bound=Base)
 
+# Relationship loader strategies a full refresh would have populated
+EAGER_LOADERS = {"joined", "selectin", "subquery", "immediate"}
+
 
 class BaseRepository(Generic[T]):
     """
@@ -44,16 +50,137 @@ class BaseRepository(Generic[T]):
     async def save(self, entity: T) -> T:
         """Save a new entity."""
         self.db.add(entity)
+        stale = self._changed_relationships(entity)
         await self.db.flush()
-        await self.db.refresh(entity)
+        await self._load_server_values([entity], inserted=True)
+        if stale:
+            await self._reload_relationships(entity, stale)
         return entity
     
+    async def save_many(self, entities: List[T]) -> List[T]:
+        """Save many new entities in one flush (batched INSERTs)."""
+        if not entities:
+            return entities
+        self.db.add_all(entities)
+        await self.db.flush()
+        await self._load_server_values(entities, inserted=True)
+        return entities
+    
     async def update(self, entity: T) -> T:
         """Update an existing entity."""
+        stale = self._changed_relationships(entity)
         await self.db.flush()
-        await self.db.refresh(entity)
+        await self._load_server_values([entity])
+        if stale:
+            await self._reload_relationships(entity, stale)
         return entity
     
+    async def update_many(self, ids: Iterable[Any], values: Dict[str, Any], *criteria) -> int:
+        """
+        Set `values` on all rows whose primary key is in `ids` with a single
+        UPDATE; extra criteria narrow the match. Returns the rows affected.
+        
+        Values may be SQL expressions, e.g. {"count": Model.count + 1}.
+        """
+        ids = list(ids)
+        if not ids:
+            return 0
+        result = await self.db.execute(
+            update(self.model)
+            .where(self._pk_column().in_(ids), *criteria)
+            .values(**values)
+        )
+        return result.rowcount
+    
+    def _insert_on_conflict(
+        self,
+        unique_columns: List[str],
+        set_: Optional[Callable[[Any], Dict[str, Any]]] = None,
+    ):
+        """
+        INSERT for the dialect in use that, when a row collides with an
+        existing one on the unique key `unique_columns`, applies the SET
+        mapping `set_(new)` to the existing row, `new` standing for the
+        values being inserted; with no `set_` the row is skipped.
+        
+        Built against the Table (Core), not the mapper, so the rowcount is
+        reported.
+        """
+        table = self.model.__table__
+        dialect = self.db.get_bind().dialect.name
+        if dialect == "mysql":
+            stmt = mysql_insert(table)
+            if set_ is None:
+                # Assigning a key column to itself makes a duplicate a no-op
+                key = unique_columns[0]
+                return stmt.on_duplicate_key_update({key: stmt.inserted[key]})
+            return stmt.on_duplicate_key_update(set_(stmt.inserted))
+        if dialect == "sqlite":
+            stmt = sqlite_insert(table)
+            if set_ is None:
+                return stmt.on_conflict_do_nothing(index_elements=unique_columns)
+            return stmt.on_conflict_do_update(index_elements=unique_columns, set_=set_(stmt.excluded))
+        raise NotImplementedError(f"INSERT ... ON CONFLICT is not supported on {dialect}")
+    
+    async def insert_ignore(self, rows: List[Dict[str, Any]], unique_columns: List[str]) -> int:
+        """
+        Insert rows with a single INSERT, skipping any that collide with an
+        existing row on the unique key `unique_columns`.
+        
+        Unlike add + flush, a concurrent insert of the same key is not an
+        error, so get-or-create needs no savepoint, retry or separate
+        commit. Column defaults apply; rows are given by column name and nothing is
+        added to the session.
+        Returns the rows inserted.
+        """
+        if not rows:
+            return 0
+        result = await self.db.execute(self._insert_on_conflict(unique_columns), rows)
+        return result.rowcount
+    
+    async def insert_or_increment(
+        self,
+        rows: List[Dict[str, Any]],
+        unique_columns: List[str],
+        increment_columns: List[str],
+        update_columns: List[str] = (),
+    ) -> None:
+        """
+        Insert rows; for a row whose unique key already exists, add its
+        `increment_columns` values to the stored ones instead (and
+        overwrite its `update_columns`, e.g. a last-seen timestamp).
+        
+        One atomic statement per call, so concurrent writers maintaining the
+        same aggregate row never lose an increment.
+        """
+        if not rows:
+            return
+        table = self.model.__table__
+        stmt = self._insert_on_conflict(unique_columns, lambda new: {
+            **{column: table.c[column] + new[column] for column in increment_columns},
+            **{column: new[column] for column in update_columns},
+        })
+        await self.db.execute(stmt, rows)
+    
+    async def upsert(
+        self,
+        rows: List[Dict[str, Any]],
+        unique_columns: List[str],
+        update_columns: List[str],
+    ) -> None:
+        """
+        Insert rows; for a row whose unique key already exists, overwrite its
+        `update_columns` with the new values instead.
+        
+        A whole batch is one statement, with no prior SELECT to decide
+        between insert and update. Objects already in the session are not
+        refreshed; reload them with populate_existing.
+        """
+        if not rows:
+            return
+        stmt = self._insert_on_conflict(unique_columns, lambda new: {column: new[column] for column in update_columns})
+        await self.db.execute(stmt, rows)
+    
     async def delete(self, entity: T) -> bool:
         """Delete an entity."""
         await self.db.delete(entity)
@@ -68,10 +195,97 @@ class BaseRepository(Generic[T]):
             return True
         return False
     
+    async def delete_many(self, ids: Iterable[Any], *criteria) -> int:
+        """
+        Delete all rows whose primary key is in `ids` with a single DELETE.
+        
+        ORM-level cascades do not run; use `delete` for entities that rely
+        on them. Returns the rows affected.
+        """
+        ids = list(ids)
+        if not ids:
+            return 0
+        result = await self.db.execute(
+            delete(self.model).where(self._pk_column().in_(ids), *criteria)
+        )
+        return result.rowcount
+    
     async def commit(self) -> None:
         """Commit the current transaction."""
         await self.db.commit()
     
+    async def _load_server_values(self, entities: List[T], inserted: bool = False) -> None:
+        """
+        Load column values the flush left unloaded, without a full refresh.
+        
+        Python-side defaults and autoincrement keys are set by the flush
+        itself, and server defaults come back via RETURNING where the dialect
+        supports it. Columns omitted from an INSERT that have no server-side
+        default are known to be NULL; anything else is fetched with a single
+        SELECT by primary key.
+        """
+        mapper = inspect(self.model)
+        missing = set()
+        for entity in entities:
+            unloaded = inspect(entity).unloaded
+            for attr in mapper.column_attrs:
+                if attr.key not in unloaded:
+                    continue
+                column = attr.columns[0]
+                if inserted and column.server_default is None and column.server_onupdate is None:
+                    set_committed_value(entity, attr.key, None)
+                else:
+                    missing.add(attr.key)
+        if not missing:
+            return
+        
+        pk = self._pk_column()
+        keys = sorted(missing)
+        by_id = {getattr(entity, pk.key): entity for entity in entities}
+        result = await self.db.execute(
+            select(pk, *[getattr(self.model, key) for key in keys]).where(pk.in_(list(by_id)))
+        )
+        for row in result.all():
+            entity = by_id[row[0]]
+            for key, value in zip(keys, row[1:]):
+                set_committed_value(entity, key, value)
+    
+    def _changed_relationships(self, entity: T) -> List[str]:
+        """
+        Many-to-one relationships made stale by a pending foreign key change.
+        
+        Only relationships that are already loaded or eagerly loaded count;
+        the rest are resolved lazily as before.
+        """
+        state = inspect(entity)
+        stale = []
+        for rel in state.mapper.relationships:
+            if rel.direction is not MANYTOONE or rel.viewonly:
+                continue
+            if rel.key not in state.dict and rel.lazy not in EAGER_LOADERS:
+                continue
+            keys = [state.mapper.get_property_by_column(col).key for col in rel.local_columns]
+            if any(state.attrs[key].history.has_changes() for key in keys):
+                stale.append(rel.key)
+        return stale
+    
+    async def _reload_relationships(self, entity: T, keys: List[str]) -> None:
+        """Reload the given relationships; a NULL foreign key needs no query."""
+        state = inspect(entity)
+        to_load = []
+        for key in keys:
+            rel = state.mapper.relationships[key]
+            if all(getattr(entity, state.mapper.get_property_by_column(col).key) is None for col in rel.local_columns):
+                set_committed_value(entity, key, None)
+            else:
+                to_load.append(key)
+        if to_load:
+            await self.db.refresh(entity, attribute_names=to_load)
+    
+    def _pk_column(self):
+        """Get the mapped primary key attribute."""
+        return getattr(self.model, self._get_pk_name())
+    
     def _get_pk_name(self) -> str:
         """Get the primary key column name."""
         pk_columns = self.model.__table__.primary_key.columns
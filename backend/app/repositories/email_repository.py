@@ -0,0 +1,109 @@
+"""
+Email outbox repository.
+"""
+import uuid
+from datetime import datetime, timedelta
+from typing import List
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, update, insert
+
+from app.repositories.base_repository import BaseRepository
+from app.models.email import EmailOutbox, EmailDeadLetter
+from app.models.enums import EmailStatus
+
+
+class EmailOutboxRepository(BaseRepository[EmailOutbox]):
+    """Repository for EmailOutbox operations."""
+    
+    def __init__(self, db: AsyncSession):
+        super().__init__(EmailOutbox, db)
+    
+    async def enqueue_many(self, rows: List[dict]) -> int:
+        """Insert many outbound emails with a single executemany statement."""
+        if not rows:
+            return 0
+        await self.db.execute(insert(EmailOutbox), rows)
+        return len(rows)
+    
+    async def claim_due(self, limit: int, now: datetime = None) -> List[EmailOutbox]:
+        """
+        Claim up to `limit` due emails for delivery, grouped by recipient domain.
+        
+        Rows are claimed with a conditional UPDATE and a fresh token, so
+        concurrent workers never pick up the same email.
+        """
+        now = now or datetime.utcnow()
+        result = await self.db.execute(
+            select(EmailOutbox.email_id)
+            .where(EmailOutbox.status == EmailStatus.PENDING, EmailOutbox.next_attempt_at <= now)
+            .order_by(EmailOutbox.next_attempt_at)
+            .limit(limit)
+        )
+        ids = list(result.scalars().all())
+        if not ids:
+            return []
+        
+        token = str(uuid.uuid4())
+        await self.db.execute(
+            update(EmailOutbox)
+            .where(EmailOutbox.email_id.in_(ids), EmailOutbox.status == EmailStatus.PENDING)
+            .values(status=EmailStatus.SENDING, claim_token=token, claimed_at=now)
+        )
+        result = await self.db.execute(
+            select(EmailOutbox)
+            .where(EmailOutbox.claim_token == token)
+            .order_by(EmailOutbox.recipient_domain, EmailOutbox.email_id)
+        )
+        return list(result.scalars().all())
+    
+    async def mark_sent(self, email_ids: List[int]) -> None:
+        """Mark delivered emails as sent."""
+        if not email_ids:
+            return
+        await self.db.execute(
+            update(EmailOutbox)
+            .where(EmailOutbox.email_id.in_(email_ids))
+            .values(status=EmailStatus.SENT, sent_at=datetime.utcnow(), claim_token=None, last_error=None)
+        )
+    
+    async def schedule_retry(self, email: EmailOutbox, next_attempt_at: datetime, error: str) -> None:
+        """Return an email to the queue for a later attempt."""
+        await self.db.execute(
+            update(EmailOutbox)
+            .where(EmailOutbox.email_id == email.email_id)
+            .values(
+                status=EmailStatus.PENDING,
+                attempts=email.attempts + 1,
+                next_attempt_at=next_attempt_at,
+                claim_token=None,
+                last_error=error,
+            )
+        )
+    
+    async def move_to_dead_letter(self, email: EmailOutbox, error: str) -> None:
+        """Record an email that exhausted its retries."""
+        self.db.add(EmailDeadLetter(
+            email_id=email.email_id,
+            recipient=email.recipient,
+            subject=email.subject,
+            body=email.body,
+            attempts=email.attempts + 1,
+            last_error=error,
+        ))
+        await self.db.execute(
+            update(EmailOutbox)
+            .where(EmailOutbox.email_id == email.email_id)
+            .values(status=EmailStatus.DEAD, attempts=email.attempts + 1, claim_token=None, last_error=error)
+        )
+    
+    async def release_stale(self, lease: timedelta) -> int:
+        """Return emails stuck in Sending (e.g. after a crash) to the queue."""
+        result = await self.db.execute(
+            update(EmailOutbox)
+            .where(
+                EmailOutbox.status == EmailStatus.SENDING,
+                EmailOutbox.claimed_at < datetime.utcnow() - lease
+            )
+            .values(status=EmailStatus.PENDING, claim_token=None)
+        )
+        return result.rowcount
@@ -1,13 +1,14 @@
 """
-Field and Calendar repositories.
+Field, Calendar and Amenity repositories.
 """
-from typing import Optional, List
-from datetime import date
+from typing import Optional, List, Tuple
+from datetime import date, datetime
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 
 from app.repositories.base_repository import BaseRepository
-from app.models.field import FieldProfile, FieldCalendar
+from app.utils.keyset import keyset_after
+from app.models.field import FieldProfile, FieldCalendar, Amenity, FieldAmenity
 from app.models.enums import FieldStatus
 
 
@@ -31,11 +32,12 @@ class FieldRepository(BaseRepository[FieldProfile]):
         )
         return list(result.scalars().all())
     
-    async def find_pending(self) -> List[FieldProfile]:
-        """Find fields pending verification."""
-        result = await self.db.execute(
-            select(FieldProfile).where(FieldProfile.status == FieldStatus.PENDING)
-        )
+    async def find_pending(self, after: Optional[Tuple[datetime, int]] = None, limit: int = 50) -> List[FieldProfile]:
+        """A page of fields pending verification, oldest first, after (created_at, field_id)."""
+        stmt = select(FieldProfile).where(FieldProfile.status == FieldStatus.PENDING)
+        if after:
+            stmt = stmt.where(keyset_after((FieldProfile.created_at, after[0], False), (FieldProfile.field_id, after[1], False)))
+        result = await self.db.execute(stmt.order_by(FieldProfile.created_at, FieldProfile.field_id).limit(limit))
         return list(result.scalars().all())
     
     async def search(self, query: str = None, location: str = None, limit: int = 20) -> List[FieldProfile]:
@@ -49,6 +51,24 @@ class FieldRepository(BaseRepository[FieldProfile]):
         
         result = await self.db.execute(stmt.limit(limit))
         return list(result.scalars().all())
+    
+    async def find_amenity_ids(self, field_id: int) -> List[int]:
+        """IDs of the amenities linked to a field."""
+        result = await self.db.execute(
+            select(FieldAmenity.amenity_id)
+            .where(FieldAmenity.field_id == field_id)
+            .order_by(FieldAmenity.field_amenity_id)
+        )
+        return list(result.scalars().all())
+    
+    
+    async def find_suggestions(self, field_ids: Optional[List[int]] = None) -> List[tuple]:
+        """(field_id, field_name) of verified fields, optionally only these."""
+        stmt = select(FieldProfile.field_id, FieldProfile.field_name).where(FieldProfile.status == FieldStatus.VERIFIED)
+        if field_ids is not None:
+            stmt = stmt.where(FieldProfile.field_id.in_(field_ids))
+        result = await self.db.execute(stmt)
+        return [tuple(row) for row in result.all()]
 
 
 class CalendarRepository(BaseRepository[FieldCalendar]):
@@ -68,3 +88,15 @@ class CalendarRepository(BaseRepository[FieldCalendar]):
         
         result = await self.db.execute(stmt.order_by(FieldCalendar.date, FieldCalendar.start_time))
         return list(result.scalars().all())
+
+
+class AmenityRepository(BaseRepository[Amenity]):
+    """Repository for the Amenity lookup table."""
+    
+    def __init__(self, db: AsyncSession):
+        super().__init__(Amenity, db)
+    
+    async def find_all_ordered(self) -> List[Amenity]:
+        """All amenities, active or not, by ID."""
+        result = await self.db.execute(select(Amenity).order_by(Amenity.amenity_id))
+        return list(result.scalars().all())
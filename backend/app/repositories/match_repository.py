@@ -1,13 +1,14 @@
 """
 Match, Invitation, and Attendance repositories.
 """
-from typing import Optional, List
+from datetime import date
+from typing import Dict, Optional, List, Set
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, or_
+from sqlalchemy import select, update, or_, func
 
 from app.repositories.base_repository import BaseRepository
-from app.models.match import MatchEvent, MatchInvitation, AttendanceRecord
-from app.models.enums import InvitationStatus
+from app.models.match import MatchEvent, MatchInvitation, AttendanceRecord, MatchResult
+from app.models.enums import InvitationStatus, AttendanceStatus, MatchStatus
 
 
 class MatchRepository(BaseRepository[MatchEvent]):
@@ -23,6 +24,20 @@ class MatchRepository(BaseRepository[MatchEvent]):
         )
         return result.scalar_one_or_none()
     
+    async def lock(self, match: MatchEvent) -> MatchEvent:
+        """
+        Lock the match row until the transaction ends (SELECT ... FOR
+        UPDATE) and refresh the match from it, so writers deriving stats
+        from the match's current state run one at a time.
+        """
+        result = await self.db.execute(
+            select(MatchEvent)
+            .where(MatchEvent.match_id == match.match_id)
+            .with_for_update()
+            .execution_options(populate_existing=True)
+        )
+        return result.scalar_one()
+    
     async def find_by_team(self, team_id: int) -> List[MatchEvent]:
         """Find matches where team is host or opponent."""
         result = await self.db.execute(
@@ -34,6 +49,14 @@ class MatchRepository(BaseRepository[MatchEvent]):
             .order_by(MatchEvent.match_date.desc())
         )
         return list(result.scalars().all())
+    
+    async def find_busy_team_ids(self, match_date: date) -> Set[int]:
+        """Teams hosting or playing a non-cancelled match on the date."""
+        result = await self.db.execute(
+            select(MatchEvent.host_team_id, MatchEvent.opponent_team_id)
+            .where(MatchEvent.match_date == match_date, MatchEvent.status != MatchStatus.CANCELLED)
+        )
+        return {team_id for row in result.all() for team_id in row if team_id}
 
 
 class InvitationRepository(BaseRepository[MatchInvitation]):
@@ -79,20 +102,81 @@ class AttendanceRepository(BaseRepository[AttendanceRecord]):
             select(AttendanceRecord).where(AttendanceRecord.player_id == player_id)
         )
         return list(result.scalars().all())
+    
+    async def find_by_match_and_players(self, match_id: int, player_ids: List[int]) -> Dict[int, AttendanceRecord]:
+        """Map player_id -> record for the given players of a match, in one query."""
+        if not player_ids:
+            return {}
+        result = await self.db.execute(
+            select(AttendanceRecord)
+            .where(AttendanceRecord.match_id == match_id, AttendanceRecord.player_id.in_(player_ids))
+            .execution_options(populate_existing=True)
+        )
+        return {r.player_id: r for r in result.scalars().all()}
+    
+    async def find_statuses(self, match_id: int) -> List[tuple]:
+        """(player_id, team_id, status) of every record of a match, as stored."""
+        result = await self.db.execute(
+            select(AttendanceRecord.player_id, AttendanceRecord.team_id, AttendanceRecord.status)
+            .where(AttendanceRecord.match_id == match_id)
+        )
+        return list(result.all())
+    
+    async def upsert_statuses(self, rows: List[dict]) -> None:
+        """
+        Set status/confirmation on (match_id, player_id) records, creating
+        missing ones with the given team_id; existing records keep theirs.
+        """
+        await self.upsert(
+            rows, ["match_id", "player_id"], ["status", "confirmed_at", "confirmed_by"]
+        )
+    
+    async def count_by_status(self, match_id: int) -> Dict[AttendanceStatus, int]:
+        """Number of a match's attendance records per status."""
+        result = await self.db.execute(
+            select(AttendanceRecord.status, func.count())
+            .where(AttendanceRecord.match_id == match_id)
+            .group_by(AttendanceRecord.status)
+        )
+        return dict(result.all())
 
 
 class ResultRepository(BaseRepository):
     """Repository for MatchResult operations."""
     
     def __init__(self, db: AsyncSession):
-        from app.models.match import MatchResult
         super().__init__(MatchResult, db)
     
     async def find_by_match(self, match_id: int):
         """Find result for a match."""
-        from app.models.match import MatchResult
         result = await self.db.execute(
             select(MatchResult).where(MatchResult.match_id == match_id)
+            .execution_options(populate_existing=True)
         )
         return result.scalar_one_or_none()
+    
+    async def find_rated_history(self) -> List[tuple]:
+        """
+        (result_id, host_team_id, opponent_team_id, home_score, away_score)
+        of every non-cancelled match between two teams, oldest first.
+        """
+        result = await self.db.execute(
+            select(
+                MatchResult.result_id, MatchEvent.host_team_id, MatchEvent.opponent_team_id,
+                MatchResult.home_score, MatchResult.away_score,
+            )
+            .join(MatchEvent, MatchEvent.match_id == MatchResult.match_id)
+            .where(MatchEvent.status != MatchStatus.CANCELLED, MatchEvent.opponent_team_id.is_not(None))
+            .order_by(MatchEvent.match_date, MatchEvent.start_time, MatchEvent.match_id)
+        )
+        return [tuple(row) for row in result.all()]
+    
+    async def replace_rating_changes(self, changes: Dict[int, float]) -> None:
+        """Clear every stored rating change, then write the given ones by result ID (no commit)."""
+        await self.db.execute(update(MatchResult).values(rating_change=None))
+        if changes:
+            await self.db.execute(
+                update(MatchResult),
+                [{"result_id": result_id, "rating_change": change} for result_id, change in changes.items()],
+            )
 
@@ -0,0 +1,304 @@
+"""
+Moderation repositories: report queue, report cases, moderation log and dashboard counters.
+"""
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, update, insert, func, and_, distinct
+
+from app.repositories.base_repository import BaseRepository
+from app.models.moderation import Report, ReportCase, ModerationLog, ModerationCounter
+from app.models.team import TeamProfile
+from app.models.field import FieldProfile
+from app.models.user import UserAccount
+from app.models.enums import ReportStatus, TeamStatus, FieldStatus, ModerationAction
+from app.utils.keyset import keyset_after
+
+
+class ReportRepository(BaseRepository[Report]):
+    """Repository for Report operations."""
+    
+    def __init__(self, db: AsyncSession):
+        super().__init__(Report, db)
+    
+    async def find_queue(
+        self,
+        status: Optional[ReportStatus] = None,
+        by_priority: bool = False,
+        after: Optional[tuple] = None,
+        limit: int = 50,
+    ) -> List[Tuple[Report, int]]:
+        """
+        A page of (report, priority), where priority is the report count of
+        the report's open case, 0 once the case is closed.
+        
+        Oldest first, `after` being the created_at, report_id of the last
+        row; or, by_priority, the reports of open cases, most reported case
+        first and each case's reports oldest first, `after` being the
+        report_count, case_id, created_at, report_id of the last row.
+        """
+        if by_priority:
+            # Walks the (status, report_count, case_id) index. The cursor keeps
+            # the count the last case had when listed, so a case reported again
+            # later moves up out of this walk rather than being listed twice.
+            stmt = select(Report, ReportCase.report_count).join(
+                ReportCase, ReportCase.case_id == Report.case_id
+            ).where(ReportCase.status == ReportStatus.PENDING)
+            keys = [
+                (ReportCase.report_count, True), (ReportCase.case_id, False),
+                (Report.created_at, False), (Report.report_id, False),
+            ]
+        else:
+            stmt = select(Report, func.coalesce(ReportCase.report_count, 0)).outerjoin(
+                ReportCase, and_(ReportCase.case_id == Report.case_id, ReportCase.status == ReportStatus.PENDING)
+            )
+            keys = [(Report.created_at, False), (Report.report_id, False)]
+        if status is not None:
+            stmt = stmt.where(Report.status == status)
+        if after:
+            stmt = stmt.where(keyset_after(*((c, v, d) for (c, d), v in zip(keys, after))))
+        stmt = stmt.order_by(*(c.desc() if d else c for c, d in keys)).limit(limit)
+        result = await self.db.execute(stmt)
+        return [tuple(row) for row in result.all()]
+
+
+class ReportCaseRepository(BaseRepository[ReportCase]):
+    """Repository for ReportCase operations."""
+    
+    def __init__(self, db: AsyncSession):
+        super().__init__(ReportCase, db)
+    
+    async def add_report(self, report: Report) -> int:
+        """
+        File a new report under the open case for its target, opening one
+        if there is none, and set its case_id. The case counts reporters,
+        not reports: the count goes up only for a user with no pending
+        report in the case yet. It is bumped, with the latest report time,
+        in the same statement as the insert, so a burst of reports on one
+        post never loses a count. Returns the case ID.
+        """
+        report.created_at = report.created_at or datetime.utcnow()
+        key = ReportCase.key_for(report.content_type, report.content_id, report.reported_user_id)
+        repeat = await self.db.execute(
+            select(Report.report_id)
+            .join(ReportCase, ReportCase.case_id == Report.case_id)
+            .where(
+                ReportCase.open_key == key,
+                Report.reporter_id == report.reporter_id,
+                Report.status == ReportStatus.PENDING,
+            )
+            .limit(1)
+        )
+        await self.insert_or_increment(
+            [{
+                "open_key": key,
+                "content_type": report.content_type,
+                "content_id": report.content_id,
+                "reported_user_id": report.reported_user_id,
+                "report_count": 0 if repeat.first() else 1,
+                "status": ReportStatus.PENDING,
+                "created_at": report.created_at,
+                "latest_report_at": report.created_at,
+            }],
+            ["open_key"], ["report_count"], ["latest_report_at"],
+        )
+        result = await self.db.execute(select(ReportCase.case_id).where(ReportCase.open_key == key))
+        report.case_id = result.scalar_one()
+        return report.case_id
+    
+    async def file_unfiled(self) -> int:
+        """
+        File pending reports that have no case yet (rows loaded in bulk,
+        bypassing add_report): one upsert for all their cases, one UPDATE
+        per case, then one to recount their reporters. Returns the reports
+        filed.
+        """
+        result = await self.db.execute(
+            select(Report.report_id, Report.content_type, Report.content_id, Report.reported_user_id, Report.created_at)
+            .where(Report.status == ReportStatus.PENDING, Report.case_id.is_(None))
+        )
+        cases: Dict[str, dict] = {}
+        report_ids: Dict[str, List[int]] = {}
+        for report_id, content_type, content_id, reported_user_id, created_at in result.all():
+            key = ReportCase.key_for(content_type, content_id, reported_user_id)
+            case = cases.setdefault(key, {
+                "open_key": key,
+                "content_type": content_type,
+                "content_id": content_id,
+                "reported_user_id": reported_user_id,
+                "report_count": 0,
+                "status": ReportStatus.PENDING,
+                "created_at": created_at,
+                "latest_report_at": created_at,
+            })
+            case["created_at"] = min(case["created_at"], created_at)
+            case["latest_report_at"] = max(case["latest_report_at"], created_at)
+            report_ids.setdefault(key, []).append(report_id)
+        if not cases:
+            return 0
+        
+        await self.upsert(list(cases.values()), ["open_key"], ["latest_report_at"])
+        result = await self.db.execute(
+            select(ReportCase.open_key, ReportCase.case_id).where(ReportCase.open_key.in_(list(cases)))
+        )
+        case_ids = []
+        for key, case_id in result.all():
+            await self.db.execute(
+                update(Report).where(Report.report_id.in_(report_ids[key])).values(case_id=case_id)
+            )
+            case_ids.append(case_id)
+        await self._recount(case_ids)
+        return sum(len(ids) for ids in report_ids.values())
+    
+    async def _recount(self, case_ids: List[int]) -> None:
+        """Set the report_count of open cases to the number of users with a pending report in them."""
+        reporters = (
+            select(func.count(distinct(Report.reporter_id)))
+            .where(Report.case_id == ReportCase.case_id, Report.status == ReportStatus.PENDING)
+            .scalar_subquery()
+        )
+        await self.update_many(case_ids, {"report_count": reporters}, ReportCase.status == ReportStatus.PENDING)
+    
+    async def find_queue(
+        self,
+        status: Optional[ReportStatus] = None,
+        by_priority: bool = False,
+        after: Optional[tuple] = None,
+        limit: int = 50,
+    ) -> List[ReportCase]:
+        """
+        A page of cases, oldest first or, by_priority, most reported first.
+        `after` is the (report_count,) created_at, case_id of the last row.
+        """
+        stmt = select(ReportCase)
+        if status is not None:
+            stmt = stmt.where(ReportCase.status == status)
+        
+        keys = [(ReportCase.created_at, False), (ReportCase.case_id, False)]
+        if by_priority:
+            keys.insert(0, (ReportCase.report_count, True))
+        if after:
+            stmt = stmt.where(keyset_after(*((c, v, d) for (c, d), v in zip(keys, after))))
+        stmt = stmt.order_by(*(c.desc() if d else c for c, d in keys)).limit(limit)
+        result = await self.db.execute(stmt)
+        return list(result.scalars().all())
+    
+    async def find_reports(self, case_id: int, limit: int = 50) -> List[Report]:
+        """The most recent reports in a case."""
+        result = await self.db.execute(
+            select(Report)
+            .where(Report.case_id == case_id)
+            .order_by(Report.created_at.desc(), Report.report_id.desc())
+            .limit(limit)
+        )
+        return list(result.scalars().all())
+    
+    async def resolve(self, case: ReportCase, status: ReportStatus) -> int:
+        """
+        Close a pending case with `status` (resolved or dismissed), then
+        all of its pending reports in a single UPDATE however many there
+        are. Returns the reports closed, 0 if the case was already closed.
+        """
+        now = datetime.utcnow()
+        # Closing the case first frees its open_key, so a report filed from
+        # here on opens a new case rather than joining this one
+        closed = await self.update_many(
+            [case.case_id], {"status": status, "resolved_at": now, "open_key": None},
+            ReportCase.status == ReportStatus.PENDING,
+        )
+        if not closed:
+            return 0
+        result = await self.db.execute(
+            update(Report)
+            .where(Report.case_id == case.case_id, Report.status == ReportStatus.PENDING)
+            .values(status=status, resolved_at=now)
+        )
+        return result.rowcount
+    
+    async def remove_report(self, case_id: int, status: ReportStatus) -> None:
+        """
+        Recount the open case of a report just closed on its own (flushed
+        already); the case closes with `status` when its last report does.
+        """
+        await self._recount([case_id])
+        await self.update_many(
+            [case_id], {"status": status, "resolved_at": datetime.utcnow(), "open_key": None},
+            ReportCase.status == ReportStatus.PENDING, ReportCase.report_count <= 0,
+        )
+
+
+class ModerationLogRepository(BaseRepository[ModerationLog]):
+    """Repository for ModerationLog operations."""
+    
+    def __init__(self, db: AsyncSession):
+        super().__init__(ModerationLog, db)
+    
+    async def find_page(
+        self,
+        action: Optional[ModerationAction] = None,
+        before_id: Optional[int] = None,
+        limit: int = 50,
+    ) -> List[ModerationLog]:
+        """A page of log entries, newest first, before `before_id`."""
+        # The log is append-only, so ID order is time order and the primary key serves
+        stmt = select(ModerationLog)
+        if action is not None:
+            stmt = stmt.where(ModerationLog.action == action)
+        if before_id is not None:
+            stmt = stmt.where(ModerationLog.log_id < before_id)
+        result = await self.db.execute(stmt.order_by(ModerationLog.log_id.desc()).limit(limit))
+        return list(result.scalars().all())
+
+
+class ModerationCounterRepository(BaseRepository[ModerationCounter]):
+    """Repository for ModerationCounter operations."""
+    
+    def __init__(self, db: AsyncSession):
+        super().__init__(ModerationCounter, db)
+    
+    async def find_values(self) -> Dict[str, int]:
+        """Load all counters."""
+        result = await self.db.execute(select(ModerationCounter.name, ModerationCounter.value))
+        return dict(result.all())
+    
+    async def increment(self, name: str, delta: int) -> None:
+        """Atomically add delta to a counter."""
+        await self.db.execute(
+            update(ModerationCounter)
+            .where(ModerationCounter.name == name)
+            .values(value=ModerationCounter.value + delta, updated_at=datetime.utcnow())
+        )
+    
+    async def set_values(self, values: Dict[str, int]) -> None:
+        """Overwrite counters, creating any that are missing."""
+        now = datetime.utcnow()
+        existing = set((await self.find_values()).keys())
+        for name, value in values.items():
+            if name in existing:
+                await self.db.execute(
+                    update(ModerationCounter)
+                    .where(ModerationCounter.name == name)
+                    .values(value=value, updated_at=now)
+                )
+            else:
+                await self.db.execute(
+                    insert(ModerationCounter).values(name=name, value=value, updated_at=now)
+                )
+    
+    async def count_actual(self) -> Dict[str, int]:
+        """Compute all dashboard counts from the source tables in one query."""
+        stmt = select(
+            select(func.count(Report.report_id))
+            .where(Report.status == ReportStatus.PENDING)
+            .scalar_subquery().label("pending_reports"),
+            select(func.count(TeamProfile.team_id))
+            .where(TeamProfile.status == TeamStatus.PENDING)
+            .scalar_subquery().label("pending_teams"),
+            select(func.count(FieldProfile.field_id))
+            .where(FieldProfile.status == FieldStatus.PENDING)
+            .scalar_subquery().label("pending_fields"),
+            select(func.count(UserAccount.user_id))
+            .scalar_subquery().label("total_users"),
+        )
+        row = (await self.db.execute(stmt)).one()
+        return {key: value or 0 for key, value in row._mapping.items()}
@@ -1,12 +1,12 @@
 """
 Notification repository.
 """
-from typing import List
+from typing import Dict, Iterable, List, Optional, Set
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, update
+from sqlalchemy import select, update, insert, func
 
 from app.repositories.base_repository import BaseRepository
-from app.models.notification import Notification
+from app.models.notification import Notification, NotificationPreference
 
 
 class NotificationRepository(BaseRepository[Notification]):
@@ -25,6 +25,56 @@ class NotificationRepository(BaseRepository[Notification]):
         result = await self.db.execute(stmt.order_by(Notification.created_at.desc()))
         return list(result.scalars().all())
     
+    async def find_after(self, user_id: int, after_id: int, limit: int = 100) -> List[Notification]:
+        """Find notifications newer than after_id, oldest first."""
+        result = await self.db.execute(
+            select(Notification)
+            .where(Notification.user_id == user_id, Notification.notification_id > after_id)
+            .order_by(Notification.notification_id)
+            .limit(limit)
+        )
+        return list(result.scalars().all())
+    
+    async def find_latest_id(self, user_id: int) -> Optional[int]:
+        """Find the highest notification ID for a user."""
+        result = await self.db.execute(
+            select(func.max(Notification.notification_id)).where(Notification.user_id == user_id)
+        )
+        return result.scalar()
+    
+    async def find_by_ids(self, notification_ids: Iterable[int]) -> List[Notification]:
+        """Find notifications by ID, in ID order."""
+        result = await self.db.execute(
+            select(Notification)
+            .where(Notification.notification_id.in_(list(notification_ids)))
+            .order_by(Notification.notification_id)
+        )
+        return list(result.scalars().all())
+    
+    async def count_unread(self, user_id: int) -> int:
+        """Count unread notifications for a user."""
+        result = await self.db.execute(
+            select(func.count()).select_from(Notification).where(
+                Notification.user_id == user_id,
+                Notification.is_read == False
+            )
+        )
+        return result.scalar() or 0
+    
+    async def count_unread_by_users(self, user_ids: Iterable[int]) -> Dict[int, int]:
+        """Count unread notifications for several users in one grouped query."""
+        user_ids = list(user_ids)
+        if not user_ids:
+            return {}
+        result = await self.db.execute(
+            select(Notification.user_id, func.count())
+            .where(Notification.user_id.in_(user_ids), Notification.is_read == False)
+            .group_by(Notification.user_id)
+        )
+        counts = {user_id: 0 for user_id in user_ids}
+        counts.update({user_id: count for user_id, count in result.all()})
+        return counts
+    
     async def mark_as_read(self, notification_id: int) -> bool:
         """Mark notification as read."""
         await self.db.execute(
@@ -42,3 +92,30 @@ class NotificationRepository(BaseRepository[Notification]):
             .values(is_read=True)
         )
         return result.rowcount
+    
+    async def bulk_create(self, rows: List[dict]) -> List[int]:
+        """Insert many notifications in one statement; returns their IDs in row order."""
+        if not rows:
+            return []
+        if self.db.get_bind().dialect.insert_returning:
+            result = await self.db.execute(
+                insert(Notification).returning(Notification.notification_id, sort_by_parameter_order=True),
+                rows
+            )
+            return list(result.scalars().all())
+        # No RETURNING (MySQL): one multi-row INSERT is given consecutive IDs from lastrowid
+        result = await self.db.execute(insert(Notification.__table__).values(rows))
+        return list(range(result.lastrowid, result.lastrowid + len(rows)))
+    
+    async def find_opted_out(self, user_ids: List[int], preference_field: str) -> Set[int]:
+        """Find users among user_ids who disabled the given preference category."""
+        if not user_ids:
+            return set()
+        column = getattr(NotificationPreference, preference_field)
+        result = await self.db.execute(
+            select(NotificationPreference.user_id).where(
+                NotificationPreference.user_id.in_(user_ids),
+                column == False
+            )
+        )
+        return set(result.scalars().all())
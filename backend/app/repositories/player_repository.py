@@ -3,10 +3,12 @@ Player profile repository.
 """
 from typing import Optional, List
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import select, or_
 
 from app.repositories.base_repository import BaseRepository
 from app.models.player import PlayerProfile
+from app.models.user import UserAccount
+from app.models.enums import AccountStatus
 
 
 class PlayerRepository(BaseRepository[PlayerProfile]):
@@ -49,3 +51,41 @@ class PlayerRepository(BaseRepository[PlayerProfile]):
             .limit(limit)
         )
         return list(result.scalars().all())
+    
+    async def find_recruitment_candidates(
+        self,
+        player_ids: Optional[List[int]] = None,
+        user_ids: Optional[List[int]] = None,
+    ) -> List[dict]:
+        """
+        Players whose account is in good standing and has coordinates: ID,
+        user ID, name, position, skill and the account's location. Either
+        filter narrows to those players or users (both: either matches).
+        """
+        stmt = (
+            select(
+                PlayerProfile.player_id, PlayerProfile.user_id, PlayerProfile.display_name,
+                PlayerProfile.position, PlayerProfile.skill_level,
+                UserAccount.location, UserAccount.latitude, UserAccount.longitude,
+            )
+            .join(UserAccount, UserAccount.user_id == PlayerProfile.user_id)
+            .where(
+                UserAccount.latitude.is_not(None),
+                UserAccount.longitude.is_not(None),
+                UserAccount.status.not_in([AccountStatus.SUSPENDED, AccountStatus.BANNED, AccountStatus.DELETED]),
+            )
+        )
+        if player_ids is not None or user_ids is not None:
+            stmt = stmt.where(or_(
+                PlayerProfile.player_id.in_(player_ids or []), PlayerProfile.user_id.in_(user_ids or [])
+            ))
+        result = await self.db.execute(stmt)
+        return [dict(row) for row in result.mappings().all()]
+    
+    async def find_suggestions(self, player_ids: Optional[List[int]] = None) -> List[tuple]:
+        """(player_id, display_name) of every player, optionally only these."""
+        stmt = select(PlayerProfile.player_id, PlayerProfile.display_name)
+        if player_ids is not None:
+            stmt = stmt.where(PlayerProfile.player_id.in_(player_ids))
+        result = await self.db.execute(stmt)
+        return [tuple(row) for row in result.all()]
@@ -0,0 +1,216 @@
+"""
+PlayerStats and TeamStats repositories.
+"""
+from typing import Dict, List, Optional
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, update, delete, func, case, and_, or_, union_all
+
+from app.repositories.base_repository import BaseRepository
+from app.models.stats import PlayerStats, TeamStats, INITIAL_RATING
+from app.models.match import MatchEvent, MatchResult, AttendanceRecord
+from app.models.team import TeamProfile
+from app.models.enums import AttendanceStatus, MatchStatus, TeamStatus
+
+PLAYER_STAT_COLUMNS = (
+    "matches_played", "matches_missed", "wins", "draws", "losses", "goals_for", "goals_against"
+)
+TEAM_STAT_COLUMNS = ("matches_played", "wins", "draws", "losses", "goals_for", "goals_against")
+FORM_LENGTH = 5
+
+
+def _count_if(condition):
+    return func.sum(case((condition, 1), else_=0))
+
+
+def _played_sides():
+    """One row per team per non-cancelled match with a result: the team's goals for and against."""
+    played = (
+        select(MatchEvent)
+        .join(MatchResult, MatchResult.match_id == MatchEvent.match_id)
+        .where(MatchEvent.status != MatchStatus.CANCELLED)
+    )
+    return union_all(
+        played.with_only_columns(
+            MatchEvent.host_team_id.label("team_id"),
+            MatchResult.home_score.label("scored"),
+            MatchResult.away_score.label("conceded"),
+            MatchEvent.match_date,
+            MatchEvent.start_time,
+            MatchEvent.match_id,
+        ),
+        played.with_only_columns(
+            MatchEvent.opponent_team_id, MatchResult.away_score, MatchResult.home_score,
+            MatchEvent.match_date, MatchEvent.start_time, MatchEvent.match_id,
+        ).where(MatchEvent.opponent_team_id.is_not(None)),
+    )
+
+
+class _StatsRepository(BaseRepository):
+    """Shared increment logic for rows keyed by a single ID column."""
+    
+    key: str
+    columns: tuple
+    
+    async def add(self, deltas: Dict[int, Dict[str, int]]) -> None:
+        """Add per-ID deltas to the stored totals, creating rows as needed (no commit)."""
+        rows = [
+            {self.key: entity_id, **{c: delta.get(c, 0) for c in self.columns}}
+            for entity_id, delta in deltas.items()
+        ]
+        await self.insert_or_increment(rows, [self.key], list(self.columns))
+
+
+class PlayerStatsRepository(_StatsRepository):
+    """Repository for PlayerStats operations."""
+    
+    key = "player_id"
+    columns = PLAYER_STAT_COLUMNS
+    
+    def __init__(self, db: AsyncSession):
+        super().__init__(PlayerStats, db)
+    
+    async def find_by_player(self, player_id: int) -> Optional[PlayerStats]:
+        result = await self.db.execute(
+            select(PlayerStats).where(PlayerStats.player_id == player_id)
+            .execution_options(populate_existing=True)
+        )
+        return result.scalar_one_or_none()
+    
+    async def rebuild(self) -> None:
+        """Recompute every row from attendance and results in one INSERT .. SELECT (no commit)."""
+        is_host = AttendanceRecord.team_id == MatchEvent.host_team_id
+        scored = case((is_host, MatchResult.home_score), else_=MatchResult.away_score)
+        conceded = case((is_host, MatchResult.away_score), else_=MatchResult.home_score)
+        present = AttendanceRecord.status == AttendanceStatus.PRESENT
+        decided = and_(
+            present,
+            MatchResult.result_id.is_not(None),
+            or_(is_host, AttendanceRecord.team_id == MatchEvent.opponent_team_id),
+        )
+        totals = (
+            select(
+                AttendanceRecord.player_id,
+                _count_if(present),
+                _count_if(AttendanceRecord.status.in_([AttendanceStatus.ABSENT, AttendanceStatus.EXCUSED])),
+                _count_if(and_(decided, scored > conceded)),
+                _count_if(and_(decided, scored == conceded)),
+                _count_if(and_(decided, scored < conceded)),
+                func.sum(case((decided, scored), else_=0)),
+                func.sum(case((decided, conceded), else_=0)),
+            )
+            .join(MatchEvent, MatchEvent.match_id == AttendanceRecord.match_id)
+            .outerjoin(MatchResult, MatchResult.match_id == MatchEvent.match_id)
+            .where(MatchEvent.status != MatchStatus.CANCELLED, AttendanceRecord.status != AttendanceStatus.PENDING)
+            .group_by(AttendanceRecord.player_id)
+        )
+        await self.db.execute(delete(PlayerStats))
+        await self.db.execute(
+            PlayerStats.__table__.insert().from_select([self.key, *self.columns], totals)
+        )
+
+
+class TeamStatsRepository(_StatsRepository):
+    """Repository for TeamStats operations."""
+    
+    key = "team_id"
+    columns = TEAM_STAT_COLUMNS
+    
+    def __init__(self, db: AsyncSession):
+        super().__init__(TeamStats, db)
+    
+    async def find_by_team(self, team_id: int) -> Optional[TeamStats]:
+        result = await self.db.execute(
+            select(TeamStats).where(TeamStats.team_id == team_id)
+            .execution_options(populate_existing=True)
+        )
+        return result.scalar_one_or_none()
+    
+    async def find_by_teams(self, team_ids: List[int]) -> Dict[int, TeamStats]:
+        if not team_ids:
+            return {}
+        result = await self.db.execute(select(TeamStats).where(TeamStats.team_id.in_(team_ids)))
+        return {s.team_id: s for s in result.scalars().all()}
+    
+    async def find_ratings(self, team_ids: List[int]) -> Dict[int, float]:
+        """Current ratings by team; teams without a row are left out."""
+        if not team_ids:
+            return {}
+        result = await self.db.execute(
+            select(TeamStats.team_id, TeamStats.rating).where(TeamStats.team_id.in_(team_ids))
+        )
+        return dict(result.all())
+    
+    async def adjust_ratings(self, changes: Dict[int, float]) -> None:
+        """Add per-team rating changes in one UPDATE (rows must exist; no commit)."""
+        if not changes:
+            return
+        delta = case(*[(TeamStats.team_id == team_id, change) for team_id, change in changes.items()], else_=0)
+        await self.db.execute(
+            update(TeamStats).where(TeamStats.team_id.in_(list(changes))).values(rating=TeamStats.rating + delta)
+        )
+    
+    async def replace_ratings(self, ratings: Dict[int, float]) -> None:
+        """Reset every rating to the initial value, then write the given ones (no commit)."""
+        await self.db.execute(update(TeamStats).values(rating=INITIAL_RATING))
+        if ratings:
+            await self.db.execute(
+                update(TeamStats), [{"team_id": team_id, "rating": rating} for team_id, rating in ratings.items()]
+            )
+    
+    async def find_standings(self, team_ids: Optional[List[int]] = None) -> List[dict]:
+        """League table rows (stats plus team name, location and skill) of teams that have played."""
+        stmt = (
+            select(
+                TeamStats.team_id, *[TeamStats.__table__.c[c] for c in TEAM_STAT_COLUMNS], TeamStats.form,
+                TeamProfile.team_name, TeamProfile.location, TeamProfile.skill_level,
+            )
+            .join(TeamProfile, TeamProfile.team_id == TeamStats.team_id)
+            .where(TeamStats.matches_played > 0, TeamProfile.status != TeamStatus.REJECTED)
+        )
+        if team_ids is not None:
+            stmt = stmt.where(TeamStats.team_id.in_(team_ids))
+        result = await self.db.execute(stmt)
+        return [dict(row) for row in result.mappings().all()]
+    
+    async def refresh_form(self, team_ids: Optional[List[int]] = None) -> None:
+        """Recompute the form string of the given teams (default: all) from their latest results (no commit)."""
+        sides = _played_sides().subquery()
+        position = func.row_number().over(
+            partition_by=sides.c.team_id,
+            order_by=(sides.c.match_date.desc(), sides.c.start_time.desc(), sides.c.match_id.desc()),
+        ).label("position")
+        recent = select(sides.c.team_id, sides.c.scored, sides.c.conceded, position)
+        if team_ids is not None:
+            recent = recent.where(sides.c.team_id.in_(team_ids))
+        recent = recent.subquery()
+        result = await self.db.execute(
+            select(recent.c.team_id, recent.c.scored, recent.c.conceded)
+            .where(recent.c.position <= FORM_LENGTH)
+            .order_by(recent.c.team_id, recent.c.position.desc())
+        )
+        forms = dict.fromkeys(team_ids or [], "")
+        for team_id, scored, conceded in result.all():
+            letter = "W" if scored > conceded else "D" if scored == conceded else "L"
+            forms[team_id] = forms.get(team_id, "") + letter
+        if forms:
+            await self.db.execute(
+                update(TeamStats), [{"team_id": team_id, "form": form} for team_id, form in forms.items()]
+            )
+    
+    async def rebuild(self) -> None:
+        """Recompute every row from match results in one INSERT .. SELECT, then the forms (no commit)."""
+        sides = _played_sides().subquery()
+        totals = select(
+            sides.c.team_id,
+            func.count(),
+            _count_if(sides.c.scored > sides.c.conceded),
+            _count_if(sides.c.scored == sides.c.conceded),
+            _count_if(sides.c.scored < sides.c.conceded),
+            func.sum(sides.c.scored),
+            func.sum(sides.c.conceded),
+        ).group_by(sides.c.team_id)
+        await self.db.execute(delete(TeamStats))
+        await self.db.execute(
+            TeamStats.__table__.insert().from_select([self.key, *self.columns], totals)
+        )
+        await self.refresh_form()
@@ -1,13 +1,32 @@
 """
-Team, Roster, and JoinRequest repositories.
+Team, Roster, JoinRequest and wallet ledger repositories.
 """
-from typing import Optional, List
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Optional, List, Set, Tuple
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import select, update, delete, func, case, literal, exists, Date
 
 from app.repositories.base_repository import BaseRepository
-from app.models.team import TeamProfile, TeamRoster, JoinRequest
-from app.models.enums import TeamStatus, JoinRequestStatus
+from app.utils.keyset import keyset_after
+from app.models.team import (
+    TeamProfile, TeamRoster, JoinRequest, TeamWallet, TransactionLog, WalletMonthlyTotal, WalletBalanceSnapshot
+)
+from app.models.player import PlayerProfile
+from app.models.stats import TeamStats, INITIAL_RATING
+from app.models.enums import TeamStatus, JoinRequestStatus, TransactionType
+
+
+def signed_amount(amount, transaction_type):
+    """SQL expression: the amount, negated for expenses."""
+    return case((transaction_type == TransactionType.INCOME, amount), else_=-amount)
+
+
+def month_start(column, dialect: str):
+    """SQL expression for the first day of the month of a datetime column."""
+    if dialect == "mysql":
+        return func.date_format(column, "%Y-%m-01")
+    return func.date(column, "start of month")
 
 
 class TeamRepository(BaseRepository[TeamProfile]):
@@ -37,11 +56,12 @@ class TeamRepository(BaseRepository[TeamProfile]):
         )
         return list(result.scalars().all())
     
-    async def find_pending(self) -> List[TeamProfile]:
-        """Find teams with pending verification."""
-        result = await self.db.execute(
-            select(TeamProfile).where(TeamProfile.status == TeamStatus.PENDING)
-        )
+    async def find_pending(self, after: Optional[Tuple[datetime, int]] = None, limit: int = 50) -> List[TeamProfile]:
+        """A page of teams pending verification, oldest first, after (created_at, team_id)."""
+        stmt = select(TeamProfile).where(TeamProfile.status == TeamStatus.PENDING)
+        if after:
+            stmt = stmt.where(keyset_after((TeamProfile.created_at, after[0], False), (TeamProfile.team_id, after[1], False)))
+        result = await self.db.execute(stmt.order_by(TeamProfile.created_at, TeamProfile.team_id).limit(limit))
         return list(result.scalars().all())
     
     async def search_by_name(self, name: str, limit: int = 20) -> List[TeamProfile]:
@@ -52,6 +72,35 @@ class TeamRepository(BaseRepository[TeamProfile]):
             .limit(limit)
         )
         return list(result.scalars().all())
+    
+    async def find_matchmaking_candidates(self, team_ids: Optional[List[int]] = None) -> List[dict]:
+        """Verified teams with coordinates: ID, name, location, skill, coordinates and Elo rating."""
+        stmt = (
+            select(
+                TeamProfile.team_id, TeamProfile.team_name, TeamProfile.location, TeamProfile.skill_level,
+                TeamProfile.latitude, TeamProfile.longitude,
+                func.coalesce(TeamStats.rating, INITIAL_RATING).label("rating"),
+            )
+            .outerjoin(TeamStats, TeamStats.team_id == TeamProfile.team_id)
+            .where(
+                TeamProfile.status == TeamStatus.VERIFIED,
+                TeamProfile.latitude.is_not(None),
+                TeamProfile.longitude.is_not(None),
+            )
+        )
+        if team_ids is not None:
+            stmt = stmt.where(TeamProfile.team_id.in_(team_ids))
+        result = await self.db.execute(stmt)
+        return [dict(row) for row in result.mappings().all()]
+    
+    
+    async def find_suggestions(self, team_ids: Optional[List[int]] = None) -> List[tuple]:
+        """(team_id, team_name) of verified teams, optionally only these."""
+        stmt = select(TeamProfile.team_id, TeamProfile.team_name).where(TeamProfile.status == TeamStatus.VERIFIED)
+        if team_ids is not None:
+            stmt = stmt.where(TeamProfile.team_id.in_(team_ids))
+        result = await self.db.execute(stmt)
+        return [tuple(row) for row in result.all()]
 
 
 class RosterRepository(BaseRepository[TeamRoster]):
@@ -84,12 +133,40 @@ class RosterRepository(BaseRepository[TeamRoster]):
         )
         return result.scalar_one_or_none()
     
+    async def find_active_player_ids(self, team_id: int) -> Set[int]:
+        """Players currently on the team's roster."""
+        result = await self.db.execute(
+            select(TeamRoster.player_id).where(TeamRoster.team_id == team_id, TeamRoster.is_active == True)
+        )
+        return set(result.scalars().all())
+    
+    async def find_team_of_player(self, player_id: int, team_ids: List[int]) -> Optional[int]:
+        """ID of whichever of the given teams lists the player, if any."""
+        result = await self.db.execute(
+            select(TeamRoster.team_id)
+            .where(TeamRoster.player_id == player_id, TeamRoster.team_id.in_(team_ids))
+            .limit(1)
+        )
+        return result.scalar_one_or_none()
+    
     async def find_by_id(self, roster_id: int) -> Optional[TeamRoster]:
         """Find roster entry by ID."""
         result = await self.db.execute(
             select(TeamRoster).where(TeamRoster.roster_id == roster_id)
         )
         return result.scalar_one_or_none()
+    
+    async def find_member_user_ids(self, team_ids: List[int]) -> List[int]:
+        """Find user IDs of active roster members across the given teams."""
+        if not team_ids:
+            return []
+        result = await self.db.execute(
+            select(PlayerProfile.user_id)
+            .join(TeamRoster, TeamRoster.player_id == PlayerProfile.player_id)
+            .where(TeamRoster.team_id.in_(team_ids), TeamRoster.is_active == True)
+            .distinct()
+        )
+        return list(result.scalars().all())
 
 
 class JoinRequestRepository(BaseRepository[JoinRequest]):
@@ -115,6 +192,23 @@ class JoinRequestRepository(BaseRepository[JoinRequest]):
         )
         return list(result.scalars().all())
     
+    async def lock_pending(self, team_id: int, request_ids: List[int]) -> List[JoinRequest]:
+        """
+        Lock the team's pending requests among request_ids until the
+        transaction ends (SELECT ... FOR UPDATE), so each one returned is
+        still pending when the caller processes it.
+        """
+        result = await self.db.execute(
+            select(JoinRequest)
+            .where(
+                JoinRequest.team_id == team_id,
+                JoinRequest.request_id.in_(request_ids),
+                JoinRequest.status == JoinRequestStatus.PENDING
+            )
+            .with_for_update()
+        )
+        return list(result.scalars().all())
+    
     async def find_pending_by_player(self, player_id: int, team_id: int) -> Optional[JoinRequest]:
         """Find pending request for player to team."""
         result = await self.db.execute(
@@ -125,3 +219,203 @@ class JoinRequestRepository(BaseRepository[JoinRequest]):
             )
         )
         return result.scalar_one_or_none()
+
+
+class WalletRepository(BaseRepository[TeamWallet]):
+    """Repository for TeamWallet operations."""
+    
+    def __init__(self, db: AsyncSession):
+        super().__init__(TeamWallet, db)
+    
+    async def find_by_team(self, team_id: int) -> Optional[TeamWallet]:
+        """Find a team's wallet."""
+        result = await self.db.execute(
+            select(TeamWallet).where(TeamWallet.team_id == team_id)
+        )
+        return result.scalar_one_or_none()
+    
+    async def find_id_by_team(self, team_id: int) -> Optional[int]:
+        """Find a team's wallet ID without loading the wallet."""
+        result = await self.db.execute(
+            select(TeamWallet.wallet_id).where(TeamWallet.team_id == team_id)
+        )
+        return result.scalar_one_or_none()
+    
+    async def create_if_missing(self, team_id: int) -> None:
+        """Create an empty wallet for the team unless one exists (no commit)."""
+        await self.insert_ignore([{"team_id": team_id, "balance": Decimal("0.00")}], ["team_id"])
+    
+    async def add_to_balance(self, wallet_id: int, delta: Decimal, allow_negative: bool = False) -> bool:
+        """
+        Atomically add delta (may be negative) to the balance.
+        
+        A single conditional UPDATE, so concurrent writers never lose an
+        update; unless allow_negative, it matches nothing when the result
+        would drop below zero. Returns whether the balance changed.
+        """
+        stmt = update(TeamWallet).where(TeamWallet.wallet_id == wallet_id)
+        if not allow_negative:
+            stmt = stmt.where(TeamWallet.balance + delta >= 0)
+        result = await self.db.execute(
+            stmt.values(balance=TeamWallet.balance + delta, updated_at=datetime.utcnow())
+        )
+        return result.rowcount == 1
+
+
+class TransactionRepository(BaseRepository[TransactionLog]):
+    """Repository for TransactionLog operations."""
+    
+    def __init__(self, db: AsyncSession):
+        super().__init__(TransactionLog, db)
+    
+    async def find_recent(self, wallet_id: int, limit: int = 50) -> List[TransactionLog]:
+        """Latest transactions of a wallet, newest first."""
+        result = await self.db.execute(
+            select(TransactionLog)
+            .where(TransactionLog.wallet_id == wallet_id)
+            .order_by(TransactionLog.created_at.desc())
+            .limit(limit)
+        )
+        return list(result.scalars().all())
+    
+    async def totals_by_category(self, wallet_id: int, start: datetime, end: datetime) -> List[tuple]:
+        """(type, category, total, count) for transactions in [start, end); "" = uncategorised."""
+        category = func.coalesce(TransactionLog.category, "")
+        result = await self.db.execute(
+            select(TransactionLog.type, category, func.sum(TransactionLog.amount), func.count())
+            .where(
+                TransactionLog.wallet_id == wallet_id,
+                TransactionLog.created_at >= start,
+                TransactionLog.created_at < end,
+            )
+            .group_by(TransactionLog.type, category)
+        )
+        return list(result.all())
+    
+    async def net_total(self, wallet_id: int, start: datetime, end: datetime) -> Decimal:
+        """Income minus expenses for transactions in [start, end)."""
+        result = await self.db.execute(
+            select(func.sum(signed_amount(TransactionLog.amount, TransactionLog.type))).where(
+                TransactionLog.wallet_id == wallet_id,
+                TransactionLog.created_at >= start,
+                TransactionLog.created_at < end,
+            )
+        )
+        return Decimal(result.scalar() or 0)
+
+
+class WalletMonthlyTotalRepository(BaseRepository[WalletMonthlyTotal]):
+    """Repository for WalletMonthlyTotal operations."""
+    
+    def __init__(self, db: AsyncSession):
+        super().__init__(WalletMonthlyTotal, db)
+    
+    async def add(
+        self,
+        wallet_id: int,
+        month: date,
+        transaction_type: TransactionType,
+        category: Optional[str],
+        amount: Decimal,
+    ) -> None:
+        """Count one transaction into its month and category (no commit)."""
+        await self.insert_or_increment(
+            [{
+                "wallet_id": wallet_id, "month": month, "type": transaction_type,
+                "category": category or "", "total": amount, "transaction_count": 1,
+            }],
+            ["wallet_id", "month", "type", "category"],
+            ["total", "transaction_count"],
+        )
+    
+    async def totals_by_category(self, wallet_id: int, start_month: date, end_month: date) -> List[tuple]:
+        """(type, category, total, count) summed over months in [start_month, end_month)."""
+        result = await self.db.execute(
+            select(
+                WalletMonthlyTotal.type,
+                WalletMonthlyTotal.category,
+                func.sum(WalletMonthlyTotal.total),
+                func.sum(WalletMonthlyTotal.transaction_count),
+            )
+            .where(
+                WalletMonthlyTotal.wallet_id == wallet_id,
+                WalletMonthlyTotal.month >= start_month,
+                WalletMonthlyTotal.month < end_month,
+            )
+            .group_by(WalletMonthlyTotal.type, WalletMonthlyTotal.category)
+        )
+        return list(result.all())
+    
+    async def net_total(self, wallet_id: int, start_month: date, end_month: Optional[date] = None) -> Decimal:
+        """Income minus expenses over months in [start_month, end_month), or from start_month on."""
+        stmt = select(func.sum(signed_amount(WalletMonthlyTotal.total, WalletMonthlyTotal.type))).where(
+            WalletMonthlyTotal.wallet_id == wallet_id,
+            WalletMonthlyTotal.month >= start_month,
+        )
+        if end_month is not None:
+            stmt = stmt.where(WalletMonthlyTotal.month < end_month)
+        result = await self.db.execute(stmt)
+        return Decimal(result.scalar() or 0)
+    
+    async def rebuild(self) -> None:
+        """Recompute every monthly total from the transaction log (no commit)."""
+        month = month_start(TransactionLog.created_at, self.db.get_bind().dialect.name)
+        category = func.coalesce(TransactionLog.category, "")
+        await self.db.execute(delete(WalletMonthlyTotal))
+        await self.db.execute(
+            WalletMonthlyTotal.__table__.insert().from_select(
+                ["wallet_id", "month", "type", "category", "total", "transaction_count"],
+                select(
+                    TransactionLog.wallet_id, month, TransactionLog.type, category,
+                    func.sum(TransactionLog.amount), func.count(),
+                ).group_by(TransactionLog.wallet_id, month, TransactionLog.type, category),
+            )
+        )
+
+
+class WalletSnapshotRepository(BaseRepository[WalletBalanceSnapshot]):
+    """Repository for WalletBalanceSnapshot operations."""
+    
+    def __init__(self, db: AsyncSession):
+        super().__init__(WalletBalanceSnapshot, db)
+    
+    async def find_latest(self, wallet_id: int, month: date) -> Optional[WalletBalanceSnapshot]:
+        """The most recent snapshot taken at or before the given month."""
+        result = await self.db.execute(
+            select(WalletBalanceSnapshot)
+            .where(WalletBalanceSnapshot.wallet_id == wallet_id, WalletBalanceSnapshot.month <= month)
+            .order_by(WalletBalanceSnapshot.month.desc())
+            .limit(1)
+        )
+        return result.scalar_one_or_none()
+    
+    async def snapshot_all(self, month: date) -> int:
+        """
+        Record the opening balance of the current `month` for every wallet
+        that has no snapshot for it yet, in one INSERT .. SELECT (no commit).
+        
+        The opening balance is the current balance less the month's net
+        total so far; both are updated in the same transaction by every
+        wallet write, so a single statement sees them consistently.
+        """
+        month_net = (
+            select(func.coalesce(func.sum(signed_amount(WalletMonthlyTotal.total, WalletMonthlyTotal.type)), 0))
+            .where(WalletMonthlyTotal.wallet_id == TeamWallet.wallet_id, WalletMonthlyTotal.month == month)
+            .scalar_subquery()
+        )
+        taken = exists().where(
+            WalletBalanceSnapshot.wallet_id == TeamWallet.wallet_id,
+            WalletBalanceSnapshot.month == month,
+        )
+        result = await self.db.execute(
+            WalletBalanceSnapshot.__table__.insert().from_select(
+                ["wallet_id", "month", "opening_balance", "created_at"],
+                select(
+                    TeamWallet.wallet_id,
+                    literal(month, Date),
+                    TeamWallet.balance - month_net,
+                    literal(datetime.utcnow()),
+                ).where(~taken),
+            )
+        )
+        return result.rowcount
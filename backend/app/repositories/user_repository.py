@@ -3,10 +3,12 @@ User and Session repositories.
 """
 from typing import Optional, List
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import select, or_
 
 from app.repositories.base_repository import BaseRepository
-from app.models.user import UserAccount, Session
+from app.models.user import UserAccount, Session, masks_with
+from app.models.enums import AccountStatus
+from app.models.field import FieldProfile
 
 
 class UserRepository(BaseRepository[UserAccount]):
@@ -35,6 +37,44 @@ class UserRepository(BaseRepository[UserAccount]):
             select(UserAccount).where(UserAccount.user_id == user_id)
         )
         return result.scalar_one_or_none()
+    
+    async def find_owner_suggestions(self, user_ids: Optional[List[int]] = None) -> List[tuple]:
+        """(user_id, username) of users owning at least one field, optionally only these."""
+        stmt = (
+            select(UserAccount.user_id, UserAccount.username)
+            .where(select(FieldProfile.field_id).where(FieldProfile.owner_id == UserAccount.user_id).exists())
+        )
+        if user_ids is not None:
+            stmt = stmt.where(UserAccount.user_id.in_(user_ids))
+        result = await self.db.execute(stmt)
+        return [tuple(row) for row in result.all()]
+    
+    async def find_page(
+        self,
+        query: Optional[str] = None,
+        role_bits: int = 0,
+        status: Optional[AccountStatus] = None,
+        after_id: Optional[int] = None,
+        limit: int = 50,
+    ) -> List[UserAccount]:
+        """
+        Users in user_id order after `after_id` (keyset pagination), optionally
+        matching a username/email substring, a status, or any of `role_bits`.
+        The role filter lists the matching role_mask values so it can use the
+        (role_mask, user_id) index.
+        """
+        stmt = select(UserAccount)
+        if query:
+            pattern = f"%{query}%"
+            stmt = stmt.where(or_(UserAccount.username.ilike(pattern), UserAccount.email.ilike(pattern)))
+        if role_bits:
+            stmt = stmt.where(UserAccount.role_mask.in_(masks_with(role_bits)))
+        if status is not None:
+            stmt = stmt.where(UserAccount.status == status)
+        if after_id is not None:
+            stmt = stmt.where(UserAccount.user_id > after_id)
+        result = await self.db.execute(stmt.order_by(UserAccount.user_id).limit(limit))
+        return list(result.scalars().all())
 
 
 class SessionRepository(BaseRepository[Session]):
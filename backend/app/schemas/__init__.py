@@ -4,14 +4,16 @@ Pydantic schemas package.
 from app.schemas.common import PaginatedResponse, MessageResponse, ErrorResponse
 from app.schemas.auth import LoginRequest, RegisterRequest, AuthResponse, ChangePasswordRequest
 from app.schemas.user import UserAccountResponse, UserAccountCreate, UserAccountUpdate
-from app.schemas.player import PlayerProfileResponse, PlayerProfileCreate, PlayerProfileUpdate
+from app.schemas.player import (
+    PlayerProfileResponse, PlayerProfileCreate, PlayerProfileUpdate, PLAYER_PROFILE_SERIALIZER
+)
 from app.schemas.team import (
-    TeamProfileResponse, TeamProfileCreate, TeamProfileUpdate,
+    TeamProfileResponse, TeamProfileCreate, TeamProfileUpdate, TEAM_PROFILE_SERIALIZER,
     TeamRosterResponse, JoinRequestResponse, JoinRequestCreate,
     TeamWalletResponse, TransactionLogResponse, TransactionLogCreate
 )
 from app.schemas.field import (
-    FieldProfileResponse, FieldProfileCreate, FieldProfileUpdate,
+    FieldProfileResponse, FieldProfileCreate, FieldProfileUpdate, FIELD_PROFILE_SERIALIZER,
     FieldCalendarResponse, FieldPricingRuleResponse, FieldPricingRuleCreate,
     CancellationPolicyResponse, AmenityResponse
 )
@@ -20,7 +22,9 @@ from app.schemas.match import (
     MatchEventResponse, MatchEventCreate, MatchEventUpdate,
     MatchInvitationResponse, AttendanceRecordResponse, MatchResultResponse
 )
-from app.schemas.social import PostResponse, PostCreate, CommentResponse, CommentCreate
+from app.schemas.social import (
+    PostResponse, PostCreate, CommentResponse, CommentCreate, POST_SERIALIZER
+)
 from app.schemas.notification import NotificationResponse, NotificationPreferenceResponse
 
 __all__ = [
@@ -31,13 +35,13 @@ __all__ = [
     # User
     "UserAccountResponse", "UserAccountCreate", "UserAccountUpdate",
     # Player
-    "PlayerProfileResponse", "PlayerProfileCreate", "PlayerProfileUpdate",
+    "PlayerProfileResponse", "PlayerProfileCreate", "PlayerProfileUpdate", "PLAYER_PROFILE_SERIALIZER",
     # Team
-    "TeamProfileResponse", "TeamProfileCreate", "TeamProfileUpdate",
+    "TeamProfileResponse", "TeamProfileCreate", "TeamProfileUpdate", "TEAM_PROFILE_SERIALIZER",
     "TeamRosterResponse", "JoinRequestResponse", "JoinRequestCreate",
     "TeamWalletResponse", "TransactionLogResponse", "TransactionLogCreate",
     # Field
-    "FieldProfileResponse", "FieldProfileCreate", "FieldProfileUpdate",
+    "FieldProfileResponse", "FieldProfileCreate", "FieldProfileUpdate", "FIELD_PROFILE_SERIALIZER",
     "FieldCalendarResponse", "FieldPricingRuleResponse", "FieldPricingRuleCreate",
     "CancellationPolicyResponse", "AmenityResponse",
     # Booking
@@ -46,7 +50,7 @@ __all__ = [
     "MatchEventResponse", "MatchEventCreate", "MatchEventUpdate",
     "MatchInvitationResponse", "AttendanceRecordResponse", "MatchResultResponse",
     # Social
-    "PostResponse", "PostCreate", "CommentResponse", "CommentCreate",
+    "PostResponse", "PostCreate", "CommentResponse", "CommentCreate", "POST_SERIALIZER",
     # Notification
     "NotificationResponse", "NotificationPreferenceResponse",
 ]
@@ -4,6 +4,8 @@ Field-related schemas matching frontend types.
 from typing import Optional, List
 from pydantic import BaseModel
 
+from app.utils.serialization import RowSerializer, as_float, enum_value, isoformat, storage_path
+
 
 # --- Field Profile ---
 class FieldProfileCreate(BaseModel):
@@ -49,6 +51,24 @@ class FieldProfileResponse(BaseModel):
         from_attributes = True
 
 
+FIELD_PROFILE_SERIALIZER = RowSerializer(FieldProfileResponse, {
+    "fieldId": "field_id",
+    "ownerId": "owner_id",
+    "fieldName": "field_name",
+    "description": "description",
+    "location": "location",
+    "latitude": "latitude",
+    "longitude": "longitude",
+    "defaultPricePerHour": as_float("default_price_per_hour"),
+    "capacity": "capacity",
+    "status": enum_value("status"),
+    "rejectionReason": "rejection_reason",
+    "coverImage": storage_path("cover_image"),
+    "createdAt": isoformat("created_at"),
+    "updatedAt": isoformat("updated_at"),
+})
+
+
 # --- Field Calendar ---
 class FieldCalendarResponse(BaseModel):
     """Field calendar slot response matching frontend FieldCalendar type."""
@@ -1,7 +1,7 @@
 """
 Notification schemas matching frontend types.
 """
-from typing import Optional
+from typing import List, Optional
 from pydantic import BaseModel
 
 
@@ -21,6 +21,11 @@ class NotificationResponse(BaseModel):
         from_attributes = True
 
 
+class NotificationBatchReadRequest(BaseModel):
+    """IDs of notifications to mark as read."""
+    notificationIds: List[int]
+
+
 class NotificationPreferenceResponse(BaseModel):
     """Notification preference response matching frontend NotificationPreference type."""
     preferenceId: int
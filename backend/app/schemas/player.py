@@ -5,6 +5,8 @@ from datetime import datetime
 from typing import Optional
 from pydantic import BaseModel
 
+from app.utils.serialization import RowSerializer, enum_value, isoformat, storage_path
+
 
 class PlayerProfileBase(BaseModel):
     """Base player profile fields."""
@@ -57,3 +59,33 @@ class PlayerProfileResponse(BaseModel):
     
     class Config:
         from_attributes = True
+
+
+PLAYER_PROFILE_SERIALIZER = RowSerializer(PlayerProfileResponse, {
+    "playerId": "player_id",
+    "userId": "user_id",
+    "displayName": "display_name",
+    "position": "position",
+    "skillLevel": "skill_level",
+    "bio": "bio",
+    "profileImage": storage_path("profile_image"),
+    "dateOfBirth": isoformat("date_of_birth"),
+    "height": "height",
+    "weight": "weight",
+    "preferredFoot": enum_value("preferred_foot"),
+    "createdAt": isoformat("created_at"),
+    "updatedAt": isoformat("updated_at"),
+})
+
+
+class PlayerStatsResponse(BaseModel):
+    """Player match statistics."""
+    playerId: int
+    matchesPlayed: int
+    matchesMissed: int
+    attendanceRate: Optional[float] = None
+    wins: int
+    draws: int
+    losses: int
+    goalsFor: int
+    goalsAgainst: int
@@ -4,6 +4,8 @@ Social content schemas matching frontend types.
 from typing import Optional, List
 from pydantic import BaseModel
 
+from app.utils.serialization import RowSerializer, enum_value, isoformat, storage_path
+
 
 # --- Post ---
 class PostCreate(BaseModel):
@@ -32,6 +34,21 @@ class PostResponse(BaseModel):
         from_attributes = True
 
 
+POST_SERIALIZER = RowSerializer(PostResponse, {
+    "postId": "post_id",
+    "authorId": "author_id",
+    "teamId": "team_id",
+    "imageUrl": storage_path("image"),
+    "content": "content",
+    "visibility": enum_value("visibility"),
+    "reactionCount": "reaction_count",
+    "commentCount": "comment_count",
+    "isHidden": "is_hidden",
+    "createdAt": isoformat("created_at"),
+    "updatedAt": isoformat("updated_at"),
+})
+
+
 # --- Comment ---
 class CommentCreate(BaseModel):
     """Comment creation matching frontend AddCommentRequest."""
@@ -5,6 +5,8 @@ from datetime import datetime
 from typing import Optional, List
 from pydantic import BaseModel, Field
 
+from app.utils.serialization import RowSerializer, enum_value, isoformat, storage_path
+
 
 # --- Team Profile ---
 class TeamProfileCreate(BaseModel):
@@ -51,6 +53,28 @@ class TeamProfileResponse(BaseModel):
         from_attributes = True
 
 
+class TeamSearchResponse(TeamProfileResponse):
+    """Team search hit with the team's Elo rating."""
+    rating: float
+
+
+TEAM_PROFILE_SERIALIZER = RowSerializer(TeamProfileResponse, {
+    "teamId": "team_id",
+    "teamName": "team_name",
+    "description": "description",
+    "logoUrl": storage_path("logo"),
+    "leaderId": "leader_id",
+    "status": enum_value("status"),
+    "rejectionReason": "rejection_reason",
+    "location": "location",
+    "latitude": "latitude",
+    "longitude": "longitude",
+    "skillLevel": "skill_level",
+    "createdAt": isoformat("created_at"),
+    "updatedAt": isoformat("updated_at"),
+})
+
+
 # --- Team Roster ---
 class TeamRosterResponse(BaseModel):
     """Team roster entry response matching frontend TeamRoster type."""
@@ -82,6 +106,11 @@ class JoinRequestCreate(BaseModel):
     message: Optional[str] = None
 
 
+class JoinRequestBatchRequest(BaseModel):
+    """IDs of pending join requests to accept or reject together."""
+    requestIds: List[int]
+
+
 class JoinRequestResponse(BaseModel):
     """Join request response matching frontend JoinRequest type."""
     requestId: int
@@ -131,3 +160,17 @@ class TransactionLogResponse(BaseModel):
     
     class Config:
         from_attributes = True
+
+
+class TeamStatsResponse(BaseModel):
+    """Team match record."""
+    teamId: int
+    matchesPlayed: int
+    wins: int
+    draws: int
+    losses: int
+    goalsFor: int
+    goalsAgainst: int
+    points: int
+    form: str
+    rating: float
@@ -9,6 +9,7 @@ from app.services.booking_service import BookingService
 from app.services.content_service import ContentService
 from app.services.notification_service import NotificationService
 from app.services.email_service import EmailService
+from app.services.moderation_stats_service import ModerationStatsService
 
 __all__ = [
     "AuthService",
@@ -19,4 +20,5 @@ __all__ = [
     "ContentService",
     "NotificationService",
     "EmailService",
+    "ModerationStatsService",
 ]
@@ -7,10 +7,12 @@ from datetime import datetime, timedelta
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.repositories.user_repository import UserRepository, SessionRepository
+from app.services.moderation_stats_service import ModerationStatsService, TOTAL_USERS
 from app.models.user import UserAccount, Session
 from app.models.enums import AccountStatus, UserRole
 from app.utils.security import hash_password, verify_password, create_access_token, create_refresh_token
 from app.config import get_settings
+from app.models.player import PlayerProfile
 
 settings = get_settings()
 
@@ -22,6 +24,7 @@ class AuthService:
         self.db = db
         self.user_repo = UserRepository(db)
         self.session_repo = SessionRepository(db)
+        self.moderation_stats = ModerationStatsService(db)
     
     async def register(
         self,
@@ -63,7 +66,6 @@ class AuthService:
         
         # Create Player Profile if role is Player
         if UserRole.PLAYER.value in roles:
-            from app.models.player import PlayerProfile
             player_profile = PlayerProfile(
                 user_id=user.user_id,
                 display_name=username, # Default display name
@@ -76,6 +78,7 @@ class AuthService:
             # But simpler to just add to db.
             self.db.add(player_profile)
         
+        await self.moderation_stats.adjust(TOTAL_USERS, 1)
         await self.user_repo.commit()
         
         return user
@@ -4,13 +4,17 @@ Maps to BookingController in class diagram.
 """
 from typing import List, Optional
 from datetime import datetime, date, time
+from fastapi import BackgroundTasks
+from sqlalchemy import select, and_
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.repositories.booking_repository import BookingRepository
 from app.repositories.field_repository import CalendarRepository
+from app.repositories.team_repository import RosterRepository
+from app.services.notification_service import NotificationService
 from app.models.booking import BookingRequest
 from app.models.field import FieldCalendar
-from app.models.enums import BookingStatus, CalendarStatus
+from app.models.enums import BookingStatus, CalendarStatus, NotificationType
 
 
 class BookingService:
@@ -20,6 +24,8 @@ class BookingService:
         self.db = db
         self.booking_repo = BookingRepository(db)
         self.calendar_repo = CalendarRepository(db)
+        self.roster_repo = RosterRepository(db)
+        self.notification_service = NotificationService(db)
     
     async def create_booking(
         self,
@@ -62,10 +68,12 @@ class BookingService:
         """Get bookings for a team."""
         return await self.booking_repo.find_by_team(team_id)
     
-    async def approve_booking(self, booking: BookingRequest) -> bool:
+    async def approve_booking(
+        self,
+        booking: BookingRequest,
+        background_tasks: Optional[BackgroundTasks] = None
+    ) -> bool:
         """Approve a booking request."""
-        from sqlalchemy import select, and_
-        
         booking.status = BookingStatus.CONFIRMED
         booking.processed_at = datetime.utcnow()
         
@@ -103,15 +111,21 @@ class BookingService:
         
         await self.booking_repo.update(booking)
         await self.booking_repo.commit()
+        await self._notify_team(booking, "approved", background_tasks)
         return True
     
-    async def reject_booking(self, booking: BookingRequest) -> bool:
+    async def reject_booking(
+        self,
+        booking: BookingRequest,
+        background_tasks: Optional[BackgroundTasks] = None
+    ) -> bool:
         """Reject a booking request."""
         booking.status = BookingStatus.REJECTED
         booking.processed_at = datetime.utcnow()
         
         await self.booking_repo.update(booking)
         await self.booking_repo.commit()
+        await self._notify_team(booking, "rejected", background_tasks)
         return True
     
     async def cancel_booking(self, booking: BookingRequest) -> bool:
@@ -122,3 +136,22 @@ class BookingService:
         await self.booking_repo.update(booking)
         await self.booking_repo.commit()
         return True
+    
+    async def _notify_team(
+        self,
+        booking: BookingRequest,
+        outcome: str,
+        background_tasks: Optional[BackgroundTasks] = None
+    ) -> int:
+        """Notify the requester and the booking team's roster of a decision."""
+        recipients = [booking.requester_id]
+        recipients += await self.roster_repo.find_member_user_ids([booking.team_id])
+        return await self.notification_service.notify_users(
+            recipients,
+            NotificationType.BOOKING_UPDATE,
+            title=f"Booking {outcome.capitalize()}",
+            message=f"Your booking for {booking.date} has been {outcome}.",
+            related_entity_id=booking.booking_id,
+            related_entity_type="Booking",
+            background_tasks=background_tasks,
+        )
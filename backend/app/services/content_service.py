@@ -64,9 +64,9 @@ class ContentService:
         parent_comment_id: int = None,
     ) -> Comment:
         """Create a comment on a post."""
-        # Get post to increment counter
-        post = await self.post_repo.find_by_id(post_id)
-        if not post:
+        # Increment the comment count atomically; no row means no post
+        updated = await self.post_repo.update_many([post_id], {"comment_count": Post.comment_count + 1})
+        if not updated:
             raise ValueError("Post not found")
         
         comment = Comment(
@@ -76,14 +76,18 @@ class ContentService:
             parent_comment_id=parent_comment_id,
         )
         await self.comment_repo.save(comment)
-        
-        # Increment comment count
-        post.comment_count += 1
-        await self.post_repo.update(post)
-        
         await self.comment_repo.commit()
         return comment
     
+    async def adjust_reaction_count(self, post_id: int, delta: int) -> bool:
+        """Atomically add delta to a post's reaction count, never going below zero."""
+        criteria = [Post.reaction_count + delta >= 0] if delta < 0 else []
+        updated = await self.post_repo.update_many(
+            [post_id], {"reaction_count": Post.reaction_count + delta}, *criteria
+        )
+        await self.post_repo.commit()
+        return bool(updated)
+    
     async def get_comments_by_post(self, post_id: int) -> List[Comment]:
         """Get comments for a post."""
         return await self.comment_repo.find_by_post(post_id)
@@ -0,0 +1,299 @@
+"""
+EmailQueue - Background delivery of the persistent email outbox.
+
+Request handlers only insert rows into `email_outbox`; a pool of worker
+tasks claims due emails, groups them by recipient domain and hands each
+group to a transport that keeps its SMTP connection open between batches.
+Failed deliveries are retried with exponential backoff and moved to
+`email_dead_letter` once they run out of attempts.
+
+For local development point SMTP_HOST/SMTP_PORT at a debugging server, e.g.
+`python -m aiosmtpd -n -l localhost:1025` (or `python -m smtpd -n -c
+DebuggingServer localhost:1025` on Python 3.11) with SMTP_USE_TLS=false.
+"""
+import asyncio
+import itertools
+import logging
+import smtplib
+from abc import ABC, abstractmethod
+from datetime import datetime, timedelta
+from email.message import EmailMessage
+from functools import lru_cache
+from string import Template
+from typing import Callable, Dict, List, Optional, Tuple
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import get_settings
+from app.database import async_session_factory
+from app.models.email import EmailOutbox
+from app.repositories.email_repository import EmailOutboxRepository
+
+logger = logging.getLogger(__name__)
+
+
+# --- Templates ---
+
+EMAIL_TEMPLATES: Dict[str, Tuple[str, str]] = {
+    "verification": (
+        "Verify your Kick-off account",
+        "Hello,\n\nPlease verify your email address using this token:\n\n"
+        "    $token\n\nThe Kick-off team",
+    ),
+    "password_reset": (
+        "Reset your Kick-off password",
+        "Hello,\n\nUse this token to reset your password:\n\n"
+        "    $token\n\nIf you did not request a reset you can ignore this email.\n\nThe Kick-off team",
+    ),
+    "notification": (
+        "$subject",
+        "$body\n\n--\nYou are receiving this email because notifications are enabled "
+        "for your Kick-off account.",
+    ),
+}
+
+
+@lru_cache(maxsize=None)
+def _compile_template(name: str) -> Tuple[Template, Template]:
+    """Parse a template once; rendering reuses the compiled pair."""
+    subject, body = EMAIL_TEMPLATES[name]
+    return Template(subject), Template(body)
+
+
+def render_template(name: str, **data) -> Tuple[str, str]:
+    """Render a named template into (subject, body)."""
+    subject, body = _compile_template(name)
+    return subject.safe_substitute(data), body.safe_substitute(data)
+
+
+# --- Transports ---
+
+class EmailTransport(ABC):
+    """Delivers batches of outbox emails."""
+    
+    @abstractmethod
+    async def send_batch(self, emails: List[EmailOutbox]) -> Dict[int, Optional[str]]:
+        """Send emails; returns an error message (or None on success) per email_id."""
+    
+    async def close(self) -> None:
+        """Release any held connections."""
+
+
+class SMTPTransport(EmailTransport):
+    """
+    SMTP transport that keeps one connection open across batches.
+    
+    smtplib is blocking, so each batch runs in a worker thread. A dropped
+    connection is re-established once per batch before giving up.
+    """
+    
+    def __init__(
+        self,
+        host: str,
+        port: int,
+        sender: str,
+        username: str = "",
+        password: str = "",
+        use_tls: bool = True,
+        timeout: float = 30,
+    ):
+        self.host = host
+        self.port = port
+        self.sender = sender
+        self.username = username
+        self.password = password
+        self.use_tls = use_tls
+        self.timeout = timeout
+        self._smtp: Optional[smtplib.SMTP] = None
+    
+    def _connect(self) -> smtplib.SMTP:
+        smtp = smtplib.SMTP(self.host, self.port, timeout=self.timeout)
+        if self.use_tls:
+            smtp.starttls()
+        if self.username:
+            smtp.login(self.username, self.password)
+        return smtp
+    
+    def _connection(self) -> smtplib.SMTP:
+        if self._smtp is None:
+            self._smtp = self._connect()
+        return self._smtp
+    
+    def _build_message(self, email: EmailOutbox) -> EmailMessage:
+        message = EmailMessage()
+        message["From"] = self.sender
+        message["To"] = email.recipient
+        message["Subject"] = email.subject
+        message.set_content(email.body)
+        return message
+    
+    def _send_batch_sync(self, emails: List[EmailOutbox]) -> Dict[int, Optional[str]]:
+        results: Dict[int, Optional[str]] = {}
+        reconnected = False
+        for email in emails:
+            while True:
+                try:
+                    self._connection().send_message(self._build_message(email))
+                    results[email.email_id] = None
+                    break
+                except smtplib.SMTPServerDisconnected as exc:
+                    self._smtp = None
+                    if reconnected:
+                        results[email.email_id] = f"Disconnected: {exc}"
+                        break
+                    reconnected = True
+                except (smtplib.SMTPException, OSError) as exc:
+                    results[email.email_id] = f"{type(exc).__name__}: {exc}"
+                    if isinstance(exc, OSError):
+                        self._smtp = None
+                    break
+        return results
+    
+    async def send_batch(self, emails: List[EmailOutbox]) -> Dict[int, Optional[str]]:
+        return await asyncio.to_thread(self._send_batch_sync, emails)
+    
+    def _close_sync(self) -> None:
+        if self._smtp is not None:
+            try:
+                self._smtp.quit()
+            except (smtplib.SMTPException, OSError):
+                pass
+            self._smtp = None
+    
+    async def close(self) -> None:
+        await asyncio.to_thread(self._close_sync)
+
+
+def smtp_transport_from_settings() -> SMTPTransport:
+    """Build an SMTP transport from application settings."""
+    settings = get_settings()
+    return SMTPTransport(
+        host=settings.smtp_host,
+        port=settings.smtp_port,
+        sender=settings.email_from,
+        username=settings.smtp_user,
+        password=settings.smtp_password,
+        use_tls=settings.smtp_use_tls,
+    )
+
+
+# --- Queue ---
+
+def retry_delay(attempt: int, base_seconds: float, max_seconds: float) -> timedelta:
+    """Exponential backoff: base, 2*base, 4*base, ... capped at max."""
+    return timedelta(seconds=min(base_seconds * (2 ** (attempt - 1)), max_seconds))
+
+
+class EmailQueue:
+    """Pool of workers draining the email outbox."""
+    
+    def __init__(
+        self,
+        session_factory: Callable[[], AsyncSession] = async_session_factory,
+        transport_factory: Callable[[], EmailTransport] = smtp_transport_from_settings,
+        workers: int = None,
+        batch_size: int = None,
+        max_attempts: int = None,
+        retry_base_seconds: float = None,
+        retry_max_seconds: float = None,
+        poll_interval: float = None,
+    ):
+        settings = get_settings()
+        self.session_factory = session_factory
+        self.transport_factory = transport_factory
+        self.workers = workers or settings.email_workers
+        self.batch_size = batch_size or settings.email_batch_size
+        self.max_attempts = max_attempts or settings.email_max_attempts
+        self.retry_base_seconds = retry_base_seconds or settings.email_retry_base_seconds
+        self.retry_max_seconds = retry_max_seconds or settings.email_retry_max_seconds
+        self.poll_interval = poll_interval or settings.email_poll_interval_seconds
+        self._tasks: List[asyncio.Task] = []
+        self._wakeup = asyncio.Event()
+    
+    async def process_batch(self, transport: EmailTransport) -> int:
+        """Claim one batch of due emails, deliver it and record the outcome."""
+        async with self.session_factory() as session:
+            repo = EmailOutboxRepository(session)
+            emails = await repo.claim_due(self.batch_size)
+            await repo.commit()
+            if not emails:
+                return 0
+            
+            results: Dict[int, Optional[str]] = {}
+            for _, group in itertools.groupby(emails, key=lambda e: e.recipient_domain):
+                group = list(group)
+                try:
+                    results.update(await transport.send_batch(group))
+                except Exception as exc:
+                    logger.exception("Email batch failed")
+                    results.update({e.email_id: f"{type(exc).__name__}: {exc}" for e in group})
+            
+            sent = [email_id for email_id, error in results.items() if error is None]
+            await repo.mark_sent(sent)
+            now = datetime.utcnow()
+            for email in emails:
+                error = results.get(email.email_id, "Not attempted")
+                if error is None:
+                    continue
+                if email.attempts + 1 >= self.max_attempts:
+                    logger.warning(f"Email {email.email_id} to {email.recipient} dead-lettered: {error}")
+                    await repo.move_to_dead_letter(email, error)
+                else:
+                    delay = retry_delay(email.attempts + 1, self.retry_base_seconds, self.retry_max_seconds)
+                    await repo.schedule_retry(email, now + delay, error)
+            await repo.commit()
+            return len(emails)
+    
+    async def _worker(self) -> None:
+        transport = self.transport_factory()
+        try:
+            while True:
+                try:
+                    processed = await self.process_batch(transport)
+                except asyncio.CancelledError:
+                    raise
+                except Exception:
+                    logger.exception("Email worker iteration failed")
+                    processed = 0
+                if processed:
+                    continue
+                self._wakeup.clear()
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), timeout=self.poll_interval)
+                except asyncio.TimeoutError:
+                    pass
+        finally:
+            await transport.close()
+    
+    def wake(self) -> None:
+        """Signal idle workers that new mail was enqueued."""
+        self._wakeup.set()
+    
+    async def start(self) -> None:
+        """Recover stale claims and start the worker pool."""
+        async with self.session_factory() as session:
+            repo = EmailOutboxRepository(session)
+            await repo.release_stale(timedelta(minutes=5))
+            await repo.commit()
+        self._tasks = [asyncio.create_task(self._worker()) for _ in range(self.workers)]
+    
+    async def stop(self) -> None:
+        """Stop all workers and close their connections."""
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+
+_queue: Optional[EmailQueue] = None
+
+
+def get_email_queue() -> Optional[EmailQueue]:
+    """Get the running email queue, if any."""
+    return _queue
+
+
+def set_email_queue(queue: Optional[EmailQueue]) -> None:
+    """Register the running email queue."""
+    global _queue
+    _queue = queue
@@ -1,8 +1,14 @@
 """
-EmailService - Email sending service (mocked).
+EmailService - Email sending service.
 Maps to EmailService in class diagram.
 """
 import logging
+from typing import List
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import get_settings
+from app.repositories.email_repository import EmailOutboxRepository
+from app.services.email_queue import render_template, get_email_queue
 
 logger = logging.getLogger(__name__)
 
@@ -10,41 +16,56 @@ logger = logging.getLogger(__name__)
 class EmailService:
     """
     Service for sending emails.
-    Currently mocked - logs instead of sending real emails.
+    Emails are written to the outbox and delivered in the background by
+    EmailQueue workers. When email is disabled they are only logged.
     """
     
-    def __init__(
-        self,
-        smtp_host: str = "localhost",
-        smtp_port: int = 587,
-        sender_email: str = "noreply@kickoff.com",
-        sender_name: str = "Kick-off Platform",
-    ):
-        self.smtp_host = smtp_host
-        self.smtp_port = smtp_port
-        self.sender_email = sender_email
-        self.sender_name = sender_name
+    def __init__(self, db: AsyncSession, enabled: bool = None):
+        self.db = db
+        self.outbox_repo = EmailOutboxRepository(db)
+        self.enabled = get_settings().email_enabled if enabled is None else enabled
     
     async def send_verification_email(self, email: str, verification_token: str) -> bool:
-        """Send email verification link (mocked)."""
-        logger.info(f"[MOCK EMAIL] Verification email to {email} with token: {verification_token}")
-        return True
+        """Send email verification link."""
+        subject, body = render_template("verification", token=verification_token)
+        return await self._enqueue([email], subject, body) == 1
     
     async def send_password_reset_email(self, email: str, reset_token: str) -> bool:
-        """Send password reset link (mocked)."""
-        logger.info(f"[MOCK EMAIL] Password reset to {email} with token: {reset_token}")
-        return True
+        """Send password reset link."""
+        subject, body = render_template("password_reset", token=reset_token)
+        return await self._enqueue([email], subject, body) == 1
     
     async def send_notification_email(self, email: str, subject: str, body: str) -> bool:
-        """Send general notification email (mocked)."""
-        logger.info(f"[MOCK EMAIL] To: {email}, Subject: {subject}")
-        return True
+        """Send general notification email."""
+        subject, body = render_template("notification", subject=subject, body=body)
+        return await self._enqueue([email], subject, body) == 1
     
-    def _build_email_template(self, template_name: str, data: dict) -> str:
-        """Build email from template (stub)."""
-        return f"Template: {template_name}, Data: {data}"
+    async def send_bulk_notification_email(self, emails: List[str], subject: str, body: str) -> int:
+        """Send one notification email to many recipients."""
+        subject, body = render_template("notification", subject=subject, body=body)
+        return await self._enqueue(emails, subject, body)
     
-    async def _send(self, to: str, subject: str, body: str) -> bool:
-        """Send email via SMTP (mocked)."""
-        logger.info(f"[MOCK SMTP] Sending to {to}: {subject}")
-        return True
+    async def _enqueue(self, recipients: List[str], subject: str, body: str) -> int:
+        """Write emails to the outbox in one statement and wake the workers."""
+        recipients = [r for r in dict.fromkeys(recipients) if r]
+        if not self.enabled:
+            for recipient in recipients:
+                logger.info(f"[MOCK EMAIL] To: {recipient}, Subject: {subject}")
+            return len(recipients)
+        
+        rows = [
+            {
+                "recipient": recipient,
+                "recipient_domain": recipient.rsplit("@", 1)[-1].lower(),
+                "subject": subject,
+                "body": body,
+            }
+            for recipient in recipients
+        ]
+        count = await self.outbox_repo.enqueue_many(rows)
+        await self.outbox_repo.commit()
+        
+        queue = get_email_queue()
+        if queue:
+            queue.wake()
+        return count
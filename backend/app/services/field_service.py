@@ -7,6 +7,7 @@ from datetime import date, time, timedelta
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.repositories.field_repository import FieldRepository, CalendarRepository
+from app.services.moderation_stats_service import ModerationStatsService, PENDING_FIELDS
 from app.models.field import FieldProfile, FieldCalendar
 from app.models.enums import FieldStatus, CalendarStatus
 
@@ -18,6 +19,7 @@ class FieldService:
         self.db = db
         self.field_repo = FieldRepository(db)
         self.calendar_repo = CalendarRepository(db)
+        self.moderation_stats = ModerationStatsService(db)
     
     async def create_field(
         self,
@@ -43,6 +45,7 @@ class FieldService:
             status=FieldStatus.PENDING,
         )
         await self.field_repo.save(field)
+        await self.moderation_stats.adjust(PENDING_FIELDS, 1)
         await self.field_repo.commit()
         return field
     
@@ -64,6 +67,14 @@ class FieldService:
         await self.field_repo.commit()
         return field
     
+    async def delete_field(self, field: FieldProfile) -> bool:
+        """Delete a field."""
+        if field.status == FieldStatus.PENDING:
+            await self.moderation_stats.adjust(PENDING_FIELDS, -1)
+        await self.field_repo.delete(field)
+        await self.field_repo.commit()
+        return True
+    
     async def get_calendar(
         self,
         field_id: int,
@@ -0,0 +1,130 @@
+"""
+IncrementalIndex - Base of the process-wide in-memory indexes.
+
+An index is loaded once, in the application lifespan or lazily on first
+use, and then kept current without re-reading everything: a flush records
+the IDs of the entities it touched in session.info, a commit marks them
+dirty in the index and a rollback forgets them, and the next reader
+re-reads only the dirty IDs. A periodic full reload picks up changes made
+by other processes. At startup every index is warmed in the background;
+a reader arriving first waits for that load instead of starting another.
+
+Subclasses name the kinds of ID they track (e.g. teams, or players and
+users), load everything, reload given IDs and say which IDs a flush
+touched.
+"""
+import asyncio
+import logging
+from abc import ABC, abstractmethod
+from typing import Callable, Dict, Iterable, List, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+logger = logging.getLogger(__name__)
+
+
+class IncrementalIndex(ABC):
+    """In-memory index reloaded in full when stale, else only its dirty IDs."""
+    
+    # Prefix of the session.info keys, and the name used in logs
+    name: str = "index"
+    kinds: Tuple[str, ...] = ("ids",)
+    
+    def __init__(self):
+        self._dirty: Dict[str, set] = {kind: set() for kind in self.kinds}
+        self._loading = asyncio.Lock()
+        self.stale = True
+    
+    @abstractmethod
+    async def _load(self, session: AsyncSession) -> None:
+        """Replace the contents with the current rows."""
+    
+    @abstractmethod
+    async def _reload(self, session: AsyncSession, dirty: Dict[str, List[int]]) -> None:
+        """Re-read the given IDs of each kind."""
+    
+    def _flushed(self, session: Session) -> Dict[str, Iterable[int]]:
+        """IDs of each kind touched by the session's pending flush."""
+        return {}
+    
+    async def load(self, session: AsyncSession) -> None:
+        """Replace the index with the current rows."""
+        # Changes committed from here on are either in the rows or stay dirty
+        self._dirty = {kind: set() for kind in self.kinds}
+        await self._load(session)
+        self.stale = False
+    
+    async def ensure_fresh(self, session: AsyncSession) -> "IncrementalIndex":
+        """Load if stale, else re-read only the IDs changed since the last read; return self."""
+        if self.stale:
+            async with self._loading:
+                # The warm-up or another reader may have loaded it meanwhile
+                if self.stale:
+                    await self.load(session)
+        elif any(self._dirty.values()):
+            dirty = {kind: list(ids) for kind, ids in self._dirty.items()}
+            self._dirty = {kind: set() for kind in self.kinds}
+            await self._reload(session, dirty)
+        return self
+    
+    def mark_dirty(self, kind: str, ids: Iterable[int]) -> None:
+        self._dirty[kind].update(ids)
+    
+    def mark_stale(self) -> None:
+        self.stale = True
+    
+    def track(self, session: AsyncSession, kind: str, ids: Iterable[int]) -> None:
+        """Re-read these IDs once the session commits."""
+        session.info.setdefault(f"{self.name}_{kind}", set()).update(ids)
+    
+    def _after_flush(self, session: Session, flush_context) -> None:
+        for kind, ids in self._flushed(session).items():
+            if ids:
+                self.track(session, kind, ids)
+    
+    def _after_commit(self, session: Session) -> None:
+        for kind in self.kinds:
+            ids = session.info.pop(f"{self.name}_{kind}", None)
+            if ids:
+                self.mark_dirty(kind, ids)
+    
+    def _after_rollback(self, session: Session) -> None:
+        for kind in self.kinds:
+            session.info.pop(f"{self.name}_{kind}", None)
+    
+    def listen(self) -> None:
+        """Follow the changes committed by every session of this process."""
+        event.listen(Session, "after_flush", self._after_flush)
+        event.listen(Session, "after_commit", self._after_commit)
+        event.listen(Session, "after_rollback", self._after_rollback)
+    
+    async def run_periodic_refresh(
+        self,
+        session_factory: Callable[[], AsyncSession],
+        interval_seconds: float
+    ) -> None:
+        """Reload the index forever, every interval_seconds."""
+        while True:
+            await asyncio.sleep(interval_seconds)
+            try:
+                async with session_factory() as session:
+                    await self.load(session)
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.exception("Refresh of the %s index failed", self.name)
+
+
+async def warm_indexes(indexes: Iterable[IncrementalIndex], session_factory: Callable[[], AsyncSession]) -> None:
+    """Load the given indexes concurrently, each in its own session."""
+    async def warm_one(index: IncrementalIndex) -> None:
+        try:
+            async with session_factory() as session:
+                await index.ensure_fresh(session)
+        except Exception:
+            # Left stale, so its first reader loads it
+            logger.exception("Warm-up of the %s index failed", index.name)
+    
+    await asyncio.gather(*(warm_one(index) for index in indexes))
@@ -0,0 +1,165 @@
+"""
+LeagueTable - Process-wide standings ranked by points, goal difference and
+goals scored.
+
+Standings are persisted in team_stats (maintained by StatsService) and
+loaded here once, in the application lifespan or lazily on first use. Each
+partition - all teams, one location, one skill band - keeps its sort keys
+in a list ordered with bisect, so "my rank" is a binary search and top-N is
+a slice, however many teams there are.
+
+Kept current as an IncrementalIndex: committing a change to a team's
+stats or profile marks just that team dirty, and the next reader reloads
+the dirty teams with one query and re-sorts them.
+"""
+from bisect import bisect_left, insort
+from collections import defaultdict
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.models.team import TeamProfile
+from app.repositories.stats_repository import TeamStatsRepository
+from app.services.incremental_index import IncrementalIndex
+
+# Name -> inclusive skill_level range
+SKILL_BANDS = {
+    "1-3": (1, 3),
+    "4-6": (4, 6),
+    "7-10": (7, 10),
+}
+
+ALL_TEAMS = ("all",)
+
+
+def skill_band(skill_level: Optional[int]) -> Optional[str]:
+    if skill_level is None:
+        return None
+    for name, (low, high) in SKILL_BANDS.items():
+        if low <= skill_level <= high:
+            return name
+    return None
+
+
+def partition(location: Optional[str] = None, band: Optional[str] = None) -> tuple:
+    """Partition key for an optional location or skill band filter (location wins)."""
+    if location:
+        return ("location", location.strip().lower())
+    if band:
+        if band not in SKILL_BANDS:
+            raise ValueError(f"Unknown skill band '{band}'; expected one of {', '.join(SKILL_BANDS)}")
+        return ("band", band)
+    return ALL_TEAMS
+
+
+class LeagueTable(IncrementalIndex):
+    """Sorted in-memory standings with O(log n) rank lookup."""
+    
+    name = "league"
+    kinds = ("teams",)
+    
+    def __init__(self):
+        super().__init__()
+        self.standings: Dict[int, dict] = {}
+        self._sorted: Dict[tuple, List[tuple]] = defaultdict(list)
+    
+    @staticmethod
+    def sort_key(standing: dict) -> tuple:
+        return (-standing["points"], -standing["goal_difference"], -standing["goals_for"], standing["team_id"])
+    
+    @staticmethod
+    def _partitions(standing: dict) -> List[tuple]:
+        keys = [ALL_TEAMS]
+        if standing["location"]:
+            keys.append(partition(location=standing["location"]))
+        band = skill_band(standing["skill_level"])
+        if band:
+            keys.append(("band", band))
+        return keys
+    
+    @staticmethod
+    def _standing(row: dict) -> dict:
+        return {
+            **row,
+            "points": 3 * row["wins"] + row["draws"],
+            "goal_difference": row["goals_for"] - row["goals_against"],
+        }
+    
+    def put(self, row: dict) -> None:
+        """Insert or re-rank a team from its persisted standings row."""
+        self.remove(row["team_id"])
+        standing = self._standing(row)
+        self.standings[standing["team_id"]] = standing
+        key = self.sort_key(standing)
+        for p in self._partitions(standing):
+            insort(self._sorted[p], key)
+    
+    def remove(self, team_id: int) -> None:
+        """Drop a team from every partition."""
+        standing = self.standings.pop(team_id, None)
+        if standing is None:
+            return
+        key = self.sort_key(standing)
+        for p in self._partitions(standing):
+            keys = self._sorted[p]
+            del keys[bisect_left(keys, key)]
+            if not keys:
+                del self._sorted[p]
+    
+    async def _load(self, session: AsyncSession) -> None:
+        rows = await TeamStatsRepository(session).find_standings()
+        self.standings, self._sorted = {}, defaultdict(list)
+        for row in rows:
+            standing = self._standing(row)
+            self.standings[standing["team_id"]] = standing
+            for p in self._partitions(standing):
+                self._sorted[p].append(self.sort_key(standing))
+        for keys in self._sorted.values():
+            keys.sort()
+    
+    async def _reload(self, session: AsyncSession, dirty: Dict[str, List[int]]) -> None:
+        team_ids = dirty["teams"]
+        rows = await TeamStatsRepository(session).find_standings(team_ids)
+        for team_id in team_ids:
+            self.remove(team_id)
+        for row in rows:
+            self.put(row)
+    
+    def _flushed(self, session: Session) -> Dict[str, Iterable[int]]:
+        # Name, location or skill changes move a team between partitions
+        return {"teams": [obj.team_id for obj in (*session.dirty, *session.deleted) if isinstance(obj, TeamProfile)]}
+    
+    def size(self, key: tuple = ALL_TEAMS) -> int:
+        return len(self._sorted.get(key, ()))
+    
+    def top(self, limit: int, offset: int = 0, key: tuple = ALL_TEAMS) -> List[Tuple[int, dict]]:
+        """(rank, standing) for positions offset+1 .. offset+limit of a partition."""
+        keys = self._sorted.get(key, [])[offset:offset + limit]
+        return [(offset + i + 1, self.standings[k[-1]]) for i, k in enumerate(keys)]
+    
+    def rank(self, team_id: int, key: tuple = ALL_TEAMS) -> Optional[Tuple[int, dict]]:
+        """(rank, standing) of a team within a partition, or None if it is not ranked there."""
+        standing = self.standings.get(team_id)
+        if standing is None or key not in self._partitions(standing):
+            return None
+        return bisect_left(self._sorted[key], self.sort_key(standing)) + 1, standing
+
+
+_table = LeagueTable()
+_table.listen()
+
+
+def get_league_table() -> LeagueTable:
+    """Get the process-wide league table."""
+    return _table
+
+
+async def load_league_table(session: AsyncSession) -> LeagueTable:
+    """Get the league table, bringing it up to date first."""
+    return await _table.ensure_fresh(session)
+
+
+def track_team_changes(session: AsyncSession, team_ids: Iterable[int]) -> None:
+    """Re-rank these teams once the session commits."""
+    _table.track(session, "teams", team_ids)
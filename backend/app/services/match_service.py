@@ -2,15 +2,21 @@
 MatchService - Match event business logic.
 Maps to MatchController in class diagram.
 """
-from typing import List, Optional
+from typing import Dict, List, Optional
 from datetime import datetime, date, time
+from fastapi import BackgroundTasks
+from sqlalchemy import inspect
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.repositories.match_repository import MatchRepository, InvitationRepository, AttendanceRepository
-from app.repositories.team_repository import TeamRepository
+from app.repositories.match_repository import (
+    MatchRepository, InvitationRepository, AttendanceRepository, ResultRepository
+)
+from app.repositories.team_repository import TeamRepository, RosterRepository
 from app.services.notification_service import NotificationService
+from app.services.stats_service import StatsService, NO_CONTRIBUTION
+from app.services.rating_service import RatingService
 from app.models.match import MatchEvent, MatchInvitation, AttendanceRecord, MatchResult
-from app.models.enums import MatchStatus, Visibility, InvitationStatus, NotificationType
+from app.models.enums import MatchStatus, Visibility, InvitationStatus, NotificationType, AttendanceStatus
 
 class MatchService:
     """Service handling match business logic."""
@@ -20,8 +26,12 @@ class MatchService:
         self.match_repo = MatchRepository(db)
         self.invitation_repo = InvitationRepository(db)
         self.attendance_repo = AttendanceRepository(db)
+        self.result_repo = ResultRepository(db)
         self.team_repo = TeamRepository(db)
+        self.roster_repo = RosterRepository(db)
         self.notification_service = NotificationService(db)
+        self.stats_service = StatsService(db)
+        self.rating_service = RatingService(db)
     
     async def create_match(
         self,
@@ -57,20 +67,56 @@ class MatchService:
         return await self.match_repo.find_by_team(team_id)
     
     async def update_match(self, match: MatchEvent, **kwargs) -> MatchEvent:
-        """Update match event."""
+        """Update match event; cancelling or reinstating it adjusts the stats and ratings."""
         for key, value in kwargs.items():
             if hasattr(match, key) and value is not None:
                 setattr(match, key, value)
         
+        previous = inspect(match).attrs.status.history.deleted
+        was_cancelled = bool(previous) and previous[0] == MatchStatus.CANCELLED
         await self.match_repo.update(match)
+        if was_cancelled != (match.status == MatchStatus.CANCELLED):
+            counted = await self.stats_service.contribution(match, include_cancelled=True)
+            result = await self.result_repo.find_by_match(match.match_id)
+            if was_cancelled:
+                await self.stats_service.apply_change(NO_CONTRIBUTION, counted)
+                if result:
+                    await self.rating_service.rate_result(match, result)
+            else:
+                await self.stats_service.apply_change(counted, NO_CONTRIBUTION)
+                if result:
+                    await self.rating_service.unrate_result(match, result)
         await self.match_repo.commit()
         return match
     
-    async def cancel_match(self, match: MatchEvent) -> bool:
-        """Cancel a match."""
+    async def cancel_match(
+        self,
+        match: MatchEvent,
+        cancelled_by: int = None,
+        background_tasks: Optional[BackgroundTasks] = None
+    ) -> bool:
+        """Cancel a match, drop it from the stats and ratings and notify both rosters."""
+        before = await self.stats_service.contribution(match)
         match.status = MatchStatus.CANCELLED
         await self.match_repo.update(match)
+        await self.stats_service.apply_change(before, NO_CONTRIBUTION)
+        result = await self.result_repo.find_by_match(match.match_id)
+        if result:
+            await self.rating_service.unrate_result(match, result)
         await self.match_repo.commit()
+        
+        team_ids = [t for t in (match.host_team_id, match.opponent_team_id) if t]
+        recipients = await self.roster_repo.find_member_user_ids(team_ids)
+        await self.notification_service.notify_users(
+            recipients,
+            NotificationType.MATCH_CANCELLED,
+            title="Match Cancelled",
+            message=f"The match on {match.match_date} has been cancelled.",
+            related_entity_id=match.match_id,
+            related_entity_type="Match",
+            exclude_user_ids=[cancelled_by] if cancelled_by else (),
+            background_tasks=background_tasks,
+        )
         return True
     
     # --- Invitations ---
@@ -102,7 +148,7 @@ class MatchService:
                 related_entity_id=match.match_id,
                 related_entity_type="Match"
             )
-            
+        
         await self.invitation_repo.commit()
         return invitation
     
@@ -133,3 +179,79 @@ class MatchService:
     async def get_match_attendance(self, match_id: int) -> List[AttendanceRecord]:
         """Get attendance records for a match."""
         return await self.attendance_repo.find_by_match(match_id)
+    
+    async def set_attendance(
+        self,
+        match: MatchEvent,
+        team_id: int,
+        statuses: Dict[int, str],
+        confirmed_by: int,
+    ) -> List[AttendanceRecord]:
+        """
+        Set the attendance status of each player (player_id -> status) with
+        one upsert and read the records back with one IN query. Players
+        without a record get one for team_id. Player stats follow in the
+        same transaction.
+        """
+        try:
+            parsed = {player_id: AttendanceStatus(value) for player_id, value in statuses.items()}
+        except ValueError as e:
+            raise ValueError(f"Invalid attendance status: {e}")
+        
+        match_id = match.match_id
+        await self.match_repo.lock(match)
+        before = await self.stats_service.contribution(match)
+        confirmed_at = datetime.utcnow()
+        await self.attendance_repo.upsert_statuses([
+            {
+                "match_id": match_id, "player_id": player_id, "team_id": team_id,
+                "status": value, "confirmed_at": confirmed_at, "confirmed_by": confirmed_by,
+            }
+            for player_id, value in parsed.items()
+        ])
+        records = await self.attendance_repo.find_by_match_and_players(match_id, list(parsed))
+        await self.stats_service.apply_change(before, await self.stats_service.contribution(match))
+        await self.attendance_repo.commit()
+        return [records[player_id] for player_id in parsed if player_id in records]
+    
+    async def get_attendance_counts(self, match_id: int) -> Dict[AttendanceStatus, int]:
+        """Number of attendance records per status, every status present."""
+        counts = await self.attendance_repo.count_by_status(match_id)
+        return {s: counts.get(s, 0) for s in AttendanceStatus}
+    
+    # --- Results ---
+    
+    async def record_result(
+        self,
+        match: MatchEvent,
+        home_score: int,
+        away_score: int,
+        recorded_by: int,
+        notes: Optional[str] = None,
+    ) -> MatchResult:
+        """Record the final score and update team and player stats and team ratings."""
+        # Taken before the check, so a concurrent record_result waits and then sees the result
+        await self.match_repo.lock(match)
+        if await self.result_repo.find_by_match(match.match_id):
+            raise ValueError("Result already recorded")
+        
+        winner_id = None
+        if home_score > away_score:
+            winner_id = match.host_team_id
+        elif away_score > home_score:
+            winner_id = match.opponent_team_id
+        
+        before = await self.stats_service.contribution(match)
+        result = MatchResult(
+            match_id=match.match_id,
+            home_score=home_score,
+            away_score=away_score,
+            winner_id=winner_id,
+            notes=notes,
+            recorded_by=recorded_by,
+        )
+        await self.result_repo.save(result)
+        await self.stats_service.apply_change(before, await self.stats_service.contribution(match))
+        await self.rating_service.rate_result(match, result)
+        await self.result_repo.commit()
+        return result
@@ -0,0 +1,69 @@
+"""
+MatchmakingService - Rank opponents for a team looking for a match.
+
+Candidates come from the in-memory OpponentIndex: verified teams within a
+radius of the team's coordinates, minus teams that already have a
+non-cancelled match on the proposed date (one indexed query on
+match_event.match_date). Each candidate is scored by
+
+    SKILL_WEIGHT * balance + DISTANCE_WEIGHT * nearness
+
+where balance is 1 for an even match by Elo rating and falls towards 0 as
+one side becomes the clear favourite, and nearness falls linearly from 1
+next door to 0 at the edge of the radius.
+"""
+import heapq
+from datetime import date
+from operator import itemgetter
+from typing import List
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.team import TeamProfile
+from app.repositories.match_repository import MatchRepository
+from app.services.opponent_index import load_opponent_index
+from app.services.rating_service import RatingService, expected_score
+
+SKILL_WEIGHT = 0.6
+DISTANCE_WEIGHT = 0.4
+DEFAULT_RADIUS_KM = 25.0
+
+
+def match_score(rating: float, opponent_rating: float, distance_km: float, radius_km: float) -> float:
+    """1 for an evenly matched team next door, towards 0 with rating gap and distance."""
+    balance = 1 - 2 * abs(expected_score(rating, opponent_rating) - 0.5)
+    nearness = 1 - distance_km / radius_km if radius_km else 1.0
+    return SKILL_WEIGHT * balance + DISTANCE_WEIGHT * nearness
+
+
+class MatchmakingService:
+    """Service suggesting opponents."""
+    
+    def __init__(self, db: AsyncSession):
+        self.db = db
+        self.match_repo = MatchRepository(db)
+        self.rating_service = RatingService(db)
+    
+    async def find_opponents(
+        self,
+        team: TeamProfile,
+        match_date: date,
+        radius_km: float = DEFAULT_RADIUS_KM,
+        limit: int = 10,
+    ) -> List[dict]:
+        """Best-scored available opponents within radius_km, each with distance_km and score."""
+        if team.latitude is None or team.longitude is None:
+            raise ValueError("Set the team's coordinates to find opponents nearby")
+        
+        index = await load_opponent_index(self.db)
+        rating = (await self.rating_service.get_ratings([team.team_id]))[team.team_id]
+        busy = await self.match_repo.find_busy_team_ids(match_date)
+        busy.add(team.team_id)
+        
+        scored = (
+            (match_score(rating, candidate["rating"], distance, radius_km), -candidate["team_id"], candidate, distance)
+            for candidate, distance in index.near(team.latitude, team.longitude, radius_km)
+            if candidate["team_id"] not in busy
+        )
+        best = heapq.nlargest(limit, scored, key=itemgetter(0, 1))
+        return [{**candidate, "distance_km": distance, "score": score} for score, _, candidate, distance in best]
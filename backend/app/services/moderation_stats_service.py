@@ -0,0 +1,65 @@
+"""
+ModerationStatsService - Materialized counters for the moderation dashboard.
+
+Write paths adjust the counters in the same transaction as the change that
+affects them, so reading the dashboard is a single small lookup. A periodic
+reconciliation recomputes every counter from the source tables in one
+aggregated query to correct any drift (e.g. from bulk loads or scripts).
+"""
+import asyncio
+import logging
+from typing import Callable, Dict
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.repositories.moderation_repository import ModerationCounterRepository
+
+logger = logging.getLogger(__name__)
+
+PENDING_REPORTS = "pending_reports"
+PENDING_TEAMS = "pending_teams"
+PENDING_FIELDS = "pending_fields"
+TOTAL_USERS = "total_users"
+
+COUNTER_NAMES = (PENDING_REPORTS, PENDING_TEAMS, PENDING_FIELDS, TOTAL_USERS)
+
+
+class ModerationStatsService:
+    """Service maintaining moderation dashboard counters."""
+    
+    def __init__(self, db: AsyncSession):
+        self.db = db
+        self.counter_repo = ModerationCounterRepository(db)
+    
+    async def adjust(self, name: str, delta: int = 1) -> None:
+        """Adjust a counter within the caller's transaction (caller commits)."""
+        await self.counter_repo.increment(name, delta)
+    
+    async def get_stats(self) -> Dict[str, int]:
+        """Read the counters, reconciling first if they were never initialised."""
+        values = await self.counter_repo.find_values()
+        if any(name not in values for name in COUNTER_NAMES):
+            values = await self.reconcile()
+        return {name: values[name] for name in COUNTER_NAMES}
+    
+    async def reconcile(self) -> Dict[str, int]:
+        """Recompute every counter from the source tables and commit."""
+        values = await self.counter_repo.count_actual()
+        await self.counter_repo.set_values(values)
+        await self.counter_repo.commit()
+        return values
+
+
+async def run_periodic_reconcile(
+    session_factory: Callable[[], AsyncSession],
+    interval_seconds: float
+) -> None:
+    """Reconcile moderation counters forever, every interval_seconds."""
+    while True:
+        try:
+            async with session_factory() as session:
+                await ModerationStatsService(session).reconcile()
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            logger.exception("Moderation counter reconciliation failed")
+        await asyncio.sleep(interval_seconds)
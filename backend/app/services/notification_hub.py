@@ -0,0 +1,109 @@
+"""
+NotificationHub - Pub/sub fan-in for server-pushed notifications.
+
+Services publish events per user after their data is committed; each open
+stream subscribes for its user and receives events through a bounded queue.
+The hub is an abstract interface so a broker-backed implementation can be
+swapped in with set_notification_hub(); InProcessNotificationHub serves a
+single worker process and tests.
+"""
+import asyncio
+from abc import ABC, abstractmethod
+from typing import Any, Dict, Optional, Set
+
+from app.config import get_settings
+
+
+class Subscription:
+    """
+    A single stream's view of the hub.
+    
+    Events are buffered in a bounded queue. When a slow consumer lets the
+    queue fill up, further events are dropped and `overflowed` is set so the
+    stream can resynchronise from the database instead of blocking publishers.
+    """
+    
+    def __init__(self, user_id: int, max_queue_size: int):
+        self.user_id = user_id
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=max_queue_size)
+        self.overflowed = False
+    
+    def offer(self, event: Dict[str, Any]) -> bool:
+        """Enqueue an event without blocking. Returns False if it was dropped."""
+        try:
+            self.queue.put_nowait(event)
+            return True
+        except asyncio.QueueFull:
+            self.overflowed = True
+            return False
+    
+    def drain(self) -> None:
+        """Discard buffered events and clear the overflow flag."""
+        while not self.queue.empty():
+            self.queue.get_nowait()
+        self.overflowed = False
+
+
+class NotificationHub(ABC):
+    """Interface for delivering notification events to connected clients."""
+    
+    @abstractmethod
+    def subscribe(self, user_id: int) -> Subscription:
+        """Register a new subscription for a user."""
+    
+    @abstractmethod
+    def unsubscribe(self, subscription: Subscription) -> None:
+        """Remove a subscription."""
+    
+    @abstractmethod
+    async def publish(self, user_id: int, event: Dict[str, Any]) -> None:
+        """Deliver an event to every subscription of a user."""
+    
+    @abstractmethod
+    def subscribed_users(self) -> Set[int]:
+        """User IDs with at least one open subscription."""
+
+
+class InProcessNotificationHub(NotificationHub):
+    """Hub backed by in-memory queues within one process."""
+    
+    def __init__(self, max_queue_size: int = 100):
+        self.max_queue_size = max_queue_size
+        self._subscriptions: Dict[int, Set[Subscription]] = {}
+    
+    def subscribe(self, user_id: int) -> Subscription:
+        subscription = Subscription(user_id, self.max_queue_size)
+        self._subscriptions.setdefault(user_id, set()).add(subscription)
+        return subscription
+    
+    def unsubscribe(self, subscription: Subscription) -> None:
+        subscriptions = self._subscriptions.get(subscription.user_id)
+        if not subscriptions:
+            return
+        subscriptions.discard(subscription)
+        if not subscriptions:
+            del self._subscriptions[subscription.user_id]
+    
+    async def publish(self, user_id: int, event: Dict[str, Any]) -> None:
+        for subscription in list(self._subscriptions.get(user_id, ())):
+            subscription.offer(event)
+    
+    def subscribed_users(self) -> Set[int]:
+        return set(self._subscriptions)
+
+
+_hub: Optional[NotificationHub] = None
+
+
+def get_notification_hub() -> NotificationHub:
+    """Get the process-wide notification hub."""
+    global _hub
+    if _hub is None:
+        _hub = InProcessNotificationHub(get_settings().notification_stream_queue_size)
+    return _hub
+
+
+def set_notification_hub(hub: NotificationHub) -> None:
+    """Replace the process-wide notification hub (e.g. with a broker-backed one)."""
+    global _hub
+    _hub = hub
@@ -2,20 +2,45 @@
 NotificationService - Notification business logic.
 Maps to NotificationController in class diagram.
 """
-from typing import List
+from typing import List, Iterable, Optional, Callable
+from datetime import datetime
+from fastapi import BackgroundTasks
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.config import get_settings
+from app.database import async_session_factory
 from app.repositories.notification_repository import NotificationRepository
+from app.services.notification_hub import NotificationHub, get_notification_hub
 from app.models.notification import Notification
 from app.models.enums import NotificationType
 
 
+# NotificationPreference column gating each notification type.
+# Types not listed here (account/system messages) are always delivered.
+PREFERENCE_FIELDS = {
+    NotificationType.MATCH_INVITE: "match_reminders",
+    NotificationType.MATCH_CANCELLED: "match_reminders",
+    NotificationType.MATCH_UPDATES: "match_reminders",
+    NotificationType.TEAM_VERIFIED: "team_updates",
+    NotificationType.TEAM_DELETED: "team_updates",
+    NotificationType.TEAM_NEWS: "team_updates",
+    NotificationType.JOIN_REQUEST: "team_updates",
+    NotificationType.BOOKING_UPDATE: "booking_updates",
+    NotificationType.BOOKING_ALERTS: "booking_updates",
+    NotificationType.FIELD_REJECTED: "booking_updates",
+    NotificationType.COMMENTS: "community_updates",
+    NotificationType.REACTIONS: "community_updates",
+    NotificationType.PROMOTIONS: "community_updates",
+}
+
+
 class NotificationService:
     """Service handling notification business logic."""
     
-    def __init__(self, db: AsyncSession):
+    def __init__(self, db: AsyncSession, hub: Optional[NotificationHub] = None):
         self.db = db
         self.notification_repo = NotificationRepository(db)
+        self.hub = hub or get_notification_hub()
     
     async def get_notifications(
         self,
@@ -25,16 +50,49 @@ class NotificationService:
         """Get notifications for a user."""
         return await self.notification_repo.find_by_user(user_id, unread_only)
     
-    async def mark_as_read(self, notification_id: int) -> bool:
+    async def get_notifications_since(
+        self,
+        user_id: int,
+        after_id: int,
+        limit: int = 100
+    ) -> List[Notification]:
+        """Get notifications created after a given ID, oldest first."""
+        return await self.notification_repo.find_after(user_id, after_id, limit)
+    
+    async def get_latest_notification_id(self, user_id: int) -> int:
+        """Get the newest notification ID for a user, or 0."""
+        return await self.notification_repo.find_latest_id(user_id) or 0
+    
+    async def get_unread_count(self, user_id: int) -> int:
+        """Get unread notification count."""
+        return await self.notification_repo.count_unread(user_id)
+    
+    async def mark_as_read(self, notification_id: int, user_id: int = None) -> bool:
         """Mark notification as read."""
+        if user_id is not None:
+            return await self.mark_many_as_read([notification_id], user_id) > 0
         await self.notification_repo.mark_as_read(notification_id)
         await self.notification_repo.commit()
         return True
     
+    async def mark_many_as_read(self, notification_ids: List[int], user_id: int) -> int:
+        """Mark a user's notifications as read with one UPDATE."""
+        count = await self.notification_repo.update_many(
+            notification_ids,
+            {"is_read": True},
+            Notification.user_id == user_id,
+            Notification.is_read == False,
+        )
+        await self.notification_repo.commit()
+        if count:
+            await self._publish_unread_counts([user_id])
+        return count
+    
     async def mark_all_read(self, user_id: int) -> int:
         """Mark all notifications as read."""
         count = await self.notification_repo.mark_all_read(user_id)
         await self.notification_repo.commit()
+        await self.hub.publish(user_id, unread_count_event(0))
         return count
     
     async def create_notification(
@@ -57,4 +115,159 @@ class NotificationService:
         )
         await self.notification_repo.save(notification)
         await self.notification_repo.commit()
+        
+        await self.hub.publish(user_id, notification_event(notification))
+        await self._publish_unread_counts([user_id])
         return notification
+    
+    async def fan_out(
+        self,
+        user_ids: Iterable[int],
+        notification_type: NotificationType,
+        title: str,
+        message: str,
+        related_entity_id: int = None,
+        related_entity_type: str = None,
+        exclude_user_ids: Iterable[int] = (),
+    ) -> int:
+        """
+        Send one notification template to many users.
+        
+        Recipients who disabled the matching preference category are
+        filtered out in one query, and the rest are inserted in a single
+        statement. Returns the number of notifications created.
+        """
+        excluded = set(exclude_user_ids)
+        recipients = [
+            uid for uid in dict.fromkeys(user_ids)
+            if uid is not None and uid not in excluded
+        ]
+        
+        preference_field = PREFERENCE_FIELDS.get(notification_type)
+        if recipients and preference_field:
+            opted_out = await self.notification_repo.find_opted_out(recipients, preference_field)
+            recipients = [uid for uid in recipients if uid not in opted_out]
+        
+        if not recipients:
+            return 0
+        
+        now = datetime.utcnow()
+        rows = [
+            {
+                "user_id": uid,
+                "type": notification_type,
+                "title": title,
+                "message": message,
+                "related_entity_id": related_entity_id,
+                "related_entity_type": related_entity_type,
+                "is_read": False,
+                "created_at": now,
+            }
+            for uid in recipients
+        ]
+        notification_ids = await self.notification_repo.bulk_create(rows)
+        await self.notification_repo.commit()
+        
+        # Only the rows this fan-out inserted, by ID
+        for notification in await self.notification_repo.find_by_ids(notification_ids):
+            await self.hub.publish(notification.user_id, notification_event(notification))
+        await self._publish_unread_counts(recipients)
+        return len(notification_ids)
+    
+    async def _publish_unread_counts(self, user_ids: Iterable[int]) -> None:
+        """Push fresh unread counts to the users' streams."""
+        counts = await self.notification_repo.count_unread_by_users(user_ids)
+        for user_id, count in counts.items():
+            await self.hub.publish(user_id, unread_count_event(count))
+    
+    async def notify_users(
+        self,
+        user_ids: Iterable[int],
+        notification_type: NotificationType,
+        title: str,
+        message: str,
+        related_entity_id: int = None,
+        related_entity_type: str = None,
+        exclude_user_ids: Iterable[int] = (),
+        background_tasks: Optional[BackgroundTasks] = None,
+        session_factory: Optional[Callable[[], AsyncSession]] = None,
+    ) -> int:
+        """
+        Fan out a notification, deferring large audiences to a background task.
+        
+        When background_tasks is given and the audience reaches the configured
+        threshold, delivery runs after the response is sent in its own session
+        and 0 is returned. Otherwise delivery happens inline.
+        """
+        user_ids = list(user_ids)
+        threshold = get_settings().notification_fanout_background_threshold
+        if background_tasks is not None and len(user_ids) >= threshold:
+            background_tasks.add_task(
+                run_fan_out,
+                session_factory or async_session_factory,
+                user_ids,
+                notification_type,
+                title,
+                message,
+                related_entity_id,
+                related_entity_type,
+                list(exclude_user_ids),
+            )
+            return 0
+        
+        return await self.fan_out(
+            user_ids,
+            notification_type,
+            title,
+            message,
+            related_entity_id=related_entity_id,
+            related_entity_type=related_entity_type,
+            exclude_user_ids=exclude_user_ids,
+        )
+
+
+def notification_event(notification: Notification) -> dict:
+    """Build the hub event for a newly created notification."""
+    return {
+        "event": "notification",
+        "id": notification.notification_id,
+        "data": {
+            "notificationId": notification.notification_id,
+            "userId": notification.user_id,
+            "type": notification.type.value,
+            "title": notification.title,
+            "message": notification.message,
+            "relatedEntityId": notification.related_entity_id,
+            "relatedEntityType": notification.related_entity_type,
+            "isRead": notification.is_read,
+            "createdAt": notification.created_at.isoformat(),
+        },
+    }
+
+
+def unread_count_event(count: int) -> dict:
+    """Build the hub event for an unread count change."""
+    return {"event": "unread_count", "data": {"count": count}}
+
+
+async def run_fan_out(
+    session_factory: Callable[[], AsyncSession],
+    user_ids: List[int],
+    notification_type: NotificationType,
+    title: str,
+    message: str,
+    related_entity_id: int = None,
+    related_entity_type: str = None,
+    exclude_user_ids: List[int] = (),
+) -> int:
+    """Run a fan-out in a fresh session (used by background tasks)."""
+    async with session_factory() as session:
+        return await NotificationService(session).fan_out(
+            user_ids,
+            notification_type,
+            title,
+            message,
+            related_entity_id=related_entity_id,
+            related_entity_type=related_entity_type,
+            exclude_user_ids=exclude_user_ids,
+        )
@@ -0,0 +1,90 @@
+"""
+OpponentIndex - Process-wide candidate index for opponent matchmaking.
+
+Every verified team with coordinates is kept in memory with its name,
+location, skill level and Elo rating, bucketed in a GridIndex by
+coordinates. Finding opponents near a team visits only the grid cells
+around it instead of scanning team_profile on each request.
+
+Kept current as an IncrementalIndex: committing a change to a team's
+profile or rating marks just that team dirty, and the next reader reloads
+the dirty teams with one query.
+"""
+from typing import Dict, Iterable, List, Tuple
+
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.models.team import TeamProfile
+from app.repositories.team_repository import TeamRepository
+from app.services.incremental_index import IncrementalIndex
+from app.utils.geo import GridIndex
+
+GRID_CELL_DEGREES = 0.1  # About 11 km north-south
+
+
+class OpponentIndex(IncrementalIndex):
+    """Matchmaking candidates by ID and by grid cell."""
+    
+    name = "opponent"
+    kinds = ("teams",)
+    
+    def __init__(self, cell_degrees: float = GRID_CELL_DEGREES):
+        super().__init__()
+        self.teams: Dict[int, dict] = {}
+        self.grid = GridIndex(cell_degrees)
+    
+    def put(self, row: dict) -> None:
+        """Insert or move a team from its candidate row."""
+        self.teams[row["team_id"]] = row
+        self.grid.put(row["team_id"], row["latitude"], row["longitude"])
+    
+    def remove(self, team_id: int) -> None:
+        self.teams.pop(team_id, None)
+        self.grid.remove(team_id)
+    
+    async def _load(self, session: AsyncSession) -> None:
+        rows = await TeamRepository(session).find_matchmaking_candidates()
+        self.teams, self.grid = {}, GridIndex(self.grid.cell_degrees)
+        for row in rows:
+            self.put(row)
+    
+    async def _reload(self, session: AsyncSession, dirty: Dict[str, List[int]]) -> None:
+        team_ids = dirty["teams"]
+        rows = await TeamRepository(session).find_matchmaking_candidates(team_ids)
+        for team_id in team_ids:
+            self.remove(team_id)
+        for row in rows:
+            self.put(row)
+    
+    def _flushed(self, session: Session) -> Dict[str, Iterable[int]]:
+        # New and verified teams become candidates; moved, renamed or rejected ones change
+        changed = (*session.new, *session.dirty, *session.deleted)
+        return {"teams": [obj.team_id for obj in changed if isinstance(obj, TeamProfile)]}
+    
+    def size(self) -> int:
+        return len(self.teams)
+    
+    def near(self, latitude: float, longitude: float, radius_km: float) -> List[Tuple[dict, float]]:
+        """(candidate, distance in km) of the teams within radius_km, nearest first."""
+        teams = self.teams
+        return [(teams[team_id], distance) for team_id, distance in self.grid.within(latitude, longitude, radius_km)]
+
+
+_index = OpponentIndex()
+_index.listen()
+
+
+def get_opponent_index() -> OpponentIndex:
+    """Get the process-wide opponent index."""
+    return _index
+
+
+async def load_opponent_index(session: AsyncSession) -> OpponentIndex:
+    """Get the opponent index, bringing it up to date first."""
+    return await _index.ensure_fresh(session)
+
+
+def track_team_changes(session: AsyncSession, team_ids: Iterable[int]) -> None:
+    """Re-read these teams' candidate rows once the session commits."""
+    _index.track(session, "teams", team_ids)
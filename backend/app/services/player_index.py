@@ -0,0 +1,126 @@
+"""
+PlayerIndex - Process-wide candidate index for recruiting players.
+
+Every player whose account has coordinates (and is not suspended, banned
+or deleted) is kept in memory in a GridIndex, labelled with its
+(position, skill level). A recruitment search visits the grid cells
+around the team, takes only the labels matching the position and skill
+band asked for, and computes distances for those players alone, so it
+answers in milliseconds however many players are indexed.
+
+Kept current as an IncrementalIndex: committing a change to a player
+profile or user account marks just that player or user dirty, and the
+next reader reloads them with one query.
+"""
+import heapq
+from typing import Collection, Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.models.player import PlayerProfile
+from app.models.user import UserAccount
+from app.repositories.player_repository import PlayerRepository
+from app.services.incremental_index import IncrementalIndex
+from app.utils.geo import GridIndex
+
+GRID_CELL_DEGREES = 0.05  # About 5.5 km north-south
+
+
+def position_key(position: Optional[str]) -> str:
+    return (position or "").strip().lower()
+
+
+class PlayerIndex(IncrementalIndex):
+    """Recruitment candidates by grid cell, position and skill level."""
+    
+    name = "recruit"
+    kinds = ("players", "users")
+    
+    def __init__(self, cell_degrees: float = GRID_CELL_DEGREES):
+        super().__init__()
+        self.players: Dict[int, dict] = {}
+        self.grid = GridIndex(cell_degrees)
+        self._by_user: Dict[int, int] = {}
+    
+    def put(self, row: dict) -> None:
+        """Insert or move a player from its candidate row."""
+        self.remove(row["player_id"])
+        self.players[row["player_id"]] = row
+        self._by_user[row["user_id"]] = row["player_id"]
+        self.grid.put(
+            row["player_id"], row["latitude"], row["longitude"],
+            (position_key(row["position"]), row["skill_level"]),
+        )
+    
+    def remove(self, player_id: int) -> None:
+        row = self.players.pop(player_id, None)
+        if row is None:
+            return
+        self._by_user.pop(row["user_id"], None)
+        self.grid.remove(player_id)
+    
+    async def _load(self, session: AsyncSession) -> None:
+        rows = await PlayerRepository(session).find_recruitment_candidates()
+        self.players, self.grid, self._by_user = {}, GridIndex(self.grid.cell_degrees), {}
+        for row in rows:
+            self.put(row)
+    
+    async def _reload(self, session: AsyncSession, dirty: Dict[str, List[int]]) -> None:
+        player_ids, user_ids = dirty["players"], dirty["users"]
+        rows = await PlayerRepository(session).find_recruitment_candidates(player_ids, user_ids)
+        for player_id in player_ids + [self._by_user[u] for u in user_ids if u in self._by_user]:
+            self.remove(player_id)
+        for row in rows:
+            self.put(row)
+    
+    def _flushed(self, session: Session) -> Dict[str, Iterable[int]]:
+        changed = (*session.new, *session.dirty, *session.deleted)
+        return {
+            "players": [obj.player_id for obj in changed if isinstance(obj, PlayerProfile)],
+            # Location and account status live on the user
+            "users": [obj.user_id for obj in changed if isinstance(obj, UserAccount)],
+        }
+    
+    def size(self) -> int:
+        return len(self.players)
+    
+    def search(
+        self,
+        latitude: float,
+        longitude: float,
+        radius_km: float,
+        position: Optional[str] = None,
+        skill_range: Optional[Tuple[int, int]] = None,
+        exclude: Collection[int] = (),
+        limit: int = 20,
+    ) -> List[Tuple[dict, float]]:
+        """(candidate, distance in km) of the nearest matching players within radius_km."""
+        wanted = position_key(position) if position else None
+        low, high = skill_range or (None, None)
+        
+        def matches(label: Tuple[str, Optional[int]]) -> bool:
+            bucket_position, skill = label
+            if wanted is not None and bucket_position != wanted:
+                return False
+            return not skill_range or (skill is not None and low <= skill <= high)
+        
+        found = (
+            (distance, player_id)
+            for player_id, distance in self.grid.near(latitude, longitude, radius_km, matches)
+            if player_id not in exclude
+        )
+        return [(self.players[player_id], distance) for distance, player_id in heapq.nsmallest(limit, found)]
+
+_index = PlayerIndex()
+_index.listen()
+
+
+def get_player_index() -> PlayerIndex:
+    """Get the process-wide player index."""
+    return _index
+
+
+async def load_player_index(session: AsyncSession) -> PlayerIndex:
+    """Get the player index, bringing it up to date first."""
+    return await _index.ensure_fresh(session)
@@ -0,0 +1,144 @@
+"""
+RatingService - Elo ratings of teams computed from match results.
+
+Every team starts at INITIAL_RATING. A result between two registered
+teams moves K_FACTOR * (actual - expected) points from the loser to the
+winner, where expected = 1 / (1 + 10 ** ((opponent - rating) / 400)) and
+actual is 1, 0.5 or 0. Matches against unregistered opponents are unrated.
+
+Ratings are updated incrementally: recording a result applies its change
+against the current ratings and stores it on match_result.rating_change,
+cancelling the match takes that change back and reinstating it rates it
+again. Changed teams are re-read by the OpponentIndex after commit.
+Because Elo depends on order, results recorded late or cancelled leave
+the incremental ratings slightly off the chronological ones; replay()
+recomputes the whole history in order.
+
+A replay groups matches into waves in which no team plays twice, keeping
+each team's matches in chronological order across waves. All matches of a
+wave read ratings that are final for that wave, so with NumPy a wave is a
+handful of array operations and a replay takes as many steps as the
+longest run of dependent matches rather than one per match.
+"""
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.repositories.match_repository import ResultRepository
+from app.repositories.stats_repository import TeamStatsRepository
+from app.services.opponent_index import track_team_changes
+from app.models.match import MatchEvent, MatchResult
+from app.models.stats import INITIAL_RATING
+from app.models.enums import MatchStatus
+
+K_FACTOR = 32.0
+
+# (host_team_id, opponent_team_id, home_score, away_score), oldest first
+RatedMatch = Tuple[int, int, int, int]
+
+
+def expected_score(rating: float, opponent_rating: float) -> float:
+    """Probability-like score a team is expected to take from the match."""
+    return 1 / (1 + 10 ** ((opponent_rating - rating) / 400))
+
+
+def actual_score(scored: int, conceded: int) -> float:
+    if scored > conceded:
+        return 1.0
+    return 0.5 if scored == conceded else 0.0
+
+
+def rating_change(home_rating: float, away_rating: float, home_score: int, away_score: int) -> float:
+    """Points the host team gains (negative: loses) from a result."""
+    return K_FACTOR * (actual_score(home_score, away_score) - expected_score(home_rating, away_rating))
+
+
+def schedule_waves(matches: Sequence[RatedMatch]) -> List[int]:
+    """
+    Wave index of every match: one past the latest wave either team already
+    plays in, so no team appears twice in a wave and each team's matches
+    keep their order.
+    """
+    last_wave: Dict[int, int] = {}
+    waves = []
+    for home_id, away_id, _, _ in matches:
+        wave = max(last_wave.get(home_id, -1), last_wave.get(away_id, -1)) + 1
+        last_wave[home_id] = last_wave[away_id] = wave
+        waves.append(wave)
+    return waves
+
+
+def replay(matches: Sequence[RatedMatch]) -> Tuple[Dict[int, float], List[float]]:
+    """Final rating of every team that played and the change of every match, in input order."""
+    if not matches:
+        return {}, []
+    team_ids, slots = numpy.unique(
+        numpy.array([(m[0], m[1]) for m in matches], dtype=numpy.int64), return_inverse=True
+    )
+    slots = slots.reshape(-1, 2)
+    scores = numpy.array([actual_score(m[2], m[3]) for m in matches])
+    waves = numpy.array(schedule_waves(matches))
+    order = numpy.argsort(waves, kind="stable")
+    bounds = numpy.flatnonzero(numpy.diff(waves[order])) + 1
+    
+    ratings = numpy.full(len(team_ids), INITIAL_RATING)
+    changes = numpy.empty(len(matches))
+    for wave in numpy.split(order, bounds):
+        home, away = slots[wave, 0], slots[wave, 1]
+        expected = 1 / (1 + 10 ** ((ratings[away] - ratings[home]) / 400))
+        change = K_FACTOR * (scores[wave] - expected)
+        ratings[home] += change
+        ratings[away] -= change
+        changes[wave] = change
+    return dict(zip(team_ids.tolist(), ratings.tolist())), changes.tolist()
+
+
+class RatingService:
+    """Service maintaining team Elo ratings."""
+    
+    def __init__(self, db: AsyncSession):
+        self.db = db
+        self.result_repo = ResultRepository(db)
+        self.team_stats_repo = TeamStatsRepository(db)
+    
+    async def get_ratings(self, team_ids: List[int]) -> Dict[int, float]:
+        """Rating of each team; INITIAL_RATING for teams that have not played."""
+        stored = await self.team_stats_repo.find_ratings(team_ids)
+        return {team_id: stored.get(team_id, INITIAL_RATING) for team_id in team_ids}
+    
+    async def rate_result(self, match: MatchEvent, result: MatchResult) -> Optional[float]:
+        """
+        Apply a result's change against the current ratings and store it on
+        the result (caller commits). The teams' stats rows must exist, i.e.
+        StatsService has counted the result. Returns the change, or None if
+        the match is unrated.
+        """
+        if not match.opponent_team_id or match.status == MatchStatus.CANCELLED:
+            return None
+        home_id, away_id = match.host_team_id, match.opponent_team_id
+        ratings = await self.get_ratings([home_id, away_id])
+        change = rating_change(ratings[home_id], ratings[away_id], result.home_score, result.away_score)
+        await self.team_stats_repo.adjust_ratings({home_id: change, away_id: -change})
+        track_team_changes(self.db, [home_id, away_id])
+        result.rating_change = change
+        await self.db.flush()
+        return change
+    
+    async def unrate_result(self, match: MatchEvent, result: MatchResult) -> None:
+        """Take back a result's stored change (caller commits)."""
+        if result.rating_change is None:
+            return
+        change = result.rating_change
+        await self.team_stats_repo.adjust_ratings({match.host_team_id: -change, match.opponent_team_id: change})
+        track_team_changes(self.db, [match.host_team_id, match.opponent_team_id])
+        result.rating_change = None
+        await self.db.flush()
+    
+    async def replay(self) -> int:
+        """Recompute every rating and stored change from the full history (no commit). Returns the matches rated."""
+        history = await self.result_repo.find_rated_history()
+        ratings, changes = replay([row[1:] for row in history])
+        await self.team_stats_repo.replace_ratings(ratings)
+        await self.result_repo.replace_rating_changes({row[0]: change for row, change in zip(history, changes)})
+        return len(history)
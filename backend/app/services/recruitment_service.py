@@ -0,0 +1,51 @@
+"""
+RecruitmentService - Find players for a team to recruit.
+
+Candidates come from the in-memory PlayerIndex: players near the team's
+coordinates, optionally of one position and skill band, nearest first,
+leaving out everyone already on the team's active roster (one indexed
+query on team_roster.team_id).
+"""
+from typing import List, Optional
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.team import TeamProfile
+from app.repositories.team_repository import RosterRepository
+from app.services.league_table import SKILL_BANDS
+from app.services.player_index import load_player_index
+
+DEFAULT_RADIUS_KM = 10.0
+
+
+class RecruitmentService:
+    """Service suggesting players to recruit."""
+    
+    def __init__(self, db: AsyncSession):
+        self.db = db
+        self.roster_repo = RosterRepository(db)
+    
+    async def find_players(
+        self,
+        team: TeamProfile,
+        position: Optional[str] = None,
+        skill_band: Optional[str] = None,
+        radius_km: float = DEFAULT_RADIUS_KM,
+        limit: int = 20,
+    ) -> List[dict]:
+        """Nearest matching players not on the team, each with distance_km."""
+        if team.latitude is None or team.longitude is None:
+            raise ValueError("Set the team's coordinates to find players nearby")
+        if skill_band and skill_band not in SKILL_BANDS:
+            raise ValueError(f"Unknown skill band '{skill_band}'; expected one of {', '.join(SKILL_BANDS)}")
+        
+        index = await load_player_index(self.db)
+        roster = await self.roster_repo.find_active_player_ids(team.team_id)
+        found = index.search(
+            team.latitude, team.longitude, radius_km,
+            position=position,
+            skill_range=SKILL_BANDS[skill_band] if skill_band else None,
+            exclude=roster,
+            limit=limit,
+        )
+        return [{**row, "distance_km": distance} for row, distance in found]
@@ -0,0 +1,135 @@
+"""
+ReferenceData - Process-wide registry of rarely changing lookup data.
+
+Amenities are loaded once, in the application lifespan (or lazily on first
+use, e.g. in tests), and then served from memory: the public amenity list,
+the amenity details behind a field's amenity IDs and validation of amenity
+filters. Enum-backed lookups (statuses, positions, ...) are Python enums and
+never touch the database in the first place.
+
+Committing a change to an Amenity row in this process marks the registry
+stale so the next reader reloads it; a periodic refresh picks up edits made
+by other processes or directly in the database, and an amenity ID the cache
+does not know triggers an immediate reload before it is rejected.
+"""
+import asyncio
+import logging
+from typing import Callable, Dict, Iterable, List
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.models.field import Amenity
+from app.repositories.field_repository import AmenityRepository
+from app.schemas.field import AmenityResponse
+
+logger = logging.getLogger(__name__)
+
+
+class ReferenceData:
+    """In-memory amenity lookups, reloaded when marked stale."""
+    
+    def __init__(self):
+        self.amenities: Dict[int, dict] = {}
+        self.active_amenities: List[dict] = []
+        self.version = 0
+        self.stale = True
+    
+    async def load(self, session: AsyncSession) -> None:
+        """Replace the cached data with the current database contents."""
+        rows = await AmenityRepository(session).find_all_ordered()
+        amenities = {
+            a.amenity_id: AmenityResponse(
+                amenityId=a.amenity_id,
+                name=a.name,
+                description=a.description,
+                icon=a.icon,
+                isActive=a.is_active,
+            ).model_dump()
+            for a in rows
+        }
+        if amenities != self.amenities:
+            self.amenities = amenities
+            self.active_amenities = [a for a in amenities.values() if a["isActive"]]
+            self.version += 1
+        self.stale = False
+    
+    async def ensure_loaded(self, session: AsyncSession) -> "ReferenceData":
+        """Load (or reload) if stale, then return self."""
+        if self.stale:
+            await self.load(session)
+        return self
+    
+    def mark_stale(self) -> None:
+        self.stale = True
+    
+    def amenity_responses(self, amenity_ids: Iterable[int]) -> List[dict]:
+        """Amenity responses for the given IDs, in order, skipping unknown IDs."""
+        amenities = self.amenities
+        return [amenities[i] for i in amenity_ids if i in amenities]
+    
+    def _unknown(self, amenity_ids: Iterable[int]) -> List[int]:
+        amenities = self.amenities
+        return sorted({
+            i for i in amenity_ids if i not in amenities or not amenities[i]["isActive"]
+        })
+    
+    async def unknown_amenity_ids(self, session: AsyncSession, amenity_ids: Iterable[int]) -> List[int]:
+        """
+        IDs that do not name an active amenity. If the cache does not know
+        some, it reloads once (they may have been added by another process)
+        and only IDs still unknown are returned.
+        """
+        amenity_ids = list(amenity_ids)
+        unknown = self._unknown(amenity_ids)
+        if unknown:
+            await self.load(session)
+            unknown = self._unknown(amenity_ids)
+        return unknown
+
+
+_registry = ReferenceData()
+
+
+def get_reference_data() -> ReferenceData:
+    """Get the process-wide reference data registry."""
+    return _registry
+
+
+async def load_reference_data(session: AsyncSession) -> ReferenceData:
+    """Get the registry, loading it first if needed."""
+    return await _registry.ensure_loaded(session)
+
+
+@event.listens_for(Session, "after_flush")
+def _track_amenity_changes(session: Session, flush_context) -> None:
+    if any(isinstance(obj, Amenity) for obj in (*session.new, *session.dirty, *session.deleted)):
+        session.info["amenities_changed"] = True
+
+
+@event.listens_for(Session, "after_commit")
+def _refresh_after_amenity_commit(session: Session) -> None:
+    if session.info.pop("amenities_changed", False):
+        _registry.mark_stale()
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_amenity_changes(session: Session) -> None:
+    session.info.pop("amenities_changed", None)
+
+
+async def run_periodic_refresh(
+    session_factory: Callable[[], AsyncSession],
+    interval_seconds: float
+) -> None:
+    """Reload reference data forever, every interval_seconds."""
+    while True:
+        await asyncio.sleep(interval_seconds)
+        try:
+            async with session_factory() as session:
+                await _registry.load(session)
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            logger.exception("Reference data refresh failed")
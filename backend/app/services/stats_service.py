@@ -0,0 +1,125 @@
+"""
+StatsService - Denormalized player and team match statistics.
+
+Each match contributes a fixed set of increments (the teams' W/D/L and
+goals once a result exists, and per-player attendance and outcomes).
+Writes that change a match take its contribution before and after the
+change and add the difference to player_stats/team_stats in the same
+transaction, so a profile or leaderboard reads one row per player or team
+instead of aggregating match history. Teams whose record changed get
+their form recomputed and are re-ranked in the LeagueTable after commit.
+rebuild() recomputes both tables from scratch in bulk, replaying the team
+ratings kept in team_stats (see RatingService).
+"""
+from typing import Dict, Tuple
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.repositories.match_repository import AttendanceRepository, ResultRepository
+from app.repositories.stats_repository import (
+    PlayerStatsRepository, TeamStatsRepository, PLAYER_STAT_COLUMNS, TEAM_STAT_COLUMNS
+)
+from app.services.league_table import get_league_table, track_team_changes
+from app.services.rating_service import RatingService
+from app.services.opponent_index import get_opponent_index
+from app.models.match import MatchEvent
+from app.models.stats import INITIAL_RATING
+from app.models.enums import AttendanceStatus, MatchStatus
+
+Deltas = Dict[int, Dict[str, int]]
+Contribution = Tuple[Deltas, Deltas]  # (team deltas, player deltas)
+
+NO_CONTRIBUTION: Contribution = ({}, {})
+
+
+def _outcome(scored: int, conceded: int) -> str:
+    if scored > conceded:
+        return "wins"
+    return "draws" if scored == conceded else "losses"
+
+
+def _difference(before: Deltas, after: Deltas, columns: tuple) -> Deltas:
+    changes = {}
+    for entity_id in before.keys() | after.keys():
+        old, new = before.get(entity_id, {}), after.get(entity_id, {})
+        delta = {c: new.get(c, 0) - old.get(c, 0) for c in columns}
+        if any(delta.values()):
+            changes[entity_id] = delta
+    return changes
+
+
+class StatsService:
+    """Service maintaining player_stats and team_stats."""
+    
+    def __init__(self, db: AsyncSession):
+        self.db = db
+        self.attendance_repo = AttendanceRepository(db)
+        self.result_repo = ResultRepository(db)
+        self.player_stats_repo = PlayerStatsRepository(db)
+        self.team_stats_repo = TeamStatsRepository(db)
+        self.rating_service = RatingService(db)
+    
+    async def contribution(self, match: MatchEvent, include_cancelled: bool = False) -> Contribution:
+        """What the match currently adds to the stats tables (nothing once cancelled)."""
+        if match.status == MatchStatus.CANCELLED and not include_cancelled:
+            return NO_CONTRIBUTION
+        
+        teams, players = {}, {}
+        goals = {}
+        result = await self.result_repo.find_by_match(match.match_id)
+        if result:
+            goals[match.host_team_id] = (result.home_score, result.away_score)
+            if match.opponent_team_id:
+                goals[match.opponent_team_id] = (result.away_score, result.home_score)
+        for team_id, (scored, conceded) in goals.items():
+            teams[team_id] = {
+                "matches_played": 1, _outcome(scored, conceded): 1,
+                "goals_for": scored, "goals_against": conceded,
+            }
+        
+        for player_id, team_id, status in await self.attendance_repo.find_statuses(match.match_id):
+            if status == AttendanceStatus.PRESENT:
+                players[player_id] = {"matches_played": 1}
+                if team_id in goals:
+                    scored, conceded = goals[team_id]
+                    players[player_id].update({
+                        _outcome(scored, conceded): 1, "goals_for": scored, "goals_against": conceded,
+                    })
+            elif status in (AttendanceStatus.ABSENT, AttendanceStatus.EXCUSED):
+                players[player_id] = {"matches_missed": 1}
+        return teams, players
+    
+    async def apply_change(self, before: Contribution, after: Contribution) -> None:
+        """Add after - before to the stored stats (caller commits)."""
+        teams = _difference(before[0], after[0], TEAM_STAT_COLUMNS)
+        if teams:
+            await self.team_stats_repo.add(teams)
+            await self.team_stats_repo.refresh_form(list(teams))
+            track_team_changes(self.db, teams)
+        await self.player_stats_repo.add(_difference(before[1], after[1], PLAYER_STAT_COLUMNS))
+    
+    async def get_player_stats(self, player_id: int) -> dict:
+        """A player's totals; zeros if they have none yet."""
+        stats = await self.player_stats_repo.find_by_player(player_id)
+        values = {c: getattr(stats, c) if stats else 0 for c in PLAYER_STAT_COLUMNS}
+        values["attendance_rate"] = stats.attendance_rate if stats else None
+        return {"player_id": player_id, **values}
+    
+    async def get_team_stats(self, team_id: int) -> dict:
+        """A team's record; zeros if it has none yet."""
+        stats = await self.team_stats_repo.find_by_team(team_id)
+        values = {c: getattr(stats, c) if stats else 0 for c in TEAM_STAT_COLUMNS}
+        return {
+            "team_id": team_id, **values,
+            "points": stats.points if stats else 0,
+            "form": stats.form if stats else "",
+            "rating": stats.rating if stats else INITIAL_RATING,
+        }
+    
+    async def rebuild(self) -> None:
+        """Recompute both tables and the ratings from the match tables and commit."""
+        await self.team_stats_repo.rebuild()
+        await self.rating_service.replay()
+        await self.player_stats_repo.rebuild()
+        await self.team_stats_repo.commit()
+        get_league_table().mark_stale()
+        get_opponent_index().mark_stale()
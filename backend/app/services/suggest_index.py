@@ -0,0 +1,184 @@
+"""
+SuggestIndex - Process-wide type-ahead index of searchable names.
+
+Holds the ID and name of every verified team and field, every player and
+every field owner. Each type keeps two sorted lists of (key, ID): the
+whole name, and every later word of it, normalized (case-folded, accents
+removed). A prefix is found with bisect and the matches are the run that
+follows, so a lookup costs O(log n) plus the suggestions returned, with no
+database round trip. Whole-name matches come before word matches.
+
+Kept current as an IncrementalIndex: committing a create, rename or
+status change marks just that entity dirty, and the next reader reloads
+the dirty entities with one query per type.
+"""
+import unicodedata
+from bisect import bisect_left, insort
+from typing import Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.models.field import FieldProfile
+from app.models.player import PlayerProfile
+from app.models.team import TeamProfile
+from app.models.user import UserAccount
+from app.repositories.field_repository import FieldRepository
+from app.repositories.player_repository import PlayerRepository
+from app.repositories.team_repository import TeamRepository
+from app.repositories.user_repository import UserRepository
+from app.services.incremental_index import IncrementalIndex
+
+SUGGEST_TYPES = ("team", "field", "player", "owner")
+
+# Letters without a decomposed form
+_FOLD = str.maketrans({"đ": "d", "ð": "d", "ø": "o", "ł": "l", "ß": "ss"})
+
+
+def normalize(text: str) -> str:
+    """Lower-case, accent-free form of a name or prefix, single-spaced."""
+    text = unicodedata.normalize("NFKD", text.casefold().translate(_FOLD))
+    return " ".join("".join(c for c in text if not unicodedata.combining(c)).split())
+
+
+def name_keys(name: str) -> Tuple[Optional[str], List[str]]:
+    """The whole-name key and the keys starting at each later word."""
+    key = normalize(name or "")
+    if not key:
+        return None, []
+    starts = [i + 1 for i, c in enumerate(key) if c == " "]
+    return key, [key[i:] for i in starts]
+
+
+class SuggestIndex(IncrementalIndex):
+    """Sorted in-memory names with O(log n) prefix lookup."""
+    
+    name = "suggest"
+    kinds = SUGGEST_TYPES
+    
+    def __init__(self):
+        super().__init__()
+        self.names: Dict[str, Dict[int, str]] = {t: {} for t in SUGGEST_TYPES}
+        # Per type: sorted (key, id) for whole names, and for later words
+        self._whole: Dict[str, List[Tuple[str, int]]] = {t: [] for t in SUGGEST_TYPES}
+        self._words: Dict[str, List[Tuple[str, int]]] = {t: [] for t in SUGGEST_TYPES}
+    
+    def put(self, kind: str, entity_id: int, name: str) -> None:
+        """Insert or rename an entity."""
+        self.remove(kind, entity_id)
+        key, words = name_keys(name)
+        if key is None:
+            return
+        self.names[kind][entity_id] = name
+        insort(self._whole[kind], (key, entity_id))
+        for word in words:
+            insort(self._words[kind], (word, entity_id))
+    
+    def remove(self, kind: str, entity_id: int) -> None:
+        name = self.names[kind].pop(entity_id, None)
+        if name is None:
+            return
+        key, words = name_keys(name)
+        whole = self._whole[kind]
+        del whole[bisect_left(whole, (key, entity_id))]
+        for word in words:
+            keys = self._words[kind]
+            del keys[bisect_left(keys, (word, entity_id))]
+    
+    @staticmethod
+    async def _find(session: AsyncSession, kind: str, ids: Optional[List[int]] = None) -> List[tuple]:
+        if kind == "team":
+            return await TeamRepository(session).find_suggestions(ids)
+        if kind == "field":
+            return await FieldRepository(session).find_suggestions(ids)
+        if kind == "player":
+            return await PlayerRepository(session).find_suggestions(ids)
+        return await UserRepository(session).find_owner_suggestions(ids)
+    
+    async def _load(self, session: AsyncSession) -> None:
+        for kind in SUGGEST_TYPES:
+            rows = await self._find(session, kind)
+            names, whole, words = {}, [], []
+            for entity_id, name in rows:
+                key, later = name_keys(name)
+                if key is None:
+                    continue
+                names[entity_id] = name
+                whole.append((key, entity_id))
+                words.extend((word, entity_id) for word in later)
+            whole.sort()
+            words.sort()
+            self.names[kind], self._whole[kind], self._words[kind] = names, whole, words
+    
+    async def _reload(self, session: AsyncSession, dirty: Dict[str, List[int]]) -> None:
+        for kind, ids in dirty.items():
+            if not ids:
+                continue
+            rows = await self._find(session, kind, ids)
+            for entity_id in ids:
+                self.remove(kind, entity_id)
+            for entity_id, name in rows:
+                self.put(kind, entity_id, name)
+    
+    def _flushed(self, session: Session) -> Dict[str, Iterable[int]]:
+        changed = {t: set() for t in SUGGEST_TYPES}
+        for obj in (*session.new, *session.dirty, *session.deleted):
+            if isinstance(obj, TeamProfile):
+                changed["team"].add(obj.team_id)
+            elif isinstance(obj, FieldProfile):
+                changed["field"].add(obj.field_id)
+                # Owning a first field, or no longer any, adds or drops the owner
+                changed["owner"].add(obj.owner_id)
+            elif isinstance(obj, PlayerProfile):
+                changed["player"].add(obj.player_id)
+            elif isinstance(obj, UserAccount):
+                changed["owner"].add(obj.user_id)
+        return changed
+    
+    def size(self, kind: Optional[str] = None) -> int:
+        kinds = [kind] if kind else SUGGEST_TYPES
+        return sum(len(self.names[k]) for k in kinds)
+    
+    @staticmethod
+    def _prefixed(keys: List[Tuple[str, int]], prefix: str, limit: int, seen: Set[int]) -> List[Tuple[str, int]]:
+        found = []
+        i = bisect_left(keys, (prefix,))
+        while i < len(keys) and len(found) < limit and keys[i][0].startswith(prefix):
+            if keys[i][1] not in seen:
+                found.append(keys[i])
+                seen.add(keys[i][1])
+            i += 1
+        return found
+    
+    def suggest(self, prefix: str, kinds: Sequence[str] = SUGGEST_TYPES, limit: int = 10) -> List[Tuple[str, int, str]]:
+        """(type, ID, name) of up to limit names starting with prefix, or with a word that does."""
+        prefix = normalize(prefix)
+        if not prefix:
+            return []
+        found = []
+        for tier in (self._whole, self._words):
+            matches = []
+            for kind in kinds:
+                seen = {entity_id for k, entity_id, _ in found if k == kind}
+                matches.extend(
+                    (key, kind, entity_id) for key, entity_id in self._prefixed(tier[kind], prefix, limit, seen)
+                )
+            matches.sort()
+            found.extend((kind, entity_id, self.names[kind][entity_id]) for _, kind, entity_id in matches)
+            if len(found) >= limit:
+                break
+        return found[:limit]
+
+
+_index = SuggestIndex()
+_index.listen()
+
+
+def get_suggest_index() -> SuggestIndex:
+    """Get the process-wide suggest index."""
+    return _index
+
+
+async def load_suggest_index(session: AsyncSession) -> SuggestIndex:
+    """Get the suggest index, bringing it up to date first."""
+    return await _index.ensure_fresh(session)
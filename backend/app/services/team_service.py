@@ -8,6 +8,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.repositories.team_repository import TeamRepository, RosterRepository, JoinRequestRepository
 from app.repositories.player_repository import PlayerRepository
+from app.services.moderation_stats_service import ModerationStatsService, PENDING_TEAMS
 from app.models.team import TeamProfile, TeamRoster, JoinRequest
 from app.models.enums import TeamStatus, RosterRole, JoinRequestStatus, UserRole
 
@@ -21,6 +22,7 @@ class TeamService:
         self.roster_repo = RosterRepository(db)
         self.join_request_repo = JoinRequestRepository(db)
         self.player_repo = PlayerRepository(db)
+        self.moderation_stats = ModerationStatsService(db)
     
     async def create_team(
         self,
@@ -47,6 +49,7 @@ class TeamService:
             longitude=longitude,
         )
         await self.team_repo.save(team)
+        await self.moderation_stats.adjust(PENDING_TEAMS, 1)
         
         # Add leader to roster as Captain
         player = await self.player_repo.find_by_user_id(leader_id)
@@ -97,6 +100,8 @@ class TeamService:
     
     async def delete_team(self, team: TeamProfile) -> bool:
         """Delete a team."""
+        if team.status == TeamStatus.PENDING:
+            await self.moderation_stats.adjust(PENDING_TEAMS, -1)
         await self.team_repo.delete(team)
         await self.team_repo.commit()
         return True
@@ -153,3 +158,34 @@ class TeamService:
         await self.join_request_repo.update(request)
         await self.join_request_repo.commit()
         return True
+    
+    async def process_join_requests(
+        self,
+        team_id: int,
+        request_ids: List[int],
+        approve: bool
+    ) -> int:
+        """Approve or reject several pending join requests of a team at once."""
+        pending = await self.join_request_repo.lock_pending(team_id, request_ids)
+        if not pending:
+            return 0
+        
+        now = datetime.utcnow()
+        count = await self.join_request_repo.update_many(
+            [r.request_id for r in pending],
+            {"status": JoinRequestStatus.ACCEPTED if approve else JoinRequestStatus.REJECTED, "processed_at": now},
+        )
+        if approve:
+            # Players who left the team rejoin on their old roster row
+            roster = {entry.player_id: entry for entry in await self.roster_repo.find_by_team(team_id)}
+            joining = sorted({r.player_id for r in pending})
+            await self.roster_repo.update_many(
+                [roster[p].roster_id for p in joining if p in roster and not roster[p].is_active],
+                {"is_active": True, "role": RosterRole.MEMBER, "joined_at": now},
+            )
+            await self.roster_repo.save_many([
+                TeamRoster(team_id=team_id, player_id=player_id, role=RosterRole.MEMBER, is_active=True)
+                for player_id in joining if player_id not in roster
+            ])
+        await self.join_request_repo.commit()
+        return count
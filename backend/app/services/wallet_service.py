@@ -0,0 +1,266 @@
+"""
+WalletService - Team wallet ledger.
+
+Every balance change is a single conditional UPDATE
+(`balance = balance + :delta`) committed together with its TransactionLog
+row, so concurrent writers cannot lose updates or overdraw a wallet, and a
+balance never changes without its ledger entry. Wallets are created on
+first use inside the same transaction.
+
+Statements are served from two summaries instead of scanning the ledger:
+per-month, per-category totals (updated in the same transaction as every
+write) and monthly opening-balance snapshots (taken by a periodic job).
+Only the partial months at the edges of a period read TransactionLog rows,
+through the (wallet_id, created_at) index, so a yearly statement costs
+about as much as a monthly one.
+"""
+import asyncio
+import logging
+from datetime import date, datetime, time, timedelta
+from decimal import Decimal
+from typing import Callable, Dict, List, Optional, Tuple
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.repositories.team_repository import (
+    WalletRepository, TransactionRepository, WalletMonthlyTotalRepository, WalletSnapshotRepository
+)
+from app.models.team import TeamWallet, TransactionLog
+from app.models.enums import TransactionType
+
+logger = logging.getLogger(__name__)
+
+
+def month_of(moment: datetime) -> date:
+    """First day of the month containing the given moment."""
+    return date(moment.year, moment.month, 1)
+
+
+def next_month(month: date) -> date:
+    return date(month.year + month.month // 12, month.month % 12 + 1, 1)
+
+
+def _midnight(day: date) -> datetime:
+    return datetime.combine(day, time.min)
+
+
+class WalletService:
+    """Service handling team wallet balances and transactions."""
+    
+    def __init__(self, db: AsyncSession):
+        self.db = db
+        self.wallet_repo = WalletRepository(db)
+        self.transaction_repo = TransactionRepository(db)
+        self.monthly_repo = WalletMonthlyTotalRepository(db)
+        self.snapshot_repo = WalletSnapshotRepository(db)
+    
+    async def get_wallet(self, team_id: int) -> TeamWallet:
+        """Get the team's wallet, creating an empty one on first use."""
+        wallet = await self.wallet_repo.find_by_team(team_id)
+        if wallet is None:
+            await self.wallet_repo.create_if_missing(team_id)
+            wallet = await self.wallet_repo.find_by_team(team_id)
+            await self.wallet_repo.commit()
+        return wallet
+    
+    async def get_transactions(self, team_id: int, limit: int = 50) -> List[TransactionLog]:
+        """Latest transactions of the team's wallet, newest first."""
+        wallet_id = await self.wallet_repo.find_id_by_team(team_id)
+        if wallet_id is None:
+            return []
+        return await self.transaction_repo.find_recent(wallet_id, limit)
+    
+    async def deposit(
+        self,
+        team_id: int,
+        amount: float,
+        user_id: int,
+        description: Optional[str] = None,
+        category: Optional[str] = None,
+    ) -> TransactionLog:
+        """Add funds, creating the wallet if needed."""
+        return await self._record(
+            team_id, TransactionType.INCOME, amount, user_id, description or "Deposit", category,
+            create_wallet=True, allow_negative=True,
+        )
+    
+    async def withdraw(
+        self,
+        team_id: int,
+        amount: float,
+        user_id: int,
+        description: Optional[str] = None,
+        category: Optional[str] = None,
+    ) -> TransactionLog:
+        """Take funds out; fails rather than overdraw."""
+        return await self._record(
+            team_id, TransactionType.EXPENSE, amount, user_id, description or "Withdrawal", category,
+            create_wallet=False, allow_negative=False,
+        )
+    
+    async def record_expense(
+        self,
+        team_id: int,
+        amount: float,
+        user_id: int,
+        description: Optional[str] = None,
+        category: Optional[str] = None,
+    ) -> TransactionLog:
+        """Record money already spent; the balance may go negative."""
+        return await self._record(
+            team_id, TransactionType.EXPENSE, amount, user_id, description or "Expense", category,
+            create_wallet=True, allow_negative=True,
+        )
+    
+    async def _record(
+        self,
+        team_id: int,
+        transaction_type: TransactionType,
+        amount: float,
+        user_id: int,
+        description: str,
+        category: Optional[str],
+        create_wallet: bool,
+        allow_negative: bool,
+    ) -> TransactionLog:
+        amount = Decimal(str(amount))
+        if amount <= 0:
+            raise ValueError("Amount must be positive")
+        
+        wallet_id = await self.wallet_repo.find_id_by_team(team_id)
+        if wallet_id is None:
+            if not create_wallet:
+                raise ValueError("Wallet not found")
+            await self.wallet_repo.create_if_missing(team_id)
+            wallet_id = await self.wallet_repo.find_id_by_team(team_id)
+        
+        delta = amount if transaction_type == TransactionType.INCOME else -amount
+        if not await self.wallet_repo.add_to_balance(wallet_id, delta, allow_negative):
+            raise ValueError("Insufficient funds")
+        
+        created_at = datetime.utcnow()
+        transaction = TransactionLog(
+            wallet_id=wallet_id,
+            type=transaction_type,
+            amount=amount,
+            description=description,
+            category=category,
+            created_by=user_id,
+            created_at=created_at,
+        )
+        await self.transaction_repo.save(transaction)
+        await self.monthly_repo.add(wallet_id, month_of(created_at), transaction_type, category, amount)
+        await self.transaction_repo.commit()
+        return transaction
+    
+    async def get_statement(self, team_id: int, start: date, end: date) -> dict:
+        """
+        Opening/closing balance and per-category totals for the days
+        start..end (inclusive). A team without a wallet gets an empty,
+        zero-balance statement; nothing is created.
+        """
+        if end < start:
+            raise ValueError("Statement end must not be before its start")
+        wallet = await self.wallet_repo.find_by_team(team_id)
+        if wallet is None:
+            return {
+                "wallet_id": None,
+                "team_id": team_id,
+                "start": start,
+                "end": end,
+                "opening_balance": Decimal(0),
+                "closing_balance": Decimal(0),
+                "total_income": Decimal(0),
+                "total_expense": Decimal(0),
+                "categories": [],
+            }
+        period_start, period_end = _midnight(start), _midnight(end + timedelta(days=1))
+        
+        opening = await self._balance_at(wallet, period_start)
+        totals = await self._totals_between(wallet.wallet_id, period_start, period_end)
+        income = sum((t for (kind, _), (t, _) in totals.items() if kind == TransactionType.INCOME), Decimal(0))
+        expense = sum((t for (kind, _), (t, _) in totals.items() if kind == TransactionType.EXPENSE), Decimal(0))
+        return {
+            "wallet_id": wallet.wallet_id,
+            "team_id": team_id,
+            "start": start,
+            "end": end,
+            "opening_balance": opening,
+            "closing_balance": opening + income - expense,
+            "total_income": income,
+            "total_expense": expense,
+            "categories": [
+                {"type": kind, "category": category or None, "total": total, "count": count}
+                for (kind, category), (total, count) in sorted(
+                    totals.items(), key=lambda item: (item[0][0].value, item[0][1])
+                )
+            ],
+        }
+    
+    async def _balance_at(self, wallet: TeamWallet, moment: datetime) -> Decimal:
+        """Balance just before `moment`."""
+        month = month_of(moment)
+        snapshot = await self.snapshot_repo.find_latest(wallet.wallet_id, month)
+        if snapshot is not None:
+            # Roll forward from the snapshot's opening balance
+            return (
+                snapshot.opening_balance
+                + await self.monthly_repo.net_total(wallet.wallet_id, snapshot.month, month)
+                + await self.transaction_repo.net_total(wallet.wallet_id, _midnight(month), moment)
+            )
+        # No snapshot yet: roll back from the current balance
+        following = next_month(month)
+        return (
+            wallet.balance
+            - await self.monthly_repo.net_total(wallet.wallet_id, following)
+            - await self.transaction_repo.net_total(wallet.wallet_id, moment, _midnight(following))
+        )
+    
+    async def _totals_between(
+        self, wallet_id: int, start: datetime, end: datetime
+    ) -> Dict[Tuple[TransactionType, str], Tuple[Decimal, int]]:
+        """(type, category) -> (total, count) over [start, end)."""
+        first_full = month_of(start) if start == _midnight(month_of(start)) else next_month(month_of(start))
+        last_full = month_of(end)
+        if first_full < last_full:
+            parts = [
+                await self.transaction_repo.totals_by_category(wallet_id, start, _midnight(first_full)),
+                await self.monthly_repo.totals_by_category(wallet_id, first_full, last_full),
+                await self.transaction_repo.totals_by_category(wallet_id, _midnight(last_full), end),
+            ]
+        else:
+            parts = [await self.transaction_repo.totals_by_category(wallet_id, start, end)]
+        
+        totals = {}
+        for rows in parts:
+            for kind, category, total, count in rows:
+                key = (kind, category)
+                previous_total, previous_count = totals.get(key, (Decimal(0), 0))
+                totals[key] = (previous_total + Decimal(total), previous_count + int(count))
+        return totals
+    
+    async def take_snapshots(self) -> int:
+        """Snapshot the current month's opening balance of every wallet that lacks one."""
+        taken = await self.snapshot_repo.snapshot_all(month_of(datetime.utcnow()))
+        await self.snapshot_repo.commit()
+        return taken
+    
+    async def rebuild_ledger_summaries(self) -> None:
+        """Recompute monthly totals from the ledger, then snapshot the current month."""
+        await self.monthly_repo.rebuild()
+        await self.take_snapshots()
+
+
+async def run_periodic_snapshots(
+    session_factory: Callable[[], AsyncSession],
+    interval_seconds: float
+) -> None:
+    """Take missing monthly balance snapshots forever, every interval_seconds."""
+    while True:
+        try:
+            async with session_factory() as session:
+                await WalletService(session).take_snapshots()
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            logger.exception("Wallet balance snapshot failed")
+        await asyncio.sleep(interval_seconds)
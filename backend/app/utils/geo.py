@@ -0,0 +1,104 @@
+"""
+Geo - Great-circle distances and a uniform grid index over coordinates.
+
+GridIndex buckets points into cells of `cell_degrees` latitude by
+`cell_degrees` longitude and, within a cell, by an optional label (e.g.
+position and skill level). A radius query visits only the cells
+overlapping the radius' bounding box (wrapping at the antimeridian),
+skips the labels not asked for and computes exact distances for the
+points left, so its cost depends on how many matching points are nearby
+rather than on how many are indexed.
+"""
+import math
+from typing import Callable, Dict, Hashable, Iterator, List, Optional, Set, Tuple
+
+EARTH_RADIUS_KM = 6371.0088
+KM_PER_DEGREE = math.pi * EARTH_RADIUS_KM / 180
+
+
+def haversine_km(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    """Great-circle distance between two points in kilometres."""
+    phi1, phi2 = math.radians(lat1), math.radians(lat2)
+    a = (
+        math.sin((phi2 - phi1) / 2) ** 2
+        + math.cos(phi1) * math.cos(phi2) * math.sin(math.radians(lon2 - lon1) / 2) ** 2
+    )
+    return 2 * EARTH_RADIUS_KM * math.asin(min(1.0, math.sqrt(a)))
+
+
+def bounding_box(lat: float, lon: float, radius_km: float) -> Tuple[float, float, float, float]:
+    """(south, north, west, east) degrees of a box holding every point within radius_km."""
+    lat_span = radius_km / KM_PER_DEGREE
+    # Longitude degrees shrink towards the poles; size the box for the widest latitude it covers
+    cos_lat = math.cos(math.radians(min(90.0, abs(lat) + lat_span)))
+    lon_span = 180.0 if cos_lat < 1e-9 else min(180.0, lat_span / cos_lat)
+    return lat - lat_span, lat + lat_span, lon - lon_span, lon + lon_span
+
+
+class GridIndex:
+    """Points keyed by ID, bucketed by grid cell and label for radius queries."""
+    
+    def __init__(self, cell_degrees: float = 0.1):
+        self.cell_degrees = cell_degrees
+        self.columns = math.ceil(360 / cell_degrees)
+        self.points: Dict[Hashable, Tuple[float, float]] = {}
+        self.cells: Dict[Tuple[int, int], Dict[Hashable, Set[Hashable]]] = {}
+        self._labels: Dict[Hashable, Hashable] = {}
+    
+    def __len__(self) -> int:
+        return len(self.points)
+    
+    def _row(self, lat: float) -> int:
+        return math.floor(lat / self.cell_degrees)
+    
+    def _column(self, lon: float) -> int:
+        return math.floor((lon + 180) / self.cell_degrees) % self.columns
+    
+    def put(self, key: Hashable, lat: float, lon: float, label: Hashable = None) -> None:
+        """Add a point or move it to new coordinates and label."""
+        self.remove(key)
+        self.points[key] = (lat, lon)
+        self._labels[key] = label
+        cell = self.cells.setdefault((self._row(lat), self._column(lon)), {})
+        cell.setdefault(label, set()).add(key)
+    
+    def remove(self, key: Hashable) -> None:
+        point = self.points.pop(key, None)
+        if point is None:
+            return
+        label = self._labels.pop(key)
+        cell_key = (self._row(point[0]), self._column(point[1]))
+        cell = self.cells[cell_key]
+        cell[label].discard(key)
+        if not cell[label]:
+            del cell[label]
+            if not cell:
+                del self.cells[cell_key]
+    
+    def near(
+        self,
+        lat: float,
+        lon: float,
+        radius_km: float,
+        labels: Optional[Callable[[Hashable], bool]] = None,
+    ) -> Iterator[Tuple[Hashable, float]]:
+        """(key, distance in km) of every point within radius_km whose label passes `labels`, unordered."""
+        south, north, west, east = bounding_box(lat, lon, radius_km)
+        first = math.floor((west + 180) / self.cell_degrees)
+        last = min(math.floor((east + 180) / self.cell_degrees), first + self.columns - 1)
+        columns = {c % self.columns for c in range(first, last + 1)}
+        
+        for row in range(self._row(south), self._row(north) + 1):
+            for column in columns:
+                for label, keys in self.cells.get((row, column), {}).items():
+                    if labels is not None and not labels(label):
+                        continue
+                    for key in keys:
+                        point_lat, point_lon = self.points[key]
+                        distance = haversine_km(lat, lon, point_lat, point_lon)
+                        if distance <= radius_km:
+                            yield key, distance
+    
+    def within(self, lat: float, lon: float, radius_km: float) -> List[Tuple[Hashable, float]]:
+        """(key, distance in km) of every point within radius_km, nearest first."""
+        return sorted(self.near(lat, lon, radius_km), key=lambda item: item[1])
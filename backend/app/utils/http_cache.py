@@ -0,0 +1,116 @@
+"""
+HTTP cache - Conditional GET and in-process response caching for public reads.
+
+Public detail endpoints serialize their body once and keep it, with a weak
+ETag built from the resource's `updated_at`, in a TTL+LRU cache keyed by
+resource (e.g. "field:12", "field:12:pricing"). A hit answers without
+touching the database, and a matching If-None-Match answers 304 with no
+body. Handlers that change a resource call `invalidate()` with its keys
+after committing. The cache is per process, so the TTL bounds how long
+another worker can keep serving a stale copy.
+"""
+import time
+import zlib
+from collections import OrderedDict
+from datetime import datetime
+from typing import Any, Callable, Optional
+
+import orjson
+from fastapi import Request, Response
+
+from app.config import get_settings
+
+CACHE_CONTROL = "public, no-cache"
+
+
+def weak_etag(key: str, version: Any) -> str:
+    """Weak validator for a resource key at a given version (usually updated_at)."""
+    if isinstance(version, datetime):
+        version = f"{version.timestamp():.6f}"
+    return f'W/"{zlib.crc32(f"{key}@{version}".encode()):08x}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Weak comparison of an If-None-Match header against an ETag (RFC 9110 13.1.2)."""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    opaque = etag.removeprefix("W/")
+    return any(tag.strip().removeprefix("W/") == opaque for tag in if_none_match.split(","))
+
+
+class CachedResponse:
+    """A serialized JSON body with its ETag and expiry."""
+    
+    __slots__ = ("body", "etag", "expires_at")
+    
+    def __init__(self, body: bytes, etag: str, expires_at: float):
+        self.body = body
+        self.etag = etag
+        self.expires_at = expires_at
+
+
+class ResponseCache:
+    """TTL+LRU cache of serialized response bodies."""
+    
+    def __init__(self, max_entries: int, ttl_seconds: float, clock: Callable[[], float] = time.monotonic):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.clock = clock
+        self._entries: "OrderedDict[str, CachedResponse]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+    
+    def get(self, key: str) -> Optional[CachedResponse]:
+        entry = self._entries.get(key)
+        if entry is None or entry.expires_at <= self.clock():
+            if entry is not None:
+                del self._entries[key]
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry
+    
+    def put(self, key: str, content: Any, version: Any) -> CachedResponse:
+        """Serialize `content` and store it under `key` with an ETag for `version`."""
+        entry = CachedResponse(
+            orjson.dumps(content), weak_etag(key, version), self.clock() + self.ttl_seconds
+        )
+        if self.max_entries > 0:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return entry
+    
+    def invalidate(self, *keys: str) -> None:
+        for key in keys:
+            self._entries.pop(key, None)
+    
+    def clear(self) -> None:
+        self._entries.clear()
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+def cached_response(request: Request, entry: CachedResponse) -> Response:
+    """Full JSON response, or 304 when the client already holds this version."""
+    headers = {"ETag": entry.etag, "Cache-Control": CACHE_CONTROL}
+    if etag_matches(request.headers.get("if-none-match"), entry.etag):
+        return Response(status_code=304, headers=headers)
+    return Response(entry.body, media_type="application/json", headers=headers)
+
+
+_cache: Optional[ResponseCache] = None
+
+
+def get_response_cache() -> ResponseCache:
+    """Get the process-wide response cache."""
+    global _cache
+    if _cache is None:
+        settings = get_settings()
+        _cache = ResponseCache(settings.response_cache_max_entries, settings.response_cache_ttl_seconds)
+    return _cache
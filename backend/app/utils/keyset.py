@@ -0,0 +1,59 @@
+"""
+Keyset pagination - "rows after this one" instead of OFFSET.
+
+A page ends with the sort key of its last row, handed to the client as an
+opaque cursor (the X-Next-Cursor response header). The next request turns
+it back into a WHERE clause on the same columns, so every page is an index
+range scan from where the previous one stopped, however deep the client
+pages and however fast rows arrive at the head of the queue.
+"""
+import base64
+from datetime import datetime
+from typing import Any, Optional, Sequence, Tuple
+
+import orjson
+from sqlalchemy import and_, or_
+from sqlalchemy.sql import ColumnElement
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+# (column or expression, value from the cursor, descending?)
+SortKey = Tuple[Any, Any, bool]
+
+
+def encode_cursor(*values: Any) -> str:
+    """Opaque cursor for a row's sort key values (ints, strings, datetimes)."""
+    return base64.urlsafe_b64encode(orjson.dumps(values)).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, *types: type) -> tuple:
+    """Sort key values of a cursor, converted to `types`; ValueError if it is not one of ours."""
+    try:
+        values = orjson.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+        if not isinstance(values, list) or len(values) != len(types):
+            raise ValueError
+        return tuple(
+            datetime.fromisoformat(value) if kind is datetime else kind(value)
+            for kind, value in zip(types, values)
+        )
+    except (ValueError, TypeError, orjson.JSONDecodeError):
+        raise ValueError("Invalid cursor")
+
+
+def keyset_after(*keys: SortKey) -> ColumnElement:
+    """
+    Rows sorting after the given key values, for ORDER BY the same columns
+    in the same directions (the last key should be unique, e.g. the ID).
+    """
+    first, value, descending = keys[0]
+    # The leading bound alone is sargable; the OR picks the exact position
+    clauses = [and_(*(c == v for c, v, _ in keys[:i]), (c < v) if d else (c > v))
+               for i, (c, v, d) in enumerate(keys)]
+    return and_(first <= value if descending else first >= value, or_(*clauses))
+
+
+def next_cursor(rows: Sequence, limit: int, key) -> Optional[str]:
+    """Cursor after the last row of a full page, or None when this page is the last."""
+    if len(rows) < limit:
+        return None
+    return encode_cursor(*key(rows[-1]))
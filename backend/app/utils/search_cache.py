@@ -0,0 +1,185 @@
+"""
+Search cache - In-process cache of search result pages.
+
+The same searches (same city, same price range) arrive over and over, so
+each result list is serialized once and kept in a TTL+LRU cache under a
+normalized key: the kind of search plus its filters, with text folded to
+lower case and trimmed and list filters sorted, so "Hanoi " and "hanoi"
+share an entry.
+
+Invalidation is per kind. Committing a change to a table a kind reads from
+(team_profile or team_stats for team searches, field_profile for field and
+owner searches, ...) drops every entry of that kind and nothing else, from
+ORM flushes and bulk statements alike. Each kind also has a generation
+counter: a result computed while a change was committing is not stored.
+The cache is per process, so the TTL bounds how long another worker can
+keep serving a stale page.
+"""
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Iterable, Optional, Set, Tuple
+
+import orjson
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from app.config import get_settings
+
+SEARCH_KINDS = ("teams", "fields", "players", "owners")
+
+# Table -> search kinds whose results it feeds
+SEARCH_TABLES: Dict[str, Tuple[str, ...]] = {
+    "team_profile": ("teams",),
+    "team_stats": ("teams",),
+    "field_profile": ("fields", "owners"),
+    "field_amenity": ("fields",),
+    "player_profile": ("players",),
+    "user_account": ("owners",),
+}
+
+
+def _normalize(value: Any) -> Hashable:
+    if isinstance(value, str):
+        return value.strip().lower() or None
+    if isinstance(value, (list, tuple, set)):
+        return tuple(sorted(set(value))) or None
+    return value
+
+
+def normalize_filters(**filters: Any) -> Dict[str, Any]:
+    """Filters with text trimmed and lower-cased and lists de-duplicated and sorted; blanks become None."""
+    return {name: _normalize(value) for name, value in filters.items()}
+
+
+def search_key(filters: Dict[str, Any]) -> tuple:
+    """Cache key for normalized filters, independent of argument order."""
+    return tuple(sorted(filters.items()))
+
+
+class SearchCache:
+    """TTL+LRU cache of serialized search results, invalidated per kind."""
+    
+    def __init__(self, max_entries: int, ttl_seconds: float, clock: Callable[[], float] = time.monotonic):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.clock = clock
+        self._entries: "OrderedDict[Tuple[str, tuple], Tuple[bytes, float]]" = OrderedDict()
+        self._keys: Dict[str, Set[tuple]] = {kind: set() for kind in SEARCH_KINDS}
+        self._generations: Dict[str, int] = {kind: 0 for kind in SEARCH_KINDS}
+        self.hits = {kind: 0 for kind in SEARCH_KINDS}
+        self.misses = {kind: 0 for kind in SEARCH_KINDS}
+        self.invalidations = {kind: 0 for kind in SEARCH_KINDS}
+        self.evictions = 0
+    
+    def generation(self, kind: str) -> int:
+        """Take before computing a result; pass to put() so an invalidated result is not stored."""
+        return self._generations[kind]
+    
+    def get(self, kind: str, key: tuple) -> Optional[bytes]:
+        entry = self._entries.get((kind, key))
+        if entry is None or entry[1] <= self.clock():
+            if entry is not None:
+                self._drop((kind, key))
+            self.misses[kind] += 1
+            return None
+        self._entries.move_to_end((kind, key))
+        self.hits[kind] += 1
+        return entry[0]
+    
+    def put(self, kind: str, key: tuple, content: Any, generation: int) -> bytes:
+        """Serialize `content` and, unless `kind` was invalidated since `generation`, store it."""
+        body = orjson.dumps(content)
+        if self.max_entries > 0 and generation == self._generations[kind]:
+            self._entries[(kind, key)] = (body, self.clock() + self.ttl_seconds)
+            self._entries.move_to_end((kind, key))
+            self._keys[kind].add(key)
+            while len(self._entries) > self.max_entries:
+                self._drop(next(iter(self._entries)))
+                self.evictions += 1
+        return body
+    
+    def _drop(self, entry_key: Tuple[str, tuple]) -> None:
+        del self._entries[entry_key]
+        self._keys[entry_key[0]].discard(entry_key[1])
+    
+    def invalidate(self, kinds: Iterable[str]) -> None:
+        """Drop every entry of these kinds."""
+        for kind in kinds:
+            self._generations[kind] += 1
+            self.invalidations[kind] += 1
+            keys, self._keys[kind] = self._keys[kind], set()
+            for key in keys:
+                del self._entries[(kind, key)]
+    
+    def clear(self) -> None:
+        self.invalidate(SEARCH_KINDS)
+    
+    def stats(self) -> Dict[str, dict]:
+        """Entries, hits, misses, hit rate and invalidations per kind, plus LRU evictions."""
+        kinds = {}
+        for kind in SEARCH_KINDS:
+            lookups = self.hits[kind] + self.misses[kind]
+            kinds[kind] = {
+                "entries": len(self._keys[kind]),
+                "hits": self.hits[kind],
+                "misses": self.misses[kind],
+                "hitRate": round(self.hits[kind] / lookups, 4) if lookups else 0.0,
+                "invalidations": self.invalidations[kind],
+            }
+        hits, misses = sum(self.hits.values()), sum(self.misses.values())
+        return {
+            "entries": len(self._entries),
+            "maxEntries": self.max_entries,
+            "hits": hits,
+            "misses": misses,
+            "hitRate": round(hits / (hits + misses), 4) if hits + misses else 0.0,
+            "evictions": self.evictions,
+            "kinds": kinds,
+        }
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+_cache: Optional[SearchCache] = None
+
+
+def get_search_cache() -> SearchCache:
+    """Get the process-wide search cache."""
+    global _cache
+    if _cache is None:
+        settings = get_settings()
+        _cache = SearchCache(settings.search_cache_max_entries, settings.search_cache_ttl_seconds)
+    return _cache
+
+
+def _track(session: Session, table_name: Optional[str]) -> None:
+    kinds = SEARCH_TABLES.get(table_name)
+    if kinds:
+        session.info.setdefault("search_kinds", set()).update(kinds)
+
+
+@event.listens_for(Session, "after_flush")
+def _track_flushed_tables(session: Session, flush_context) -> None:
+    for obj in (*session.new, *session.dirty, *session.deleted):
+        _track(session, getattr(obj, "__tablename__", None))
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _track_bulk_statements(orm_execute_state) -> None:
+    # Bulk UPDATE/INSERT/DELETE statements (e.g. rating adjustments) bypass the flush
+    if orm_execute_state.is_update or orm_execute_state.is_delete or orm_execute_state.is_insert:
+        table = getattr(orm_execute_state.statement, "table", None)
+        _track(orm_execute_state.session, getattr(table, "name", None))
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_after_commit(session: Session) -> None:
+    kinds = session.info.pop("search_kinds", None)
+    if kinds:
+        get_search_cache().invalidate(kinds)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_tracked_tables(session: Session) -> None:
+    session.info.pop("search_kinds", None)
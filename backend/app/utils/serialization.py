@@ -0,0 +1,133 @@
+"""
+Serialization - Fast ORM-to-JSON path for read endpoints.
+
+Building a response model from an ORM row validates every field, and
+FastAPI then validates the returned model again against `response_model`.
+For rows read from our own database neither pass finds anything, so a
+RowSerializer maps a row straight to the camelCase dict of its response
+model in one step. List endpoints return those dicts through
+ORJSONResponse, which skips response_model validation entirely while the
+declared model still drives the OpenAPI schema.
+"""
+from operator import attrgetter
+from typing import Any, Callable, Dict, Iterable, List, Type, Union
+
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel
+
+Getter = Callable[[Any], Any]
+
+
+class Transform:
+    """An attribute read from the row, passed through `func` unless it is None."""
+    
+    __slots__ = ("attr", "func")
+    
+    def __init__(self, attr: str, func: Callable[[Any], Any]):
+        self.attr = attr
+        self.func = func
+    
+    def __call__(self, row):
+        value = getattr(row, self.attr)
+        return self.func(value) if value is not None else None
+
+
+def isoformat(attr: str) -> Transform:
+    """Date/datetime attribute as an ISO 8601 string."""
+    return Transform(attr, lambda value: value.isoformat())
+
+
+def enum_value(attr: str) -> Transform:
+    """Enum attribute as its value."""
+    return Transform(attr, lambda value: value.value)
+
+
+def as_float(attr: str) -> Transform:
+    """Numeric attribute (e.g. Decimal) as a float."""
+    return Transform(attr, float)
+
+
+def storage_path(relationship: str) -> Transform:
+    """Storage path of an optional MediaAsset relationship."""
+    return Transform(relationship, lambda asset: asset.storage_path)
+
+
+class RowSerializer:
+    """
+    Precompiled mapping from ORM rows to a response model's JSON shape.
+    
+    `fields` maps each response field to an attribute name, a Transform or
+    an arbitrary getter. The map is checked against the model once, at
+    import time, so a schema change that is not reflected here fails loudly
+    instead of silently dropping a key.
+    
+    Attribute and Transform fields are compiled into a single function that
+    reads the instance `__dict__` directly, skipping the ORM descriptor on
+    every column. If any attribute is missing from `__dict__` (expired or
+    never loaded) the row falls back to regular attribute access.
+    """
+    
+    def __init__(self, model: Type[BaseModel], fields: Dict[str, Union[str, Transform, Getter]]):
+        missing = set(model.model_fields) - set(fields)
+        unknown = set(fields) - set(model.model_fields)
+        if missing or unknown:
+            raise ValueError(
+                f"{model.__name__} serializer mismatch: "
+                f"missing {sorted(missing)}, unknown {sorted(unknown)}"
+            )
+        self.model = model
+        # Keys follow the model's field order so the JSON matches response_model output
+        specs = [(name, fields[name]) for name in model.model_fields]
+        self._getters = tuple(
+            (name, attrgetter(spec) if isinstance(spec, str) else spec) for name, spec in specs
+        )
+        self._serialize = self._compile(specs)
+    
+    def _compile(self, specs) -> Callable[[Any], Dict[str, Any]]:
+        namespace: Dict[str, Any] = {"KeyError": KeyError, "slow": self._serialize_slow}
+        reads_dict = False
+        items = []
+        for i, (name, spec) in enumerate(specs):
+            if isinstance(spec, str):
+                expr = f"d[{spec!r}]"
+                reads_dict = True
+            elif isinstance(spec, Transform):
+                namespace[f"f{i}"] = spec.func
+                expr = f"(None if (v := d[{spec.attr!r}]) is None else f{i}(v))"
+                reads_dict = True
+            else:
+                namespace[f"g{i}"] = spec
+                expr = f"g{i}(row)"
+            items.append(f"{name!r}: {expr}")
+        body = "{" + ", ".join(items) + "}"
+        if reads_dict:
+            source = (
+                "def serialize(row):\n"
+                "    d = row.__dict__\n"
+                "    try:\n"
+                f"        return {body}\n"
+                "    except KeyError:\n"
+                "        return slow(row)\n"
+            )
+        else:
+            source = f"def serialize(row):\n    return {body}\n"
+        exec(compile(source, f"<serializer {self.model.__name__}>", "exec"), namespace)
+        return namespace["serialize"]
+    
+    def _serialize_slow(self, row) -> Dict[str, Any]:
+        return {name: get(row) for name, get in self._getters}
+    
+    def __call__(self, row) -> Dict[str, Any]:
+        return self._serialize(row)
+    
+    def many(self, rows: Iterable) -> List[Dict[str, Any]]:
+        serialize = self._serialize
+        return [serialize(row) for row in rows]
+    
+    def to_model(self, row) -> BaseModel:
+        """Response model instance without validation, for single-object endpoints."""
+        return self.model.model_construct(**self._serialize(row))
+    
+    def response(self, rows: Iterable, status_code: int = 200) -> ORJSONResponse:
+        """Serialized list response that bypasses response_model validation."""
+        return ORJSONResponse(self.many(rows), status_code=status_code)
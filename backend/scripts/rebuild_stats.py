@@ -0,0 +1,38 @@
+#!/usr/bin/env python3
+"""
+Recompute player_stats and team_stats, including team ratings, from the
+match tables.
+
+The API keeps both tables current as results, attendance and cancellations
+are written; run this after bulk loads or manual database edits.
+
+Usage:
+    python scripts/rebuild_stats.py
+"""
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+# Add parent dir to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from sqlalchemy import func, select
+
+from app.database import async_session_factory, engine
+from app.models.stats import PlayerStats, TeamStats
+from app.services.stats_service import StatsService
+
+
+async def rebuild() -> None:
+    started = time.perf_counter()
+    async with async_session_factory() as session:
+        await StatsService(session).rebuild()
+        players = (await session.execute(select(func.count()).select_from(PlayerStats))).scalar()
+        teams = (await session.execute(select(func.count()).select_from(TeamStats))).scalar()
+    await engine.dispose()
+    print(f"Rebuilt stats for {players} players and {teams} teams in {time.perf_counter() - started:.2f}s")
+
+
+if __name__ == "__main__":
+    asyncio.run(rebuild())
@@ -1,6 +1,6 @@
 #!/usr/bin/env python3
 """
-Reset the database by dropping and recreating all tables.
+Reset the database by dropping all tables and migrating to the latest revision.
 
 Usage:
     python scripts/reset_db.py
@@ -9,8 +9,14 @@ import asyncio
 import sys
 from pathlib import Path
 
+from alembic import command
+from alembic.config import Config
+from sqlalchemy import text
+
+BACKEND_DIR = Path(__file__).parent.parent
+
 # Add parent dir to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent))
+sys.path.insert(0, str(BACKEND_DIR))
 
 from app.database import engine, Base
 
@@ -21,19 +27,26 @@ from app.models import (
 )
 
 
-async def reset_db():
-    print("Resetting database...")
+async def drop_db():
     print(f"Registered tables: {list(Base.metadata.tables.keys())}")
     
     async with engine.begin() as conn:
         print("Dropping all tables...")
         await conn.run_sync(Base.metadata.drop_all)
-        print("Creating all tables...")
-        await conn.run_sync(Base.metadata.create_all)
+        await conn.execute(text("DROP TABLE IF EXISTS alembic_version"))
+    await engine.dispose()
+
+
+def reset_db():
+    print("Resetting database...")
+    asyncio.run(drop_db())
+    
+    # Alembic's env.py runs its own event loop, so migrate outside ours
+    print("Migrating to head...")
+    command.upgrade(Config(str(BACKEND_DIR / "alembic.ini")), "head")
     
     print("Database reset successfully.")
-    await engine.dispose()
 
 
 if __name__ == "__main__":
-    asyncio.run(reset_db())
+    reset_db()
@@ -8,15 +8,24 @@ Usage:
     python scripts/seed_data.py --dry-run    # Preview without inserting
     python scripts/seed_data.py --verify     # Count records in tables
     python scripts/seed_data.py --clear      # Clear all data first
+    python scripts/seed_data.py --scale 20   # Multiply all CONFIG counts by 20
+    python scripts/seed_data.py --bulk --scale 20000 --workers 8   # ~1M users via Core inserts
 """
 import argparse
 import asyncio
+import multiprocessing
+import os
 import random
 import sys
+import zlib
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime, date, time, timedelta
 from decimal import Decimal
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Tuple
 
 from faker import Faker
 
@@ -27,6 +36,7 @@ from app.database import engine, async_session_factory, Base
 from app.utils.security import hash_password
 from app.models import *
 from app.models.enums import *
+from app.models.user import role_mask
 
 # Fixed seed for reproducibility
 SEED = 42
@@ -52,6 +62,22 @@ CONFIG = {
     'calendar_days': 14,  # Days of calendar slots to generate
 }
 
+# Keys of CONFIG that are not row counts and must not be scaled
+UNSCALED_KEYS = {'calendar_days'}
+
+
+def apply_scale(scale: float) -> None:
+    """Multiply every row count in CONFIG by scale (used for load testing)."""
+    for key, value in CONFIG.items():
+        if key not in UNSCALED_KEYS:
+            CONFIG[key] = max(1, int(value * scale))
+
+
+def reset_random_state() -> None:
+    """Re-seed the generators so every run produces the same data."""
+    random.seed(SEED)
+    fake.seed_instance(SEED)
+
 # UK Cities with coordinates
 UK_CITIES = [
     ("London", 51.5074, -0.1278),
@@ -79,6 +105,8 @@ AMENITIES = ["Parking", "Changing Room", "Showers", "Lighting", "Water Fountain"
 def generate_users(count: int) -> List[Dict]:
     """Generate user accounts with various roles."""
     users = []
+    # bcrypt is deliberately slow; every seeded user shares the same password
+    password_hash = hash_password("password123")
     roles_dist = [
         ([UserRole.PLAYER.value], 60),
         ([UserRole.PLAYER.value, UserRole.TEAM_LEADER.value], 20),
@@ -100,7 +128,7 @@ def generate_users(count: int) -> List[Dict]:
         users.append({
             'username': f"user_{i+1:03d}",
             'email': f"user_{i+1:03d}@example.com",
-            'password_hash': hash_password("password123"),
+            'password_hash': password_hash,
             'roles': selected_roles,
             'status': AccountStatus.ACTIVE,
             'is_verified': random.random() < 0.9,
@@ -158,7 +186,7 @@ def generate_teams(users: List[UserAccount]) -> List[Dict]:
             # Fallback: append index to ensure uniqueness
             team_name = f"{fake.last_name()} {random.choice(TEAM_SUFFIXES)} {i+1}"
             used_names.add(team_name)
-
+        
         teams.append({
             'team_name': team_name,
             'description': fake.paragraph(nb_sentences=2),
@@ -457,12 +485,23 @@ def generate_media_assets(users: List[UserAccount], fields: List[FieldProfile],
 # ============================================================================
 # MAIN SEEDING LOGIC
 # ============================================================================
-async def seed_database(dry_run: bool = False, clear: bool = False):
-    """Main function to seed the database."""
+async def seed_database(
+    dry_run: bool = False,
+    clear: bool = False,
+    session_factory=None,
+    dispose_engine: bool = True,
+):
+    """
+    Main function to seed the database.
+    
+    session_factory defaults to the application's; the benchmark harness
+    passes its own to seed a separate database.
+    """
     print(f"🌱 Starting database seeding (dry_run={dry_run}, clear={clear})")
     print(f"   Seed: {SEED} (reproducible)")
+    reset_random_state()
     
-    async with async_session_factory() as session:
+    async with (session_factory or async_session_factory)() as session:
         if clear:
             print("🗑️  Clearing existing data...")
             for table in reversed(Base.metadata.sorted_tables):
@@ -709,6 +748,9 @@ async def seed_database(dry_run: bool = False, clear: bool = False):
         if not dry_run:
             session.add_all(report_objs)
             await session.flush()
+            # Group the pending ones into cases, as filing through the API would
+            from app.repositories.moderation_repository import ReportCaseRepository
+            await ReportCaseRepository(session).file_unfiled()
         print(f"     Created {len(report_objs)} reports")
         
         # 18. Join Requests
@@ -885,26 +927,30 @@ async def seed_database(dry_run: bool = False, clear: bool = False):
             
             # Link media assets to entities via FK
             # Fields: cover_image_id
+            fields_by_id = {f.field_id: f for f in field_objs}
             for field_id, media_idx in media_result['field_covers'].items():
-                field = next((f for f in field_objs if f.field_id == field_id), None)
+                field = fields_by_id.get(field_id)
                 if field and media_idx < len(media_objs):
                     field.cover_image_id = media_objs[media_idx].asset_id
             
             # Teams: logo_id
+            teams_by_id = {t.team_id: t for t in team_objs}
             for team_id, media_idx in media_result['team_logos'].items():
-                team = next((t for t in team_objs if t.team_id == team_id), None)
+                team = teams_by_id.get(team_id)
                 if team and media_idx < len(media_objs):
                     team.logo_id = media_objs[media_idx].asset_id
             
             # Players: profile_image_id
+            players_by_id = {p.player_id: p for p in player_objs}
             for player_id, media_idx in media_result['player_images'].items():
-                player = next((p for p in player_objs if p.player_id == player_id), None)
+                player = players_by_id.get(player_id)
                 if player and media_idx < len(media_objs):
                     player.profile_image_id = media_objs[media_idx].asset_id
             
             # Posts: image_id
+            posts_by_id = {p.post_id: p for p in post_objs}
             for post_id, media_idx in media_result['post_images'].items():
-                post = next((p for p in post_objs if p.post_id == post_id), None)
+                post = posts_by_id.get(post_id)
                 if post and media_idx < len(media_objs):
                     post.image_id = media_objs[media_idx].asset_id
             
@@ -913,12 +959,700 @@ async def seed_database(dry_run: bool = False, clear: bool = False):
         
         if not dry_run:
             await session.commit()
+            # Seeded rows bypass the dashboard counters; recompute them
+            from app.services.moderation_stats_service import ModerationStatsService
+            await ModerationStatsService(session).reconcile()
+            # ...and the wallet statement summaries and match stats
+            from app.services.wallet_service import WalletService
+            await WalletService(session).rebuild_ledger_summaries()
+            from app.services.stats_service import StatsService
+            await StatsService(session).rebuild()
             print("\n✅ Database seeding complete!")
         else:
             print("\n🔍 Dry run complete - no data was inserted.")
     
     # Properly dispose engine to avoid aiomysql cleanup warnings
-    await engine.dispose()
+    if dispose_engine:
+        await engine.dispose()
+
+
+# ============================================================================
+# BULK LOADER
+# ============================================================================
+# Bulk mode skips the ORM entirely: rows are plain dicts with primary keys
+# assigned up front, generated in fixed-size chunks (in worker processes when
+# --workers > 1) and written with Core executemany inserts, one commit per
+# chunk. Each chunk draws from its own RNG seeded from (SEED, table, chunk),
+# and attributes that other tables depend on (roles, statuses, prices, match
+# pairings) are derived from the row index, so for a given chunk size the
+# output is the same for any worker count. Media assets, invitations, join requests, attendance and
+# moderation logs are only produced by the default mode.
+
+# Roles repeat over a cycle of 20 users: 60% players, 20% player+leader,
+# 15% field owners, 5% moderators
+ROLE_CYCLE = (
+    [[UserRole.PLAYER.value]] * 12
+    + [[UserRole.PLAYER.value, UserRole.TEAM_LEADER.value]] * 4
+    + [[UserRole.FIELD_OWNER.value]] * 3
+    + [[UserRole.MODERATOR.value]]
+)
+PLAYER_SLOTS = tuple(i for i, roles in enumerate(ROLE_CYCLE) if UserRole.PLAYER.value in roles)
+LEADER_SLOTS = tuple(i for i, roles in enumerate(ROLE_CYCLE) if UserRole.TEAM_LEADER.value in roles)
+OWNER_SLOTS = tuple(i for i, roles in enumerate(ROLE_CYCLE) if UserRole.FIELD_OWNER.value in roles)
+PLAYER_POSITION = {slot: pos for pos, slot in enumerate(PLAYER_SLOTS)}
+
+# Tables whose primary keys are assigned by the loader (others are referenced by nobody)
+BULK_ID_TABLES = {
+    'user_account': UserAccount.user_id,
+    'player_profile': PlayerProfile.player_id,
+    'team_profile': TeamProfile.team_id,
+    'team_wallet': TeamWallet.wallet_id,
+    'field_profile': FieldProfile.field_id,
+    'match_event': MatchEvent.match_id,
+    'post': Post.post_id,
+    'comment': Comment.comment_id,
+}
+
+
+@dataclass(frozen=True)
+class BulkPlan:
+    """Row counts and ID offsets shared by every chunk generator."""
+    users: int
+    players: int
+    teams: int
+    fields: int
+    bookings: int
+    matches: int
+    posts: int
+    comments: int
+    reactions: int
+    notifications: int
+    reports: int
+    calendar_days: int
+    amenity_ids: Tuple[int, ...]
+    password_hash: str
+    id_offsets: Tuple[Tuple[str, int], ...]
+    
+    def offset(self, table: str) -> int:
+        """Highest ID already present in table; new IDs continue from it."""
+        return dict(self.id_offsets)[table]
+
+
+def _slot_index(k: int, slots: Tuple[int, ...]) -> int:
+    """Index of the k-th user whose position in ROLE_CYCLE is in slots."""
+    return (k // len(slots)) * len(ROLE_CYCLE) + slots[k % len(slots)]
+
+
+def _slot_count(users: int, slots: Tuple[int, ...]) -> int:
+    """Number of users among the first `users` whose cycle position is in slots."""
+    full, rest = divmod(users, len(ROLE_CYCLE))
+    return full * len(slots) + sum(1 for s in slots if s < rest)
+
+
+def _hashed(index: int, salt: str) -> int:
+    """Stable pseudo-random integer for a row, independent of chunking."""
+    return zlib.crc32(f"{SEED}:{salt}:{index}".encode())
+
+
+def _pick(index: int, salt: str, options: list, weights: list):
+    """Weighted choice that every table derives identically for a row."""
+    roll = _hashed(index, salt) % sum(weights)
+    for option, weight in zip(options, weights):
+        if roll < weight:
+            return option
+        roll -= weight
+
+
+def _team_status(t: int) -> TeamStatus:
+    return _pick(t, "team_status",
+                 [TeamStatus.VERIFIED, TeamStatus.PENDING, TeamStatus.PENDING_REVISION, TeamStatus.REJECTED],
+                 [60, 20, 15, 5])
+
+
+def _field_status(f: int) -> FieldStatus:
+    return _pick(f, "field_status", [FieldStatus.VERIFIED, FieldStatus.PENDING, FieldStatus.REJECTED], [70, 20, 10])
+
+
+def _field_price(f: int) -> Decimal:
+    return Decimal([20, 30, 40, 50][_hashed(f, "field_price") % 4])
+
+
+def _match_status(m: int) -> MatchStatus:
+    return _pick(m, "match_status",
+                 [MatchStatus.COMPLETED, MatchStatus.SCHEDULED, MatchStatus.PENDING_APPROVAL,
+                  MatchStatus.IN_PROGRESS, MatchStatus.CANCELLED],
+                 [25, 30, 20, 15, 10])
+
+
+@lru_cache(maxsize=None)
+def _verified_teams(teams: int) -> Tuple[int, ...]:
+    return tuple(t for t in range(teams) if _team_status(t) == TeamStatus.VERIFIED)
+
+
+@lru_cache(maxsize=None)
+def _verified_fields(fields: int) -> Tuple[int, ...]:
+    return tuple(f for f in range(fields) if _field_status(f) == FieldStatus.VERIFIED)
+
+
+def _leader_user(t: int) -> int:
+    """User index of team t's leader."""
+    return _slot_index(t, LEADER_SLOTS)
+
+
+def _leader_player(plan: BulkPlan, t: int):
+    """Player index of team t's leader, or None if they have no profile."""
+    u = _leader_user(t)
+    k = (u // len(ROLE_CYCLE)) * len(PLAYER_SLOTS) + PLAYER_POSITION[u % len(ROLE_CYCLE)]
+    return k if k < plan.players else None
+
+
+def _match_teams(plan: BulkPlan, m: int) -> Tuple[int, int]:
+    """(host, opponent) team indexes of match m, two distinct verified teams."""
+    verified = _verified_teams(plan.teams)
+    host = _hashed(m, "match_host") % len(verified)
+    opponent = (host + 1 + _hashed(m, "match_opponent") % (len(verified) - 1)) % len(verified)
+    return verified[host], verified[opponent]
+
+
+def _bulk_users(plan: BulkPlan, start: int, end: int, rng: random.Random) -> List[Dict]:
+    base = plan.offset('user_account')
+    rows = []
+    for i in range(start, end):
+        user_id = base + i + 1
+        city, lat, lng = rng.choice(UK_CITIES)
+        rows.append({
+            'user_id': user_id,
+            'username': f"user_{user_id:03d}",
+            'email': f"user_{user_id:03d}@example.com",
+            'password_hash': plan.password_hash,
+            'roles': ROLE_CYCLE[i % len(ROLE_CYCLE)],
+            # Core inserts skip the model's roles validator
+            'role_mask': role_mask(ROLE_CYCLE[i % len(ROLE_CYCLE)]),
+            'status': AccountStatus.ACTIVE,
+            'is_verified': rng.random() < 0.9,
+            'contact_info': fake.phone_number(),
+            'location': city,
+            'latitude': lat + rng.uniform(-0.05, 0.05),
+            'longitude': lng + rng.uniform(-0.05, 0.05),
+        })
+    return rows
+
+
+def _bulk_players(plan: BulkPlan, start: int, end: int, rng: random.Random) -> List[Dict]:
+    base, user_base = plan.offset('player_profile'), plan.offset('user_account')
+    rows = []
+    for k in range(start, end):
+        rows.append({
+            'player_id': base + k + 1,
+            'user_id': user_base + _slot_index(k, PLAYER_SLOTS) + 1,
+            'display_name': fake.name(),
+            'position': rng.choice(POSITIONS),
+            'skill_level': rng.randint(3, 10),
+            'bio': fake.sentence(nb_words=10),
+            'date_of_birth': fake.date_of_birth(minimum_age=16, maximum_age=45),
+            'height': round(rng.uniform(160, 195), 1),
+            'weight': round(rng.uniform(55, 95), 1),
+            'preferred_foot': rng.choice(list(PreferredFoot)),
+        })
+    return rows
+
+
+def _bulk_teams(plan: BulkPlan, start: int, end: int, rng: random.Random) -> List[Dict]:
+    base, user_base = plan.offset('team_profile'), plan.offset('user_account')
+    rows = []
+    for t in range(start, end):
+        team_id = base + t + 1
+        city, lat, lng = rng.choice(UK_CITIES)
+        status = _team_status(t)
+        rows.append({
+            'team_id': team_id,
+            # The ID suffix keeps names unique without tracking used ones
+            'team_name': f"{city} {rng.choice(TEAM_SUFFIXES)} {team_id}",
+            'description': fake.paragraph(nb_sentences=2),
+            'leader_id': user_base + _leader_user(t) + 1,
+            'status': status,
+            'rejection_reason': fake.sentence() if status == TeamStatus.REJECTED else None,
+            'location': city,
+            'latitude': lat + rng.uniform(-0.05, 0.05),
+            'longitude': lng + rng.uniform(-0.05, 0.05),
+            'skill_level': rng.randint(3, 9),
+        })
+    return rows
+
+
+def _bulk_wallets(plan: BulkPlan, start: int, end: int, rng: random.Random) -> List[Dict]:
+    base, team_base = plan.offset('team_wallet'), plan.offset('team_profile')
+    return [
+        {'wallet_id': base + t + 1, 'team_id': team_base + t + 1, 'balance': Decimal(rng.randint(0, 5000000))}
+        for t in range(start, end)
+    ]
+
+
+def _bulk_rosters(plan: BulkPlan, start: int, end: int, rng: random.Random) -> List[Dict]:
+    team_base, player_base = plan.offset('team_profile'), plan.offset('player_profile')
+    rows = []
+    for t in range(start, end):
+        team_id = team_base + t + 1
+        captain = _leader_player(plan, t)
+        if captain is not None:
+            rows.append({'team_id': team_id, 'player_id': player_base + captain + 1, 'role': RosterRole.CAPTAIN})
+        count = rng.randint(4, 10)
+        sampled = rng.sample(range(plan.players), min(count + 1, plan.players))
+        members = [k for k in sampled if k != captain][:count]
+        for j, k in enumerate(members):
+            role = RosterRole.VICE_CAPTAIN if j == 0 else RosterRole.MEMBER
+            rows.append({'team_id': team_id, 'player_id': player_base + k + 1, 'role': role})
+    return rows
+
+
+def _bulk_fields(plan: BulkPlan, start: int, end: int, rng: random.Random) -> List[Dict]:
+    base, user_base = plan.offset('field_profile'), plan.offset('user_account')
+    rows = []
+    for f in range(start, end):
+        city, lat, lng = rng.choice(UK_CITIES)
+        field_type = rng.choice(FIELD_TYPES)
+        status = _field_status(f)
+        street = fake.street_name()
+        rows.append({
+            'field_id': base + f + 1,
+            'owner_id': user_base + _slot_index(f, OWNER_SLOTS) + 1,
+            'field_name': f"{street} Football Complex {field_type}",
+            'description': f"High quality {field_type} artificial turf pitch. Located near the center.",
+            'location': f"{fake.building_number()} {street}, {city}",
+            'latitude': lat + rng.uniform(-0.05, 0.05),
+            'longitude': lng + rng.uniform(-0.05, 0.05),
+            'default_price_per_hour': _field_price(f),
+            'capacity': {"5v5": 10, "7v7": 14, "11v11": 22}[field_type],
+            'status': status,
+            'rejection_reason': fake.sentence() if status == FieldStatus.REJECTED else None,
+        })
+    return rows
+
+
+def _bulk_field_amenities(plan: BulkPlan, start: int, end: int, rng: random.Random) -> List[Dict]:
+    base = plan.offset('field_profile')
+    low, high = min(3, len(plan.amenity_ids)), min(7, len(plan.amenity_ids))
+    return [
+        {'field_id': base + f + 1, 'amenity_id': amenity_id}
+        for f in range(start, end)
+        for amenity_id in rng.sample(plan.amenity_ids, rng.randint(low, high))
+    ]
+
+
+def _bulk_calendar(plan: BulkPlan, start: int, end: int, rng: random.Random) -> List[Dict]:
+    base = plan.offset('field_profile')
+    today = date.today()
+    statuses = [CalendarStatus.AVAILABLE, CalendarStatus.BOOKED, CalendarStatus.MAINTENANCE, CalendarStatus.BLOCKED]
+    rows = []
+    for f in range(start, end):
+        if _field_status(f) != FieldStatus.VERIFIED:
+            continue
+        for day_offset in range(plan.calendar_days):
+            slot_date = today + timedelta(days=day_offset)
+            for hour in range(6, 22):
+                rows.append({
+                    'field_id': base + f + 1,
+                    'date': slot_date,
+                    'start_time': time(hour, 0),
+                    'end_time': time(hour + 1, 0),
+                    'status': rng.choices(statuses, weights=[70, 20, 5, 5])[0],
+                })
+    return rows
+
+
+def _bulk_pricing_rules(plan: BulkPlan, start: int, end: int, rng: random.Random) -> List[Dict]:
+    base = plan.offset('field_profile')
+    rows = []
+    for f in range(start, end):
+        price = _field_price(f)
+        rows.append({
+            'field_id': base + f + 1, 'name': "Peak Hours", 'day_of_week': ["Saturday", "Sunday"],
+            'start_time': time(17, 0), 'end_time': time(21, 0),
+            'price_per_hour': price * Decimal("1.5"), 'priority': 10, 'is_active': True,
+        })
+        rows.append({
+            'field_id': base + f + 1, 'name': "Off-Peak",
+            'day_of_week': ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday"],
+            'start_time': time(6, 0), 'end_time': time(17, 0),
+            'price_per_hour': price * Decimal("0.8"), 'priority': 5, 'is_active': True,
+        })
+    return rows
+
+
+def _bulk_policies(plan: BulkPlan, start: int, end: int, rng: random.Random) -> List[Dict]:
+    base = plan.offset('field_profile')
+    return [
+        {
+            'field_id': base + f + 1,
+            'free_cancellation_hours': rng.choice([12, 24, 48]),
+            'late_cancellation_penalty_percent': Decimal(rng.choice([25, 50, 75])),
+            'no_show_penalty_percent': Decimal("100"),
+            'refund_processing_days': rng.choice([3, 5, 7]),
+            'policy_description': "Standard cancellation policy. Free cancellation up to the specified hours before booking.",
+            'is_active': True,
+        }
+        for f in range(start, end)
+    ]
+
+
+def _bulk_bookings(plan: BulkPlan, start: int, end: int, rng: random.Random) -> List[Dict]:
+    fields, teams = _verified_fields(plan.fields), _verified_teams(plan.teams)
+    field_base, team_base, user_base = (
+        plan.offset('field_profile'), plan.offset('team_profile'), plan.offset('user_account')
+    )
+    today = date.today()
+    statuses = [BookingStatus.CONFIRMED, BookingStatus.PENDING, BookingStatus.CANCELLED, BookingStatus.REJECTED]
+    rows = []
+    for _ in range(start, end):
+        t = rng.choice(teams)
+        start_hour = rng.randint(6, 20)
+        status = rng.choices(statuses, weights=[40, 30, 20, 10])[0]
+        rows.append({
+            'field_id': field_base + rng.choice(fields) + 1,
+            'team_id': team_base + t + 1,
+            'requester_id': user_base + _leader_user(t) + 1,
+            'date': today + timedelta(days=rng.randint(-7, 14)),
+            'start_time': time(start_hour, 0),
+            'end_time': time(start_hour + 1, 0),
+            'status': status,
+            'notes': fake.sentence() if rng.random() > 0.5 else None,
+            'processed_at': datetime.utcnow() if status != BookingStatus.PENDING else None,
+        })
+    return rows
+
+
+def _bulk_matches(plan: BulkPlan, start: int, end: int, rng: random.Random) -> List[Dict]:
+    fields = _verified_fields(plan.fields)
+    base, team_base, field_base = plan.offset('match_event'), plan.offset('team_profile'), plan.offset('field_profile')
+    today = date.today()
+    rows = []
+    for m in range(start, end):
+        host, opponent = _match_teams(plan, m)
+        start_hour = rng.randint(6, 20)
+        rows.append({
+            'match_id': base + m + 1,
+            'host_team_id': team_base + host + 1,
+            'opponent_team_id': team_base + opponent + 1,
+            'field_id': field_base + rng.choice(fields) + 1 if fields else None,
+            'match_date': today + timedelta(days=rng.randint(-14, 14)),
+            'start_time': time(start_hour, 0),
+            'end_time': time(start_hour + 2, 0),
+            'status': _match_status(m),
+            'visibility': rng.choice(list(Visibility)),
+            'description': fake.sentence() if rng.random() > 0.5 else None,
+        })
+    return rows
+
+
+def _bulk_results(plan: BulkPlan, start: int, end: int, rng: random.Random) -> List[Dict]:
+    base, team_base, user_base = plan.offset('match_event'), plan.offset('team_profile'), plan.offset('user_account')
+    rows = []
+    for m in range(start, end):
+        if _match_status(m) != MatchStatus.COMPLETED:
+            continue
+        host, opponent = _match_teams(plan, m)
+        home_score, away_score = rng.randint(0, 5), rng.randint(0, 5)
+        winner = host if home_score > away_score else (opponent if away_score > home_score else None)
+        rows.append({
+            'match_id': base + m + 1,
+            'home_score': home_score,
+            'away_score': away_score,
+            'winner_id': team_base + winner + 1 if winner is not None else None,
+            'recorded_by': user_base + _leader_user(host) + 1,
+        })
+    return rows
+
+
+def _bulk_posts(plan: BulkPlan, start: int, end: int, rng: random.Random) -> List[Dict]:
+    base, user_base, team_base = plan.offset('post'), plan.offset('user_account'), plan.offset('team_profile')
+    rows = []
+    for p in range(start, end):
+        has_team = rng.random() > 0.5 and plan.teams
+        rows.append({
+            'post_id': base + p + 1,
+            'author_id': user_base + rng.randrange(plan.users) + 1,
+            'team_id': team_base + rng.randrange(plan.teams) + 1 if has_team else None,
+            'content': fake.paragraph(nb_sentences=rng.randint(1, 4)),
+            'visibility': rng.choice(list(Visibility)),
+            'reaction_count': rng.randint(0, 50),
+            'comment_count': rng.randint(0, 20),
+        })
+    return rows
+
+
+def _bulk_comments(plan: BulkPlan, start: int, end: int, rng: random.Random) -> List[Dict]:
+    base, post_base, user_base = plan.offset('comment'), plan.offset('post'), plan.offset('user_account')
+    return [
+        {
+            'comment_id': base + c + 1,
+            'post_id': post_base + rng.randrange(plan.posts) + 1,
+            'author_id': user_base + rng.randrange(plan.users) + 1,
+            'content': fake.sentence(),
+        }
+        for c in range(start, end)
+    ]
+
+
+def _bulk_reactions(plan: BulkPlan, start: int, end: int, rng: random.Random) -> List[Dict]:
+    post_base, comment_base, user_base = plan.offset('post'), plan.offset('comment'), plan.offset('user_account')
+    entity_types = list(ReactionEntityType) if plan.comments else [ReactionEntityType.POST]
+    rows = []
+    for _ in range(start, end):
+        entity_type = rng.choice(entity_types)
+        if entity_type == ReactionEntityType.POST:
+            entity_id = post_base + rng.randrange(plan.posts) + 1
+        else:
+            entity_id = comment_base + rng.randrange(plan.comments) + 1
+        rows.append({
+            'entity_type': entity_type,
+            'entity_id': entity_id,
+            'user_id': user_base + rng.randrange(plan.users) + 1,
+            'type': rng.choice(list(ReactionType)),
+        })
+    return rows
+
+
+def _bulk_notifications(plan: BulkPlan, start: int, end: int, rng: random.Random) -> List[Dict]:
+    user_base = plan.offset('user_account')
+    types = list(NotificationType)
+    rows = []
+    for _ in range(start, end):
+        notif_type = rng.choice(types)
+        rows.append({
+            'user_id': user_base + rng.randrange(plan.users) + 1,
+            'type': notif_type,
+            'title': f"Notification: {notif_type.value}",
+            'message': fake.sentence(),
+            'is_read': rng.random() > 0.6,
+        })
+    return rows
+
+
+def _bulk_preferences(plan: BulkPlan, start: int, end: int, rng: random.Random) -> List[Dict]:
+    user_base = plan.offset('user_account')
+    return [
+        {
+            'user_id': user_base + i + 1,
+            'email_notifications': rng.random() > 0.3,
+            'push_notifications': rng.random() > 0.2,
+            'match_reminders': rng.random() > 0.1,
+            'team_updates': rng.random() > 0.2,
+            'booking_updates': rng.random() > 0.2,
+            'community_updates': rng.random() > 0.4,
+        }
+        for i in range(start, end)
+    ]
+
+
+def _bulk_reports(plan: BulkPlan, start: int, end: int, rng: random.Random) -> List[Dict]:
+    user_base = plan.offset('user_account')
+    rows = []
+    for _ in range(start, end):
+        reporter = rng.randrange(plan.users)
+        reported = rng.randrange(plan.users - 1)
+        if reported >= reporter:
+            reported += 1
+        rows.append({
+            'reporter_id': user_base + reporter + 1,
+            'reported_user_id': user_base + reported + 1,
+            'content_type': rng.choice(list(ReportContentType)),
+            'reason': rng.choice(["Spam", "Harassment", "Inappropriate content", "Fake account"]),
+            'details': fake.sentence(),
+            'status': rng.choice(list(ReportStatus)),
+        })
+    return rows
+
+
+def _bulk_transactions(plan: BulkPlan, start: int, end: int, rng: random.Random) -> List[Dict]:
+    wallet_base, user_base = plan.offset('team_wallet'), plan.offset('user_account')
+    rows = []
+    for t in range(start, end):
+        for _ in range(rng.randint(3, 8)):
+            tx_type = rng.choice(list(TransactionType))
+            rows.append({
+                'wallet_id': wallet_base + t + 1,
+                'type': tx_type,
+                'amount': Decimal(rng.randint(10, 500)),
+                'description': f"{'Match fee' if tx_type == TransactionType.EXPENSE else 'Contribution'} - {fake.date_this_month()}",
+                'category': rng.choice(["Match Fee", "Equipment", "Contribution", "Prize", "Refund"]),
+                'created_by': user_base + rng.randrange(plan.users) + 1,
+            })
+    return rows
+
+
+# table -> (generator, plan attribute holding the unit count, approx rows per unit)
+# Listed in foreign-key order; chunks are inserted in this order.
+BULK_TABLES = {
+    'user_account': (_bulk_users, 'users', 1),
+    'player_profile': (_bulk_players, 'players', 1),
+    'team_profile': (_bulk_teams, 'teams', 1),
+    'team_wallet': (_bulk_wallets, 'teams', 1),
+    'team_roster': (_bulk_rosters, 'teams', 8),
+    'field_profile': (_bulk_fields, 'fields', 1),
+    'field_amenity': (_bulk_field_amenities, 'fields', 5),
+    'field_calendar': (_bulk_calendar, 'fields', 16 * CONFIG['calendar_days']),
+    'field_pricing_rule': (_bulk_pricing_rules, 'fields', 2),
+    'cancellation_policy': (_bulk_policies, 'fields', 1),
+    'booking_request': (_bulk_bookings, 'bookings', 1),
+    'match_event': (_bulk_matches, 'matches', 1),
+    'match_result': (_bulk_results, 'matches', 1),
+    'post': (_bulk_posts, 'posts', 1),
+    'comment': (_bulk_comments, 'comments', 1),
+    'reaction': (_bulk_reactions, 'reactions', 1),
+    'notification': (_bulk_notifications, 'notifications', 1),
+    'notification_preference': (_bulk_preferences, 'users', 1),
+    'report': (_bulk_reports, 'reports', 1),
+    'transaction_log': (_bulk_transactions, 'teams', 5),
+}
+
+
+def generate_bulk_chunk(plan: BulkPlan, table: str, start: int, end: int) -> List[Dict]:
+    """Generate rows start..end of a table; runs in a worker process."""
+    chunk_seed = zlib.crc32(f"{SEED}:{table}:{start}".encode())
+    fake.seed_instance(chunk_seed)
+    generator = BULK_TABLES[table][0]
+    return generator(plan, start, end, random.Random(chunk_seed))
+
+
+def bulk_chunks(plan: BulkPlan, chunk_size: int) -> List[Tuple[str, int, int]]:
+    """Split every table into (table, start, end) chunks of roughly chunk_size rows."""
+    chunks = []
+    for table, (_, count_attr, rows_per_unit) in BULK_TABLES.items():
+        units = getattr(plan, count_attr)
+        step = max(1, chunk_size // rows_per_unit)
+        chunks.extend((table, start, min(start + step, units)) for start in range(0, units, step))
+    return chunks
+
+
+async def build_bulk_plan(session) -> BulkPlan:
+    """Resolve row counts from CONFIG and ID offsets from the existing data."""
+    from sqlalchemy import select, func, insert
+    
+    offsets = []
+    for table, pk in BULK_ID_TABLES.items():
+        offsets.append((table, (await session.execute(select(func.max(pk)))).scalar() or 0))
+    
+    # Amenities are a small lookup table with unique names; reuse what exists
+    existing = set((await session.execute(select(Amenity.name))).scalars().all())
+    missing = [name for name in AMENITIES if name not in existing]
+    if missing:
+        await session.execute(insert(Amenity), [
+            {'name': name, 'description': f"{name} facility", 'icon': name.lower()} for name in missing
+        ])
+        await session.commit()
+    amenity_ids = tuple((await session.execute(select(Amenity.amenity_id).order_by(Amenity.amenity_id))).scalars().all())
+    
+    users = CONFIG['users']
+    players = min(CONFIG['players'], _slot_count(users, PLAYER_SLOTS))
+    teams = min(CONFIG['teams'], _slot_count(users, LEADER_SLOTS))
+    fields = min(CONFIG['fields'], _slot_count(users, OWNER_SLOTS))
+    has_pairs = len(_verified_teams(teams)) >= 2
+    has_bookings = bool(_verified_teams(teams)) and bool(_verified_fields(fields))
+    posts = CONFIG['posts'] if users else 0
+    return BulkPlan(
+        users=users,
+        players=players,
+        teams=teams,
+        fields=fields,
+        bookings=CONFIG['bookings'] if has_bookings else 0,
+        matches=CONFIG['matches'] if has_pairs else 0,
+        posts=posts,
+        comments=CONFIG['comments'] if posts else 0,
+        reactions=CONFIG['reactions'] if posts else 0,
+        notifications=CONFIG['notifications'],
+        reports=CONFIG['reports'] if users > 1 else 0,
+        calendar_days=CONFIG['calendar_days'],
+        amenity_ids=amenity_ids,
+        password_hash=hash_password("password123"),
+        id_offsets=tuple(offsets),
+    )
+
+
+async def seed_database_bulk(
+    clear: bool = False,
+    chunk_size: int = 5000,
+    workers: int = None,
+    session_factory=None,
+    dispose_engine: bool = True,
+):
+    """
+    Seed the database with Core executemany inserts (see BULK LOADER above).
+    
+    At most 2 * workers chunks are generated ahead of the insert, so memory
+    stays bounded regardless of scale.
+    """
+    from sqlalchemy import insert
+    
+    workers = workers or os.cpu_count() or 1
+    print(f"🌱 Starting bulk seeding (clear={clear}, chunk_size={chunk_size}, workers={workers})")
+    print(f"   Seed: {SEED} (reproducible)")
+    reset_random_state()
+    started = datetime.now()
+    
+    async with (session_factory or async_session_factory)() as session:
+        if clear:
+            print("🗑️  Clearing existing data...")
+            for table in reversed(Base.metadata.sorted_tables):
+                await session.execute(table.delete())
+            await session.commit()
+            print("   Done clearing.")
+        
+        plan = await build_bulk_plan(session)
+        chunks = iter(bulk_chunks(plan, chunk_size))
+        executor = ProcessPoolExecutor(workers, mp_context=multiprocessing.get_context("spawn")) if workers > 1 else None
+        loop = asyncio.get_running_loop()
+        pending = deque()
+        
+        def submit_next():
+            chunk = next(chunks, None)
+            if chunk is None:
+                return
+            if executor:
+                future = loop.run_in_executor(executor, generate_bulk_chunk, plan, *chunk)
+            else:
+                future = loop.create_future()
+                future.set_result(generate_bulk_chunk(plan, *chunk))
+            pending.append((chunk[0], future))
+        
+        print("\n📊 Generating and inserting data...")
+        totals: Dict[str, int] = {}
+        try:
+            for _ in range(2 * workers):
+                submit_next()
+            while pending:
+                table, future = pending.popleft()
+                rows = await future
+                submit_next()
+                if rows:
+                    await session.execute(insert(Base.metadata.tables[table]), rows)
+                    await session.commit()
+                if table not in totals:
+                    print(f"   - {table}...")
+                totals[table] = totals.get(table, 0) + len(rows)
+        finally:
+            if executor:
+                executor.shutdown(cancel_futures=True)
+        
+        for table, count in totals.items():
+            print(f"     {table:24s} {count:10d} rows")
+        
+        # Seeded reports bypass case filing; group the pending ones into cases
+        from app.repositories.moderation_repository import ReportCaseRepository
+        await ReportCaseRepository(session).file_unfiled()
+        await session.commit()
+        # Seeded rows bypass the dashboard counters; recompute them
+        from app.services.moderation_stats_service import ModerationStatsService
+        await ModerationStatsService(session).reconcile()
+        # ...and the wallet statement summaries and match stats
+        from app.services.wallet_service import WalletService
+        await WalletService(session).rebuild_ledger_summaries()
+        from app.services.stats_service import StatsService
+        await StatsService(session).rebuild()
+        elapsed = (datetime.now() - started).total_seconds()
+        print(f"\n✅ Bulk seeding complete: {sum(totals.values())} rows in {elapsed:.1f}s")
+    
+    if dispose_engine:
+        await engine.dispose()
 
 
 async def verify_database():
@@ -975,10 +1709,19 @@ def main():
     parser.add_argument("--dry-run", action="store_true", help="Preview without inserting")
     parser.add_argument("--verify", action="store_true", help="Count records in tables")
     parser.add_argument("--clear", action="store_true", help="Clear existing data first")
+    parser.add_argument("--scale", type=float, default=1.0, help="Multiply all CONFIG counts")
+    parser.add_argument("--bulk", action="store_true", help="Use the Core bulk loader (for large scales)")
+    parser.add_argument("--chunk-size", type=int, default=5000, help="Rows per bulk insert chunk")
+    parser.add_argument("--workers", type=int, default=None, help="Bulk generator processes (default: CPU count)")
     args = parser.parse_args()
     
+    if args.scale != 1.0:
+        apply_scale(args.scale)
+    
     if args.verify:
         asyncio.run(verify_database())
+    elif args.bulk:
+        asyncio.run(seed_database_bulk(clear=args.clear, chunk_size=args.chunk_size, workers=args.workers))
     else:
         asyncio.run(seed_database(dry_run=args.dry_run, clear=args.clear))
 
@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+Measure per-item serialization cost of search list responses.
+
+Compares the validated path (build a response model per ORM row, then
+FastAPI's response_model validation and JSON rendering) with the
+precompiled RowSerializer + ORJSONResponse path, on in-memory rows so the
+numbers exclude database time.
+
+Usage:
+    python scripts/serialization_benchmark.py                # 100-row responses
+    python scripts/serialization_benchmark.py --rows 20 --repeat 2000
+"""
+import argparse
+import asyncio
+import sys
+import time
+from datetime import date, datetime, timedelta
+from decimal import Decimal
+from pathlib import Path
+from typing import List
+
+from fastapi.responses import JSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_response_field
+
+# Add parent dir to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.models import FieldProfile, PlayerProfile, TeamProfile
+from app.models.enums import TeamStatus, FieldStatus, PreferredFoot
+from app.schemas.team import TeamProfileResponse, TEAM_PROFILE_SERIALIZER
+from app.schemas.field import FieldProfileResponse, FIELD_PROFILE_SERIALIZER
+from app.schemas.player import PlayerProfileResponse, PLAYER_PROFILE_SERIALIZER
+
+
+def make_rows(count: int) -> dict:
+    """Transient ORM rows shaped like search results."""
+    now = datetime(2024, 1, 1, 12, 0, 0)
+    teams, fields, players = [], [], []
+    for i in range(count):
+        stamp = now + timedelta(minutes=i)
+        teams.append(TeamProfile(
+            team_id=i, team_name=f"Team {i}", description="Sunday league side", logo=None,
+            leader_id=i, status=TeamStatus.VERIFIED, rejection_reason=None, location="Leeds",
+            latitude=53.8 + i / 1000, longitude=-1.55, skill_level=i % 10 + 1,
+            created_at=stamp, updated_at=stamp,
+        ))
+        fields.append(FieldProfile(
+            field_id=i, owner_id=i, field_name=f"Field {i}", description="3G pitch",
+            location="Leeds", latitude=53.8, longitude=-1.55,
+            default_price_per_hour=Decimal("45.50"), capacity=14, status=FieldStatus.VERIFIED,
+            rejection_reason=None, cover_image=None, created_at=stamp, updated_at=stamp,
+        ))
+        players.append(PlayerProfile(
+            player_id=i, user_id=i, display_name=f"Player {i}", position="Midfielder",
+            skill_level=i % 10 + 1, bio=None, profile_image=None,
+            date_of_birth=date(1995, 1, 1), height=180.0, weight=75.0,
+            preferred_foot=PreferredFoot.RIGHT, created_at=stamp, updated_at=stamp,
+        ))
+    return {
+        "teams": (teams, TeamProfileResponse, TEAM_PROFILE_SERIALIZER),
+        "fields": (fields, FieldProfileResponse, FIELD_PROFILE_SERIALIZER),
+        "players": (players, PlayerProfileResponse, PLAYER_PROFILE_SERIALIZER),
+    }
+
+
+async def validated_path(rows, model, serializer, field) -> bytes:
+    """Previous behaviour: per-row model construction plus response_model validation."""
+    content = [model(**serializer(row)) for row in rows]
+    body = await serialize_response(field=field, response_content=content)
+    return JSONResponse(body).body
+
+
+async def fast_path(rows, model, serializer, field) -> bytes:
+    return serializer.response(rows).body
+
+
+async def time_path(path, rows, model, serializer, repeat: int) -> float:
+    """Mean microseconds per item over `repeat` full responses."""
+    field = create_response_field(name="response", type_=List[model], mode="serialization")
+    await path(rows, model, serializer, field)
+    start = time.perf_counter()
+    for _ in range(repeat):
+        await path(rows, model, serializer, field)
+    elapsed = time.perf_counter() - start
+    return elapsed / (repeat * len(rows)) * 1e6
+
+
+async def run(rows_per_response: int, repeat: int) -> None:
+    print(f"{'entity':10s} {'validated us':>13s} {'fast us':>9s} {'speedup':>8s}")
+    for name, (rows, model, serializer) in make_rows(rows_per_response).items():
+        slow = await time_path(validated_path, rows, model, serializer, repeat)
+        fast = await time_path(fast_path, rows, model, serializer, repeat)
+        print(f"{name:10s} {slow:13.2f} {fast:9.2f} {slow / fast:7.1f}x")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Per-item cost of list response serialization")
+    parser.add_argument("--rows", type=int, default=100, help="Rows per response")
+    parser.add_argument("--repeat", type=int, default=200, help="Responses per measurement")
+    args = parser.parse_args()
+    asyncio.run(run(args.rows, args.repeat))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,230 @@
+#!/usr/bin/env python3
+"""
+Profile API cold start: per-module import cost and time to first request.
+
+Each run happens in a fresh interpreter so nothing is already imported:
+
+- `python -X importtime -c "import app.main"` gives self and cumulative
+  import time per module; modules are ranked by self time and rolled up per
+  top-level package (app, fastapi, sqlalchemy, ...).
+- A SQLite database is migrated to head and seeded once, then a uvicorn
+  process is started against it in the production `check` schema mode.
+  Time to first request is measured from spawning the process to the first
+  200 from /api/health, i.e. what an autoscaled replica waits before it can
+  take traffic, and time to first indexed request to the first 200 from
+  endpoints served by the in-memory indexes (standings and suggestions),
+  i.e. the revision check plus the index warm-up on real data.
+
+Medians over the runs are written as JSON so runs can be compared.
+
+Usage:
+    python scripts/startup_profile.py                       # 5 runs, top 25 modules
+    python scripts/startup_profile.py --runs 10 --top 50
+    python scripts/startup_profile.py --scale 20            # Seed 20x the default data
+    python scripts/startup_profile.py --baseline old.json   # Fail if cold start regresses
+"""
+import argparse
+import json
+import os
+import re
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+import urllib.request
+from collections import defaultdict
+from datetime import datetime
+from pathlib import Path
+from statistics import median
+from typing import Dict, List, Tuple
+
+BACKEND_DIR = Path(__file__).parent.parent
+
+# Served from the in-memory indexes once their warm-up load has finished
+INDEXED_PATHS = ("/api/standings?limit=10", "/api/search/suggest?q=a")
+
+IMPORTTIME_LINE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \|(\s*)(\S+)$")
+
+
+def parse_importtime(stderr: str) -> Dict[str, Tuple[int, int]]:
+    """Map module -> (self us, cumulative us) from `-X importtime` output."""
+    modules = {}
+    for line in stderr.splitlines():
+        match = IMPORTTIME_LINE.match(line)
+        if match:
+            modules[match.group(4)] = (int(match.group(1)), int(match.group(2)))
+    return modules
+
+
+def profile_imports(module: str) -> Dict[str, Tuple[int, int]]:
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=BACKEND_DIR, env=_child_env(), capture_output=True, text=True, check=True,
+    )
+    return parse_importtime(result.stderr)
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _child_env(**overrides) -> dict:
+    env = dict(os.environ)
+    env.pop("PYTHONDONTWRITEBYTECODE", None)
+    env.update(overrides)
+    return env
+
+
+def prepare_database(workdir: Path, scale: float) -> str:
+    """Migrate a SQLite database to head and seed it; return its URL."""
+    database_url = f"sqlite+aiosqlite:///{workdir / 'startup.db'}"
+    env = _child_env(DATABASE_URL=database_url)
+    subprocess.run(
+        [sys.executable, "-m", "alembic", "upgrade", "head"],
+        cwd=BACKEND_DIR, env=env, capture_output=True, check=True,
+    )
+    subprocess.run(
+        [sys.executable, "scripts/seed_data.py", "--bulk", "--scale", str(scale)],
+        cwd=BACKEND_DIR, env=env, capture_output=True, check=True,
+    )
+    return database_url
+
+
+def _get_ok(url: str) -> bool:
+    try:
+        with urllib.request.urlopen(url, timeout=1) as response:
+            return response.status == 200
+    except OSError:
+        return False
+
+
+def time_to_first_request(workdir: Path, database_url: str, timeout: float) -> Tuple[float, float]:
+    """Milliseconds from spawning uvicorn to the first health check and indexed requests answered."""
+    port = _free_port()
+    # StaticFiles checks the upload directory when the app module is imported
+    (workdir / "uploads").mkdir(exist_ok=True)
+    env = _child_env(
+        DATABASE_URL=database_url,
+        DATABASE_SCHEMA_MODE="check",
+        UPLOAD_DIR=str(workdir / "uploads"),
+        EMAIL_ENABLED="false",
+    )
+    base_url = f"http://127.0.0.1:{port}"
+    pending = ["/api/health", *INDEXED_PATHS]
+    answered = {}
+    start = time.perf_counter()
+    process = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "app.main:app", "--port", str(port), "--log-level", "warning"],
+        cwd=BACKEND_DIR, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+    )
+    try:
+        while pending and time.perf_counter() - start < timeout:
+            if process.poll() is not None:
+                raise RuntimeError(f"uvicorn exited with {process.returncode} before serving")
+            if _get_ok(base_url + pending[0]):
+                answered[pending.pop(0)] = (time.perf_counter() - start) * 1000
+            else:
+                time.sleep(0.005)
+        if pending:
+            raise RuntimeError(f"No response from {base_url + pending[0]} within {timeout}s")
+        return answered["/api/health"], max(answered.values())
+    finally:
+        process.terminate()
+        process.wait()
+
+
+def summarize(runs: List[Dict[str, Tuple[int, int]]], root: str, top: int) -> dict:
+    """Median self/cumulative time per module and self time per package."""
+    names = set().union(*runs)
+    modules = {
+        name: (
+            median(run.get(name, (0, 0))[0] for run in runs) / 1000,
+            median(run.get(name, (0, 0))[1] for run in runs) / 1000,
+        )
+        for name in names
+    }
+    packages = defaultdict(float)
+    for name, (self_ms, _) in modules.items():
+        packages[name.split(".")[0]] += self_ms
+    
+    ranked = sorted(modules.items(), key=lambda item: item[1][0], reverse=True)[:top]
+    return {
+        "importMs": round(modules[root][1], 1),
+        "moduleCount": len(modules),
+        "packages": {
+            name: round(ms, 1)
+            for name, ms in sorted(packages.items(), key=lambda item: item[1], reverse=True)[:top]
+        },
+        "modules": [
+            {"module": name, "selfMs": round(self_ms, 1), "cumulativeMs": round(cumulative_ms, 1)}
+            for name, (self_ms, cumulative_ms) in ranked
+        ],
+    }
+
+
+def compare_with_baseline(report: dict, baseline: dict, max_regression: float) -> List[str]:
+    problems = []
+    for key in ("importMs", "firstRequestMs", "firstIndexedRequestMs"):
+        old, new = baseline.get(key), report[key]
+        if old and new > old * (1 + max_regression):
+            problems.append(f"{key}: {old:.1f}ms -> {new:.1f}ms")
+    return problems
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Profile API import cost and time to first request")
+    parser.add_argument("--module", default="app.main", help="Module whose import is profiled")
+    parser.add_argument("--runs", type=int, default=5, help="Fresh interpreters per measurement")
+    parser.add_argument("--top", type=int, default=25, help="Modules and packages to report")
+    parser.add_argument("--timeout", type=float, default=60.0, help="Seconds to wait for the first request")
+    parser.add_argument("--skip-server", action="store_true", help="Only profile imports")
+    parser.add_argument("--scale", type=float, default=10.0, help="Seed data multiplier for the served database")
+    parser.add_argument("--output", default="startup_report.json", help="Where to write the JSON report")
+    parser.add_argument("--baseline", help="Previous report to compare against")
+    parser.add_argument("--max-regression", type=float, default=0.25, help="Allowed slowdown ratio")
+    args = parser.parse_args()
+    
+    # Warm the bytecode cache so runs measure imports rather than compilation
+    profile_imports(args.module)
+    runs = [profile_imports(args.module) for _ in range(args.runs)]
+    report = {"generatedAt": datetime.utcnow().isoformat(), "runs": args.runs}
+    report.update(summarize(runs, args.module, args.top))
+    
+    report.update(scale=None, firstRequestMs=None, firstIndexedRequestMs=None)
+    if not args.skip_server:
+        with tempfile.TemporaryDirectory() as workdir:
+            database_url = prepare_database(Path(workdir), args.scale)
+            samples = [time_to_first_request(Path(workdir), database_url, args.timeout) for _ in range(args.runs)]
+        report["scale"] = args.scale
+        report["firstRequestMs"] = round(median(health for health, _ in samples), 1)
+        report["firstIndexedRequestMs"] = round(median(indexed for _, indexed in samples), 1)
+    Path(args.output).write_text(json.dumps(report, indent=2))
+    
+    print(f"\n{'module':48s} {'self ms':>9s} {'cum ms':>9s}")
+    for row in report["modules"]:
+        print(f"{row['module']:48s} {row['selfMs']:9.1f} {row['cumulativeMs']:9.1f}")
+    print(f"\n{'package':48s} {'self ms':>9s}")
+    for name, ms in report["packages"].items():
+        print(f"{name:48s} {ms:9.1f}")
+    print(f"\nimport {args.module}: {report['importMs']:.1f}ms ({report['moduleCount']} modules)")
+    if report["firstRequestMs"] is not None:
+        print(f"time to first request: {report['firstRequestMs']:.1f}ms")
+        print(f"time to first indexed request: {report['firstIndexedRequestMs']:.1f}ms (scale {args.scale:g})")
+    print(f"Report written to {args.output}")
+    
+    if args.baseline:
+        baseline = json.loads(Path(args.baseline).read_text())
+        problems = compare_with_baseline(report, baseline, args.max_regression)
+        if problems:
+            print("\n❌ Regressions detected:")
+            for problem in problems:
+                print(f"   {problem}")
+            sys.exit(1)
+        print("\n✅ No regressions against baseline")
+
+
+if __name__ == "__main__":
+    main()
@@ -7,8 +7,11 @@ from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sess
 from sqlalchemy.pool import StaticPool
 
 from app.main import app
+from app.controllers import media_controller
 from app.database import Base, get_db
 from app.config import get_settings
+from app.models.team import TeamProfile
+from app.models.user import UserAccount
 
 # Use in-memory SQLite for testing
 TEST_DATABASE_URL = "sqlite+aiosqlite:///:memory:"
@@ -58,20 +61,48 @@ async def client(db_session: AsyncSession) -> AsyncGenerator[AsyncClient, None]:
     
     async def override_get_db():
         yield db_session
-        
+    
     app.dependency_overrides[get_db] = override_get_db
     
     async with AsyncClient(app=app, base_url="http://test") as c:
         yield c
-        
+    
     app.dependency_overrides.clear()
 
 import uuid
 
+@pytest.fixture(autouse=True)
+def upload_dir(tmp_path, monkeypatch):
+    """Write uploaded media to a temporary directory, not the repository."""
+    monkeypatch.setattr(media_controller, "UPLOAD_DIR", str(tmp_path))
+    return tmp_path
+
 @pytest.fixture
 def unique_id():
     return str(uuid.uuid4())[:8]
 
+@pytest.fixture
+def make_user(db_session):
+    """Factory to add a user named <prefix>_<random hex> straight to the session."""
+    async def _make(prefix="user", **fields) -> UserAccount:
+        username = f"{prefix}_{uuid.uuid4().hex[:8]}"
+        user = UserAccount(username=username, email=f"{username}@test.com", password_hash="x", **fields)
+        db_session.add(user)
+        await db_session.flush()
+        return user
+    return _make
+
+@pytest.fixture
+def make_team(db_session, make_user):
+    """Factory to add a team, named after its new leader, straight to the session."""
+    async def _make(prefix="team", **fields) -> TeamProfile:
+        leader = await make_user(prefix)
+        team = TeamProfile(team_name=leader.username, leader_id=leader.user_id, **fields)
+        db_session.add(team)
+        await db_session.flush()
+        return team
+    return _make
+
 @pytest.fixture
 async def create_auth_headers(client):
     """Factory to create a user and return auth headers."""
@@ -88,7 +119,7 @@ async def create_auth_headers(client):
         reg_res = await client.post("/api/auth/register", json=payload)
         if reg_res.status_code != 201:
             raise ValueError(f"Register failed: {reg_res.text}")
-            
+        
         # Login
         login_res = await client.post("/api/auth/login", json={
             "username": username,
@@ -96,7 +127,7 @@ async def create_auth_headers(client):
         })
         if login_res.status_code != 200:
              raise ValueError(f"Login failed: {login_res.text}")
-            
+        
         token = login_res.json()["accessToken"]
         return {"Authorization": f"Bearer {token}"}
     return _create
@@ -1,9 +1,16 @@
 """
 Tests for attendance management endpoints.
 """
+import uuid
 import pytest
 from httpx import AsyncClient
 from fastapi import status
+from sqlalchemy import event, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.match import AttendanceRecord
+from app.models.player import PlayerProfile
+from app.models.user import UserAccount
 
 
 @pytest.fixture
@@ -121,3 +128,69 @@ async def test_get_attendance_stats(client: AsyncClient, player_headers, test_ma
     assert "confirmed" in data
     assert "declined" in data
     assert "pending" in data
+
+
+async def _players(db_session: AsyncSession, count: int) -> list:
+    ids = []
+    for _ in range(count):
+        name = f"att_{uuid.uuid4().hex[:8]}"
+        user = UserAccount(username=name, email=f"{name}@test.com", password_hash="x")
+        db_session.add(user)
+        await db_session.flush()
+        player = PlayerProfile(user_id=user.user_id, display_name=name)
+        db_session.add(player)
+        await db_session.flush()
+        ids.append(player.player_id)
+    await db_session.commit()
+    return ids
+
+
+@pytest.mark.asyncio
+async def test_batch_attendance_is_set_based(
+    client: AsyncClient, db_session: AsyncSession, db_engine, player_headers, test_match
+):
+    """Batch size does not change the statement count; repeats update in place."""
+    match_id = test_match["matchId"]
+    url = f"/api/matches/{match_id}/attendance/batch"
+    first, second, third, fourth = await _players(db_session, 4)
+    
+    statements = []
+    
+    def record(conn, cursor, sql, *args):
+        statements.append(sql)
+    
+    async def post(records):
+        statements.clear()
+        event.listen(db_engine.sync_engine, "before_cursor_execute", record)
+        try:
+            return await client.post(url, json={"records": records}, headers=player_headers)
+        finally:
+            event.remove(db_engine.sync_engine, "before_cursor_execute", record)
+    
+    res = await post([{"playerId": first, "status": "Present"}])
+    assert res.status_code == status.HTTP_200_OK
+    single = len(statements)
+    
+    res = await post([
+        {"playerId": second, "status": "Absent"},
+        {"playerId": third, "status": "Pending"},
+        {"playerId": first, "status": "Excused"},
+        {"playerId": fourth, "status": "Present"},
+        {"playerId": fourth, "status": "Pending"},
+    ])
+    assert res.status_code == status.HTTP_200_OK
+    assert len(statements) == single
+    assert [(r["playerId"], r["status"]) for r in res.json()] == [
+        (second, "Absent"), (third, "Pending"), (first, "Excused"), (fourth, "Pending"),
+    ]
+    
+    count = await db_session.execute(
+        select(func.count()).select_from(AttendanceRecord).where(AttendanceRecord.match_id == match_id)
+    )
+    assert count.scalar() == 4
+    
+    res = await client.get(f"/api/matches/{match_id}/attendance/stats", headers=player_headers)
+    assert res.json() == {"totalPlayers": 4, "confirmed": 0, "declined": 1, "pending": 2, "absent": 2}
+    
+    res = await post([{"playerId": first, "status": "Maybe"}])
+    assert res.status_code == status.HTTP_400_BAD_REQUEST
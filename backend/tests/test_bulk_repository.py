@@ -0,0 +1,204 @@
+"""
+Tests for BaseRepository insert/update without refresh and the bulk primitives.
+"""
+import uuid
+import pytest
+from httpx import AsyncClient
+from fastapi import status
+from sqlalchemy import event, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.user import UserAccount
+from app.models.social import Post
+from app.models.media import MediaAsset
+from app.models.team import TeamRoster
+from app.models.enums import AccountStatus, MediaOwnerType, MediaType
+from app.repositories.base_repository import BaseRepository
+
+
+class _StatementLog:
+    """Records SQL statements executed on an engine."""
+    
+    def __init__(self, engine):
+        self.engine = engine.sync_engine
+        self.statements = []
+    
+    def _record(self, conn, cursor, statement, parameters, context, executemany):
+        self.statements.append(statement.split()[0].upper())
+    
+    def __enter__(self):
+        event.listen(self.engine, "before_cursor_execute", self._record)
+        return self
+    
+    def __exit__(self, *exc):
+        event.remove(self.engine, "before_cursor_execute", self._record)
+
+
+def _user():
+    name = f"bulk_{uuid.uuid4().hex[:8]}"
+    return UserAccount(
+        username=name,
+        email=f"{name}@test.com",
+        password_hash="x",
+        roles=["Player"],
+        status=AccountStatus.ACTIVE,
+    )
+
+
+@pytest.mark.asyncio
+async def test_save_does_not_refresh(db_session: AsyncSession, db_engine):
+    """Saving issues only the INSERT; defaults and NULL columns are readable."""
+    repo = BaseRepository(UserAccount, db_session)
+    user = _user()
+    
+    with _StatementLog(db_engine) as log:
+        await repo.save(user)
+        assert user.user_id is not None
+        assert user.created_at is not None
+        assert user.location is None
+    assert log.statements == ["INSERT"]
+    await db_session.rollback()
+
+
+@pytest.mark.asyncio
+async def test_save_many_update_many_delete_many(db_session: AsyncSession, db_engine):
+    """Bulk primitives each run one statement and honour extra criteria."""
+    repo = BaseRepository(UserAccount, db_session)
+    users = await repo.save_many([_user() for _ in range(5)])
+    ids = [u.user_id for u in users]
+    assert len(set(ids)) == 5
+    
+    with _StatementLog(db_engine) as log:
+        updated = await repo.update_many(ids[:3], {"location": "Leeds"})
+        skipped = await repo.update_many(ids, {"is_verified": True}, UserAccount.location == "Leeds")
+    assert (updated, skipped) == (3, 3)
+    assert log.statements == ["UPDATE", "UPDATE"]
+    assert [u.location for u in users] == ["Leeds"] * 3 + [None] * 2
+    assert [u.is_verified for u in users] == [True] * 3 + [False] * 2
+    
+    assert await repo.update_many([], {"location": "Nowhere"}) == 0
+    assert await repo.delete_many(ids[3:]) == 2
+    assert await repo.find_by_id(ids[4]) is None
+    await db_session.rollback()
+
+
+@pytest.mark.asyncio
+async def test_update_reloads_changed_eager_relationship(db_session: AsyncSession):
+    """Changing a foreign key reloads the eagerly loaded relationship it drives."""
+    user = await BaseRepository(UserAccount, db_session).save(_user())
+    post_repo = BaseRepository(Post, db_session)
+    post = await post_repo.save(Post(author_id=user.user_id, content="Hello"))
+    assert post.image is None
+    
+    media = await BaseRepository(MediaAsset, db_session).save(MediaAsset(
+        owner_id=user.user_id,
+        owner_type=MediaOwnerType.POST,
+        entity_id=post.post_id,
+        file_name="pitch.jpg",
+        storage_path="/uploads/pitch.jpg",
+        file_type=MediaType.IMAGE,
+        file_size=1,
+        mime_type="image/jpeg",
+    ))
+    post.image_id = media.asset_id
+    await post_repo.update(post)
+    assert post.image.storage_path == "/uploads/pitch.jpg"
+    await db_session.rollback()
+
+
+@pytest.mark.asyncio
+async def test_batch_join_requests(client: AsyncClient, player_headers, test_team, create_auth_headers):
+    """A leader accepts several join requests in one call."""
+    team_id = test_team["teamId"]
+    request_ids = []
+    for _ in range(3):
+        headers = await create_auth_headers("applicant", "Player")
+        res = await client.post(f"/api/teams/{team_id}/join-requests", json={}, headers=headers)
+        request_ids.append(res.json()["requestId"])
+    
+    res = await client.put(
+        f"/api/teams/{team_id}/join-requests/accept",
+        json={"requestIds": request_ids[:2] + [999999]},
+        headers=player_headers,
+    )
+    assert res.status_code == status.HTTP_200_OK
+    assert res.json()["message"] == "2 requests accepted"
+    
+    pending = (await client.get(f"/api/teams/{team_id}/join-requests", headers=player_headers)).json()
+    assert [r["requestId"] for r in pending] == request_ids[2:]
+    roster = (await client.get(f"/api/teams/{team_id}/roster")).json()
+    assert len(roster) == 3
+
+
+@pytest.mark.asyncio
+async def test_batch_accept_reactivates_former_members(
+    client: AsyncClient, db_session: AsyncSession, player_headers, test_team, create_auth_headers
+):
+    """A player who left rejoins on their old roster row; a processed request is not processed again."""
+    team_id = test_team["teamId"]
+    headers = await create_auth_headers("rejoiner", "Player")
+    
+    async def request_and_accept():
+        request = (await client.post(f"/api/teams/{team_id}/join-requests", json={}, headers=headers)).json()
+        res = await client.put(
+            f"/api/teams/{team_id}/join-requests/accept", json={"requestIds": [request["requestId"]]},
+            headers=player_headers,
+        )
+        assert res.json()["message"] == "1 requests accepted"
+        return request
+    
+    first = await request_and_accept()
+    await db_session.execute(
+        update(TeamRoster)
+        .where(TeamRoster.team_id == team_id, TeamRoster.player_id == first["playerId"])
+        .values(is_active=False)
+    )
+    await db_session.commit()
+    await request_and_accept()
+    
+    rows = [r for r in (await client.get(f"/api/teams/{team_id}/roster")).json() if r["playerId"] == first["playerId"]]
+    assert [r["isActive"] for r in rows] == [True]
+    
+    res = await client.put(
+        f"/api/teams/{team_id}/join-requests/accept", json={"requestIds": [first["requestId"]]},
+        headers=player_headers,
+    )
+    assert res.json()["message"] == "0 requests accepted"
+
+
+@pytest.mark.asyncio
+async def test_like_counter_is_atomic(client: AsyncClient, player_headers):
+    """Likes adjust the counter in SQL and never drop below zero."""
+    post = (await client.post("/api/posts", json={"content": "Counting"}, headers=player_headers)).json()
+    url = f"/api/posts/{post['postId']}/like"
+    
+    assert (await client.post(url, headers=player_headers)).status_code == status.HTTP_200_OK
+    assert (await client.delete(url, headers=player_headers)).status_code == status.HTTP_200_OK
+    assert (await client.delete(url, headers=player_headers)).status_code == status.HTTP_200_OK
+    res = await client.get(f"/api/posts/{post['postId']}", headers=player_headers)
+    assert res.json()["reactionCount"] == 0
+    
+    missing = await client.post("/api/posts/999999/like", headers=player_headers)
+    assert missing.status_code == status.HTTP_404_NOT_FOUND
+
+
+@pytest.mark.asyncio
+async def test_batch_mark_read_only_touches_own(client: AsyncClient, db_session: AsyncSession):
+    """Batch read marks only the caller's unread notifications."""
+    from app.models.enums import NotificationType
+    from app.services.notification_service import NotificationService
+    from app.utils.security import create_access_token
+    
+    owner, other = _user(), _user()
+    await BaseRepository(UserAccount, db_session).save_many([owner, other])
+    await db_session.commit()
+    service = NotificationService(db_session)
+    mine = [await service.create_notification(owner.user_id, NotificationType.TEAM_NEWS, "T", "M") for _ in range(2)]
+    theirs = await service.create_notification(other.user_id, NotificationType.TEAM_NEWS, "T", "M")
+    headers = {"Authorization": f"Bearer {create_access_token({'sub': str(owner.user_id)})}"}
+    
+    ids = [n.notification_id for n in mine] + [theirs.notification_id]
+    res = await client.put("/api/notifications/read", json={"notificationIds": ids}, headers=headers)
+    assert res.json()["message"] == "Marked 2 notifications as read"
+    assert await service.get_unread_count(owner.user_id) == 0
+    assert await service.get_unread_count(other.user_id) == 1
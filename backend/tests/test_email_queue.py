@@ -0,0 +1,173 @@
+"""
+Tests for the outbound email queue against a local debugging SMTP server.
+"""
+import socketserver
+import threading
+import pytest
+from datetime import datetime, timedelta
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.models.email import EmailOutbox, EmailDeadLetter
+from app.models.enums import EmailStatus
+from app.services.email_queue import (
+    EmailQueue, SMTPTransport, render_template, retry_delay, _compile_template
+)
+from app.services.email_service import EmailService
+
+
+class _SMTPSinkHandler(socketserver.StreamRequestHandler):
+    """Minimal SMTP dialogue that records messages and refuses `bounce@` recipients."""
+    
+    def reply(self, line: str):
+        self.wfile.write(f"{line}\r\n".encode())
+    
+    def handle(self):
+        self.server.connections += 1
+        self.reply("220 localhost debugging SMTP")
+        recipients = []
+        while True:
+            line = self.rfile.readline()
+            if not line:
+                break
+            command = line.decode().strip()
+            verb = command[:4].upper()
+            if verb in ("EHLO", "HELO"):
+                self.reply("250 localhost")
+            elif verb == "MAIL":
+                recipients = []
+                self.reply("250 OK")
+            elif verb == "RCPT":
+                address = command.split(":", 1)[1].strip(" <>")
+                if address.startswith("bounce@"):
+                    self.reply("550 No such user")
+                else:
+                    recipients.append(address)
+                    self.reply("250 OK")
+            elif verb == "DATA":
+                self.reply("354 End data with <CR><LF>.<CR><LF>")
+                data = b""
+                while True:
+                    chunk = self.rfile.readline()
+                    if chunk in (b".\r\n", b""):
+                        break
+                    data += chunk
+                self.server.messages.append((recipients, data.decode()))
+                self.reply("250 OK")
+            elif verb == "QUIT":
+                self.reply("221 Bye")
+                break
+            else:
+                self.reply("250 OK")
+
+
+@pytest.fixture
+def smtp_server():
+    server = socketserver.ThreadingTCPServer(("127.0.0.1", 0), _SMTPSinkHandler)
+    server.daemon_threads = True
+    server.connections = 0
+    server.messages = []
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def _queue(db_engine, smtp_server, **kwargs):
+    session_factory = async_sessionmaker(db_engine, class_=AsyncSession, expire_on_commit=False)
+    host, port = smtp_server.server_address
+    transport = SMTPTransport(host, port, sender="noreply@kickoff.local", use_tls=False)
+    queue = EmailQueue(session_factory, lambda: transport, workers=1, batch_size=3, **kwargs)
+    return queue, transport
+
+
+def test_templates_are_compiled_once():
+    """Rendering reuses the cached compiled template."""
+    _compile_template.cache_clear()
+    render_template("verification", token="a")
+    subject, body = render_template("verification", token="b")
+    
+    assert subject == "Verify your Kick-off account"
+    assert "    b\n" in body
+    assert _compile_template.cache_info().hits == 1
+
+
+def test_retry_delay_backs_off_exponentially():
+    """Delays double per attempt up to the cap."""
+    delays = [retry_delay(n, 30, 100).total_seconds() for n in range(1, 5)]
+    assert delays == [30, 60, 100, 100]
+
+
+@pytest.mark.asyncio
+async def test_queue_delivers_over_reused_connection(db_session: AsyncSession, db_engine, smtp_server):
+    """Enqueued emails are delivered in domain batches over one SMTP connection."""
+    service = EmailService(db_session, enabled=True)
+    recipients = ["a@one.test", "b@two.test", "c@one.test", "d@two.test", "e@one.test"]
+    assert await service.send_bulk_notification_email(recipients, "Kick-off", "Match tonight") == 5
+    
+    queue, transport = _queue(db_engine, smtp_server)
+    assert await queue.process_batch(transport) == 3
+    assert await queue.process_batch(transport) == 2
+    assert await queue.process_batch(transport) == 0
+    await transport.close()
+    
+    assert smtp_server.connections == 1
+    delivered = [r[0] for r, _ in smtp_server.messages]
+    assert sorted(delivered) == sorted(recipients)
+    # Each claimed batch is sent grouped by recipient domain
+    first_batch = [r.split("@")[1] for r in delivered[:3]]
+    assert first_batch == sorted(first_batch)
+    assert "Subject: Kick-off" in smtp_server.messages[0][1]
+    
+    result = await db_session.execute(
+        select(EmailOutbox.status).where(EmailOutbox.recipient.in_(recipients))
+    )
+    assert set(result.scalars().all()) == {EmailStatus.SENT}
+
+
+@pytest.mark.asyncio
+async def test_failed_delivery_retries_then_dead_letters(db_session: AsyncSession, db_engine, smtp_server):
+    """Refused recipients back off and land in the dead-letter table."""
+    service = EmailService(db_session, enabled=True)
+    assert await service.send_verification_email("bounce@nowhere.test", "token123")
+    
+    queue, transport = _queue(db_engine, smtp_server, max_attempts=2, retry_base_seconds=60)
+    assert await queue.process_batch(transport) == 1
+    
+    email = (await db_session.execute(
+        select(EmailOutbox).where(EmailOutbox.recipient == "bounce@nowhere.test")
+    )).scalar_one()
+    await db_session.refresh(email)
+    assert email.status == EmailStatus.PENDING
+    assert email.attempts == 1
+    assert email.next_attempt_at > datetime.utcnow() + timedelta(seconds=50)
+    
+    # Not due yet
+    assert await queue.process_batch(transport) == 0
+    
+    email.next_attempt_at = datetime.utcnow()
+    await db_session.commit()
+    assert await queue.process_batch(transport) == 1
+    await transport.close()
+    
+    await db_session.refresh(email)
+    assert email.status == EmailStatus.DEAD
+    dead = (await db_session.execute(
+        select(EmailDeadLetter).where(EmailDeadLetter.email_id == email.email_id)
+    )).scalar_one()
+    assert dead.attempts == 2
+    assert "550" in dead.last_error
+    assert smtp_server.messages == []
+
+
+@pytest.mark.asyncio
+async def test_disabled_email_is_not_queued(db_session: AsyncSession):
+    """With email disabled nothing is written to the outbox."""
+    service = EmailService(db_session, enabled=False)
+    assert await service.send_password_reset_email("someone@off.test", "reset")
+    
+    result = await db_session.execute(
+        select(EmailOutbox).where(EmailOutbox.recipient == "someone@off.test")
+    )
+    assert result.scalar_one_or_none() is None
@@ -1,9 +1,20 @@
 """
 Tests for team finance/wallet endpoints.
 """
+import asyncio
+from datetime import date, datetime
+from decimal import Decimal
 import pytest
 from httpx import AsyncClient
 from fastapi import status
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from app.database import Base
+from app.models.enums import TransactionType
+from app.models.team import TeamProfile, TeamWallet, TransactionLog, WalletBalanceSnapshot, WalletMonthlyTotal
+from app.models.user import UserAccount
+from app.services.wallet_service import WalletService
 
 
 @pytest.mark.asyncio
@@ -107,3 +118,139 @@ async def test_record_expense(client: AsyncClient, player_headers, test_team):
     data = res.json()
     assert data["amount"] == 25.0
     assert data["category"] == "Equipment"
+
+
+@pytest.mark.asyncio
+async def test_wallet_balance_and_overdraft(client: AsyncClient, player_headers, test_team):
+    """Balances follow the ledger; withdrawals never overdraw and leave no entry when refused."""
+    base = f"/api/teams/{test_team['teamId']}/wallet"
+    await client.post(f"{base}/deposit", json={"type": "DEPOSIT", "amount": 100.0}, headers=player_headers)
+    await client.post(f"{base}/withdraw", json={"type": "WITHDRAWAL", "amount": 30.0}, headers=player_headers)
+    await client.post(f"{base}/expense", json={"type": "Expense", "amount": 20.0}, headers=player_headers)
+    
+    res = await client.post(f"{base}/withdraw", json={"type": "WITHDRAWAL", "amount": 50.01}, headers=player_headers)
+    assert res.status_code == status.HTTP_400_BAD_REQUEST
+    assert res.json()["detail"] == "Insufficient funds"
+    
+    res = await client.post(f"{base}/deposit", json={"type": "DEPOSIT", "amount": -5.0}, headers=player_headers)
+    assert res.status_code == status.HTTP_400_BAD_REQUEST
+    
+    assert (await client.get(base, headers=player_headers)).json()["balance"] == 50.0
+    transactions = (await client.get(f"{base}/transactions", headers=player_headers)).json()
+    assert sorted(t["amount"] for t in transactions) == [20.0, 30.0, 100.0]
+
+
+@pytest.mark.asyncio
+async def test_concurrent_wallet_writers(tmp_path):
+    """Concurrent deposits are all applied and concurrent withdrawals cannot overdraw."""
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'wallet.db'}", connect_args={"timeout": 30})
+    session_factory = async_sessionmaker(engine, expire_on_commit=False)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    async with session_factory() as session:
+        user = UserAccount(username="treasurer", email="treasurer@test.com", password_hash="x")
+        session.add(user)
+        await session.flush()
+        team = TeamProfile(team_name="Ledger FC", leader_id=user.user_id)
+        session.add(team)
+        await session.commit()
+    
+    async def run(operation, amount):
+        async with session_factory() as session:
+            try:
+                await getattr(WalletService(session), operation)(team.team_id, amount, user.user_id)
+                return True
+            except ValueError:
+                return False
+    
+    try:
+        assert all(await asyncio.gather(*[run("deposit", 5.0) for _ in range(20)]))
+        results = await asyncio.gather(*[run("withdraw", 30.0) for _ in range(10)])
+        assert results.count(True) == 3
+        
+        async with session_factory() as session:
+            service = WalletService(session)
+            assert (await service.get_wallet(team.team_id)).balance == Decimal("10.00")
+            assert len(await service.get_transactions(team.team_id, limit=100)) == 23
+    finally:
+        await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_wallet_statement(client: AsyncClient, db_session: AsyncSession, player_headers, test_team):
+    """Statements combine monthly totals, edge-month transactions and snapshots."""
+    team_id = test_team["teamId"]
+    service = WalletService(db_session)
+    writes = [
+        (service.deposit, 100, "Dues", datetime(2025, 1, 10)),
+        (service.record_expense, 30, "Pitch", datetime(2025, 2, 15)),
+        (service.deposit, 50, "Dues", datetime(2025, 3, 5)),
+        (service.record_expense, 20, None, None),
+    ]
+    for write, amount, category, created_at in writes:
+        transaction = await write(team_id, amount, 1, category=category)
+        if created_at:
+            await db_session.execute(
+                update(TransactionLog)
+                .where(TransactionLog.transaction_id == transaction.transaction_id)
+                .values(created_at=created_at)
+            )
+    wallet_id = transaction.wallet_id
+    
+    # Each write was counted into the month it happened in
+    totals = (await db_session.execute(
+        select(WalletMonthlyTotal).where(WalletMonthlyTotal.wallet_id == wallet_id)
+    )).scalars().all()
+    assert {(t.month.day, t.type, t.category, t.total, t.transaction_count) for t in totals} == {
+        (1, TransactionType.INCOME, "Dues", Decimal("150.00"), 2),
+        (1, TransactionType.EXPENSE, "Pitch", Decimal("30.00"), 1),
+        (1, TransactionType.EXPENSE, "", Decimal("20.00"), 1),
+    }
+    
+    # Backdated rows: recompute the summaries from the ledger
+    await service.monthly_repo.rebuild()
+    await db_session.commit()
+    
+    url = f"/api/teams/{team_id}/wallet/statement"
+    res = await client.get(url, params={"start": "2025-01-01", "end": "2025-12-31"}, headers=player_headers)
+    assert res.status_code == status.HTTP_200_OK
+    data = res.json()
+    assert (data["openingBalance"], data["closingBalance"]) == (0.0, 120.0)
+    assert (data["totalIncome"], data["totalExpense"]) == (150.0, 30.0)
+    assert data["categories"] == [
+        {"type": "Expense", "category": "Pitch", "total": 30.0, "count": 1},
+        {"type": "Income", "category": "Dues", "total": 150.0, "count": 2},
+    ]
+    
+    # Partial months at both edges
+    res = await client.get(url, params={"start": "2025-02-20", "end": "2025-03-04"}, headers=player_headers)
+    data = res.json()
+    assert (data["openingBalance"], data["closingBalance"], data["categories"]) == (70.0, 70.0, [])
+    
+    # The current month's snapshot anchors later statements
+    await service.take_snapshots()
+    snapshot = (await db_session.execute(
+        select(WalletBalanceSnapshot).where(WalletBalanceSnapshot.wallet_id == wallet_id)
+    )).scalar_one()
+    assert snapshot.opening_balance == Decimal("120.00")
+    today = datetime.utcnow().date()
+    res = await client.get(url, params={"start": today.replace(day=1).isoformat()}, headers=player_headers)
+    data = res.json()
+    assert (data["openingBalance"], data["closingBalance"]) == (120.0, 100.0)
+    assert data["categories"] == [{"type": "Expense", "category": None, "total": 20.0, "count": 1}]
+    
+    res = await client.get(url, params={"start": "2025-02-01", "end": "2025-01-01"}, headers=player_headers)
+    assert res.status_code == status.HTTP_400_BAD_REQUEST
+
+
+@pytest.mark.asyncio
+async def test_statement_without_wallet_is_read_only(db_session: AsyncSession, make_team):
+    """A team that never used its wallet gets an empty statement and no wallet row."""
+    team = await make_team("nowallet")
+    await db_session.commit()
+    
+    statement = await WalletService(db_session).get_statement(team.team_id, date(2025, 1, 1), date(2025, 1, 31))
+    assert statement["wallet_id"] is None
+    assert (statement["opening_balance"], statement["closing_balance"], statement["categories"]) == (0, 0, [])
+    wallets = await db_session.execute(select(TeamWallet).where(TeamWallet.team_id == team.team_id))
+    assert wallets.scalar_one_or_none() is None
@@ -0,0 +1,103 @@
+"""
+Tests for the public GET response cache and conditional requests.
+"""
+import pytest
+from httpx import AsyncClient
+from fastapi import status
+from sqlalchemy import event
+
+from app.utils.http_cache import ResponseCache, etag_matches, weak_etag
+
+
+class _QueryCount:
+    """Counts SQL statements executed on an engine."""
+    
+    def __init__(self, engine):
+        self.engine = engine.sync_engine
+        self.count = 0
+    
+    def _record(self, *args):
+        self.count += 1
+    
+    def __enter__(self):
+        event.listen(self.engine, "before_cursor_execute", self._record)
+        return self
+    
+    def __exit__(self, *exc):
+        event.remove(self.engine, "before_cursor_execute", self._record)
+
+
+def test_cache_expires_and_evicts_least_recent():
+    """Entries expire after the TTL and the least recently used is evicted first."""
+    now = [0.0]
+    cache = ResponseCache(max_entries=2, ttl_seconds=10, clock=lambda: now[0])
+    cache.put("a", {"n": 1}, 1)
+    cache.put("b", {"n": 2}, 1)
+    assert cache.get("a").body == b'{"n":1}'
+    
+    cache.put("c", {"n": 3}, 1)
+    assert cache.get("b") is None
+    assert cache.get("a") is not None
+    
+    now[0] = 10
+    assert cache.get("a") is None and cache.get("c") is None
+    assert len(cache) == 0
+    
+    cache.put("d", {}, 1)
+    cache.invalidate("d", "missing")
+    assert cache.get("d") is None
+
+
+def test_weak_etag_comparison():
+    """ETags change with the version and compare weakly against If-None-Match lists."""
+    etag = weak_etag("field:1", 5)
+    assert etag.startswith('W/"') and etag != weak_etag("field:1", 6)
+    assert etag_matches(f'"abc", {etag}', etag)
+    assert etag_matches(etag.removeprefix("W/"), etag)
+    assert etag_matches("*", etag)
+    assert not etag_matches(None, etag)
+    assert not etag_matches('W/"abc"', etag)
+
+
+@pytest.mark.asyncio
+async def test_field_detail_is_cached_and_revalidated(client: AsyncClient, db_engine, test_field, owner_headers):
+    """Repeat views skip the database, 304 on a matching ETag, and updates invalidate."""
+    url = f"/api/fields/{test_field['fieldId']}"
+    first = await client.get(url)
+    etag = first.headers["etag"]
+    assert first.status_code == status.HTTP_200_OK
+    assert first.headers["cache-control"] == "public, no-cache"
+    
+    with _QueryCount(db_engine) as queries:
+        again = await client.get(url)
+        not_modified = await client.get(url, headers={"If-None-Match": etag})
+    assert queries.count == 0
+    assert again.json() == first.json()
+    assert not_modified.status_code == status.HTTP_304_NOT_MODIFIED
+    assert not_modified.content == b""
+    
+    await client.put(url, json={"description": "Floodlit"}, headers=owner_headers)
+    changed = await client.get(url, headers={"If-None-Match": etag})
+    assert changed.status_code == status.HTTP_200_OK
+    assert changed.json()["description"] == "Floodlit"
+    assert changed.headers["etag"] != etag
+
+
+@pytest.mark.asyncio
+async def test_pricing_cache_invalidated_on_replace(client: AsyncClient, test_field, owner_headers):
+    """Replacing pricing rules drops the cached list."""
+    url = f"/api/fields/{test_field['fieldId']}/pricing"
+    assert (await client.get(url)).json() == []
+    
+    rule = {"name": "Evening", "dayOfWeek": ["Friday"], "startTime": "18:00:00",
+            "endTime": "22:00:00", "pricePerHour": 60.0, "priority": 1, "isActive": True}
+    await client.put(url, json=[rule], headers=owner_headers)
+    assert [r["name"] for r in (await client.get(url)).json()] == ["Evening"]
+
+
+@pytest.mark.asyncio
+async def test_missing_resources_are_not_cached(client: AsyncClient):
+    """404s are answered normally and leave nothing in the cache."""
+    res = await client.get("/api/teams/999999")
+    assert res.status_code == status.HTTP_404_NOT_FOUND
+    assert "etag" not in res.headers
@@ -0,0 +1,164 @@
+"""
+Tests that the in-memory indexes answer as a full scan would, at scale.
+
+Each case builds an index with many random entries, moves and removes
+some, and returns the queries to run with two answers for each: the
+index's and one computed by scanning every entry.
+"""
+import random
+import pytest
+
+from app.services.league_table import ALL_TEAMS, LeagueTable
+from app.services.player_index import PlayerIndex
+from app.services.suggest_index import SuggestIndex, normalize
+from app.utils.geo import GridIndex, haversine_km
+
+
+def _grid():
+    """50k teams in a GridIndex; every team within the radius, nearest first."""
+    rng = random.Random(44)
+    grid = GridIndex(0.1)
+    points = {}
+    for team_id in range(50_000):
+        point = (rng.uniform(10.0, 11.5), rng.uniform(106.0, 107.5))
+        points[team_id] = point
+        grid.put(team_id, *point)
+    grid.put(0, 10.5, 106.5)
+    points[0] = (10.5, 106.5)
+    grid.remove(1)
+    del points[1]
+    
+    def indexed(lat, lon, radius):
+        found = grid.within(lat, lon, radius)
+        return {k for k, _ in found}, [d for _, d in found] == sorted(d for _, d in found)
+    
+    def scanned(lat, lon, radius):
+        return {k for k, (plat, plon) in points.items() if haversine_km(lat, lon, plat, plon) <= radius}, True
+    
+    queries = [(10.75, 106.7, 10), (10.0, 106.0, 25), (11.4, 107.4, 3), (10.5, 106.5, 0.5)]
+    return queries, indexed, scanned
+
+
+def _league():
+    """5k teams re-ranked incrementally; size, a page and ranks of each partition."""
+    rng = random.Random(7)
+    table = LeagueTable()
+    
+    def row(team_id):
+        wins, draws, losses = rng.randint(0, 20), rng.randint(0, 10), rng.randint(0, 20)
+        return {
+            "team_id": team_id, "team_name": f"T{team_id}", "location": rng.choice(["Hanoi", "Hue", None]),
+            "skill_level": rng.randint(1, 10), "matches_played": wins + draws + losses,
+            "wins": wins, "draws": draws, "losses": losses,
+            "goals_for": rng.randint(0, 60), "goals_against": rng.randint(0, 60), "form": "",
+        }
+    
+    for team_id in range(5000):
+        table.put(row(team_id))
+    for team_id in rng.sample(range(5000), 500):
+        table.put(row(team_id))
+    for team_id in rng.sample(range(5000), 100):
+        table.remove(team_id)
+    
+    def ranked(key):
+        return sorted((s for s in table.standings.values() if key in table._partitions(s)), key=LeagueTable.sort_key)
+    
+    def indexed(key):
+        team_ids = [s["team_id"] for s in ranked(key)]
+        sample = [team_ids[0], team_ids[len(team_ids) // 2], team_ids[-1]]
+        return (
+            table.size(key),
+            [(rank, s["team_id"]) for rank, s in table.top(50, offset=10, key=key)],
+            [table.rank(team_id, key) for team_id in sample],
+        )
+    
+    def scanned(key):
+        expected = ranked(key)
+        positions = [0, len(expected) // 2, len(expected) - 1]
+        return (
+            len(expected),
+            [(i + 1, s["team_id"]) for i, s in enumerate(expected)][10:60],
+            [(i + 1, expected[i]) for i in positions],
+        )
+    
+    return [(ALL_TEAMS,), (("location", "hue"),), (("band", "4-6"),)], indexed, scanned
+
+
+def _suggest():
+    """100k names; whole-name matches, then word matches, each sorted."""
+    rng = random.Random(46)
+    syllables = ["sai", "gon", "ha", "noi", "da", "nang", "hue", "can", "tho", "vung", "tau", "fc", "united", "đức"]
+    index = SuggestIndex()
+    for entity_id in range(100_000):
+        name = " ".join(
+            "".join(rng.choice(syllables) for _ in range(rng.randint(1, 3))) for _ in range(rng.randint(1, 3))
+        )
+        index.put(rng.choice(["team", "player"]), entity_id, name.title())
+    index.put("team", 5, "Renamed Once")
+    index.remove("player", 6)
+    index.remove("team", 6)
+    
+    def indexed(prefix):
+        return [(kind, entity_id) for kind, entity_id, _ in index.suggest(prefix, limit=25)]
+    
+    def scanned(prefix):
+        key = normalize(prefix)
+        whole, words = [], []
+        for kind in ("team", "player"):
+            for entity_id, name in index.names[kind].items():
+                name_key = normalize(name)
+                if name_key.startswith(key):
+                    whole.append((name_key, kind, entity_id))
+                else:
+                    later = [name_key[i + 1:] for i, c in enumerate(name_key) if c == " "]
+                    matching = [w for w in later if w.startswith(key)]
+                    if matching:
+                        words.append((min(matching), kind, entity_id))
+        return [(kind, entity_id) for _, kind, entity_id in sorted(whole) + sorted(words)][:25]
+    
+    return [(prefix,) for prefix in ["sai", "Gon Ha", "duc", "unitedfc", "tau t", "zz"]], indexed, scanned
+
+
+def _players():
+    """100k players in a labelled GridIndex; the nearest matching ones within the radius."""
+    rng = random.Random(45)
+    positions = ["Goalkeeper", "Defender", "Midfielder", "Forward", None]
+    index = PlayerIndex()
+    for player_id in range(100_000):
+        index.put({
+            "player_id": player_id, "user_id": player_id, "display_name": str(player_id),
+            "position": rng.choice(positions), "skill_level": rng.choice([None, *range(1, 11)]),
+            "location": None, "latitude": rng.uniform(10.0, 11.5), "longitude": rng.uniform(106.0, 107.5),
+        })
+    index.remove(7)
+    exclude = set(range(0, 100_000, 3))
+    
+    def indexed(lat, lon, radius, position, skill_range):
+        found = index.search(lat, lon, radius, position, skill_range, exclude, limit=50)
+        return [row["player_id"] for row, _ in found]
+    
+    def scanned(lat, lon, radius, position, skill_range):
+        expected = sorted(
+            (haversine_km(lat, lon, row["latitude"], row["longitude"]), player_id)
+            for player_id, row in index.players.items()
+            if player_id not in exclude
+            and (position is None or (row["position"] or "").lower() == position.lower())
+            and (skill_range is None or (row["skill_level"] is not None
+                                         and skill_range[0] <= row["skill_level"] <= skill_range[1]))
+        )
+        return [player_id for distance, player_id in expected if distance <= radius][:50]
+    
+    queries = [
+        (10.75, 106.7, 10, "Forward", (4, 6)),
+        (10.0, 106.0, 25, None, (7, 10)),
+        (11.2, 107.3, 3, "midfielder", None),
+    ]
+    return queries, indexed, scanned
+
+
+@pytest.mark.parametrize("build", [_grid, _league, _suggest, _players], ids=["grid", "league", "suggest", "players"])
+def test_index_matches_full_scan_at_scale(build):
+    """Every query gets the same answer from the index as from a scan of all its entries."""
+    queries, indexed, scanned = build()
+    for query in queries:
+        assert indexed(*query) == scanned(*query), query
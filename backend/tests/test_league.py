@@ -0,0 +1,84 @@
+"""
+Tests for the league table.
+"""
+import asyncio
+import uuid
+from datetime import date, time, timedelta
+import pytest
+from httpx import AsyncClient
+from fastapi import status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.match import MatchEvent
+from app.services.incremental_index import warm_indexes
+from app.services.league_table import LeagueTable
+from app.services.match_service import MatchService
+
+
+@pytest.mark.asyncio
+async def test_standings_follow_results(client: AsyncClient, db_session: AsyncSession, make_team):
+    """Results and cancellations re-rank teams; location and skill band filter the table."""
+    city, other_city = f"City {uuid.uuid4().hex[:6]}", f"Town {uuid.uuid4().hex[:6]}"
+    a = await make_team("league", location=city, skill_level=5)
+    b = await make_team("league", location=city.upper(), skill_level=8)
+    c = await make_team("league", location=other_city, skill_level=5)
+    service = MatchService(db_session)
+    matches = []
+    for day, (home, away, home_score, away_score) in enumerate([(a, b, 2, 0), (c, a, 1, 1), (b, c, 3, 0)]):
+        match = MatchEvent(
+            host_team_id=home.team_id, opponent_team_id=away.team_id,
+            match_date=date.today() - timedelta(days=10 - day), start_time=time(18, 0),
+        )
+        db_session.add(match)
+        await db_session.flush()
+        await service.record_result(match, home_score, away_score, a.leader_id)
+        matches.append(match)
+    
+    res = await client.get("/api/standings", params={"location": city})
+    assert res.status_code == status.HTTP_200_OK
+    rows = res.json()
+    assert [(r["rank"], r["teamId"], r["points"], r["goalDifference"]) for r in rows] == [
+        (1, a.team_id, 4, 2), (2, b.team_id, 3, 1),
+    ]
+    assert rows[0]["form"] == "WD"
+    
+    res = await client.get(f"/api/standings/teams/{c.team_id}", params={"location": other_city})
+    assert (res.json()["rank"], res.json()["totalTeams"], res.json()["form"]) == (1, 1, "DL")
+    
+    res = await client.get("/api/standings", params={"skillBand": "4-6", "limit": 100})
+    ids = [r["teamId"] for r in res.json()]
+    assert ids.index(a.team_id) < ids.index(c.team_id) and b.team_id not in ids
+    
+    # Cancelling A's win puts B on top
+    await service.cancel_match(matches[0])
+    res = await client.get(f"/api/standings/teams/{b.team_id}", params={"location": city})
+    assert (res.json()["rank"], res.json()["points"]) == (1, 3)
+    res = await client.get(f"/api/standings/teams/{a.team_id}", params={"location": city})
+    assert (res.json()["rank"], res.json()["points"], res.json()["form"]) == (2, 1, "D")
+    
+    # Moving to another city moves the team to that city's table
+    a.location = other_city
+    await db_session.commit()
+    res = await client.get("/api/standings", params={"location": other_city})
+    assert {r["teamId"] for r in res.json()} == {a.team_id, c.team_id}
+    
+    assert (await client.get("/api/standings", params={"skillBand": "11-20"})).status_code == 400
+    assert (await client.get(f"/api/standings/teams/{a.team_id}", params={"location": city})).status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_warm_up_and_first_reader_load_once(db_session: AsyncSession):
+    """A reader arriving during the startup warm-up waits for it instead of loading again."""
+    table = LeagueTable()
+    loads = []
+    
+    async def load(session):
+        loads.append(session)
+        await asyncio.sleep(0.05)
+    
+    table._load = load
+    await asyncio.gather(
+        warm_indexes([table], lambda: AsyncSession(db_session.bind)),
+        table.ensure_fresh(db_session),
+    )
+    assert len(loads) == 1 and not table.stale
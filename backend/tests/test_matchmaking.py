@@ -0,0 +1,92 @@
+"""
+Tests for opponent matchmaking.
+"""
+import random
+from datetime import date, time, timedelta
+import pytest
+from httpx import AsyncClient
+from fastapi import status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.enums import TeamStatus
+from app.models.match import MatchEvent
+from app.models.stats import TeamStats
+from app.models.team import TeamProfile
+from app.utils.geo import GridIndex, KM_PER_DEGREE
+
+# A spot no other test places teams at
+BASE = (47.37 + random.uniform(-0.2, 0.2), 8.54 + random.uniform(-0.2, 0.2))
+
+
+def _north_of_base(km: float) -> tuple:
+    return BASE[0] + km / KM_PER_DEGREE, BASE[1]
+
+
+@pytest.fixture
+def team_at(db_session: AsyncSession, make_team):
+    """Factory to add a verified team km north of BASE, rated if a rating is given."""
+    async def _make(km: float, rating: float = None, **fields) -> TeamProfile:
+        lat, lon = _north_of_base(km)
+        team = await make_team("mm", latitude=lat, longitude=lon, **{"status": TeamStatus.VERIFIED, **fields})
+        if rating is not None:
+            db_session.add(TeamStats(team_id=team.team_id, rating=rating))
+        return team
+    return _make
+
+
+@pytest.mark.asyncio
+async def test_opponents_ranked_by_balance_distance_and_availability(
+    client: AsyncClient, db_session: AsyncSession, player_headers, owner_headers, test_team, team_at
+):
+    """Nearby even teams rank first; busy, unverified and distant teams are left out; edits are picked up."""
+    url = f"/api/matchmaking/teams/{test_team['teamId']}/opponents"
+    match_date = date.today() + timedelta(days=5)
+    params = {"matchDate": match_date.isoformat(), "radiusKm": 25}
+    
+    res = await client.get(url, params=params, headers=player_headers)
+    assert res.status_code == status.HTTP_200_OK
+    host = await db_session.get(TeamProfile, test_team["teamId"])
+    host.latitude, host.longitude = BASE
+    even = await team_at(3)
+    strong = await team_at(3, rating=1900)
+    far = await team_at(20)
+    await team_at(60)
+    await team_at(2, status=TeamStatus.PENDING)
+    busy = await team_at(2)
+    db_session.add(MatchEvent(host_team_id=busy.team_id, match_date=match_date, start_time=time(18, 0)))
+    await db_session.commit()
+    
+    res = await client.get(url, params=params, headers=player_headers)
+    assert res.status_code == status.HTTP_200_OK
+    opponents = res.json()
+    assert [o["teamId"] for o in opponents] == [even.team_id, far.team_id, strong.team_id]
+    assert opponents[0]["distanceKm"] == pytest.approx(3, abs=0.01)
+    assert opponents[2]["rating"] == 1900.0
+    assert opponents[0]["score"] > opponents[1]["score"] > opponents[2]["score"]
+    
+    # Busy on a different day only
+    res = await client.get(url, params={**params, "matchDate": (match_date + timedelta(days=1)).isoformat()},
+                           headers=player_headers)
+    assert busy.team_id in [o["teamId"] for o in res.json()]
+    
+    # Committed profile changes reach the index
+    far.latitude, far.longitude = _north_of_base(1)
+    even.status = TeamStatus.REJECTED
+    await db_session.commit()
+    res = await client.get(url, params={**params, "limit": 1}, headers=player_headers)
+    assert [o["teamId"] for o in res.json()] == [far.team_id]
+    
+    res = await client.get(url, params=params, headers=owner_headers)
+    assert res.status_code == status.HTTP_403_FORBIDDEN
+    host.latitude = None
+    await db_session.commit()
+    res = await client.get(url, params=params, headers=player_headers)
+    assert res.status_code == status.HTTP_400_BAD_REQUEST
+
+
+def test_grid_radius_query_crosses_antimeridian():
+    """Points either side of longitude 180 are neighbours."""
+    grid = GridIndex(0.1)
+    grid.put("east", 0.0, 179.99)
+    grid.put("west", 0.0, -179.99)
+    assert {k for k, _ in grid.within(0.0, 180.0, 5)} == {"east", "west"}
@@ -2,9 +2,13 @@
 Tests for moderation module endpoints.
 Note: Moderator role may not be recognized in test environment.
 """
+import uuid
 import pytest
 from httpx import AsyncClient
 from fastapi import status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.user import UserAccount
 
 
 @pytest.fixture
@@ -151,6 +155,43 @@ async def test_update_user_role(client: AsyncClient, mod_headers):
                                 status.HTTP_403_FORBIDDEN]
 
 
+@pytest.mark.asyncio
+async def test_get_users_by_role_a_page_at_a_time(client: AsyncClient, db_session: AsyncSession, mod_headers):
+    """The role filter is a bitmask match, pages follow X-Next-Cursor, and role changes update the mask."""
+    tag = f"rm{uuid.uuid4().hex[:8]}"
+    roles = [["FieldOwner"], ["Player"], ["Player", "FieldOwner"], ["FieldOwner"], ["Moderator"], ["FieldOwner"]]
+    users = [
+        UserAccount(username=f"{tag}_{i}", email=f"{tag}_{i}@test.com", password_hash="x", roles=r)
+        for i, r in enumerate(roles)
+    ]
+    db_session.add_all(users)
+    await db_session.commit()
+    assert [u.role_mask for u in users] == [4, 1, 5, 4, 8, 4]
+    assert users[2].has_role("TeamLeader", "Player") and not users[2].has_role("Moderator")
+    
+    owners, cursor = [], None
+    for _ in range(3):
+        params = {"query": tag, "role": "FieldOwner", "limit": 2, **({"cursor": cursor} if cursor else {})}
+        res = await client.get("/api/mod/users", params=params, headers=mod_headers)
+        assert res.status_code == status.HTTP_200_OK
+        owners.append([u["username"] for u in res.json()])
+        cursor = res.headers.get("x-next-cursor")
+    assert owners == [[f"{tag}_0", f"{tag}_2"], [f"{tag}_3", f"{tag}_5"], []]
+    assert cursor is None
+    
+    res = await client.get("/api/mod/users", params={"role": "Coach"}, headers=mod_headers)
+    assert res.status_code == status.HTTP_400_BAD_REQUEST
+    res = await client.get("/api/mod/users", params={"cursor": "42"}, headers=mod_headers)
+    assert res.status_code == status.HTTP_400_BAD_REQUEST
+    
+    res = await client.put(f"/api/mod/users/{users[1].user_id}/role", json={"role": "Moderator"}, headers=mod_headers)
+    assert res.status_code == status.HTTP_200_OK
+    await db_session.refresh(users[1])
+    assert users[1].role_mask == 8
+    res = await client.get("/api/mod/users", params={"query": tag, "role": "Moderator"}, headers=mod_headers)
+    assert [u["username"] for u in res.json()] == [f"{tag}_1", f"{tag}_4"]
+
+
 @pytest.mark.asyncio
 async def test_suspend_user(client: AsyncClient, mod_headers):
     """Test suspending a user."""
@@ -0,0 +1,182 @@
+"""
+Tests for the keyset-paginated moderation queues and report cases.
+"""
+import random
+import uuid
+from datetime import datetime, timedelta
+import pytest
+from httpx import AsyncClient
+from fastapi import status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.enums import ReportContentType, ReportStatus, ModerationAction
+from app.models.moderation import Report, ModerationLog
+from app.models.team import TeamProfile
+from app.repositories.moderation_repository import ReportCaseRepository
+
+# Older than anything the API creates
+BASE = datetime(2001, 1, 1)
+
+
+@pytest.fixture
+async def mod_headers(create_auth_headers):
+    return await create_auth_headers("queue_mod", "Moderator")
+
+
+async def _walk(client: AsyncClient, url: str, headers: dict, **params) -> list:
+    """Every row of a queue, following X-Next-Cursor two rows at a time."""
+    rows, cursor = [], None
+    while True:
+        res = await client.get(url, params={**params, "limit": 2, **({"cursor": cursor} if cursor else {})},
+                               headers=headers)
+        assert res.status_code == status.HTTP_200_OK
+        rows.extend(res.json())
+        cursor = res.headers.get("x-next-cursor")
+        if cursor is None:
+            return rows
+
+
+@pytest.mark.asyncio
+async def test_report_queue_by_age_and_priority(client: AsyncClient, db_session: AsyncSession, mod_headers, make_user):
+    """Pages cover the queue once each; priority puts the most reported content first."""
+    user = await make_user("q")
+    post_id = random.randint(10**8, 10**9)
+    targets = [
+        (ReportContentType.COMMENT, post_id, None),
+        (ReportContentType.POST, post_id, None),
+        (ReportContentType.POST, post_id, None),
+        (ReportContentType.USER, None, user.user_id),
+        (ReportContentType.POST, post_id, None),
+    ]
+    reporters = [await make_user("qr") for _ in targets]
+    reports = [
+        Report(reporter_id=reporter.user_id, content_type=kind, content_id=content_id, reported_user_id=reported,
+               reason="spam", created_at=BASE + timedelta(seconds=i))
+        for i, (reporter, (kind, content_id, reported)) in enumerate(zip(reporters, targets))
+    ]
+    for report in reports:
+        await ReportCaseRepository(db_session).add_report(report)
+    reports.append(Report(reporter_id=user.user_id, content_type=ReportContentType.POST, content_id=post_id,
+                          reason="spam", status=ReportStatus.DISMISSED, created_at=BASE - timedelta(seconds=1)))
+    db_session.add_all(reports)
+    await db_session.commit()
+    ids = [r.report_id for r in reports]
+    
+    queue = await _walk(client, "/api/mod/reports", mod_headers, status="Pending")
+    assert len({r["reportId"] for r in queue}) == len(queue)
+    mine = [(r["reportId"], r["priority"]) for r in queue if r["reportId"] in ids]
+    assert mine == [(ids[0], 1), (ids[1], 3), (ids[2], 3), (ids[3], 1), (ids[4], 3)]
+    assert queue[0]["reportId"] == ids[0]
+    
+    queue = await _walk(client, "/api/mod/reports", mod_headers, status="Pending", sort="priority")
+    assert len({r["reportId"] for r in queue}) == len(queue)
+    assert [r["priority"] for r in queue] == sorted((r["priority"] for r in queue), reverse=True)
+    assert [r["reportId"] for r in queue if r["reportId"] in ids] == [ids[1], ids[2], ids[4], ids[0], ids[3]]
+    
+    # A report arriving mid-walk moves its case up without listing any report twice
+    params = {"status": "Pending", "sort": "priority", "limit": 2}
+    res = await client.get("/api/mod/reports", params=params, headers=mod_headers)
+    late = Report(reporter_id=user.user_id, content_type=ReportContentType.POST, content_id=post_id, reason="spam")
+    await ReportCaseRepository(db_session).add_report(late)
+    db_session.add(late)
+    await db_session.commit()
+    rest = await _walk(client, "/api/mod/reports", mod_headers, **params, cursor=res.headers["x-next-cursor"])
+    listed = [r["reportId"] for r in res.json() + rest]
+    assert len(set(listed)) == len(listed)
+    
+    # Without a status filter closed reports are listed too; they have no open case
+    queue = await _walk(client, "/api/mod/reports", mod_headers)
+    assert queue[0]["reportId"] == ids[5] and queue[0]["priority"] == 0
+    
+    res = await client.get("/api/mod/reports", params={"cursor": "not-a-cursor"}, headers=mod_headers)
+    assert res.status_code == status.HTTP_400_BAD_REQUEST
+
+
+@pytest.mark.asyncio
+async def test_pending_teams_and_logs_page_by_cursor(
+    client: AsyncClient, db_session: AsyncSession, mod_headers, make_user
+):
+    """Pending teams come oldest first and logs newest first, each row exactly once."""
+    tag = uuid.uuid4().hex[:8]
+    user = await make_user("ql")
+    # Two share a timestamp; the ID breaks the tie
+    teams = [
+        TeamProfile(team_name=f"Queue {tag} {i}", leader_id=user.user_id, created_at=BASE + timedelta(minutes=i // 2))
+        for i in range(3)
+    ]
+    logs = [
+        ModerationLog(moderator_id=user.user_id, target_user_id=user.user_id, action=ModerationAction.WARNING,
+                      reason=f"{tag} {i}")
+        for i in range(3)
+    ]
+    db_session.add_all(teams + logs)
+    await db_session.commit()
+    
+    queue = await _walk(client, "/api/mod/teams/pending", mod_headers)
+    assert len({t["teamId"] for t in queue}) == len(queue)
+    assert [t["teamId"] for t in queue[:3]] == [t.team_id for t in teams]
+    
+    history = await _walk(client, "/api/mod/logs", mod_headers)
+    assert len({l["logId"] for l in history}) == len(history)
+    assert [l["reason"] for l in history if l["reason"].startswith(tag)] == [f"{tag} 2", f"{tag} 1", f"{tag} 0"]
+    assert [l["logId"] for l in history] == sorted((l["logId"] for l in history), reverse=True)
+
+
+@pytest.mark.asyncio
+async def test_reports_on_one_target_share_a_case(client: AsyncClient, mod_headers, create_auth_headers):
+    """Reports on the same post add up in one case, counted per reporter; resolving it closes them all at once."""
+    post_id = random.randint(10**8, 10**9)
+    created = []
+    for n in range(3):
+        reporter = await create_auth_headers(f"case_reporter{n}")
+        url = "/api/posts/report" if n else "/api/mod/reports"
+        res = await client.post(url, json={"contentType": "Post", "contentId": post_id, "reason": "Spam"},
+                                headers=reporter)
+        assert res.status_code == status.HTTP_201_CREATED
+        created.append(res.json())
+    # The same reporter again: one more report in the case, no more reporters
+    res = await client.post("/api/posts/report", json={"contentType": "Post", "contentId": post_id, "reason": "Still"},
+                            headers=reporter)
+    created.append(res.json())
+    other = await client.post("/api/mod/reports", json={"contentType": "Comment", "contentId": post_id, "reason": "Spam"},
+                              headers=reporter)
+    pending_before = (await client.get("/api/mod/stats", headers=mod_headers)).json()["pendingReports"]
+    
+    cases = await _walk(client, "/api/mod/cases", mod_headers, sort="priority")
+    assert [c["reportCount"] for c in cases] == sorted((c["reportCount"] for c in cases), reverse=True)
+    case = next(c for c in cases if c["contentId"] == post_id and c["contentType"] == "Post")
+    assert case["reportCount"] == 3 and case["status"] == "Pending"
+    assert case["latestReportAt"] == created[-1]["createdAt"]
+    
+    res = await client.get(f"/api/mod/cases/{case['caseId']}", headers=mod_headers)
+    assert [r["reportId"] for r in res.json()["reports"]] == [r["reportId"] for r in reversed(created)]
+    assert res.json()["reportCount"] == 3
+    
+    res = await client.put(f"/api/mod/cases/{case['caseId']}/resolve", params={"action": "resolve"}, headers=mod_headers)
+    assert res.status_code == status.HTTP_200_OK
+    assert res.json()["status"] == "Resolved" and res.json()["resolvedAt"]
+    for report in created:
+        res = await client.get(f"/api/mod/reports/{report['reportId']}", headers=mod_headers)
+        assert res.json()["status"] == "Resolved"
+    stats = (await client.get("/api/mod/stats", headers=mod_headers)).json()
+    assert stats["pendingReports"] == pending_before - 4
+    assert case["caseId"] not in [c["caseId"] for c in await _walk(client, "/api/mod/cases", mod_headers)]
+    
+    # A new report opens a new case; closing a case's only report closes the case
+    res = await client.post("/api/posts/report", json={"contentType": "Post", "contentId": post_id, "reason": "Again"},
+                            headers=reporter)
+    cases = await _walk(client, "/api/mod/cases", mod_headers)
+    reopened = next(c for c in cases if c["contentId"] == post_id and c["contentType"] == "Post")
+    assert reopened["caseId"] != case["caseId"] and reopened["reportCount"] == 1
+    await client.put(f"/api/mod/reports/{res.json()['reportId']}/resolve", params={"action": "dismiss"},
+                     headers=mod_headers)
+    res = await client.get(f"/api/mod/cases/{reopened['caseId']}", headers=mod_headers)
+    assert res.json()["status"] == "Dismissed" and res.json()["reportCount"] == 0
+    
+    # The comment's case was untouched
+    cases = await _walk(client, "/api/mod/cases", mod_headers)
+    assert any(c["contentType"] == "Comment" and c["contentId"] == post_id for c in cases)
+    assert other.json()["status"] == "Pending"
+    
+    res = await client.get("/api/mod/cases/999999999", headers=mod_headers)
+    assert res.status_code == status.HTTP_404_NOT_FOUND
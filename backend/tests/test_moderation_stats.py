@@ -0,0 +1,91 @@
+"""
+Tests for materialized moderation dashboard counters.
+"""
+import uuid
+import pytest
+from httpx import AsyncClient
+from fastapi import status
+from sqlalchemy import update
+
+from app.models.moderation import ModerationCounter
+from app.services.moderation_stats_service import ModerationStatsService, PENDING_REPORTS
+
+
+@pytest.fixture
+async def mod_headers(create_auth_headers):
+    """Create moderator auth headers."""
+    return await create_auth_headers("stats_mod", "Moderator")
+
+
+async def _stats(client, headers):
+    res = await client.get("/api/mod/stats", headers=headers)
+    assert res.status_code == status.HTTP_200_OK
+    return res.json()
+
+
+@pytest.mark.asyncio
+async def test_stats_match_source_tables(client: AsyncClient, mod_headers, db_session):
+    """Counters equal the aggregated counts after reconciliation."""
+    actual = await ModerationStatsService(db_session).counter_repo.count_actual()
+    res = await client.post("/api/mod/stats/reconcile", headers=mod_headers)
+    assert res.status_code == status.HTTP_200_OK
+    
+    stats = await _stats(client, mod_headers)
+    assert stats == {
+        "pendingReports": actual["pending_reports"],
+        "pendingTeams": actual["pending_teams"],
+        "pendingFields": actual["pending_fields"],
+        "totalUsers": actual["total_users"],
+    }
+
+
+@pytest.mark.asyncio
+async def test_counters_follow_writes(client: AsyncClient, mod_headers, player_headers, owner_headers, create_auth_headers):
+    """Report, team, field and user writes adjust the counters incrementally."""
+    await client.post("/api/mod/stats/reconcile", headers=mod_headers)
+    before = await _stats(client, mod_headers)
+    
+    report = await client.post("/api/mod/reports", json={
+        "contentType": "Post", "contentId": 1, "reason": "Spam"
+    }, headers=player_headers)
+    team = await client.post("/api/teams", json={
+        "teamName": f"Stats_{uuid.uuid4().hex[:6]}", "description": "d",
+        "location": "L", "latitude": 1.0, "longitude": 1.0
+    }, headers=player_headers)
+    field = await client.post("/api/fields", json={
+        "fieldName": f"StatsField_{uuid.uuid4().hex[:6]}", "location": "L",
+        "latitude": 1.0, "longitude": 1.0, "defaultPricePerHour": 10.0
+    }, headers=owner_headers)
+    await create_auth_headers("stats_new_user", "Player")
+    
+    after = await _stats(client, mod_headers)
+    assert after["pendingReports"] == before["pendingReports"] + 1
+    assert after["pendingTeams"] == before["pendingTeams"] + 1
+    assert after["pendingFields"] == before["pendingFields"] + 1
+    assert after["totalUsers"] == before["totalUsers"] + 1
+    
+    await client.put(f"/api/mod/reports/{report.json()['reportId']}/resolve?action=resolve", headers=mod_headers)
+    await client.put(f"/api/mod/teams/{team.json()['teamId']}/verify", json={"approved": True}, headers=mod_headers)
+    await client.put(f"/api/mod/fields/{field.json()['fieldId']}/verify", json={"approved": False, "rejectionReason": "x"}, headers=mod_headers)
+    # Re-verifying a non-pending team does not decrement again
+    await client.put(f"/api/mod/teams/{team.json()['teamId']}/verify", json={"approved": True}, headers=mod_headers)
+    
+    final = await _stats(client, mod_headers)
+    assert final["pendingReports"] == before["pendingReports"]
+    assert final["pendingTeams"] == before["pendingTeams"]
+    assert final["pendingFields"] == before["pendingFields"]
+
+
+@pytest.mark.asyncio
+async def test_reconcile_corrects_drift(db_session):
+    """Reconciliation overwrites drifted counters with the true counts."""
+    service = ModerationStatsService(db_session)
+    await service.reconcile()
+    await db_session.execute(
+        update(ModerationCounter).where(ModerationCounter.name == PENDING_REPORTS).values(value=-999)
+    )
+    await db_session.commit()
+    
+    values = await service.reconcile()
+    stats = await service.get_stats()
+    assert stats[PENDING_REPORTS] == values[PENDING_REPORTS] >= 0
@@ -0,0 +1,142 @@
+"""
+Tests for batched notification fan-out.
+"""
+import uuid
+import pytest
+from httpx import AsyncClient
+from fastapi import BackgroundTasks, status
+from sqlalchemy import select, func
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.models.user import UserAccount
+from app.models.notification import Notification, NotificationPreference
+from app.models.enums import NotificationType, AccountStatus
+from app.services.notification_service import NotificationService
+
+
+async def _create_users(db_session, count):
+    users = []
+    for _ in range(count):
+        name = f"fanout_{uuid.uuid4().hex[:8]}"
+        users.append(UserAccount(
+            username=name,
+            email=f"{name}@test.com",
+            password_hash="x",
+            roles=["Player"],
+            status=AccountStatus.ACTIVE,
+        ))
+    db_session.add_all(users)
+    await db_session.flush()
+    return [u.user_id for u in users]
+
+
+async def _count_for(db_session, user_ids, related_entity_id):
+    result = await db_session.execute(
+        select(func.count()).select_from(Notification).where(
+            Notification.user_id.in_(user_ids),
+            Notification.related_entity_id == related_entity_id
+        )
+    )
+    return result.scalar()
+
+
+@pytest.mark.asyncio
+async def test_fan_out_respects_preferences(db_session: AsyncSession):
+    """Users who disabled the category are skipped, duplicates collapse."""
+    user_ids = await _create_users(db_session, 4)
+    db_session.add(NotificationPreference(user_id=user_ids[0], match_reminders=False))
+    await db_session.flush()
+    
+    service = NotificationService(db_session)
+    created = await service.fan_out(
+        user_ids + [user_ids[1]],
+        NotificationType.MATCH_CANCELLED,
+        title="Match Cancelled",
+        message="Cancelled",
+        related_entity_id=900001,
+        related_entity_type="Match",
+        exclude_user_ids=[user_ids[3]],
+    )
+    
+    assert created == 2
+    assert await _count_for(db_session, user_ids, 900001) == 2
+
+
+@pytest.mark.asyncio
+async def test_fan_out_system_messages_ignore_preferences(db_session: AsyncSession):
+    """Types without a preference category are always delivered."""
+    user_ids = await _create_users(db_session, 2)
+    db_session.add(NotificationPreference(
+        user_id=user_ids[0], match_reminders=False, team_updates=False,
+        booking_updates=False, community_updates=False
+    ))
+    await db_session.flush()
+    
+    created = await NotificationService(db_session).fan_out(
+        user_ids, NotificationType.SYSTEM_MESSAGES, "Maintenance", "Tonight",
+        related_entity_id=900002
+    )
+    
+    assert created == 2
+
+
+@pytest.mark.asyncio
+async def test_notify_users_defers_large_audience(db_session: AsyncSession, db_engine):
+    """Audiences over the threshold run as a background task in their own session."""
+    from app.config import get_settings
+    
+    threshold = get_settings().notification_fanout_background_threshold
+    user_ids = await _create_users(db_session, threshold)
+    await db_session.commit()
+    
+    session_factory = async_sessionmaker(db_engine, class_=AsyncSession, expire_on_commit=False)
+    background_tasks = BackgroundTasks()
+    service = NotificationService(db_session)
+    created = await service.notify_users(
+        user_ids, NotificationType.TEAM_NEWS, "News", "Hello",
+        related_entity_id=900003,
+        background_tasks=background_tasks,
+        session_factory=session_factory,
+    )
+    
+    assert created == 0
+    assert await _count_for(db_session, user_ids, 900003) == 0
+    
+    await background_tasks()
+    assert await _count_for(db_session, user_ids, 900003) == threshold
+
+
+@pytest.mark.asyncio
+async def test_cancel_match_notifies_roster(client: AsyncClient, player_headers, test_team, create_auth_headers):
+    """Cancelling a match notifies roster members but not the canceller."""
+    team_id = test_team["teamId"]
+    member_headers = await create_auth_headers("fanout_member", "Player")
+    profile = (await client.get("/api/players/profile", headers=member_headers)).json()
+    
+    res = await client.post(
+        f"/api/teams/{team_id}/roster",
+        json={"playerId": profile["playerId"], "role": "Member"},
+        headers=player_headers
+    )
+    assert res.status_code == status.HTTP_201_CREATED
+    
+    match_res = await client.post("/api/matches", json={
+        "hostTeamId": team_id,
+        "matchDate": "2030-01-01",
+        "startTime": "10:00:00",
+        "endTime": "12:00:00",
+        "visibility": "Public"
+    }, headers=player_headers)
+    match_id = match_res.json()["matchId"]
+    
+    res = await client.put(f"/api/matches/{match_id}/cancel", headers=player_headers)
+    assert res.status_code == status.HTTP_200_OK
+    
+    member_notifications = (await client.get("/api/notifications", headers=member_headers)).json()
+    assert any(
+        n["type"] == "MatchCancelled" and n["relatedEntityId"] == match_id
+        for n in member_notifications
+    )
+    
+    leader_notifications = (await client.get("/api/notifications", headers=player_headers)).json()
+    assert not any(n["type"] == "MatchCancelled" for n in leader_notifications)
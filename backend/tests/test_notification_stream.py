@@ -0,0 +1,207 @@
+"""
+Tests for server-pushed notifications (hub and SSE stream).
+"""
+import asyncio
+import uuid
+import pytest
+from httpx import AsyncClient
+from fastapi import status
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.controllers import notification_controller
+from app.controllers.notification_controller import notification_event_stream
+from app.models.user import UserAccount
+from app.models.enums import NotificationType, AccountStatus
+from app.services.notification_hub import InProcessNotificationHub
+from app.services.notification_service import NotificationService
+
+
+async def _create_user(db_session):
+    name = f"stream_{uuid.uuid4().hex[:8]}"
+    user = UserAccount(
+        username=name,
+        email=f"{name}@test.com",
+        password_hash="x",
+        roles=["Player"],
+        status=AccountStatus.ACTIVE,
+    )
+    db_session.add(user)
+    await db_session.commit()
+    return user.user_id
+
+
+async def _next(stream):
+    return await asyncio.wait_for(stream.__anext__(), timeout=2)
+
+
+def _connected():
+    state = {"closed": False}
+    
+    async def is_disconnected():
+        return state["closed"]
+    return state, is_disconnected
+
+
+@pytest.mark.asyncio
+async def test_hub_publish_and_overflow():
+    """Events reach only the user's subscriptions; full queues flag overflow."""
+    hub = InProcessNotificationHub(max_queue_size=2)
+    sub = hub.subscribe(1)
+    other = hub.subscribe(2)
+    
+    for i in range(3):
+        await hub.publish(1, {"event": "unread_count", "data": {"count": i}})
+    
+    assert sub.queue.qsize() == 2
+    assert sub.overflowed is True
+    assert other.queue.empty()
+    
+    sub.drain()
+    assert sub.queue.empty() and sub.overflowed is False
+    
+    hub.unsubscribe(sub)
+    hub.unsubscribe(other)
+    assert hub.subscribed_users() == set()
+
+
+@pytest.mark.asyncio
+async def test_stream_resumes_and_pushes_live(db_session: AsyncSession, db_engine):
+    """The stream replays missed notifications, then pushes new ones."""
+    hub = InProcessNotificationHub()
+    session_factory = async_sessionmaker(db_engine, class_=AsyncSession, expire_on_commit=False)
+    user_id = await _create_user(db_session)
+    service = NotificationService(db_session, hub)
+    
+    first = await service.create_notification(user_id, NotificationType.TEAM_NEWS, "One", "First")
+    missed = await service.create_notification(user_id, NotificationType.TEAM_NEWS, "Two", "Second")
+    
+    state, is_disconnected = _connected()
+    stream = notification_event_stream(
+        hub, user_id, session_factory, is_disconnected,
+        last_event_id=first.notification_id, heartbeat_interval=0.05
+    )
+    
+    frame = await _next(stream)
+    assert frame.startswith(f"id: {missed.notification_id}\nevent: notification")
+    assert await _next(stream) == 'event: unread_count\ndata: {"count": 2}\n\n'
+    assert hub.subscribed_users() == {user_id}
+    
+    assert await _next(stream) == ": heartbeat\n\n"
+    
+    live = await service.create_notification(user_id, NotificationType.TEAM_NEWS, "Three", "Third")
+    frame = await _next(stream)
+    assert frame.startswith(f"id: {live.notification_id}\nevent: notification")
+    assert '"title": "Three"' in frame
+    assert await _next(stream) == 'event: unread_count\ndata: {"count": 3}\n\n'
+    
+    await service.mark_all_read(user_id)
+    assert await _next(stream) == 'event: unread_count\ndata: {"count": 0}\n\n'
+    
+    state["closed"] = True
+    with pytest.raises(StopAsyncIteration):
+        await _next(stream)
+    assert hub.subscribed_users() == set()
+
+
+@pytest.mark.asyncio
+async def test_stream_catches_up_after_overflow(db_session: AsyncSession, db_engine):
+    """A lagging stream drops buffered events and resynchronises from the database."""
+    hub = InProcessNotificationHub(max_queue_size=1)
+    session_factory = async_sessionmaker(db_engine, class_=AsyncSession, expire_on_commit=False)
+    user_id = await _create_user(db_session)
+    service = NotificationService(db_session, hub)
+    
+    _, is_disconnected = _connected()
+    stream = notification_event_stream(hub, user_id, session_factory, is_disconnected, heartbeat_interval=0.05)
+    assert await _next(stream) == 'event: unread_count\ndata: {"count": 0}\n\n'
+    
+    created = await service.fan_out([user_id], NotificationType.TEAM_NEWS, "Fan", "Out")
+    assert created == 1
+    await service.create_notification(user_id, NotificationType.TEAM_NEWS, "Again", "More")
+    
+    frames = [await _next(stream) for _ in range(3)]
+    assert frames[0].startswith("id: ") and '"title": "Fan"' in frames[0]
+    assert '"title": "Again"' in frames[1]
+    assert frames[2] == 'event: unread_count\ndata: {"count": 2}\n\n'
+    await stream.aclose()
+
+
+@pytest.mark.asyncio
+async def test_stream_replays_a_backlog_longer_than_a_page(db_session: AsyncSession, db_engine, monkeypatch):
+    """Every missed notification is replayed, however many pages they span."""
+    monkeypatch.setattr(notification_controller, "CATCH_UP_PAGE_SIZE", 2)
+    hub = InProcessNotificationHub()
+    session_factory = async_sessionmaker(db_engine, class_=AsyncSession, expire_on_commit=False)
+    user_id = await _create_user(db_session)
+    service = NotificationService(db_session, hub)
+    seen = await service.create_notification(user_id, NotificationType.TEAM_NEWS, "Seen", "0")
+    missed = [await service.create_notification(user_id, NotificationType.TEAM_NEWS, f"Missed {i}", "m")
+              for i in range(5)]
+    
+    _, is_disconnected = _connected()
+    stream = notification_event_stream(
+        hub, user_id, session_factory, is_disconnected, last_event_id=seen.notification_id
+    )
+    frames = [await _next(stream) for _ in range(6)]
+    assert [f.split("\n", 1)[0] for f in frames[:5]] == [f"id: {n.notification_id}" for n in missed]
+    assert frames[5] == 'event: unread_count\ndata: {"count": 6}\n\n'
+    await stream.aclose()
+
+
+@pytest.mark.asyncio
+async def test_fan_out_publishes_only_its_own_rows(db_session: AsyncSession):
+    """Two fan-outs with the same title in the same second each publish just what they inserted."""
+    hub = InProcessNotificationHub()
+    user_id = await _create_user(db_session)
+    service = NotificationService(db_session, hub)
+    subscription = hub.subscribe(user_id)
+    
+    for _ in range(2):
+        await service.fan_out([user_id], NotificationType.TEAM_NEWS, "Same", "Same")
+    events = []
+    while not subscription.queue.empty():
+        events.append(subscription.queue.get_nowait())
+    notification_ids = [e["id"] for e in events if e["event"] == "notification"]
+    assert len(notification_ids) == 2 and len(set(notification_ids)) == 2
+    hub.unsubscribe(subscription)
+
+
+class _RecordingHub(InProcessNotificationHub):
+    """Hub whose subscribers live elsewhere, as with a broker-backed hub."""
+    
+    def __init__(self):
+        super().__init__()
+        self.published = []
+    
+    async def publish(self, user_id, event):
+        self.published.append((user_id, event["event"]))
+
+
+@pytest.mark.asyncio
+async def test_events_reach_the_hub_without_local_subscribers(db_session: AsyncSession):
+    """Every notification is handed to the hub, which knows who is listening in other processes."""
+    hub = _RecordingHub()
+    first, second = await _create_user(db_session), await _create_user(db_session)
+    service = NotificationService(db_session, hub)
+    
+    await service.fan_out([first, second], NotificationType.TEAM_NEWS, "News", "News")
+    await service.mark_all_read(first)
+    assert sorted(hub.published) == sorted([
+        (first, "notification"), (second, "notification"),
+        (first, "unread_count"), (second, "unread_count"), (first, "unread_count"),
+    ])
+
+
+@pytest.mark.asyncio
+async def test_unread_count(client: AsyncClient, player_headers):
+    """Unread count is served by a COUNT query."""
+    res = await client.get("/api/notifications/unread-count", headers=player_headers)
+    assert res.status_code == status.HTTP_200_OK
+    assert res.json() == {"count": 0}
+
+
+@pytest.mark.asyncio
+async def test_stream_requires_auth(client: AsyncClient):
+    """The stream rejects missing or invalid tokens."""
+    res = await client.get("/api/notifications/stream", params={"token": "invalid"})
+    assert res.status_code == status.HTTP_401_UNAUTHORIZED
@@ -0,0 +1,103 @@
+"""
+Tests for team Elo ratings.
+"""
+import random
+import uuid
+from datetime import date, time, timedelta
+import pytest
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.enums import MatchStatus, TeamStatus
+from app.models.match import MatchEvent
+from app.models.team import TeamProfile
+from app.services.match_service import MatchService
+from app.services.rating_service import rating_change, replay, schedule_waves
+from app.services.stats_service import StatsService
+
+
+async def _rating(client: AsyncClient, team: TeamProfile) -> float:
+    return (await client.get(f"/api/teams/{team.team_id}/stats")).json()["rating"]
+
+
+@pytest.mark.asyncio
+async def test_ratings_follow_results(client: AsyncClient, db_session: AsyncSession, make_team):
+    """Results move ratings, cancellations take them back and a replay agrees; search filters and sorts by them."""
+    prefix = f"elo{uuid.uuid4().hex[:6]}"
+    a, b, c = [await make_team(prefix, status=TeamStatus.VERIFIED) for _ in range(3)]
+    service = MatchService(db_session)
+    history = [(a, b, 2, 0), (b, c, 1, 1), (c, a, 0, 3), (b, None, 5, 0)]
+    matches = []
+    for day, (home, away, home_score, away_score) in enumerate(history):
+        match = MatchEvent(
+            host_team_id=home.team_id, opponent_team_id=away.team_id if away else None,
+            match_date=date.today() - timedelta(days=10 - day), start_time=time(18, 0),
+        )
+        db_session.add(match)
+        await db_session.flush()
+        matches.append((match, await service.record_result(match, home_score, away_score, a.leader_id)))
+    
+    expected, changes = _sequential_replay([(h.team_id, w.team_id, hs, ws) for h, w, hs, ws in history[:3]])
+    assert [r.rating_change for _, r in matches] == pytest.approx([*changes, None])
+    for team in (a, b, c):
+        assert await _rating(client, team) == round(expected[team.team_id], 1)
+    
+    res = await client.get("/api/search/teams", params={"query": prefix, "sortByRating": True})
+    assert [t["teamId"] for t in res.json()] == [a.team_id, b.team_id, c.team_id]
+    assert res.json()[0]["rating"] == round(expected[a.team_id], 1)
+    res = await client.get("/api/search/teams", params={"query": prefix, "minRating": 1500})
+    assert [t["teamId"] for t in res.json()] == [a.team_id]
+    
+    # Cancelling takes the change back; reinstating rates the match again
+    first, first_result = matches[0]
+    await service.cancel_match(first)
+    assert first_result.rating_change is None
+    assert await _rating(client, a) == round(expected[a.team_id] - changes[0], 1)
+    await service.update_match(first, status=MatchStatus.SCHEDULED)
+    assert first_result.rating_change is not None
+    
+    # Rated out of order now; a replay restores the chronological ratings
+    await StatsService(db_session).rebuild()
+    for team in (a, b, c):
+        assert await _rating(client, team) == round(expected[team.team_id], 1)
+
+
+def _sequential_replay(matches: list) -> tuple:
+    """Ratings and changes of the matches applied one at a time, the reference for replay()."""
+    ratings, changes = {}, []
+    for home_id, away_id, home_score, away_score in matches:
+        home_rating, away_rating = ratings.get(home_id, 1500.0), ratings.get(away_id, 1500.0)
+        change = rating_change(home_rating, away_rating, home_score, away_score)
+        ratings[home_id], ratings[away_id] = home_rating + change, away_rating - change
+        changes.append(change)
+    return ratings, changes
+
+
+def _random_matches(count: int = 5000) -> list:
+    rng = random.Random(43)
+    matches = []
+    for _ in range(count):
+        home, away = rng.sample(range(1, 201), 2)
+        matches.append((home, away, rng.randint(0, 4), rng.randint(0, 4)))
+    return matches
+
+
+def test_waves_keep_each_teams_order():
+    """Waves never repeat a team and keep each team's order, in far fewer waves than matches."""
+    matches = _random_matches()
+    waves = schedule_waves(matches)
+    last_wave = {}
+    for (home, away, _, _), wave in zip(matches, waves):
+        assert wave > last_wave.get(home, -1) and wave > last_wave.get(away, -1)
+        last_wave[home] = last_wave[away] = wave
+    assert max(waves) < len(matches) // 10
+
+
+def test_replay_matches_sequential_elo():
+    """The wave-at-a-time NumPy replay equals one match at a time."""
+    matches = _random_matches()
+    ratings, changes = replay(matches)
+    expected_ratings, expected_changes = _sequential_replay(matches)
+    assert changes == pytest.approx(expected_changes)
+    assert ratings == pytest.approx(expected_ratings)
+    assert sum(ratings.values()) == pytest.approx(1500.0 * len(ratings))
@@ -0,0 +1,73 @@
+"""
+Tests for recruitment player search.
+"""
+import random
+import pytest
+from httpx import AsyncClient
+from fastapi import status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.enums import AccountStatus
+from app.models.player import PlayerProfile
+from app.models.team import TeamProfile, TeamRoster
+from app.models.user import UserAccount
+from app.utils.geo import KM_PER_DEGREE
+
+# A spot no other test places players at
+BASE = (-33.87 + random.uniform(-0.2, 0.2), 151.21 + random.uniform(-0.2, 0.2))
+
+
+def _east_of_base(km: float) -> tuple:
+    return BASE[0], BASE[1] + km / (KM_PER_DEGREE * 0.83)  # cos(-33.9) ~ 0.83
+
+
+@pytest.fixture
+def player_at(db_session: AsyncSession, make_user):
+    """Factory to add a player whose account is km east of BASE."""
+    async def _make(km: float, position: str = "Forward", skill_level: int = 5, **user_fields) -> PlayerProfile:
+        lat, lon = _east_of_base(km)
+        user = await make_user("recruit", latitude=lat, longitude=lon, **user_fields)
+        player = PlayerProfile(
+            user_id=user.user_id, display_name=user.username, position=position, skill_level=skill_level
+        )
+        db_session.add(player)
+        await db_session.flush()
+        return player
+    return _make
+
+
+@pytest.mark.asyncio
+async def test_recruits_filtered_by_position_band_distance_and_roster(
+    client: AsyncClient, db_session: AsyncSession, player_headers, owner_headers, test_team, player_at
+):
+    """Nearest matching players first; roster members, banned accounts and other positions are left out."""
+    team = await db_session.get(TeamProfile, test_team["teamId"])
+    team.latitude, team.longitude = BASE
+    near = await player_at(1)
+    further = await player_at(4, position=" forward ", skill_level=6)
+    member = await player_at(0.5)
+    db_session.add(TeamRoster(team_id=team.team_id, player_id=member.player_id))
+    await player_at(0.5, status=AccountStatus.BANNED)
+    await player_at(0.5, position="Goalkeeper")
+    await player_at(0.5, skill_level=9)
+    await player_at(15)
+    await db_session.commit()
+    
+    params = {"teamId": team.team_id, "position": "Forward", "skillBand": "4-6", "radiusKm": 10}
+    res = await client.get("/api/search/recruits", params=params, headers=player_headers)
+    assert res.status_code == status.HTTP_200_OK
+    recruits = res.json()
+    assert [r["playerId"] for r in recruits] == [near.player_id, further.player_id]
+    assert recruits[0]["distanceKm"] == pytest.approx(1, abs=0.05)
+    
+    # A player's location lives on their account; moving it re-buckets them
+    user = await db_session.get(UserAccount, further.user_id)
+    user.latitude, user.longitude = _east_of_base(0.2)
+    await db_session.commit()
+    res = await client.get("/api/search/recruits", params={**params, "limit": 1}, headers=player_headers)
+    assert [r["playerId"] for r in res.json()] == [further.player_id]
+    
+    res = await client.get("/api/search/recruits", params={**params, "skillBand": "5-8"}, headers=player_headers)
+    assert res.status_code == status.HTTP_400_BAD_REQUEST
+    res = await client.get("/api/search/recruits", params=params, headers=owner_headers)
+    assert res.status_code == status.HTTP_403_FORBIDDEN
@@ -0,0 +1,106 @@
+"""
+Tests for the in-memory amenity reference data registry.
+"""
+import uuid
+import pytest
+from httpx import AsyncClient
+from fastapi import status
+from sqlalchemy import event, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.field import Amenity
+from app.services.reference_data import get_reference_data
+
+
+def _count_queries(engine):
+    counter = {"n": 0}
+    
+    def record(*args):
+        counter["n"] += 1
+    event.listen(engine.sync_engine, "before_cursor_execute", record)
+    return counter, lambda: event.remove(engine.sync_engine, "before_cursor_execute", record)
+
+
+async def _amenity(db_session: AsyncSession, **kwargs) -> Amenity:
+    amenity = Amenity(name=f"Amenity {uuid.uuid4().hex[:8]}", **kwargs)
+    db_session.add(amenity)
+    await db_session.commit()
+    return amenity
+
+
+@pytest.mark.asyncio
+async def test_amenity_list_served_from_memory(client: AsyncClient, db_session: AsyncSession, db_engine):
+    """A committed amenity change reloads the registry; later reads skip the database."""
+    amenity = await _amenity(db_session, icon="shower")
+    assert get_reference_data().stale
+    
+    first = await client.get("/api/fields/amenities")
+    assert amenity.amenity_id in [a["amenityId"] for a in first.json()]
+    
+    counter, stop = _count_queries(db_engine)
+    try:
+        again = await client.get("/api/fields/amenities", headers={"If-None-Match": first.headers["etag"]})
+    finally:
+        stop()
+    assert again.status_code == status.HTTP_304_NOT_MODIFIED
+    assert counter["n"] == 0
+    
+    amenity.is_active = False
+    await db_session.commit()
+    changed = await client.get("/api/fields/amenities", headers={"If-None-Match": first.headers["etag"]})
+    assert changed.status_code == status.HTTP_200_OK
+    assert amenity.amenity_id not in [a["amenityId"] for a in changed.json()]
+
+
+@pytest.mark.asyncio
+async def test_field_amenities_validated_and_resolved_in_memory(
+    client: AsyncClient, db_session: AsyncSession, db_engine, test_field, owner_headers
+):
+    """Updates reject unknown IDs; reads need only the junction lookup."""
+    first, second = await _amenity(db_session), await _amenity(db_session, description="Covered")
+    url = f"/api/fields/{test_field['fieldId']}/amenities"
+    
+    res = await client.put(url, json={"amenityIds": [first.amenity_id, 999999]}, headers=owner_headers)
+    assert res.status_code == status.HTTP_400_BAD_REQUEST
+    assert "999999" in res.json()["detail"]
+    
+    ids = [second.amenity_id, first.amenity_id, second.amenity_id]
+    res = await client.put(url, json={"amenityIds": ids}, headers=owner_headers)
+    assert res.status_code == status.HTTP_200_OK
+    assert [a["amenityId"] for a in res.json()] == [second.amenity_id, first.amenity_id]
+    
+    counter, stop = _count_queries(db_engine)
+    try:
+        res = await client.get(url)
+    finally:
+        stop()
+    assert res.json()[0] == {
+        "amenityId": second.amenity_id, "name": second.name, "description": "Covered",
+        "icon": None, "isActive": True,
+    }
+    assert counter["n"] == 1
+
+
+@pytest.mark.asyncio
+async def test_amenity_added_elsewhere_is_accepted_before_the_refresh(
+    client: AsyncClient, db_engine, test_field, owner_headers
+):
+    """An ID the cache does not know reloads it once instead of being rejected outright."""
+    await client.get("/api/fields/amenities")
+    assert not get_reference_data().stale
+    # As another process would: no session events reach this one
+    async with db_engine.begin() as conn:
+        await conn.execute(insert(Amenity).values(name=f"Amenity {uuid.uuid4().hex[:8]}", is_active=True))
+        amenity_id = (await conn.execute(select(Amenity.amenity_id).order_by(Amenity.amenity_id.desc()))).scalar()
+    
+    res = await client.put(f"/api/fields/{test_field['fieldId']}/amenities",
+                           json={"amenityIds": [amenity_id]}, headers=owner_headers)
+    assert res.status_code == status.HTTP_200_OK
+    assert [a["amenityId"] for a in res.json()] == [amenity_id]
+
+
+@pytest.mark.asyncio
+async def test_search_rejects_unknown_amenity_filter(client: AsyncClient):
+    """Amenity filters are validated against the registry before querying."""
+    res = await client.get("/api/search/fields", params={"amenityIds[]": [999998]})
+    assert res.status_code == status.HTTP_400_BAD_REQUEST
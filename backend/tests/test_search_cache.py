@@ -0,0 +1,115 @@
+"""
+Tests for the search result cache.
+"""
+import uuid
+import pytest
+from httpx import AsyncClient
+from fastapi import status
+from sqlalchemy import event, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.enums import TeamStatus
+from app.models.player import PlayerProfile
+from app.models.stats import TeamStats
+from app.models.team import TeamProfile
+from app.models.user import UserAccount
+from app.utils.search_cache import SearchCache, get_search_cache, normalize_filters, search_key
+
+
+class _QueryCount:
+    """Counts SQL statements executed on an engine."""
+    
+    def __init__(self, engine):
+        self.engine = engine.sync_engine
+        self.count = 0
+    
+    def _record(self, *args):
+        self.count += 1
+    
+    def __enter__(self):
+        event.listen(self.engine, "before_cursor_execute", self._record)
+        return self
+    
+    def __exit__(self, *exc):
+        event.remove(self.engine, "before_cursor_execute", self._record)
+
+
+def test_cache_expires_evicts_and_invalidates_per_kind():
+    """Entries expire after the TTL, the least recent is evicted and invalidation drops one kind only."""
+    now = [0.0]
+    cache = SearchCache(max_entries=3, ttl_seconds=10, clock=lambda: now[0])
+    a = search_key(normalize_filters(query=" Hanoi ", amenityIds=[3, 1, 3], limit=20))
+    assert a == search_key(normalize_filters(limit=20, amenityIds=[1, 3], query="hanoi"))
+    
+    cache.put("teams", a, [1], cache.generation("teams"))
+    cache.put("fields", a, [2], cache.generation("fields"))
+    assert cache.get("teams", a) == b"[1]"
+    cache.invalidate(["teams"])
+    assert cache.get("teams", a) is None
+    assert cache.get("fields", a) == b"[2]"
+    
+    # A result computed across an invalidation is returned but not kept
+    generation = cache.generation("players")
+    cache.invalidate(["players"])
+    assert cache.put("players", a, [3], generation) == b"[3]"
+    assert cache.get("players", a) is None
+    
+    for n in range(3):
+        cache.put("owners", (n,), [n], cache.generation("owners"))
+    assert cache.get("fields", a) is None and len(cache) == 3
+    now[0] = 10
+    assert cache.get("owners", (2,)) is None
+    
+    stats = cache.stats()
+    assert stats["evictions"] == 1 and stats["entries"] == 2
+    assert stats["kinds"]["teams"] == {"entries": 0, "hits": 1, "misses": 1, "hitRate": 0.5, "invalidations": 1}
+
+
+@pytest.mark.asyncio
+async def test_repeated_searches_hit_the_cache_until_their_kind_changes(
+    client: AsyncClient, db_engine, db_session: AsyncSession, create_auth_headers
+):
+    """Equivalent searches skip the database; only changes to the searched kind invalidate them."""
+    tag = f"sc{uuid.uuid4().hex[:8]}"
+    leader = UserAccount(username=tag, email=f"{tag}@test.com", password_hash="x")
+    db_session.add(leader)
+    await db_session.flush()
+    team = TeamProfile(team_name=f"{tag} Athletic", leader_id=leader.user_id, status=TeamStatus.VERIFIED)
+    db_session.add(team)
+    await db_session.commit()
+    
+    teams = await client.get("/api/search/teams", params={"query": tag, "sortByRating": True})
+    players = await client.get("/api/search/players", params={"query": tag})
+    assert [t["teamId"] for t in teams.json()] == [team.team_id]
+    assert teams.json()[0]["rating"] == 1500.0
+    assert players.json() == []
+    with _QueryCount(db_engine) as queries:
+        again = await client.get("/api/search/teams", params={"query": f" {tag.upper()}", "sortByRating": True})
+    assert queries.count == 0
+    assert again.json() == teams.json()
+    
+    # A new player drops player searches only
+    db_session.add(PlayerProfile(user_id=leader.user_id, display_name=f"{tag} Keeper"))
+    await db_session.commit()
+    res = await client.get("/api/search/players", params={"query": tag})
+    assert [p["displayName"] for p in res.json()] == [f"{tag} Keeper"]
+    with _QueryCount(db_engine) as queries:
+        await client.get("/api/search/teams", params={"query": tag, "sortByRating": True})
+    assert queries.count == 0
+    
+    # Bulk statements count too
+    db_session.add(TeamStats(team_id=team.team_id))
+    await db_session.commit()
+    await client.get("/api/search/teams", params={"query": tag, "sortByRating": True})
+    await db_session.execute(update(TeamStats).where(TeamStats.team_id == team.team_id).values(rating=1600.0))
+    await db_session.commit()
+    res = await client.get("/api/search/teams", params={"query": tag, "sortByRating": True})
+    assert res.json()[0]["rating"] == 1600.0
+    
+    moderator = await create_auth_headers("search_mod", "Moderator")
+    res = await client.get("/api/search/cache/stats", headers=moderator)
+    assert res.status_code == status.HTTP_200_OK
+    assert res.json() == get_search_cache().stats()
+    assert res.json()["kinds"]["teams"]["hits"] >= 2
+    res = await client.get("/api/search/cache/stats", headers=await create_auth_headers("search_player"))
+    assert res.status_code == status.HTTP_403_FORBIDDEN
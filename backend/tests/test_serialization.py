@@ -0,0 +1,94 @@
+"""
+Tests for the precompiled ORM row serializers and the orjson list path.
+"""
+import pytest
+from datetime import datetime
+from types import SimpleNamespace
+from httpx import AsyncClient
+from fastapi import status
+from pydantic import BaseModel
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.field import FieldProfile
+from app.models.social import Post
+from app.models.team import TeamProfile
+from app.schemas.field import FieldProfileResponse, FIELD_PROFILE_SERIALIZER
+from app.schemas.social import PostResponse, POST_SERIALIZER
+from app.schemas.team import TeamProfileResponse, TEAM_PROFILE_SERIALIZER
+from app.utils.serialization import RowSerializer, isoformat
+
+
+def test_serializer_must_cover_model_fields():
+    """A field map that drifts from the response model fails at definition time."""
+    class Small(BaseModel):
+        id: int
+        createdAt: str
+    
+    with pytest.raises(ValueError, match=r"missing \['createdAt'\], unknown \['extra'\]"):
+        RowSerializer(Small, {"id": "id", "extra": "extra"})
+    
+    serializer = RowSerializer(Small, {"createdAt": isoformat("created_at"), "id": "id"})
+    row = SimpleNamespace(id=1, created_at=datetime(2024, 5, 1, 9, 30))
+    assert serializer(row) == {"id": 1, "createdAt": "2024-05-01T09:30:00"}
+    assert list(serializer(row)) == ["id", "createdAt"]
+    assert serializer(SimpleNamespace(id=2, created_at=None)) == {"id": 2, "createdAt": None}
+
+
+def test_serializer_falls_back_to_attribute_access():
+    """Attributes missing from the instance dict are read through the descriptor."""
+    class Small(BaseModel):
+        id: int
+        label: str
+    
+    class Row:
+        label = "class-level"
+        
+        def __init__(self, id):
+            self.id = id
+    
+    serializer = RowSerializer(Small, {"id": "id", "label": "label"})
+    assert serializer.many([Row(1), Row(2)]) == [
+        {"id": 1, "label": "class-level"}, {"id": 2, "label": "class-level"}
+    ]
+
+
+@pytest.mark.asyncio
+async def test_rows_serialize_to_valid_models(db_session: AsyncSession, test_team, test_field, player_headers, client):
+    """Serialized rows already satisfy their response models without coercion."""
+    await client.post("/api/posts", json={"content": "Serialize me"}, headers=player_headers)
+    cases = [
+        (TeamProfile, TeamProfileResponse, TEAM_PROFILE_SERIALIZER),
+        (FieldProfile, FieldProfileResponse, FIELD_PROFILE_SERIALIZER),
+        (Post, PostResponse, POST_SERIALIZER),
+    ]
+    for orm_model, response_model, serializer in cases:
+        rows = (await db_session.execute(select(orm_model).limit(5))).scalars().all()
+        assert rows
+        for data in serializer.many(rows):
+            assert response_model.model_validate(data, strict=True).model_dump() == data
+            assert list(data) == list(response_model.model_fields)
+
+
+@pytest.mark.asyncio
+async def test_list_endpoint_matches_validated_single(client: AsyncClient, test_field, owner_headers):
+    """The orjson list path returns the same JSON as the validated single-object path."""
+    single = await client.get(f"/api/fields/{test_field['fieldId']}")
+    listed = await client.get("/api/fields/my-fields", headers=owner_headers)
+    
+    assert listed.status_code == status.HTTP_200_OK
+    assert listed.headers["content-type"] == "application/json"
+    match = next(f for f in listed.json() if f["fieldId"] == test_field["fieldId"])
+    assert match == single.json()
+    assert list(match) == list(single.json())
+
+
+@pytest.mark.asyncio
+async def test_search_owners_uses_tuple_serializer(client: AsyncClient, test_field, owner_headers):
+    """Owner search maps (user, count) rows in one step."""
+    username = (await client.get("/api/auth/me", headers=owner_headers)).json()["username"]
+    res = await client.get("/api/search/owners", params={"query": username})
+    assert res.status_code == status.HTTP_200_OK
+    owner = next(o for o in res.json() if o["userId"] == test_field["ownerId"])
+    assert owner["fieldCount"] >= 1
+    assert set(owner) == {"userId", "username", "location", "isVerified", "fieldCount", "createdAt"}
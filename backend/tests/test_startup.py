@@ -0,0 +1,44 @@
+"""
+Regression tests for API cold start cost.
+"""
+import ast
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+APP_DIR = Path(__file__).parent.parent / "app"
+
+IMPORT_PROBE = """
+import json, sys
+from fastapi.routing import APIRoute
+from app.main import app
+routes = sum(isinstance(r, APIRoute) for r in app.routes)
+print(json.dumps({"routes": routes, "modules": sorted(sys.modules)}))
+"""
+
+
+def test_no_imports_inside_functions():
+    """Handlers, services and repositories import at module level, not per call."""
+    offenders = []
+    for package in ("controllers", "services", "repositories"):
+        for path in sorted((APP_DIR / package).glob("*.py")):
+            tree = ast.parse(path.read_text())
+            for func in ast.walk(tree):
+                if isinstance(func, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                    offenders += [
+                        f"{path.name}:{node.lineno} in {func.name}()"
+                        for node in ast.walk(func) if isinstance(node, (ast.Import, ast.ImportFrom))
+                    ]
+    assert offenders == []
+
+
+def test_app_import_leaves_out_migration_tooling():
+    """Importing the app registers every controller and does not pull in alembic."""
+    result = subprocess.run(
+        [sys.executable, "-c", IMPORT_PROBE],
+        cwd=APP_DIR.parent, capture_output=True, text=True, check=True,
+    )
+    probe = json.loads(result.stdout.strip().splitlines()[-1])
+    assert probe["routes"] > 100
+    assert "alembic" not in probe["modules"]
@@ -0,0 +1,91 @@
+"""
+Tests for denormalized player and team match statistics.
+"""
+from datetime import date, timedelta
+import pytest
+from httpx import AsyncClient
+from fastapi import status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.match import MatchEvent
+from app.models.player import PlayerProfile
+from app.services.stats_service import StatsService
+
+ZERO_TEAM = {
+    "matchesPlayed": 0, "wins": 0, "draws": 0, "losses": 0, "goalsFor": 0, "goalsAgainst": 0, "points": 0, "form": "", "rating": 1500.0,
+}
+
+
+async def _stats(client: AsyncClient, host_id, away_id, player_ids) -> tuple:
+    teams = [(await client.get(f"/api/teams/{t}/stats")).json() for t in (host_id, away_id)]
+    players = [(await client.get(f"/api/players/{p}/stats")).json() for p in player_ids]
+    return teams, players
+
+
+@pytest.mark.asyncio
+async def test_stats_follow_results_attendance_and_cancellation(
+    client: AsyncClient, db_session: AsyncSession, player_headers, test_team, test_field, make_user, make_team
+):
+    """Each write path adjusts the stats, and a rebuild reproduces them."""
+    host_id = test_team["teamId"]
+    away = await make_team("away")
+    players = []
+    for _ in range(3):
+        player = PlayerProfile(user_id=(await make_user("stats")).user_id, display_name="Stats Player")
+        db_session.add(player)
+        players.append(player)
+    await db_session.flush()
+    striker, keeper, bench = [p.player_id for p in players]
+    
+    res = await client.post("/api/matches", json={
+        "hostTeamId": host_id,
+        "matchDate": (date.today() + timedelta(days=3)).isoformat(),
+        "startTime": "18:00:00",
+        "fieldId": test_field["fieldId"],
+        "visibility": "Public",
+    }, headers=player_headers)
+    match_id = res.json()["matchId"]
+    match = await db_session.get(MatchEvent, match_id)
+    match.opponent_team_id = away.team_id
+    await db_session.commit()
+    
+    url = f"/api/matches/{match_id}"
+    await client.post(f"{url}/attendance/batch", json={"records": [
+        {"playerId": striker, "status": "Present"},
+        {"playerId": keeper, "status": "Present"},
+        {"playerId": bench, "status": "Excused"},
+    ]}, headers=player_headers)
+    res = await client.post(f"{url}/result", json={"homeScore": 3, "awayScore": 1}, headers=player_headers)
+    assert res.status_code == status.HTTP_201_CREATED
+    
+    teams, stats = await _stats(client, host_id, away.team_id, [striker, keeper, bench])
+    assert teams[0] == {"teamId": host_id, "matchesPlayed": 1, "wins": 1, "draws": 0, "losses": 0,
+                        "goalsFor": 3, "goalsAgainst": 1, "points": 3, "form": "W", "rating": 1516.0}
+    assert teams[1] == {"teamId": away.team_id, "matchesPlayed": 1, "wins": 0, "draws": 0, "losses": 1,
+                        "goalsFor": 1, "goalsAgainst": 3, "points": 0, "form": "L", "rating": 1484.0}
+    assert (stats[0]["matchesPlayed"], stats[0]["wins"], stats[0]["goalsFor"], stats[0]["attendanceRate"]) == \
+        (1, 1, 3, 1.0)
+    assert (stats[2]["matchesPlayed"], stats[2]["matchesMissed"], stats[2]["attendanceRate"]) == (0, 1, 0.0)
+    
+    # Changing a status moves that player's outcome
+    res = await client.put(f"{url}/attendance/{keeper}", json={"status": "Absent"}, headers=player_headers)
+    assert res.status_code == status.HTTP_200_OK
+    _, stats = await _stats(client, host_id, away.team_id, [keeper])
+    assert (stats[0]["matchesPlayed"], stats[0]["matchesMissed"], stats[0]["wins"]) == (0, 1, 0)
+    
+    # A rebuild from scratch agrees with the incremental updates
+    incremental = await _stats(client, host_id, away.team_id, [striker, keeper, bench])
+    await StatsService(db_session).rebuild()
+    assert await _stats(client, host_id, away.team_id, [striker, keeper, bench]) == incremental
+    
+    # Cancelling removes the match from every total
+    res = await client.put(f"{url}/cancel", headers=player_headers)
+    assert res.status_code == status.HTTP_200_OK
+    teams, stats = await _stats(client, host_id, away.team_id, [striker, keeper, bench])
+    assert teams[0] == {"teamId": host_id, **ZERO_TEAM}
+    assert all(s["matchesPlayed"] == s["matchesMissed"] == s["wins"] == 0 for s in stats)
+    
+    # ...and reinstating it restores them
+    res = await client.put(url, json={"status": "Scheduled"}, headers=player_headers)
+    assert res.status_code == status.HTTP_200_OK
+    assert await _stats(client, host_id, away.team_id, [striker, keeper, bench]) == incremental
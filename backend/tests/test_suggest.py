@@ -0,0 +1,55 @@
+"""
+Tests for search type-ahead suggestions.
+"""
+import uuid
+import pytest
+from httpx import AsyncClient
+from fastapi import status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.enums import TeamStatus, FieldStatus
+from app.models.field import FieldProfile
+from app.models.player import PlayerProfile
+from app.models.team import TeamProfile
+
+
+@pytest.mark.asyncio
+async def test_suggest_names_across_types(client: AsyncClient, db_session: AsyncSession, make_user):
+    """Whole-name prefixes first, then word prefixes; accents and case are ignored; renames are picked up."""
+    tag = f"sg{uuid.uuid4().hex[:8]}"
+    leader = await make_user(f"{tag}x_leader")
+    team = TeamProfile(team_name=f"{tag} Rovers", leader_id=leader.user_id, status=TeamStatus.VERIFIED)
+    db_session.add(team)
+    db_session.add(TeamProfile(team_name=f"{tag} Pending", leader_id=leader.user_id))
+    player = PlayerProfile(user_id=leader.user_id, display_name=f"{tag} Striker")
+    db_session.add(player)
+    owner = await make_user(f"{tag}_owner")
+    field = FieldProfile(
+        field_name=f"Étoile {tag.upper()}", owner_id=owner.user_id, location="L",
+        default_price_per_hour=10, capacity=10, status=FieldStatus.VERIFIED,
+    )
+    db_session.add(field)
+    await db_session.commit()
+    
+    res = await client.get("/api/search/suggest", params={"q": tag})
+    assert res.status_code == status.HTTP_200_OK
+    assert res.json() == [
+        {"type": "team", "id": team.team_id, "name": f"{tag} Rovers"},
+        {"type": "player", "id": player.player_id, "name": f"{tag} Striker"},
+        {"type": "owner", "id": owner.user_id, "name": owner.username},
+        {"type": "field", "id": field.field_id, "name": f"Étoile {tag.upper()}"},
+    ]
+    res = await client.get("/api/search/suggest", params={"q": f"ETOILE {tag}"})
+    assert [s["id"] for s in res.json()] == [field.field_id]
+    res = await client.get("/api/search/suggest", params={"q": tag, "types[]": ["team", "field"], "limit": 1})
+    assert [s["type"] for s in res.json()] == ["team"]
+    
+    team.team_name = f"{tag}z Renamed"
+    await db_session.commit()
+    res = await client.get("/api/search/suggest", params={"q": f"{tag} ro"})
+    assert res.json() == []
+    res = await client.get("/api/search/suggest", params={"q": "renamed", "types[]": "team"})
+    assert {"type": "team", "id": team.team_id, "name": f"{tag}z Renamed"} in res.json()
+    
+    res = await client.get("/api/search/suggest", params={"q": tag, "types[]": "coach"})
+    assert res.status_code == status.HTTP_400_BAD_REQUEST